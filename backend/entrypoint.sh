@@ -1,5 +1,13 @@
 #!/bin/sh
 
+# Commands other than gunicorn options run as given and skip the startup
+# tasks below. docker-compose.yml runs the job worker this way, so it is
+# PID 1 of its own container: it gets SIGTERM and is restarted by Docker.
+case "$1" in
+    ''|-*) ;;
+    *) exec "$@" ;;
+esac
+
 # Generate admin path if not set
 if [ -z "$ADMIN_PATH" ]; then
     export ADMIN_PATH=$(python -c "import secrets; print(secrets.token_urlsafe(16))")
@@ -18,5 +26,25 @@ if [ "${RUN_MIGRATIONS_ON_START:-true}" = "true" ]; then
     python manage.py migrate --noinput
 fi
 
+# Creates the cache table when BLEX_CACHE_BACKEND=database; no-op otherwise
+python manage.py createcachetable
+
+# Builds related post lists for posts that do not have one yet
+python manage.py rebuild_related_posts --missing
+
+# Stores Markdown renditions for content saved before they were precomputed
+python manage.py backfill_agent_markdown
+
+# Writes static sitemap files served by nginx that do not exist yet (requires
+# SITE_URL); the worker keeps them up to date after that
+python manage.py build_sitemaps --missing
+
+# Background jobs are processed by the separate worker service. Set
+# RUN_JOB_WORKER=true to run an unsupervised worker next to gunicorn instead,
+# e.g. when only this container is deployed.
+if [ "${RUN_JOB_WORKER:-false}" = "true" ]; then
+    python manage.py run_worker &
+fi
+
 # Execute gunicorn with all arguments
 exec gunicorn "$@"
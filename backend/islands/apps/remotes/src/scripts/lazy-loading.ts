@@ -2,6 +2,21 @@ let imageObserver: IntersectionObserver | null = null;
 let videoObserver: IntersectionObserver | null = null;
 let mutationObserver: MutationObserver | null = null;
 
+function loadImage(image: HTMLImageElement) {
+    // Sources of a <picture> wait in data-srcset until the image is shown.
+    if (image.parentElement instanceof HTMLPictureElement) {
+        image.parentElement.querySelectorAll('source').forEach(source => {
+            if (source.dataset.srcset) {
+                source.srcset = source.dataset.srcset;
+            }
+        });
+    }
+    if (image.dataset.src) {
+        image.src = image.dataset.src;
+    }
+    image.classList.remove('lazy');
+}
+
 function processLazyElements() {
     const lazyImages = Array.from(document.querySelectorAll('img.lazy')) as HTMLImageElement[];
     const lazyVideos = Array.from(document.querySelectorAll('video.lazy')) as HTMLVideoElement[];
@@ -12,10 +27,7 @@ function processLazyElements() {
                 entries.forEach(entry => {
                     if (entry.isIntersecting) {
                         const image = entry.target as HTMLImageElement;
-                        if (image.dataset.src) {
-                            image.src = image.dataset.src;
-                        }
-                        image.classList.remove('lazy');
+                        loadImage(image);
                         imageObserver!.unobserve(image);
                     }
                 });
@@ -52,12 +64,7 @@ function processLazyElements() {
         });
     } else {
         // Fallback for browsers without IntersectionObserver
-        lazyImages.forEach(image => {
-            if (image.dataset.src) {
-                image.src = image.dataset.src;
-            }
-            image.classList.remove('lazy');
-        });
+        lazyImages.forEach(loadImage);
 
         lazyVideos.forEach(video => {
             const source = video.querySelector('source') as HTMLSourceElement;
@@ -29,11 +29,11 @@ class ImageFilter(admin.SimpleListFilter):
 class ImageCacheAdmin(admin.ModelAdmin):
     search_fields = ['path']
 
-    list_display = ['id', 'file_size', 'image', 'open_image']
+    list_display = ['id', 'file_size', 'status', 'image', 'open_image']
     list_per_page = 50
 
     def get_list_filter(self, request):
-        return [ImageFilter]
+        return [ImageFilter, 'status']
 
     def file_size(self, obj):
         size = obj.size
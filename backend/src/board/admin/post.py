@@ -2,7 +2,7 @@
 Post Admin Configuration
 """
 from django.contrib import admin
-from django.db.models import Count, QuerySet
+from django.db.models import QuerySet
 from django.http import HttpRequest
 
 from board.services.post_status_service import PostStatusService
@@ -149,10 +149,7 @@ class PostAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         return super().get_queryset(request).select_related(
             'author', 'content', 'config', 'series'
-        ).prefetch_related('tags', 'likes', 'comments').annotate(
-            likes_count=Count('likes', distinct=True),
-            comments_count=Count('comments', distinct=True)
-        )
+        ).prefetch_related('tags')
 
     def thumbnail_preview(self, obj: Post) -> str:
         width, height = THUMBNAIL_SIZE
@@ -176,16 +173,14 @@ class PostAdmin(admin.ModelAdmin):
     tags_preview.short_description = '태그'
 
     def likes_count(self, obj: Post) -> str:
-        count = obj.likes_count if hasattr(obj, 'likes_count') else obj.likes.count()
-        return AdminDisplayService.like_count_badge(count)
+        return AdminDisplayService.like_count_badge(obj.like_count)
     likes_count.short_description = '좋아요'
-    likes_count.admin_order_field = 'likes_count'
+    likes_count.admin_order_field = 'like_count'
 
     def comments_count(self, obj: Post) -> str:
-        count = obj.comments_count if hasattr(obj, 'comments_count') else obj.comments.count()
-        return AdminDisplayService.comment_count_badge(count)
+        return AdminDisplayService.comment_count_badge(obj.comment_count)
     comments_count.short_description = '댓글'
-    comments_count.admin_order_field = 'comments_count'
+    comments_count.admin_order_field = 'comment_count'
 
     def publish_status(self, obj: Post) -> str:
         return AdminDisplayService.publish_status_badge(obj)
@@ -214,11 +209,11 @@ class PostAdmin(admin.ModelAdmin):
     image_preview.short_description = '이미지 미리보기'
 
     def total_likes(self, obj: Post) -> int:
-        return obj.likes.count()
+        return obj.like_count
     total_likes.short_description = '총 좋아요 수'
 
     def total_comments(self, obj: Post) -> int:
-        return obj.comments.count()
+        return obj.comment_count
     total_comments.short_description = '총 댓글 수'
 
     def created_at(self, obj: Post) -> str:
@@ -1,11 +1,13 @@
 """
 User & Profile Admin Configuration
 """
+from functools import partial
 from typing import Any, Optional
 from django import forms
 from django.contrib import admin
 from django.contrib.auth.models import User
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.db import transaction
 from django.http import HttpRequest
 from django.db.models import Count, QuerySet
 from django.urls import reverse
@@ -16,6 +18,7 @@ from board.models import (
     EmailChange, Profile
 )
 from board.constants.config_meta import CONFIG_TYPES
+from board.services.developer_token_service import DeveloperTokenService
 from board.services.user_role_service import UserRoleService
 
 from .service import AdminDisplayService, AdminLinkService
@@ -112,7 +115,11 @@ class CustomUserAdmin(BaseUserAdmin):
     activate_users.short_description = '선택한 사용자 활성화'
 
     def deactivate_users(self, request: HttpRequest, queryset: QuerySet[User]) -> None:
+        user_ids = list(queryset.values_list('id', flat=True))
         count = queryset.update(is_active=False)
+        # update() skips the post_save signal that drops cached developer tokens.
+        for user_id in user_ids:
+            transaction.on_commit(partial(DeveloperTokenService.invalidate_user, user_id))
         self.message_user(request, f'{count}명의 사용자를 비활성화했습니다.')
     deactivate_users.short_description = '선택한 사용자 비활성화'
 
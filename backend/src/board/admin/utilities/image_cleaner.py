@@ -12,6 +12,7 @@ from django.conf import settings
 from django.db.models import F
 
 from board.models import Post, Comment, ImageCache, Profile, Series, StaticPage
+from board.services.image_variant_service import ImageVariantService
 
 
 class ImageCleanerService:
@@ -23,15 +24,21 @@ class ImageCleanerService:
         self.title_image_dir = os.path.join(settings.MEDIA_ROOT, 'images/title')
         self.avatar_image_dir = os.path.join(settings.MEDIA_ROOT, 'images/avatar')
 
+    VARIANT_SUFFIX = re.compile(r'\.(?:\d+w\.)?(?:avif|webp)$')
+
     @staticmethod
     def get_clean_filename(filename: str) -> str:
-        """파일명에서 접미사 제거 (.preview, .minify)"""
+        """파일명에서 접미사 제거 (.preview, .minify, AVIF/WebP 변형)"""
         # .preview.jpg 제거
         if '.preview' in filename:
             filename = filename.split('.preview')[0]
         # .minify.확장자 제거
         if '.minify' in filename:
             filename = filename.split('.minify')[0]
+        # .960w.webp, .avif 등 변형 제거 (원본이 이미지 확장자일 때만)
+        clean_name = ImageCleanerService.VARIANT_SUFFIX.sub('', filename)
+        if clean_name != filename and ImageVariantService.supports(clean_name):
+            filename = clean_name
         return filename
 
     @staticmethod
@@ -269,8 +276,11 @@ class ImageCleanerService:
                             if execute:
                                 try:
                                     os.remove(full_path)
-                                    # 관련 파일도 삭제 (.preview, .minify)
-                                    for suffix in ['.preview.jpg', '.minify.jpg', '.minify.png']:
+                                    # 관련 파일도 삭제 (.preview, .minify, AVIF/WebP 변형)
+                                    for suffix in [
+                                        '.preview.jpg', '.minify.jpg', '.minify.png',
+                                        *ImageVariantService.variant_suffixes(),
+                                    ]:
                                         preview_path = f"{full_path}{suffix}"
                                         if os.path.exists(preview_path):
                                             os.remove(preview_path)
@@ -6,3 +6,4 @@ class BoardConfig(AppConfig):
 
     def ready(self):
         from board import checks  # noqa: F401
+        from board import signals  # noqa: F401
@@ -3,6 +3,7 @@ from urllib.parse import urlsplit
 from django.conf import settings
 from django.core.checks import Tags, Warning, register
 
+from board.services.database_maintenance_service import DatabaseMaintenanceService
 from board.services.site_url_service import LOCAL_SITE_HOSTS, SiteUrlService
 
 
@@ -71,3 +72,30 @@ def check_public_site_url(app_configs, **kwargs):
         ]
 
     return []
+
+
+@register(Tags.database)
+def check_sqlite_runtime_profile(app_configs, databases=None, **kwargs):
+    # Database checks only run when a command asks for them, e.g. migrate
+    # or `check --database default`.
+    if not databases or getattr(settings, 'TESTING', False):
+        return []
+
+    warnings = []
+    for alias in databases:
+        issues = DatabaseMaintenanceService.get_profile_issues(alias)
+        if issues:
+            warnings.append(
+                Warning(
+                    f'SQLite runtime profile is not active on "{alias}": '
+                    f'{"; ".join(issues)}.',
+                    hint=(
+                        'Keep the SQLITE_PRAGMAS, CONN_MAX_AGE and OPTIONS '
+                        'entries from main/settings.py in DATABASES, and make '
+                        'sure the database directory is writable so WAL can '
+                        'be enabled.'
+                    ),
+                    id='board.W005',
+                )
+            )
+    return warnings
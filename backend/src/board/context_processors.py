@@ -1,19 +1,29 @@
 from django.conf import settings
 from django.urls import reverse
 
-from board.models import SiteSetting, SiteNotice, SiteContentScope, StaticPage
-from board.services.brand_asset_service import BrandAssetService
+from board.services.site_snapshot_service import SiteSnapshotService
 from board.services.site_url_service import SiteUrlService
-from board.services.social_auth_provider_service import SocialAuthProviderService
+from main.middleware.html_minify import HTMLMinifyMiddleware
+
+
+def csrf_placeholder(request):
+    """
+    Render a placeholder instead of the visitor's CSRF token so identical
+    pages produce identical HTML; the minify middleware swaps the real token in.
+    """
+    return {
+        'csrf_token': HTMLMinifyMiddleware.CSRF_TOKEN_PLACEHOLDER,
+    }
 
 
 def oauth_settings(request):
     """
     Add OAuth client IDs to template context
     """
+    client_ids = SiteSnapshotService.get(request).oauth_client_ids
     return {
-        'GOOGLE_OAUTH_CLIENT_ID': SocialAuthProviderService.get_client_id('google'),
-        'GITHUB_OAUTH_CLIENT_ID': SocialAuthProviderService.get_client_id('github'),
+        'GOOGLE_OAUTH_CLIENT_ID': client_ids.get('google', ''),
+        'GITHUB_OAUTH_CLIENT_ID': client_ids.get('github', ''),
     }
 
 
@@ -21,10 +31,10 @@ def site_settings(request):
     """
     Add site-wide settings to template context
     """
-    setting = SiteSetting.get_instance()
+    snapshot = SiteSnapshotService.get(request)
     return {
-        'site_setting': setting,
-        'site_brand': BrandAssetService.public_context(setting),
+        'site_setting': snapshot.site_setting,
+        'site_brand': snapshot.site_brand,
         'site_rss_feed_url': SiteUrlService.absolute_url(request, reverse('site_rss_feed')),
     }
 
@@ -34,10 +44,7 @@ def global_notices(request):
     Add active global notices to template context
     """
     return {
-        'global_notices': SiteNotice.objects.filter(
-            scope=SiteContentScope.GLOBAL,
-            is_active=True,
-        ).order_by('-created_date'),
+        'global_notices': SiteSnapshotService.get(request).global_notices,
     }
 
 
@@ -46,10 +53,7 @@ def footer_pages(request):
     Add published static pages marked for footer display
     """
     return {
-        'footer_pages': StaticPage.objects.filter(
-            is_published=True,
-            show_in_footer=True
-        ).order_by('order', 'slug'),
+        'footer_pages': SiteSnapshotService.get(request).footer_pages,
     }
 
 
@@ -3,9 +3,11 @@ from functools import wraps
 from django.conf import settings
 from django.contrib import messages
 from django.shortcuts import redirect
+from django.utils.cache import get_conditional_response
 
 from board.services.api_permission_service import ApiPermissionService
 from board.services.authoring_permission_service import AuthoringPermissionService
+from board.services.conditional_get_service import ConditionalGetService
 
 def staff_member_required(view_func):
     """
@@ -58,3 +60,38 @@ def editor_required(view_func):
 
         return view_func(request, *args, **kwargs)
     return _wrapped_view
+
+
+def conditional_get(validator):
+    """
+    Answer GET and HEAD requests with 304 Not Modified when the client
+    already holds the current page.
+
+    ``validator`` takes the view arguments and returns the values the page
+    is rendered from (see ``ConditionalGetService``), or None to always run
+    the view. It runs before the view, so it must stay cheap.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            if not ConditionalGetService.is_conditional_request(request):
+                return view_func(request, *args, **kwargs)
+
+            parts = validator(request, *args, **kwargs)
+            if parts is None:
+                return view_func(request, *args, **kwargs)
+
+            etag, last_modified = ConditionalGetService.build_validators(request, parts)
+            response = get_conditional_response(
+                request,
+                etag=etag,
+                last_modified=last_modified,
+            )
+            if response is None:
+                response = view_func(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+            return ConditionalGetService.apply_headers(request, response, etag, last_modified)
+        return _wrapped_view
+
+    return decorator
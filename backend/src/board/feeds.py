@@ -1,16 +1,24 @@
+import hashlib
 import re
 
 from django.contrib.syndication.views import Feed
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
 from django.utils.feedgenerator import Rss201rev2Feed
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
 from django.contrib.auth.models import User
 from django.urls import reverse
 
 from board.models import Post
 from board.modules.time import convert_to_localtime
 from board.services.brand_asset_service import BrandAssetService
+from board.services.public_cache_service import PublicCacheScope, PublicCacheService
 from board.services.public_post_service import PublicPostService
 
 
+CONTROL_CHARACTERS = re.compile(r'[\x00-\x08\x0B-\x0C\x0E-\x1F]')
+
+
 class CorrectMimeTypeFeed(Rss201rev2Feed):
     content_type = 'application/xml'
 
@@ -27,8 +35,54 @@ class ImageRssFeedGenerator(Rss201rev2Feed):
         handler.endElement(u'image')
 
 
-class SitePostsFeed(Feed):
+class CachedFeed(Feed):
+    """
+    Feed whose rendered XML is kept in the public cache.
+
+    Entries depend on ``cache_scopes``, which are bumped when a post is
+    published, edited or hidden. Readers polling an unchanged feed get the
+    cached body, or ``304 Not Modified`` when they send back its ETag or
+    Last-Modified, without touching the database.
+    """
+
+    cache_namespace = ''
+    cache_scopes = (PublicCacheScope.POSTS,)
+
+    def __call__(self, request, *args, **kwargs):
+        rendered = PublicCacheService.get_or_set(
+            self.cache_namespace,
+            [request.build_absolute_uri('/'), *args, *sorted(kwargs.items())],
+            lambda: self.render(request, *args, **kwargs),
+            scopes=self.cache_scopes,
+        )
+
+        response = get_conditional_response(
+            request,
+            etag=rendered['etag'],
+            last_modified=rendered['last_modified'],
+        )
+        if response is None:
+            response = HttpResponse(rendered['content'], content_type=rendered['content_type'])
+
+        response.headers['ETag'] = rendered['etag']
+        if rendered['last_modified']:
+            response.headers['Last-Modified'] = http_date(rendered['last_modified'])
+        return response
+
+    def render(self, request, *args, **kwargs):
+        response = super().__call__(request, *args, **kwargs)
+        return {
+            'content': response.content,
+            'content_type': response['Content-Type'],
+            'etag': quote_etag(hashlib.sha256(response.content).hexdigest()),
+            'last_modified': parse_http_date_safe(response.get('Last-Modified', '')),
+        }
+
+
+class SitePostsFeed(CachedFeed):
     feed_type = CorrectMimeTypeFeed
+    cache_namespace = 'site_feed'
+    cache_scopes = (PublicCacheScope.POSTS, PublicCacheScope.SITE)
 
     link = '/'
 
@@ -39,16 +93,15 @@ class SitePostsFeed(Feed):
         return BrandAssetService.site_description()
 
     def items(self):
-        posts = PublicPostService.filter_public_posts(
+        return PublicPostService.filter_public_posts(
             Post.objects.select_related('author', 'content')
-        ).order_by('-published_date')
-        return posts[:20]
+        ).order_by('-published_date')[:20]
 
     def item_title(self, item):
         return item.title
 
     def item_description(self, item):
-        return re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F]', '', item.content.content_html)
+        return CONTROL_CHARACTERS.sub('', item.content.content_html)
 
     def item_link(self, item):
         return item.get_absolute_url()
@@ -56,15 +109,19 @@ class SitePostsFeed(Feed):
     def item_pubdate(self, item):
         return convert_to_localtime(item.published_date)
 
+    def item_updateddate(self, item):
+        # Lets Last-Modified follow edits as well as new posts.
+        return convert_to_localtime(item.updated_date)
 
-class UserPostsFeed(Feed):
+
+class UserPostsFeed(CachedFeed):
     feed_type = ImageRssFeedGenerator
+    cache_namespace = 'user_feed'
 
     def items(self, item):
-        posts = PublicPostService.filter_public_posts(
+        return PublicPostService.filter_public_posts(
             Post.objects.select_related('author', 'content').filter(author=item)
-        ).order_by('-published_date')
-        return posts[:20]
+        ).order_by('-published_date')[:20]
 
     def get_object(self, request, username):
         return User.objects.select_related('profile').get(username=username)
@@ -88,10 +145,14 @@ class UserPostsFeed(Feed):
         return item.title
 
     def item_description(self, item):
-        return re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F]', '', item.content.content_html)
+        return CONTROL_CHARACTERS.sub('', item.content.content_html)
 
     def item_link(self, item):
         return item.get_absolute_url()
 
     def item_pubdate(self, item):
         return convert_to_localtime(item.published_date)
+
+    def item_updateddate(self, item):
+        # Lets Last-Modified follow edits as well as new posts.
+        return convert_to_localtime(item.updated_date)
@@ -0,0 +1,49 @@
+"""
+Backfill Agent Markdown
+
+Regenerates the stored Markdown renditions served by the ``.md`` agent
+endpoints for posts, series and static pages whose rendition is missing or
+no longer matches its source (rows changed without ``save()`` or saved
+before a converter change).
+
+Usage:
+    python manage.py backfill_agent_markdown [--check] [--batch-size N]
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from board.services.markdown_rendition_service import MarkdownRenditionService
+
+
+class Command(BaseCommand):
+    help = 'Regenerate stale Markdown renditions for agent endpoints'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only report stale renditions and exit with an error if any exist'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Number of rows updated per batch (default: 200)'
+        )
+
+    def handle(self, *args, **options):
+        if options['check']:
+            stale = MarkdownRenditionService.find_stale()
+            for label, ids in stale.items():
+                if ids:
+                    self.stdout.write(f'Stale {label}: {", ".join(map(str, ids))}')
+
+            total = sum(len(ids) for ids in stale.values())
+            if total:
+                raise CommandError(f'Found {total} stale Markdown renditions.')
+            self.stdout.write(self.style.SUCCESS('All Markdown renditions are up to date.'))
+            return
+
+        synced = MarkdownRenditionService.sync_stale(batch_size=options['batch_size'])
+        summary = ', '.join(f'{count} {label}' for label, count in synced.items())
+        self.stdout.write(self.style.SUCCESS(f'Regenerated Markdown renditions: {summary}.'))
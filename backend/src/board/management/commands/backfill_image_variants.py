@@ -0,0 +1,142 @@
+"""
+Backfill Image Variants
+
+Writes the width-stepped AVIF/WebP variants of content images and post
+covers uploaded before they were generated, stores the image sizes on
+``ImageCache`` and ``Post``, then refreshes the display HTML of posts with
+images so it picks up the new ``<picture>`` sources.
+
+Usage:
+    python manage.py backfill_image_variants [--force] [--batch-size N]
+"""
+
+import os
+import re
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from PIL import Image
+
+from board.models import ImageCache, Post, PostContent
+from board.services.image_variant_service import ImageVariantService
+from board.services.post_content_service import PostContentService
+from board.services.public_cache_service import PublicCacheScope, PublicCacheService
+
+
+MEDIA_DIRECTORIES = ('images/content', 'images/title')
+# Uploads are named ``<name>.<ext>``; derivatives append further suffixes.
+ORIGINAL_NAME = re.compile(r'^[^.]+\.[A-Za-z]+$')
+
+
+class Command(BaseCommand):
+    help = 'Generate AVIF/WebP variants for existing content images and post covers'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Regenerate variants that already exist'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Number of rows updated per batch (default: 200)'
+        )
+
+    def handle(self, *args, **options):
+        pending_paths = set(ImageCache.objects.exclude(
+            status=ImageCache.Status.READY,
+        ).values_list('path', flat=True))
+
+        sizes = {}
+        generated = 0
+        for media_path in self.find_originals():
+            if media_path in pending_paths:
+                # The job worker writes these once the upload is processed.
+                continue
+
+            path = os.path.join(settings.MEDIA_ROOT, media_path)
+            try:
+                if options['force'] or not self.has_variants(path):
+                    sizes[media_path] = ImageVariantService.generate(path)
+                    generated += 1
+                else:
+                    with Image.open(path) as image:
+                        sizes[media_path] = image.size
+            except Exception as e:
+                self.stderr.write(f'Skipped {media_path}: {e}')
+
+        updated_images = self.update_sizes(
+            ImageCache.objects.filter(path__in=sizes.keys()).only('id', 'path', 'width', 'height'),
+            'path', ('width', 'height'), sizes, options['batch_size'],
+        )
+        updated_posts = self.update_sizes(
+            Post.objects.filter(image__in=sizes.keys()).only('id', 'image', 'image_width', 'image_height'),
+            'image', ('image_width', 'image_height'), sizes, options['batch_size'],
+        )
+        updated_contents = self.refresh_content_html(options['batch_size'])
+        PublicCacheService.bump(PublicCacheScope.POSTS)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Generated variants for {generated} of {len(sizes)} images; '
+            f'updated sizes of {updated_images} uploads and {updated_posts} covers '
+            f'and the HTML of {updated_contents} posts.'
+        ))
+
+    @staticmethod
+    def find_originals():
+        for directory in MEDIA_DIRECTORIES:
+            for root, _, files in os.walk(os.path.join(settings.MEDIA_ROOT, directory)):
+                for filename in sorted(files):
+                    if ORIGINAL_NAME.match(filename) and ImageVariantService.supports(filename):
+                        yield os.path.relpath(os.path.join(root, filename), settings.MEDIA_ROOT)
+
+    @staticmethod
+    def has_variants(path):
+        return all(
+            os.path.exists(ImageVariantService.variant_path(path, ext))
+            for ext, _, _ in ImageVariantService.get_formats()
+        )
+
+    @staticmethod
+    def update_sizes(queryset, path_field, size_fields, sizes, batch_size):
+        updated = 0
+        batch = []
+        for row in queryset.iterator(chunk_size=batch_size):
+            size = sizes[str(getattr(row, path_field))]
+            if tuple(getattr(row, field) for field in size_fields) == size:
+                continue
+            for field, value in zip(size_fields, size):
+                setattr(row, field, value)
+            batch.append(row)
+            if len(batch) >= batch_size:
+                queryset.model.objects.bulk_update(batch, size_fields)
+                updated += len(batch)
+                batch = []
+
+        if batch:
+            queryset.model.objects.bulk_update(batch, size_fields)
+            updated += len(batch)
+        return updated
+
+    @staticmethod
+    def refresh_content_html(batch_size):
+        contents = PostContent.objects.filter(
+            content_html__contains='<img',
+        ).only('id', 'content_html').order_by('id')
+
+        updated = 0
+        batch = []
+        for post_content in contents.iterator(chunk_size=batch_size):
+            PostContentService.sync_table_of_contents(post_content)
+            batch.append(post_content)
+            if len(batch) >= batch_size:
+                PostContent.objects.bulk_update(batch, ['content_html_with_ids', 'toc'])
+                updated += len(batch)
+                batch = []
+
+        if batch:
+            PostContent.objects.bulk_update(batch, ['content_html_with_ids', 'toc'])
+            updated += len(batch)
+        return updated
@@ -0,0 +1,53 @@
+"""
+Backfill Post Table of Contents
+
+Stores heading-id annotated HTML and the table of contents for posts saved
+before they were precomputed.
+
+Usage:
+    python manage.py backfill_post_toc [--batch-size N] [--all]
+"""
+
+from django.core.management.base import BaseCommand
+
+from board.models import PostContent
+from board.services.post_content_service import PostContentService
+
+
+class Command(BaseCommand):
+    help = 'Precompute table of contents for existing post content'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Number of rows updated per batch (default: 200)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Recompute every post, not only rows without precomputed HTML'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        contents = PostContent.objects.only('id', 'content_html').order_by('id')
+        if not options['all']:
+            contents = contents.filter(content_html_with_ids='').exclude(content_html='')
+
+        updated = 0
+        batch = []
+        for post_content in contents.iterator(chunk_size=batch_size):
+            PostContentService.sync_table_of_contents(post_content)
+            batch.append(post_content)
+            if len(batch) >= batch_size:
+                PostContent.objects.bulk_update(batch, ['content_html_with_ids', 'toc'])
+                updated += len(batch)
+                batch = []
+
+        if batch:
+            PostContent.objects.bulk_update(batch, ['content_html_with_ids', 'toc'])
+            updated += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f'Updated table of contents for {updated} posts.'))
@@ -0,0 +1,86 @@
+"""
+Markdown Rendering Benchmark
+
+Compares building a fresh Markdown renderer per call (the previous
+behaviour) with the pooled renderer, with and without the render cache.
+
+Usage:
+    python manage.py benchmark_markdown [--iterations N]
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from modules.markdown import CustomPostprocessor, MarkdownRendererPool
+
+
+SAMPLE_MARKDOWN = '''# Benchmark Post
+
+Some **bold** text, `inline code`, ==marks== and ~~strikes~~.
+
+## Code
+
+```python
+def hello(name):
+    return f'hello {name}'
+```
+
+| Column | Value |
+| --- | --- |
+| a | 1 |
+| b | 2 |
+
+- [ ] todo
+- [x] done
+
+<center>centered</center>
+
+@youtube[dQw4w9WgXcQ]{16:9}
+'''
+
+
+class Command(BaseCommand):
+    help = 'Measure per-call Markdown rendering cost'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=200,
+            help='Number of renders per scenario (default: 200)'
+        )
+
+    def handle(self, *args, **options):
+        iterations = max(options['iterations'], 1)
+        pool = MarkdownRendererPool()
+
+        def fresh_renderer():
+            renderer = MarkdownRendererPool.create_renderer()
+            return CustomPostprocessor.process(renderer.convert(SAMPLE_MARKDOWN))
+
+        def pooled_renderer():
+            return CustomPostprocessor.process(pool.convert(SAMPLE_MARKDOWN))
+
+        def cached_renderer():
+            return pool.render(SAMPLE_MARKDOWN)
+
+        results = [
+            ('fresh renderer per call', self.measure(fresh_renderer, iterations)),
+            ('pooled renderer', self.measure(pooled_renderer, iterations)),
+            ('pooled renderer + cache', self.measure(cached_renderer, iterations)),
+        ]
+
+        baseline = results[0][1]
+        for label, per_call in results:
+            self.stdout.write(
+                f'{label:<26} {per_call * 1000:8.3f} ms/call  x{baseline / per_call:6.1f}'
+            )
+
+    @staticmethod
+    def measure(render, iterations: int) -> float:
+        render()
+        started_at = time.perf_counter()
+        for _ in range(iterations):
+            render()
+        return (time.perf_counter() - started_at) / iterations
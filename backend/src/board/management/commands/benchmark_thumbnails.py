@@ -0,0 +1,173 @@
+"""
+Thumbnail Generation Benchmark
+
+Compares generating the post cover thumbnail set one type at a time (the
+previous behaviour: one full decode per type) with the single-decode
+generator. Runs on copies of the photos in ``--source``, or on generated
+photos when no directory is given.
+
+Usage:
+    python manage.py benchmark_thumbnails [--source DIR] [--count N] [--size WxH] [--iterations N]
+"""
+
+import os
+import shutil
+import tempfile
+import time
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand, CommandError
+from PIL import Image, ImageFilter
+
+from board.services.post_thumbnail_service import PostThumbnailService
+from modules.thumbnail import make_thumbnail_set
+
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+
+class CorpusImage(str):
+    """Stands in for an ImageFieldFile: its name plus a ``path``."""
+
+    def __new__(cls, path):
+        image = super().__new__(cls, os.path.basename(path))
+        image.path = path
+        return image
+
+
+def generate_per_type(instance):
+    """The previous generator: every type opens and decodes the source."""
+    image_path = instance.image.path
+    ext = str(instance.image).split('.')[-1]
+
+    image = Image.open(image_path)
+    image.convert('RGB').filter(ImageFilter.GaussianBlur(50)).save(
+        f'{image_path}.preview.jpg', quality=50,
+    )
+
+    image = Image.open(image_path)
+    image.thumbnail((750, 750), Image.LANCZOS)
+    image.save(f'{image_path}.minify.{ext}', quality=85)
+
+    image = Image.open(image_path)
+    image.thumbnail((1920, 1920), Image.LANCZOS)
+    image.save(image_path, quality=85)
+
+
+def generate_single_decode(instance):
+    make_thumbnail_set(instance, PostThumbnailService.THUMBNAIL_SET)
+
+
+class Command(BaseCommand):
+    help = 'Measure cover thumbnail generation on a corpus of large photos'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--source',
+            help='Directory of JPEG/PNG photos to use as the corpus'
+        )
+        parser.add_argument(
+            '--count',
+            type=int,
+            default=8,
+            help='Number of photos to generate without --source (default: 8)'
+        )
+        parser.add_argument(
+            '--size',
+            default='6000x4000',
+            help='Size of generated photos (default: 6000x4000)'
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=3,
+            help='Runs per scenario; the fastest one is reported (default: 3)'
+        )
+
+    def handle(self, *args, **options):
+        iterations = max(options['iterations'], 1)
+
+        with tempfile.TemporaryDirectory() as work_dir:
+            corpus_dir = os.path.join(work_dir, 'corpus')
+            os.makedirs(corpus_dir)
+            if options['source']:
+                corpus = self.copy_corpus(options['source'], corpus_dir)
+            else:
+                corpus = self.generate_corpus(corpus_dir, options['count'], options['size'])
+
+            total_pixels = 0
+            for path in corpus:
+                with Image.open(path) as image:
+                    total_pixels += image.width * image.height
+            self.stdout.write(
+                f'{len(corpus)} photos, {total_pixels / len(corpus) / 1_000_000:.1f} MP on average'
+            )
+
+            results = [
+                (label, self.measure(generate, corpus, work_dir, iterations))
+                for label, generate in (
+                    ('per-type decode', generate_per_type),
+                    ('single decode', generate_single_decode),
+                )
+            ]
+
+        baseline = results[0][1]
+        for label, per_photo in results:
+            self.stdout.write(
+                f'{label:<16} {per_photo * 1000:9.1f} ms/photo  x{baseline / per_photo:5.1f}'
+            )
+
+    @staticmethod
+    def copy_corpus(source, corpus_dir):
+        if not os.path.isdir(source):
+            raise CommandError(f'{source} is not a directory')
+
+        corpus = []
+        for name in sorted(os.listdir(source)):
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                path = os.path.join(corpus_dir, name)
+                shutil.copyfile(os.path.join(source, name), path)
+                corpus.append(path)
+
+        if not corpus:
+            raise CommandError(f'No JPEG or PNG photos in {source}')
+        return corpus
+
+    @staticmethod
+    def generate_corpus(corpus_dir, count, size):
+        try:
+            width, height = (int(value) for value in size.lower().split('x'))
+        except ValueError:
+            raise CommandError(f'Invalid size: {size}')
+
+        corpus = []
+        for index in range(max(count, 1)):
+            # Noise compresses and decodes like a detailed photo.
+            image = Image.merge('RGB', [
+                Image.effect_noise((width, height), 64 + index) for _ in range(3)
+            ])
+            path = os.path.join(corpus_dir, f'photo-{index}.jpg')
+            image.save(path, quality=90)
+            corpus.append(path)
+        return corpus
+
+    @staticmethod
+    def measure(generate, corpus, work_dir, iterations):
+        """Fastest time per photo, each run on fresh copies of the corpus."""
+        run_dir = os.path.join(work_dir, 'run')
+        best = None
+        for _ in range(iterations):
+            shutil.rmtree(run_dir, ignore_errors=True)
+            os.makedirs(run_dir)
+            instances = []
+            for path in corpus:
+                copy_path = os.path.join(run_dir, os.path.basename(path))
+                shutil.copyfile(path, copy_path)
+                instances.append(SimpleNamespace(image=CorpusImage(copy_path)))
+
+            started_at = time.perf_counter()
+            for instance in instances:
+                generate(instance)
+            elapsed = (time.perf_counter() - started_at) / len(instances)
+            best = elapsed if best is None else min(best, elapsed)
+        return best
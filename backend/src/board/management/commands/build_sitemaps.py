@@ -0,0 +1,38 @@
+"""
+Build Sitemaps
+
+Writes every sitemap section and the sitemap index as static XML files
+under resources/sitemaps for nginx to serve. Changes to posts, series,
+static pages and authors regenerate only the affected pages through the
+background worker, and reserved posts are added when they are published.
+The container runs this with ``--missing`` on start, which only writes
+sections whose files do not exist yet.
+
+Usage:
+    python manage.py build_sitemaps [--missing]
+"""
+
+from django.core.management.base import BaseCommand
+
+from board.services.sitemap_file_service import SitemapFileService
+
+
+class Command(BaseCommand):
+    help = 'Write the sitemap index and sections as static files'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--missing',
+            action='store_true',
+            help='Only write sections whose files are missing'
+        )
+
+    def handle(self, *args, **options):
+        if not SitemapFileService.is_enabled():
+            self.stdout.write(
+                'Static sitemaps are disabled (set SITE_URL and keep BLEX_STATIC_SITEMAPS enabled).'
+            )
+            return
+
+        written = SitemapFileService.rebuild(missing_only=options['missing'])
+        self.stdout.write(self.style.SUCCESS(f'Wrote {written} sitemap pages.'))
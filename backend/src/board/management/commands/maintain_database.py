@@ -0,0 +1,71 @@
+"""
+Maintain Database
+
+Refreshes SQLite planner statistics (ANALYZE, PRAGMA optimize), releases
+free pages when incremental auto_vacuum is enabled and truncates the WAL
+file. Safe to run while the site is serving requests.
+
+Usage:
+    python manage.py maintain_database [--skip-analyze] [--vacuum-pages N]
+    python manage.py maintain_database --enable-incremental-vacuum
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from board.services.database_maintenance_service import DatabaseMaintenanceService
+
+
+class Command(BaseCommand):
+    help = 'Run SQLite maintenance (ANALYZE, optimize, incremental vacuum, WAL checkpoint)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--skip-analyze',
+            action='store_true',
+            help='Only run PRAGMA optimize instead of a full ANALYZE'
+        )
+        parser.add_argument(
+            '--vacuum-pages',
+            type=int,
+            default=DatabaseMaintenanceService.DEFAULT_VACUUM_PAGES,
+            help=(
+                'Free pages released by incremental vacuum '
+                f'(default: {DatabaseMaintenanceService.DEFAULT_VACUUM_PAGES})'
+            )
+        )
+        parser.add_argument(
+            '--enable-incremental-vacuum',
+            action='store_true',
+            help='Switch to incremental auto_vacuum with a full VACUUM (locks the database while running)'
+        )
+
+    def handle(self, *args, **options):
+        if not DatabaseMaintenanceService.is_sqlite():
+            raise CommandError('maintain_database only supports SQLite.')
+
+        if options['enable_incremental_vacuum']:
+            self.stdout.write('Running VACUUM to enable incremental auto_vacuum...')
+            DatabaseMaintenanceService.enable_incremental_vacuum()
+
+        result = DatabaseMaintenanceService.run(
+            analyze=not options['skip_analyze'],
+            vacuum_pages=options['vacuum_pages'],
+        )
+
+        before, after = result['before'], result['after']
+        self.stdout.write(
+            f'Database size: {before["database_size"]} -> {after["database_size"]} bytes '
+            f'(free {before["free_size"]} -> {after["free_size"]} bytes)'
+        )
+        self.stdout.write(f'WAL size: {before["wal_size"]} -> {after["wal_size"]} bytes')
+        if not result['incremental_vacuum']:
+            self.stdout.write(
+                'Incremental vacuum is disabled; run with --enable-incremental-vacuum once to enable it.'
+            )
+        if result['checkpoint'] and result['checkpoint']['busy']:
+            self.stdout.write(self.style.WARNING('WAL checkpoint was blocked by an active reader.'))
+
+        for issue in DatabaseMaintenanceService.get_profile_issues():
+            self.stdout.write(self.style.WARNING(f'Runtime profile: {issue}'))
+
+        self.stdout.write(self.style.SUCCESS('Database maintenance finished.'))
@@ -0,0 +1,36 @@
+"""
+Rebuild Related Posts
+
+Recomputes the precomputed related-posts index. Run it once after upgrading
+and periodically (e.g. daily from cron) so newly published posts enter
+existing lists and recency scores follow post age.
+
+Usage:
+    python manage.py rebuild_related_posts [--missing]
+"""
+
+from django.core.management.base import BaseCommand
+
+from board.models import Post
+from board.services.related_post_service import RelatedPostService
+
+
+class Command(BaseCommand):
+    help = 'Recompute the related posts index'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--missing',
+            action='store_true',
+            help='Only build lists for posts that have none yet'
+        )
+
+    def handle(self, *args, **options):
+        posts = Post.objects.filter(tags__isnull=False).distinct()
+        if options['missing']:
+            posts = posts.filter(related_entries__isnull=True)
+
+        post_ids = list(posts.values_list('id', flat=True))
+        rebuilt = RelatedPostService.rebuild_many(post_ids)
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt related posts for {rebuilt} posts.'))
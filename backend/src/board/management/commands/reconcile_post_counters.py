@@ -0,0 +1,45 @@
+"""
+Reconcile Post Counters
+
+Repairs drift between the denormalized like/comment counters on posts and
+the actual like and comment rows, e.g. after bulk deletes that skip signals.
+
+Usage:
+    python manage.py reconcile_post_counters [--dry-run] [--batch-size N]
+"""
+
+from django.core.management.base import BaseCommand
+
+from board.services.post_counter_service import PostCounterService
+
+
+class Command(BaseCommand):
+    help = 'Repair drifted like/comment counters on posts'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report drifted posts without updating them'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of rows updated per batch (default: 500)'
+        )
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            drifted_posts = PostCounterService.find_drift()
+            for post in drifted_posts:
+                self.stdout.write(
+                    f'Post {post.id}: '
+                    f'likes {post.like_count} -> {post.actual_like_count}, '
+                    f'comments {post.comment_count} -> {post.actual_comment_count}'
+                )
+            self.stdout.write(f'Found {len(drifted_posts)} posts with drifted counters.')
+            return
+
+        repaired = PostCounterService.reconcile(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Repaired counters for {repaired} posts.'))
@@ -0,0 +1,116 @@
+"""
+Run Background Worker
+
+Processes queued background jobs (webhook deliveries, Telegram messages,
+related posts refreshes, upload derivatives and cover thumbnails). Several
+workers may run against the same database; each job is claimed by exactly
+one of them. Every hour the worker also prunes finished jobs, optimizes the
+database and removes expired upload sessions.
+
+Usage:
+    python manage.py run_worker [--concurrency N] [--poll-interval SECONDS] [--once]
+"""
+
+import logging
+import os
+import signal
+import socket
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+
+from board.services.background_job_service import BackgroundJobService
+from board.services.database_maintenance_service import DatabaseMaintenanceService
+from board.services.upload_session_service import UploadSessionService
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Process queued background jobs'
+
+    PRUNE_INTERVAL_SECONDS = 60 * 60
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=settings.JOB_WORKER_CONCURRENCY,
+            help=f'Number of jobs run in parallel (default: {settings.JOB_WORKER_CONCURRENCY})'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=1.0,
+            help='Seconds to wait when no job is due (default: 1.0)'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit once no job is due instead of polling'
+        )
+
+    def handle(self, *args, **options):
+        concurrency = max(options['concurrency'], 1)
+        worker_id = f'{socket.gethostname()}:{os.getpid()}'
+        self.stopping = False
+        previous_handlers = {
+            signum: signal.signal(signum, self.stop)
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+
+        self.stdout.write(f'Worker {worker_id} started with concurrency {concurrency}')
+        try:
+            processed = self.process_jobs(worker_id, concurrency, options)
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+        self.stdout.write(self.style.SUCCESS(f'Worker {worker_id} stopped after {processed} jobs.'))
+
+    def process_jobs(self, worker_id, concurrency, options):
+        processed = 0
+        next_prune_at = 0.0
+        running = set()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while not self.stopping:
+                if time.monotonic() >= next_prune_at:
+                    BackgroundJobService.prune()
+                    DatabaseMaintenanceService.optimize()
+                    UploadSessionService.collect_expired()
+                    next_prune_at = time.monotonic() + self.PRUNE_INTERVAL_SECONDS
+
+                running = {future for future in running if not future.done()}
+                jobs = BackgroundJobService.claim(worker_id, concurrency - len(running))
+                for job in jobs:
+                    running.add(executor.submit(self.run_job, job))
+                processed += len(jobs)
+
+                if jobs:
+                    continue
+                if running:
+                    wait(running, timeout=options['poll_interval'], return_when=FIRST_COMPLETED)
+                elif options['once']:
+                    break
+                else:
+                    time.sleep(options['poll_interval'])
+
+        return processed
+
+    def stop(self, signum, frame):
+        self.stopping = True
+
+    @staticmethod
+    def run_job(job):
+        close_old_connections()
+        try:
+            BackgroundJobService.run(job)
+        except Exception:
+            # The row stays running until LOCK_TIMEOUT lets a worker claim it again.
+            logger.exception(f'Job {job.id} ({job.task}) could not be recorded')
+        finally:
+            connection.close()
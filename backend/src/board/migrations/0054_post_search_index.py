@@ -0,0 +1,62 @@
+import html
+
+from django.db import OperationalError, migrations
+from django.utils.html import strip_tags
+
+
+TABLE_NAME = 'board_post_search_index'
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+
+    try:
+        schema_editor.execute(
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE_NAME} USING fts5('
+            'title, description, tags, content, '
+            "tokenize='trigram')"
+        )
+    except OperationalError:
+        # SQLite was built without FTS5; search keeps using the scan query.
+        return
+
+    Post = apps.get_model('board', 'Post')
+    PostContent = apps.get_model('board', 'PostContent')
+
+    contents = dict(PostContent.objects.values_list('post_id', 'content_html'))
+    rows = []
+    for post in Post.objects.prefetch_related('tags').iterator(chunk_size=500):
+        rows.append((
+            post.id,
+            post.title or '',
+            post.meta_description or '',
+            ' '.join(tag.value for tag in post.tags.all()),
+            html.unescape(strip_tags(contents.get(post.id) or '')),
+        ))
+
+    if rows:
+        with schema_editor.connection.cursor() as cursor:
+            cursor.executemany(
+                f'INSERT INTO {TABLE_NAME} (rowid, title, description, tags, content) '
+                'VALUES (%s, %s, %s, %s, %s)',
+                rows,
+            )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+
+    schema_editor.execute(f'DROP TABLE IF EXISTS {TABLE_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0053_encrypt_two_factor_auth_secrets'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0054_post_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='postcontent',
+            name='content_html_with_ids',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='postcontent',
+            name='toc',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
@@ -0,0 +1,41 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_post_counters(apps, schema_editor):
+    Post = apps.get_model('board', 'Post')
+    PostLikes = apps.get_model('board', 'PostLikes')
+    Comment = apps.get_model('board', 'Comment')
+
+    def count_for(model):
+        counts = model.objects.filter(
+            post_id=OuterRef('pk'),
+        ).order_by().values('post_id').annotate(count=Count('id')).values('count')
+        return Coalesce(Subquery(counts, output_field=models.IntegerField()), Value(0))
+
+    Post.objects.update(
+        like_count=count_for(PostLikes),
+        comment_count=count_for(Comment),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0055_post_content_toc'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='comment_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='like_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_post_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0056_post_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedPost',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField(default=0)),
+                ('tag_overlap', models.IntegerField(default=0)),
+                ('updated_date', models.DateTimeField(default=django.utils.timezone.now)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_entries', to='board.post')),
+                ('related_post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_from', to='board.post')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['post', 'score'], name='board_relat_post_id_5cba33_idx'), models.Index(fields=['related_post'], name='board_relat_related_f3748d_idx')],
+                'constraints': [models.UniqueConstraint(fields=('post', 'related_post'), name='unique_related_post')],
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0058_background_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='postcontent',
+            name='content_markdown',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='postcontent',
+            name='content_markdown_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='series',
+            name='text_markdown',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='series',
+            name='text_markdown_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='staticpage',
+            name='content_markdown',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='staticpage',
+            name='content_markdown_hash',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0059_agent_markdown_rendition'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='imagecache',
+            name='source_path',
+            field=models.CharField(blank=True, default='', max_length=128),
+        ),
+        migrations.AddField(
+            model_name='imagecache',
+            name='status',
+            field=models.CharField(choices=[('pending', '처리 대기'), ('ready', '완료'), ('failed', '실패')], default='ready', max_length=10),
+        ),
+    ]
@@ -19,6 +19,7 @@ from modules.randomness import randstr
 from board.constants.config_meta import CONFIG_TYPE
 from board.modules.time import time_since, time_stamp
 from board.services.post_content_service import PostContentService
+from board.services.markdown_rendition_service import MarkdownRenditionService
 from board.services.post_thumbnail_service import PostThumbnailService
 from board.services.profile_image_service import ProfileImageService
 from board.services.notification_delivery_service import NotificationDeliveryService
@@ -180,15 +181,56 @@ class Form(models.Model):
 
 
 class ImageCache(models.Model):
+    class Status(models.TextChoices):
+        PENDING = 'pending', '처리 대기'
+        READY = 'ready', '완료'
+        FAILED = 'failed', '실패'
+
     user = models.ForeignKey('auth.User', null=True, on_delete=models.SET_NULL)
     key = models.CharField(max_length=44, unique=True)
     path = models.CharField(max_length=128, unique=True)
+    # Uploaded original while ``path`` is produced from it by the worker
+    # (GIF to MP4, large PNG to JPG). Empty when both are the same file.
+    source_path = models.CharField(max_length=128, blank=True, default='')
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.READY)
     size = models.IntegerField(default=0)
+    # Intrinsic size of ``path`` once resized; 0 for videos and old uploads.
+    width = models.PositiveIntegerField(default=0)
+    height = models.PositiveIntegerField(default=0)
 
     def __str__(self):
         return self.path
 
 
+class UploadSession(models.Model):
+    """Resumable upload; received bytes are appended to a part file until it is completed."""
+
+    user = models.ForeignKey('auth.User', on_delete=models.CASCADE)
+    key = models.CharField(max_length=32, unique=True)
+    file_name = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField()
+    offset = models.PositiveBigIntegerField(default=0)
+    # Hex SHA-256 the completed file must match.
+    sha256 = models.CharField(max_length=64, blank=True, default='')
+    # URL of the stored upload once completed.
+    url = models.CharField(max_length=255, blank=True, default='')
+    created_date = models.DateTimeField(default=timezone.now)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f'{self.file_name} ({self.offset}/{self.size})'
+
+    def to_dict(self):
+        return {
+            'id': self.key,
+            'file_name': self.file_name,
+            'size': self.size,
+            'offset': self.offset,
+            'url': self.url or None,
+            'expires_at': self.expires_at.isoformat(),
+        }
+
+
 class Notify(models.Model):
     user = models.ForeignKey('auth.User', on_delete=models.CASCADE)
     key = models.CharField(max_length=44, unique=True)
@@ -263,12 +305,17 @@ class Post(models.Model):
     url = models.SlugField(max_length=65, unique=True, allow_unicode=True)
     image = models.ImageField(blank=True, upload_to=title_image_path)
     image_hash = models.CharField(max_length=64, blank=True, default='', db_index=True)
+    # Written by the job worker together with the image variants.
+    image_width = models.PositiveIntegerField(default=0)
+    image_height = models.PositiveIntegerField(default=0)
     read_time = models.IntegerField(default=0)
     tags = models.ManyToManyField(Tag, related_name='posts', blank=True)
     created_date = models.DateTimeField(default=timezone.now)
     updated_date = models.DateTimeField(default=timezone.now)
     published_date = models.DateTimeField(null=True, blank=True)
     meta_description = models.CharField(max_length=250, blank=True)
+    like_count = models.IntegerField(default=0)
+    comment_count = models.IntegerField(default=0)
 
     def create_unique_url(self, url=None):
         url = url if url else slugify(self.title, allow_unicode=True)
@@ -335,23 +382,59 @@ class Post(models.Model):
                 return self.image.url
         return self.get_image()
 
+    def get_image_sources(self):
+        if not self.image or not self.image_width:
+            return []
+
+        from board.services.image_variant_service import ImageVariantService
+        return ImageVariantService.get_sources(self.image.url, self.image_width)
+
     def __str__(self):
         return self.title
 
     def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            # Counters are maintained with F() updates by PostCounterService
+            # and image sizes by the job worker; writing back a stale
+            # in-memory value would lose them.
+            skipped_fields = {
+                'like_count', 'comment_count', 'image_width', 'image_height',
+                *self.get_deferred_fields(),
+            }
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.attname not in skipped_fields
+            ]
         will_make_thumbnail = PostThumbnailService.should_generate(self)
         super(Post, self).save(*args, **kwargs)
         if will_make_thumbnail:
-            PostThumbnailService.generate_thumbnail_set(self)
+            PostThumbnailService.schedule(self)
 
 
 class PostContent(models.Model):
     post = models.OneToOneField('board.Post', related_name='content', on_delete=models.CASCADE)
     content_html = models.TextField(blank=True)
+    content_html_with_ids = models.TextField(blank=True, default='')
+    toc = models.JSONField(default=list, blank=True)
+    content_markdown = models.TextField(blank=True, default='')
+    content_markdown_hash = models.CharField(max_length=64, blank=True, default='')
 
     def save(self, *args, **kwargs):
         if self.post and not getattr(self, '_skip_read_time_sync', False):
             PostContentService.sync_parent_read_time(self.post, self.content_html)
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'content_html' in update_fields:
+            PostContentService.sync_table_of_contents(self)
+            MarkdownRenditionService.sync_post_content(self)
+            if update_fields is not None:
+                kwargs['update_fields'] = {
+                    *update_fields,
+                    'content_html_with_ids',
+                    'toc',
+                    'content_markdown',
+                    'content_markdown_hash',
+                }
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -437,6 +520,28 @@ class PostLikes(models.Model):
         return str(self.post)
 
 
+class RelatedPost(models.Model):
+    """Precomputed neighbor of a post, maintained by RelatedPostService."""
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['post', 'related_post'], name='unique_related_post'),
+        ]
+        indexes = [
+            models.Index(fields=['post', 'score']),
+            models.Index(fields=['related_post']),
+        ]
+
+    post = models.ForeignKey('board.Post', related_name='related_entries', on_delete=models.CASCADE)
+    related_post = models.ForeignKey('board.Post', related_name='related_from', on_delete=models.CASCADE)
+    score = models.FloatField(default=0)
+    tag_overlap = models.IntegerField(default=0)
+    updated_date = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f'{self.post} -> {self.related_post}'
+
+
 class UserLinkMeta(models.Model):
     order = models.IntegerField(default=0)
     user = models.ForeignKey('auth.User', on_delete=models.CASCADE)
@@ -536,6 +641,8 @@ class Series(models.Model):
     hide = models.BooleanField(default=False)
     url = models.SlugField(max_length=50, unique=True, allow_unicode=True)
     layout = models.CharField(max_length=5, default='list')
+    text_markdown = models.TextField(blank=True, default='')
+    text_markdown_hash = models.CharField(max_length=64, blank=True, default='')
     created_date = models.DateTimeField(default=timezone.now)
     updated_date = models.DateTimeField(default=timezone.now)
 
@@ -559,6 +666,12 @@ class Series(models.Model):
 
     def save(self, *args, **kwargs):
         SeriesSaveService.prepare_for_save(self)
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or {'text_md', 'text_html'} & set(update_fields):
+            MarkdownRenditionService.sync_series(self)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'text_markdown', 'text_markdown_hash'}
         super(Series, self).save(*args, **kwargs)
 
     def __str__(self):
@@ -1030,6 +1143,8 @@ class StaticPage(models.Model):
                             help_text='URL 경로 (예: about, privacy, terms)')
     title = models.CharField(max_length=200, help_text='페이지 제목')
     content = models.TextField(help_text='페이지 내용 (HTML 지원)')
+    content_markdown = models.TextField(blank=True, default='', editable=False)
+    content_markdown_hash = models.CharField(max_length=64, blank=True, default='', editable=False)
     meta_description = models.CharField(max_length=160, blank=True,
                                         help_text='SEO용 메타 설명 (최대 160자)')
 
@@ -1056,6 +1171,14 @@ class StaticPage(models.Model):
     def get_absolute_url(self):
         return f'/static/{self.slug}/'
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'content' in update_fields:
+            MarkdownRenditionService.sync_static_page(self)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'content_markdown', 'content_markdown_hash'}
+        super().save(*args, **kwargs)
+
 
 class BannerType(models.TextChoices):
     """Banner type choices"""
@@ -1153,3 +1276,42 @@ class AuthorInvite(models.Model):
 
     def __str__(self):
         return self.code
+
+
+class BackgroundJob(models.Model):
+    """Durable job row processed by ``manage.py run_worker``."""
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', '대기'
+        RUNNING = 'running', '실행 중'
+        DONE = 'done', '완료'
+        FAILED = 'failed', '실패'
+
+    task = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    dedup_key = models.CharField(max_length=200, blank=True, default='')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    scheduled_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=100, blank=True, default='')
+    last_error = models.TextField(blank=True, default='')
+    created_date = models.DateTimeField(default=timezone.now)
+    finished_date = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'scheduled_at']),
+            models.Index(fields=['status', 'finished_date']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['dedup_key'],
+                condition=models.Q(status='pending') & ~models.Q(dedup_key=''),
+                name='unique_pending_job_dedup_key',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.task} ({self.status})'
@@ -1,15 +1,119 @@
+import base64
+import datetime
+import json
+
 from django.core.paginator import Paginator as _Paginator
+from django.db.models import Q
 from django.http import Http404
 
-def Paginator(objects, offset, page):
+def Paginator(objects, offset, page, count=None):
     paginator = _Paginator(objects, offset)
+    if count is not None:
+        # Skip the COUNT(*) query when the caller already knows the total.
+        paginator.count = count
 
     try:
         page = int(page)
     except:
         raise Http404
-    
+
     if not page or int(page) > paginator.num_pages or int(page) < 1:
         raise Http404
-    
-    return paginator.get_page(page)
\ No newline at end of file
+
+    return paginator.get_page(page)
+
+
+class CursorPage:
+    """
+    One page of a keyset-paginated listing.
+
+    Iterates like a Django page; ``next_cursor`` and ``prev_cursor`` are
+    opaque tokens (``None`` at either end of the listing).
+    """
+
+    def __init__(self, object_list, next_cursor, prev_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.prev_cursor is not None
+
+
+def encode_cursor(value, pk, direction='next'):
+    payload = json.dumps([value.isoformat(), pk, direction], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Returns (datetime, pk, direction). Raises ValueError for tokens that
+    were not produced by ``encode_cursor``.
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        value, pk, direction = json.loads(payload)
+        value = datetime.datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValueError('Invalid cursor')
+
+    if not isinstance(pk, int) or direction not in ('next', 'prev'):
+        raise ValueError('Invalid cursor')
+    return value, pk, direction
+
+
+def CursorPaginator(objects, offset, cursor, field='published_date'):
+    """
+    Keyset pagination over ``(field, id)`` in descending order.
+
+    Unlike ``Paginator`` this never counts the queryset and every page costs
+    the same no matter how deep it is. An empty cursor returns the first page.
+    """
+    direction = 'next'
+    if cursor:
+        try:
+            value, pk, direction = decode_cursor(cursor)
+        except ValueError:
+            raise Http404
+
+        if direction == 'next':
+            objects = objects.filter(
+                Q(**{f'{field}__lt': value}) | Q(**{field: value, 'id__lt': pk})
+            )
+        else:
+            objects = objects.filter(
+                Q(**{f'{field}__gt': value}) | Q(**{field: value, 'id__gt': pk})
+            )
+
+    if direction == 'next':
+        objects = objects.order_by(f'-{field}', '-id')
+    else:
+        objects = objects.order_by(field, 'id')
+
+    object_list = list(objects[:offset + 1])
+    has_more = len(object_list) > offset
+    object_list = object_list[:offset]
+    if direction == 'prev':
+        object_list.reverse()
+
+    if not object_list:
+        return CursorPage([], None, None)
+
+    first, last = object_list[0], object_list[-1]
+    has_next = has_more if direction == 'next' else True
+    has_prev = bool(cursor) if direction == 'next' else has_more
+
+    return CursorPage(
+        object_list,
+        encode_cursor(getattr(last, field), last.id, 'next') if has_next else None,
+        encode_cursor(getattr(first, field), first.id, 'prev') if has_prev else None,
+    )
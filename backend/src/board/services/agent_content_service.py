@@ -10,8 +10,10 @@ from django.urls import reverse
 
 from board.models import Post, Series, SiteSetting, StaticPage
 from board.services.brand_asset_service import BrandAssetService
+from board.services.markdown_rendition_service import MarkdownRenditionService
 from board.services.public_post_service import PublicPostService
 from board.services.public_series_service import PublicSeriesService
+from board.services.site_snapshot_service import SiteSnapshotService
 from board.services.site_url_service import SiteUrlService
 
 
@@ -31,11 +33,11 @@ class AgentContentService:
 
     @staticmethod
     def is_seo_enabled() -> bool:
-        return SiteSetting.get_instance().seo_enabled
+        return SiteSnapshotService.get().site_setting.seo_enabled
 
     @staticmethod
     def is_aeo_enabled() -> bool:
-        return SiteSetting.get_instance().aeo_enabled
+        return SiteSnapshotService.get().site_setting.aeo_enabled
 
     @staticmethod
     def require_aeo_enabled() -> None:
@@ -222,13 +224,13 @@ class AgentContentService:
 
     @staticmethod
     def build_default_robots_txt(request: HttpRequest, setting: SiteSetting | None = None) -> str:
-        resolved_setting = setting or SiteSetting.get_instance()
+        resolved_setting = setting or SiteSnapshotService.get().site_setting
         lines = AgentContentService.build_default_robots_txt_lines(request, resolved_setting)
         return '\n'.join(lines).strip() + '\n'
 
     @staticmethod
     def build_robots_txt(request: HttpRequest) -> str:
-        setting = SiteSetting.get_instance()
+        setting = SiteSnapshotService.get(request).site_setting
         lines = AgentContentService.build_default_robots_txt_lines(request, setting)
 
         extra_rules = AgentContentService.normalize_robots_txt_extra_rules(
@@ -350,7 +352,7 @@ class AgentContentService:
 
     @staticmethod
     def build_static_page_markdown(page: StaticPage, request: HttpRequest) -> str:
-        content = AgentContentService.html_to_markdown(page.content)
+        content = MarkdownRenditionService.get_static_page_markdown(page)
         source_url = SiteUrlService.absolute_url(request, reverse('static_page', args=[page.slug]))
 
         lines = [
@@ -368,16 +370,11 @@ class AgentContentService:
 
     @staticmethod
     def get_post_content_markdown(post: Post) -> str:
-        return AgentContentService.html_to_markdown(post.content.content_html)
+        return MarkdownRenditionService.get_post_content_markdown(post.content)
 
     @staticmethod
     def get_series_content_markdown(series: Series) -> str:
-        text_md = series.text_md.strip()
-
-        if text_md and not AgentContentService.looks_like_html(text_md):
-            return text_md
-
-        return AgentContentService.html_to_markdown(series.text_html or series.text_md)
+        return MarkdownRenditionService.get_series_markdown(series)
 
     @staticmethod
     def looks_like_html(text: str) -> bool:
@@ -29,7 +29,6 @@ from board.modules.notify import create_notify
 from board.modules.response import ErrorCode
 from modules.randomness import randnum, randstr
 from modules.scrap import download_image
-from modules.sub_task import SubTaskProcessor
 from modules.telegram import TelegramBot
 
 
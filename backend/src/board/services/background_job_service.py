@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import traceback
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from board.models import BackgroundJob
+
+
+logger = logging.getLogger(__name__)
+
+
+class UnknownJobTaskError(Exception):
+    pass
+
+
+class BackgroundJobService:
+    """
+    Database-backed job queue.
+
+    Jobs are inserted in the caller's transaction, so a job only becomes
+    visible to workers once the change that produced it has committed.
+    Workers claim rows with a conditional UPDATE, which works on SQLite and
+    across several worker processes. Failed jobs are retried with
+    exponential backoff until ``max_attempts`` is reached.
+    """
+
+    RETRY_BASE_SECONDS = 10
+    RETRY_MAX_SECONDS = 60 * 60
+    LOCK_TIMEOUT = datetime.timedelta(minutes=15)
+
+    @staticmethod
+    def get_tasks() -> Dict[str, Any]:
+        from board.tasks import TASKS
+        return TASKS
+
+    @staticmethod
+    def enqueue(
+        task: str,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        dedup_key: str = '',
+        run_at: Optional[datetime.datetime] = None,
+        max_attempts: int = 5,
+    ) -> BackgroundJob:
+        """
+        Queue ``task`` with JSON-serializable ``payload``.
+
+        When ``dedup_key`` is given and a pending job with the same key
+        exists, that job is returned instead of queueing a duplicate.
+        """
+        if task not in BackgroundJobService.get_tasks():
+            raise UnknownJobTaskError(task)
+
+        if dedup_key:
+            pending_job = BackgroundJob.objects.filter(
+                dedup_key=dedup_key,
+                status=BackgroundJob.Status.PENDING,
+            ).first()
+            if pending_job:
+                return pending_job
+
+        try:
+            with transaction.atomic():
+                return BackgroundJob.objects.create(
+                    task=task,
+                    payload=payload or {},
+                    dedup_key=dedup_key,
+                    scheduled_at=run_at or timezone.now(),
+                    max_attempts=max_attempts,
+                )
+        except IntegrityError:
+            # Another process queued the same key between the check and insert.
+            return BackgroundJob.objects.get(
+                dedup_key=dedup_key,
+                status=BackgroundJob.Status.PENDING,
+            )
+
+    @staticmethod
+    def claim(worker_id: str, limit: int) -> List[BackgroundJob]:
+        """
+        Claim up to ``limit`` due jobs for ``worker_id``.
+
+        Running jobs whose lock is older than ``LOCK_TIMEOUT`` belonged to a
+        worker that died and are claimed again.
+        """
+        if limit <= 0:
+            return []
+
+        now = timezone.now()
+        candidate_ids = list(BackgroundJob.objects.filter(
+            Q(status=BackgroundJob.Status.PENDING, scheduled_at__lte=now) |
+            Q(status=BackgroundJob.Status.RUNNING, locked_at__lt=now - BackgroundJobService.LOCK_TIMEOUT)
+        ).order_by('scheduled_at', 'id').values_list('id', 'status', 'locked_at')[:limit])
+
+        claimed_ids = []
+        for job_id, status, locked_at in candidate_ids:
+            claimed = BackgroundJob.objects.filter(
+                id=job_id,
+                status=status,
+                locked_at=locked_at,
+            ).update(
+                status=BackgroundJob.Status.RUNNING,
+                locked_at=now,
+                locked_by=worker_id,
+            )
+            if claimed:
+                claimed_ids.append(job_id)
+
+        return list(BackgroundJob.objects.filter(id__in=claimed_ids).order_by('scheduled_at', 'id'))
+
+    @staticmethod
+    def get_retry_delay(attempts: int) -> datetime.timedelta:
+        seconds = BackgroundJobService.RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0))
+        return datetime.timedelta(seconds=min(seconds, BackgroundJobService.RETRY_MAX_SECONDS))
+
+    @staticmethod
+    def run(job: BackgroundJob) -> bool:
+        """
+        Execute a claimed job and record the outcome.
+
+        Returns:
+            True if the task finished without raising
+        """
+        job.attempts += 1
+        try:
+            task = BackgroundJobService.get_tasks().get(job.task)
+            if task is None:
+                raise UnknownJobTaskError(job.task)
+            task(**job.payload)
+        except Exception:
+            job.last_error = traceback.format_exc()
+            if job.attempts >= job.max_attempts:
+                job.status = BackgroundJob.Status.FAILED
+                job.finished_date = timezone.now()
+                logger.error(f'Job {job.id} ({job.task}) failed after {job.attempts} attempts')
+            else:
+                job.status = BackgroundJob.Status.PENDING
+                job.scheduled_at = timezone.now() + BackgroundJobService.get_retry_delay(job.attempts)
+                logger.warning(f'Job {job.id} ({job.task}) failed, retrying at {job.scheduled_at}')
+            succeeded = False
+        else:
+            job.status = BackgroundJob.Status.DONE
+            job.finished_date = timezone.now()
+            succeeded = True
+
+        job.locked_at = None
+        job.locked_by = ''
+        update_fields = [
+            'status', 'attempts', 'scheduled_at', 'locked_at', 'locked_by',
+            'last_error', 'finished_date',
+        ]
+        try:
+            with transaction.atomic():
+                job.save(update_fields=update_fields)
+        except IntegrityError:
+            # A job with the same key was queued while this one ran; it
+            # covers the retry, so this one is closed instead.
+            job.status = BackgroundJob.Status.FAILED
+            job.finished_date = timezone.now()
+            job.last_error += '\nSuperseded by a pending job with the same dedup key.'
+            job.save(update_fields=update_fields)
+            logger.warning(f'Job {job.id} ({job.task}) failed, superseded by a pending job')
+        return succeeded
+
+    @staticmethod
+    def run_pending(worker_id: str = 'inline', limit: int = 100) -> int:
+        """
+        Run due jobs in the current thread until none are left.
+
+        Returns:
+            Number of jobs that were executed
+        """
+        executed = 0
+        while executed < limit:
+            jobs = BackgroundJobService.claim(worker_id, min(10, limit - executed))
+            if not jobs:
+                break
+            for job in jobs:
+                BackgroundJobService.run(job)
+                executed += 1
+        return executed
+
+    @staticmethod
+    def prune(retention_days: Optional[int] = None) -> int:
+        """Delete finished jobs older than the retention window."""
+        if retention_days is None:
+            retention_days = settings.JOB_RETENTION_DAYS
+        deleted, _ = BackgroundJob.objects.filter(
+            status__in=[BackgroundJob.Status.DONE, BackgroundJob.Status.FAILED],
+            finished_date__lt=timezone.now() - datetime.timedelta(days=retention_days),
+        ).delete()
+        return deleted
@@ -7,11 +7,14 @@ from django.contrib.auth.models import User
 from django.db.models import Q
 
 from board.models import SiteBanner, SiteContentScope, BannerType, BannerPosition
+from board.services.public_cache_service import PublicCacheScope, PublicCacheService
 
 
 class BannerService:
     """Service for managing and displaying banners"""
 
+    POSITIONS = ('top', 'bottom', 'left', 'right')
+
     @staticmethod
     def get_combined_banners_for_position(
         author: User,
@@ -40,11 +43,53 @@ class BannerService:
             ).select_related('user').order_by('order', '-created_date')
         )
 
+    @staticmethod
+    def bucket_by_position(banners) -> Dict[str, List[SiteBanner]]:
+        result = {position: [] for position in BannerService.POSITIONS}
+        for banner in banners:
+            if banner.position in result:
+                result[banner.position].append(banner)
+        return result
+
+    @staticmethod
+    def get_global_banners() -> Dict[str, List[SiteBanner]]:
+        """Active global banners by position, shared by every author."""
+        return PublicCacheService.get_or_set(
+            'global_banners',
+            [],
+            lambda: BannerService.bucket_by_position(
+                SiteBanner.objects.filter(
+                    is_active=True,
+                    scope=SiteContentScope.GLOBAL,
+                ).select_related('user').order_by('order', '-created_date')
+            ),
+            scopes=(PublicCacheScope.SITE,),
+        )
+
+    @staticmethod
+    def get_author_banners(author_id: int) -> Dict[str, List[SiteBanner]]:
+        """Active banners of one author by position."""
+        return PublicCacheService.get_or_set(
+            'author_banners',
+            [author_id],
+            lambda: BannerService.bucket_by_position(
+                SiteBanner.objects.filter(
+                    is_active=True,
+                    scope=SiteContentScope.USER,
+                    user_id=author_id,
+                ).select_related('user').order_by('order', '-created_date')
+            ),
+            scopes=(PublicCacheScope.author(author_id),),
+        )
+
     @staticmethod
     def get_all_banners_for_author(author: User) -> Dict[str, List[SiteBanner]]:
         """
         Get all active banners for a post author, including global banners.
 
+        Global and author banners are cached separately; saving a banner
+        bumps the site or author cache scope, which drops the matching entry.
+
         Args:
             author: The post author (User instance)
 
@@ -57,22 +102,13 @@ class BannerService:
                 'right': [...]
             }
         """
-        banners = SiteBanner.objects.filter(
-            is_active=True,
-        ).filter(
-            Q(scope=SiteContentScope.GLOBAL) |
-            Q(scope=SiteContentScope.USER, user=author)
-        ).select_related('user').order_by('order', '-created_date')
+        global_banners = BannerService.get_global_banners()
+        author_banners = BannerService.get_author_banners(author.id)
 
-        result = {
-            'top': [],
-            'bottom': [],
-            'left': [],
-            'right': []
+        return {
+            position: sorted(
+                global_banners[position] + author_banners[position],
+                key=lambda banner: (banner.order, -banner.created_date.timestamp()),
+            )
+            for position in BannerService.POSITIONS
         }
-
-        for banner in banners:
-            if banner.position in result:
-                result[banner.position].append(banner)
-
-        return result
@@ -14,6 +14,7 @@ from django.http import HttpRequest
 from PIL import Image, UnidentifiedImageError
 
 from board.models import SiteSetting
+from board.services.site_snapshot_service import SiteSnapshotService
 from board.services.site_url_service import SiteUrlService
 
 
@@ -66,7 +67,7 @@ class BrandAssetService:
 
     @staticmethod
     def site_name(setting: SiteSetting | None = None) -> str:
-        setting = setting or SiteSetting.get_instance()
+        setting = setting or SiteSnapshotService.get().site_setting
         return (setting.site_name or BrandAssetService.DEFAULT_SITE_NAME).strip()
 
     @staticmethod
@@ -96,7 +97,7 @@ class BrandAssetService:
 
     @staticmethod
     def logo_url(setting: SiteSetting | None = None, *, dark: bool = False) -> str:
-        setting = setting or SiteSetting.get_instance()
+        setting = setting or SiteSnapshotService.get().site_setting
         if dark:
             if logo_dark_url := BrandAssetService.stored_field_url(setting.logo_svg_dark):
                 return logo_dark_url
@@ -110,7 +111,7 @@ class BrandAssetService:
 
     @staticmethod
     def icon_svg_url(setting: SiteSetting | None = None, *, dark: bool = False) -> str:
-        setting = setting or SiteSetting.get_instance()
+        setting = setting or SiteSnapshotService.get().site_setting
         if dark:
             if icon_dark_url := BrandAssetService.stored_field_url(setting.icon_svg_dark):
                 return icon_dark_url
@@ -124,7 +125,7 @@ class BrandAssetService:
 
     @staticmethod
     def icon_png_url(setting: SiteSetting | None, size: int) -> str:
-        setting = setting or SiteSetting.get_instance()
+        setting = setting or SiteSnapshotService.get().site_setting
         path = (setting.icon_manifest or {}).get('png', {}).get(str(size))
         if icon_url := BrandAssetService.stored_media_url(path):
             return icon_url
@@ -134,7 +135,7 @@ class BrandAssetService:
 
     @staticmethod
     def favicon_url(setting: SiteSetting | None = None) -> str:
-        setting = setting or SiteSetting.get_instance()
+        setting = setting or SiteSnapshotService.get().site_setting
         path = (setting.icon_manifest or {}).get('ico')
         if favicon_url := BrandAssetService.stored_media_url(path):
             return favicon_url
@@ -149,7 +150,7 @@ class BrandAssetService:
 
     @staticmethod
     def public_context(setting: SiteSetting | None = None) -> dict[str, Any]:
-        setting = setting or SiteSetting.get_instance()
+        setting = setting or SiteSnapshotService.get().site_setting
         icon_png_urls = {
             str(size): BrandAssetService.icon_png_url(setting, size)
             for size in BrandAssetService.REQUIRED_ICON_PNG_SIZES
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+from typing import Any, List, Optional, Tuple
+
+from django.contrib.auth.models import User
+from django.contrib.messages import get_messages
+from django.db.models import Count, Max, Sum
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+from board.models import Post, Series, StaticPage
+from board.services.post_page_cache_service import PostPageCacheService
+from board.services.public_cache_service import PublicCacheScope, PublicCacheService
+from board.services.public_post_service import PublicPostService
+from board.services.public_series_service import PublicSeriesService
+
+
+class ConditionalGetService:
+    """
+    Cheap validators for ``conditional_get`` views.
+
+    A validator returns the values a page is rendered from (update dates,
+    counters, cache scope versions) or None when the page cannot be
+    validated cheaply. They are hashed together with the request path,
+    visitor and frontend build into a weak ETag, so an unchanged page is
+    answered with 304 before the view runs its queries and renders.
+    """
+
+    build_stamp = None
+
+    @staticmethod
+    def get_build_stamp() -> str:
+        # Pages reference hashed assets, so a new frontend build must not
+        # revalidate pages rendered by the previous one.
+        if ConditionalGetService.build_stamp is None:
+            from board.templatetags.island import get_manifest
+
+            manifest = json.dumps(get_manifest(), sort_keys=True, default=str)
+            ConditionalGetService.build_stamp = hashlib.sha256(manifest.encode()).hexdigest()[:16]
+        return ConditionalGetService.build_stamp
+
+    @staticmethod
+    def is_conditional_request(request: HttpRequest) -> bool:
+        if request.method not in {'GET', 'HEAD'}:
+            return False
+
+        # Flash messages are rendered once; the page must be rendered again.
+        return len(get_messages(request)) == 0
+
+    @staticmethod
+    def build_validators(
+        request: HttpRequest,
+        parts: List[Any],
+    ) -> Tuple[str, Optional[int]]:
+        """
+        Returns the ETag and the Last-Modified timestamp for ``parts``.
+
+        Last-Modified is only offered to anonymous visitors since it cannot
+        tell visitors apart; the ETag includes the visitor.
+        """
+        versions = PublicCacheService.get_versions([PublicCacheScope.SITE])
+        payload = repr((
+            request.get_host(),
+            request.get_full_path(),
+            request.user.id,
+            request.COOKIES.get(PostPageCacheService.THEME_COOKIE, ''),
+            ConditionalGetService.get_build_stamp(),
+            versions,
+            parts,
+        ))
+        etag = 'W/"%s"' % hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+        last_modified = None
+        if not request.user.is_authenticated:
+            dates = [part for part in parts if isinstance(part, datetime.datetime)]
+            if dates:
+                last_modified = int(max(dates).timestamp())
+        return etag, last_modified
+
+    @staticmethod
+    def apply_headers(
+        request: HttpRequest,
+        response: HttpResponse,
+        etag: str,
+        last_modified: Optional[int],
+    ) -> HttpResponse:
+        response.headers.setdefault('ETag', etag)
+        if last_modified is not None:
+            response.headers.setdefault('Last-Modified', http_date(last_modified))
+
+        # Make browsers revalidate instead of reusing pages heuristically.
+        if not response.has_header('Cache-Control'):
+            patch_cache_control(
+                response,
+                no_cache=True,
+                private=request.user.is_authenticated,
+            )
+        patch_vary_headers(response, ('Cookie',))
+        return response
+
+    @staticmethod
+    def summarize_posts(posts) -> List[Any]:
+        summary = PublicPostService.filter_public_posts(posts).aggregate(
+            count=Count('id'),
+            updated_date=Max('updated_date'),
+            like_count=Sum('like_count'),
+            comment_count=Sum('comment_count'),
+        )
+        return [
+            summary['count'],
+            summary['updated_date'],
+            summary['like_count'],
+            summary['comment_count'],
+        ]
+
+    @staticmethod
+    def post_detail(request: HttpRequest, username: str, post_url: str) -> Optional[List[Any]]:
+        post = PostPageCacheService.get_post_values(request, username, post_url)
+        if post is None:
+            # Renamed authors are redirected by the view.
+            return None
+
+        scopes = [PublicCacheScope.post(post['id']), PublicCacheScope.author(post['author_id'])]
+        parts = [
+            post['updated_date'],
+            post,
+            timezone.now() >= post['published_date'] if post['published_date'] else None,
+        ]
+        if post['series_id']:
+            scopes.append(PublicCacheScope.series(post['series_id']))
+            parts += ConditionalGetService.summarize_posts(
+                Post.objects.filter(series_id=post['series_id'])
+            )
+
+        return parts + [PublicCacheService.get_versions(scopes)]
+
+    @staticmethod
+    def series_detail(request: HttpRequest, username: str, series_url: str) -> Optional[List[Any]]:
+        series = PublicSeriesService.filter_public_series(
+            Series.objects.filter(owner__username=username, url=series_url)
+        ).values('id', 'owner_id', 'updated_date').first()
+        if series is None:
+            return None
+
+        return [
+            series['updated_date'],
+            series,
+            *ConditionalGetService.summarize_posts(Post.objects.filter(series_id=series['id'])),
+            PublicCacheService.get_versions([
+                PublicCacheScope.ENGAGEMENT,
+                PublicCacheScope.series(series['id']),
+                PublicCacheScope.author(series['owner_id']),
+            ]),
+        ]
+
+    @staticmethod
+    def tag_detail(request: HttpRequest, name: str) -> Optional[List[Any]]:
+        return [
+            *ConditionalGetService.summarize_posts(Post.objects.filter(tags__value=name)),
+            PublicCacheService.get_versions([PublicCacheScope.ENGAGEMENT]),
+        ]
+
+    @staticmethod
+    def author_overview(request: HttpRequest, username: str) -> Optional[List[Any]]:
+        author = User.objects.filter(
+            username=username,
+        ).values('id', 'first_name').first()
+        if author is None:
+            return None
+
+        series = PublicSeriesService.filter_public_series(
+            Series.objects.filter(owner_id=author['id'])
+        ).aggregate(count=Count('id'), updated_date=Max('updated_date'))
+        return [
+            author['id'],
+            author['first_name'],
+            *ConditionalGetService.summarize_posts(Post.objects.filter(author_id=author['id'])),
+            series['count'],
+            series['updated_date'],
+            PublicCacheService.get_versions([
+                PublicCacheScope.ENGAGEMENT,
+                PublicCacheScope.author(author['id']),
+            ]),
+        ]
+
+    @staticmethod
+    def author_heatmap(request: HttpRequest, username: str) -> Optional[List[Any]]:
+        return [
+            timezone.localdate(),
+            *ConditionalGetService.summarize_posts(Post.objects.filter(author__username=username)),
+        ]
+
+    @staticmethod
+    def post_markdown(request: HttpRequest, username: str, post_url: str) -> Optional[List[Any]]:
+        post = PublicPostService.filter_public_posts(
+            Post.objects.filter(author__username=username, url=post_url)
+        ).values('id', 'updated_date').first()
+        if post is None:
+            return None
+        return [
+            post['updated_date'],
+            post,
+            PublicCacheService.get_versions([PublicCacheScope.post(post['id'])]),
+        ]
+
+    @staticmethod
+    def series_markdown(request: HttpRequest, username: str, series_url: str) -> Optional[List[Any]]:
+        return ConditionalGetService.series_detail(request, username, series_url)
+
+    @staticmethod
+    def static_page_markdown(request: HttpRequest, slug: str) -> Optional[List[Any]]:
+        page = StaticPage.objects.filter(
+            slug=slug,
+            is_published=True,
+        ).values('id', 'updated_date').first()
+        if page is None:
+            return None
+        return [page['updated_date'], page]
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import os
+from typing import List, Optional
+
+from django.db import connections
+
+
+class DatabaseMaintenanceService:
+    """
+    Runtime checks and maintenance for the SQLite database.
+
+    The runtime profile (WAL, busy timeout, mmap, ...) is applied through
+    ``SQLITE_PRAGMAS`` in settings. Maintenance keeps the query planner
+    statistics fresh, returns free pages to the file system when incremental
+    vacuum is enabled and truncates the WAL file so it does not keep growing
+    between automatic checkpoints.
+    """
+
+    DEFAULT_VACUUM_PAGES = 1000
+    AUTO_VACUUM_INCREMENTAL = 2
+
+    @staticmethod
+    def is_sqlite(using: str = 'default') -> bool:
+        return connections[using].vendor == 'sqlite'
+
+    @staticmethod
+    def pragma(name: str, using: str = 'default'):
+        with connections[using].cursor() as cursor:
+            cursor.execute(f'PRAGMA {name}')
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def get_profile_issues(using: str = 'default') -> List[str]:
+        """Describe every part of the runtime profile that is not in effect."""
+        if not DatabaseMaintenanceService.is_sqlite(using):
+            return []
+
+        issues = []
+        journal_mode = str(DatabaseMaintenanceService.pragma('journal_mode', using)).lower()
+        if journal_mode != 'wal':
+            issues.append(f'journal_mode is {journal_mode}, expected wal')
+
+        if not DatabaseMaintenanceService.pragma('busy_timeout', using):
+            issues.append('busy_timeout is not set')
+
+        if not connections[using].settings_dict.get('CONN_MAX_AGE'):
+            issues.append('CONN_MAX_AGE is 0, a new connection is opened for every request')
+
+        return issues
+
+    @staticmethod
+    def get_stats(using: str = 'default') -> dict:
+        if not DatabaseMaintenanceService.is_sqlite(using):
+            return {}
+
+        pragma = DatabaseMaintenanceService.pragma
+        page_size = pragma('page_size', using)
+        database_path = str(connections[using].settings_dict['NAME'])
+        wal_path = f'{database_path}-wal'
+
+        return {
+            'journal_mode': str(pragma('journal_mode', using)).lower(),
+            'auto_vacuum': pragma('auto_vacuum', using),
+            'page_size': page_size,
+            'database_size': pragma('page_count', using) * page_size,
+            'free_size': pragma('freelist_count', using) * page_size,
+            'wal_size': os.path.getsize(wal_path) if os.path.exists(wal_path) else 0,
+        }
+
+    @staticmethod
+    def optimize(using: str = 'default') -> None:
+        """Cheap enough to run every hour from long-lived processes."""
+        if DatabaseMaintenanceService.is_sqlite(using):
+            DatabaseMaintenanceService.pragma('optimize', using)
+
+    @staticmethod
+    def checkpoint(using: str = 'default') -> Optional[dict]:
+        """Copy the WAL back into the database file and truncate it."""
+        if not DatabaseMaintenanceService.is_sqlite(using):
+            return None
+
+        if str(DatabaseMaintenanceService.pragma('journal_mode', using)).lower() != 'wal':
+            return None
+
+        with connections[using].cursor() as cursor:
+            cursor.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            busy, log_pages, checkpointed_pages = cursor.fetchone()
+        return {
+            'busy': bool(busy),
+            'log_pages': log_pages,
+            'checkpointed_pages': checkpointed_pages,
+        }
+
+    @staticmethod
+    def run(
+        analyze: bool = True,
+        vacuum_pages: Optional[int] = None,
+        using: str = 'default',
+    ) -> dict:
+        """
+        Run the full maintenance pass.
+
+        Args:
+            analyze: Rebuild planner statistics for every table
+            vacuum_pages: Free pages to release (incremental auto_vacuum only)
+
+        Returns:
+            Database stats before and after plus the checkpoint result
+        """
+        if not DatabaseMaintenanceService.is_sqlite(using):
+            return {}
+
+        if vacuum_pages is None:
+            vacuum_pages = DatabaseMaintenanceService.DEFAULT_VACUUM_PAGES
+
+        before = DatabaseMaintenanceService.get_stats(using)
+        incremental_vacuum = (
+            before['auto_vacuum'] == DatabaseMaintenanceService.AUTO_VACUUM_INCREMENTAL
+        )
+        with connections[using].cursor() as cursor:
+            if analyze:
+                cursor.execute('ANALYZE')
+            cursor.execute('PRAGMA optimize')
+            if incremental_vacuum:
+                cursor.execute(f'PRAGMA incremental_vacuum({max(int(vacuum_pages), 0)})')
+                cursor.fetchall()
+
+        checkpoint = DatabaseMaintenanceService.checkpoint(using)
+        return {
+            'before': before,
+            'after': DatabaseMaintenanceService.get_stats(using),
+            'analyzed': analyze,
+            'incremental_vacuum': incremental_vacuum,
+            'checkpoint': checkpoint,
+        }
+
+    @staticmethod
+    def enable_incremental_vacuum(using: str = 'default') -> None:
+        """
+        Switch the database to incremental auto_vacuum.
+
+        The mode only takes effect after a full VACUUM, which rewrites the
+        whole file and holds the write lock until it finishes.
+        """
+        if not DatabaseMaintenanceService.is_sqlite(using):
+            return
+
+        with connections[using].cursor() as cursor:
+            cursor.execute('PRAGMA auto_vacuum=INCREMENTAL')
+            cursor.execute('VACUUM')
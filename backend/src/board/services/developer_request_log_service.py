@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+from typing import List, Optional
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import DatabaseError, close_old_connections, connection, transaction
+
+from board.models import DeveloperRequestLog, DeveloperToken
+
+
+logger = logging.getLogger(__name__)
+
+
+class DeveloperRequestLogService:
+    """
+    In-memory buffer of developer API request logs.
+
+    Inserting a log row on every API call adds a write to each request, and
+    SQLite allows a single writer at a time. Logs are kept in a per-process
+    buffer instead and a daemon thread inserts them with ``bulk_create``
+    every ``DEVELOPER_REQUEST_LOG_FLUSH_INTERVAL`` seconds, or sooner once
+    ``BATCH_SIZE`` logs are waiting. The buffer is flushed once more when
+    the process exits normally.
+    """
+
+    BATCH_SIZE = 100
+    MAX_PENDING = 5000
+
+    pending: List[DeveloperRequestLog] = []
+    lock = threading.Lock()
+    wake = threading.Event()
+    flusher: Optional[threading.Thread] = None
+    flusher_pid: Optional[int] = None
+    exit_hook_registered = False
+
+    @staticmethod
+    def get_flush_interval() -> int:
+        return getattr(settings, 'DEVELOPER_REQUEST_LOG_FLUSH_INTERVAL', 0)
+
+    @staticmethod
+    def record(log: DeveloperRequestLog) -> None:
+        if DeveloperRequestLogService.get_flush_interval() <= 0:
+            log.save()
+            return
+
+        with DeveloperRequestLogService.lock:
+            DeveloperRequestLogService.pending.append(log)
+            del DeveloperRequestLogService.pending[:-DeveloperRequestLogService.MAX_PENDING]
+            pending_count = len(DeveloperRequestLogService.pending)
+
+        DeveloperRequestLogService.start_flusher()
+        if pending_count >= DeveloperRequestLogService.BATCH_SIZE:
+            DeveloperRequestLogService.wake.set()
+
+    @staticmethod
+    def start_flusher() -> None:
+        # A forked worker inherits the buffer state but not the thread.
+        pid = os.getpid()
+        if DeveloperRequestLogService.flusher_pid == pid:
+            return
+
+        with DeveloperRequestLogService.lock:
+            if DeveloperRequestLogService.flusher_pid == pid:
+                return
+            DeveloperRequestLogService.flusher = threading.Thread(
+                target=DeveloperRequestLogService.run_flusher,
+                name='developer-request-log-flusher',
+                daemon=True,
+            )
+            DeveloperRequestLogService.flusher.start()
+            DeveloperRequestLogService.flusher_pid = pid
+
+            if not DeveloperRequestLogService.exit_hook_registered:
+                atexit.register(DeveloperRequestLogService.flush)
+                DeveloperRequestLogService.exit_hook_registered = True
+
+    @staticmethod
+    def run_flusher() -> None:
+        while True:
+            DeveloperRequestLogService.wake.wait(DeveloperRequestLogService.get_flush_interval())
+            DeveloperRequestLogService.wake.clear()
+            close_old_connections()
+            try:
+                DeveloperRequestLogService.flush()
+            except Exception:
+                logger.exception('Failed to flush developer request logs')
+            finally:
+                connection.close()
+
+    @staticmethod
+    def drop_orphans(logs: List[DeveloperRequestLog]) -> List[DeveloperRequestLog]:
+        """Skip logs of users deleted while buffered and detach deleted tokens."""
+        user_ids = set(User.objects.filter(
+            id__in={log.user_id for log in logs},
+        ).values_list('id', flat=True))
+        token_ids = set(DeveloperToken.objects.filter(
+            id__in={log.token_id for log in logs if log.token_id},
+        ).values_list('id', flat=True))
+
+        kept = []
+        for log in logs:
+            if log.user_id not in user_ids:
+                continue
+            if log.token_id not in token_ids:
+                log.token = None
+            kept.append(log)
+        return kept
+
+    @staticmethod
+    def insert(logs: List[DeveloperRequestLog]) -> None:
+        with transaction.atomic():
+            DeveloperRequestLog.objects.bulk_create(
+                logs,
+                batch_size=DeveloperRequestLogService.BATCH_SIZE,
+            )
+
+    @staticmethod
+    def flush() -> int:
+        """
+        Insert every buffered log.
+
+        Returns:
+            Number of logs written
+        """
+        with DeveloperRequestLogService.lock:
+            logs = DeveloperRequestLogService.pending
+            DeveloperRequestLogService.pending = []
+
+        if not logs:
+            return 0
+
+        try:
+            logs = DeveloperRequestLogService.drop_orphans(logs)
+            DeveloperRequestLogService.insert(logs)
+        except DatabaseError:
+            # Keep the logs for the next flush, e.g. while the database is locked.
+            with DeveloperRequestLogService.lock:
+                DeveloperRequestLogService.pending = (
+                    logs + DeveloperRequestLogService.pending
+                )[-DeveloperRequestLogService.MAX_PENDING:]
+            raise
+
+        return len(logs)
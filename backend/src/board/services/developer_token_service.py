@@ -1,12 +1,16 @@
 import hashlib
 import secrets
+import time
 from datetime import timedelta
 
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.utils import timezone
 
 from board.models import DeveloperRequestLog, DeveloperToken
 from board.services.authoring_permission_service import AuthoringPermissionService
+from board.services.developer_request_log_service import DeveloperRequestLogService
 
 
 class DeveloperAuthError(Exception):
@@ -22,6 +26,106 @@ class DeveloperTokenService:
     DEFAULT_EXPIRES_DAYS = 90
     MAX_EXPIRES_DAYS = 365
     VALID_SCOPES = {'posts:read', 'posts:write'}
+    CACHE_KEY_PREFIX = 'developer_token'
+
+    @staticmethod
+    def token_cache_key(token_hash):
+        return f'{DeveloperTokenService.CACHE_KEY_PREFIX}:{token_hash}'
+
+    @staticmethod
+    def user_version_key(user_id):
+        return f'{DeveloperTokenService.CACHE_KEY_PREFIX}:user:{user_id}'
+
+    @staticmethod
+    def invalidate_token(token_hash):
+        cache.delete(DeveloperTokenService.token_cache_key(token_hash))
+
+    @staticmethod
+    def invalidate_user(user_id):
+        """
+        Drop every cached token of ``user_id``, e.g. after the user was
+        deactivated or lost the editor role.
+        """
+        cache.set(DeveloperTokenService.user_version_key(user_id), time.time_ns(), None)
+
+    @staticmethod
+    def get_cached_token(token_hash):
+        """
+        Returns the entry of a token verified within
+        ``DEVELOPER_TOKEN_CACHE_TIMEOUT`` seconds, or None. The token still has
+        to pass the validity checks, since it may have expired in the meantime.
+        A request racing with a revocation can cache the old state, but only
+        for the timeout.
+        """
+        timeout = getattr(settings, 'DEVELOPER_TOKEN_CACHE_TIMEOUT', 0)
+        if timeout <= 0:
+            return None
+
+        token_key = DeveloperTokenService.token_cache_key(token_hash)
+        entry = cache.get(token_key)
+        if entry is None:
+            return None
+
+        if cache.get(DeveloperTokenService.user_version_key(entry['user_id'])) != entry['version']:
+            cache.delete(token_key)
+            return None
+        return entry
+
+    @staticmethod
+    def set_cached_token(token):
+        """
+        Cache the fields the checks need, not the token with its user, so
+        the password hash never reaches the cache.
+        """
+        timeout = getattr(settings, 'DEVELOPER_TOKEN_CACHE_TIMEOUT', 0)
+        if timeout <= 0:
+            return
+
+        cache.set(
+            DeveloperTokenService.token_cache_key(token.token_hash),
+            {
+                'version': cache.get(DeveloperTokenService.user_version_key(token.user_id)),
+                'id': token.id,
+                'user_id': token.user_id,
+                'token_hash': token.token_hash,
+                'scopes': token.scopes,
+                'expires_at': token.expires_at,
+                'revoked_at': token.revoked_at,
+                'is_active': token.user.is_active,
+                'is_editor': AuthoringPermissionService.is_active_editor(token.user),
+            },
+            timeout,
+        )
+
+    @staticmethod
+    def token_from_cache(entry):
+        """
+        Build the token of a cache entry. Its other fields and the fields of
+        its user are deferred and loaded when they are accessed.
+        """
+        token_fields = ['id', 'user_id', 'token_hash', 'scopes', 'expires_at', 'revoked_at']
+        token = DeveloperToken.from_db(
+            None, token_fields, [entry[field] for field in token_fields],
+        )
+        token.user = User.from_db(None, ['id', 'is_active'], [entry['user_id'], entry['is_active']])
+        return token
+
+    @staticmethod
+    def touch(request, token):
+        """Record the last use of ``token``, at most once per touch interval."""
+        interval = getattr(settings, 'DEVELOPER_TOKEN_TOUCH_INTERVAL', 0)
+        if interval > 0 and not cache.add(
+            f'{DeveloperTokenService.CACHE_KEY_PREFIX}:touched:{token.id}',
+            True,
+            interval,
+        ):
+            return
+
+        DeveloperToken.objects.filter(id=token.id).update(
+            last_used_at=timezone.now(),
+            last_used_ip=DeveloperTokenService.client_ip(request),
+            updated_date=timezone.now(),
+        )
 
     @staticmethod
     def hash_token(token):
@@ -170,17 +274,23 @@ class DeveloperTokenService:
         token_prefix = DeveloperTokenService.parse_token_prefix(raw_token)
         token_hash = DeveloperTokenService.hash_token(raw_token)
 
-        try:
-            token = DeveloperToken.objects.select_related(
-                'user',
-                'user__profile',
-            ).get(token_prefix=token_prefix)
-        except DeveloperToken.DoesNotExist:
-            raise DeveloperAuthError(
-                'auth.invalid_token',
-                '유효하지 않은 토큰입니다.',
-                401,
-            )
+        entry = DeveloperTokenService.get_cached_token(token_hash)
+        if entry is not None:
+            token = DeveloperTokenService.token_from_cache(entry)
+            is_editor = entry['is_editor']
+        else:
+            try:
+                token = DeveloperToken.objects.select_related(
+                    'user',
+                    'user__profile',
+                ).get(token_prefix=token_prefix)
+            except DeveloperToken.DoesNotExist:
+                raise DeveloperAuthError(
+                    'auth.invalid_token',
+                    '유효하지 않은 토큰입니다.',
+                    401,
+                )
+            is_editor = AuthoringPermissionService.is_active_editor(token.user)
 
         if not secrets.compare_digest(token.token_hash, token_hash):
             raise DeveloperAuthError(
@@ -203,18 +313,16 @@ class DeveloperTokenService:
                 401,
             )
 
-        if not AuthoringPermissionService.is_active_editor(token.user):
+        if not is_editor:
             raise DeveloperAuthError(
                 'auth.editor_required',
                 '개발자 API는 작가 권한이 필요합니다.',
                 403,
             )
 
-        DeveloperToken.objects.filter(id=token.id).update(
-            last_used_at=timezone.now(),
-            last_used_ip=DeveloperTokenService.client_ip(request),
-            updated_date=timezone.now(),
-        )
+        if entry is None:
+            DeveloperTokenService.set_cached_token(token)
+        DeveloperTokenService.touch(request, token)
 
         return token
 
@@ -236,7 +344,7 @@ class DeveloperTokenService:
 
     @staticmethod
     def record_request(request, token, status_code):
-        DeveloperRequestLog.objects.create(
+        DeveloperRequestLogService.record(DeveloperRequestLog(
             user=token.user,
             token=token,
             method=request.method,
@@ -244,4 +352,4 @@ class DeveloperTokenService:
             status_code=status_code,
             ip_address=DeveloperTokenService.client_ip(request),
             user_agent=request.META.get('HTTP_USER_AGENT', '')[:255],
-        )
+        ))
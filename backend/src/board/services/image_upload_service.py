@@ -1,14 +1,17 @@
+import base64
 import datetime
+import hashlib
 import os
 import subprocess
-import traceback
 
 import imageio_ffmpeg
 from django.conf import settings
+from django.core.files.move import file_move_safe
 from PIL import Image, ImageFilter
 
 from board.models import ImageCache
-from modules.hash import get_sha256
+from board.services.background_job_service import BackgroundJobService
+from board.services.image_variant_service import ImageVariantService
 from modules.randomness import randstr
 from modules.sysutil import make_path
 
@@ -21,30 +24,129 @@ class ImageUploadError(Exception):
 
 
 class ImageUploadService:
+    """
+    Content image uploads.
+
+    The request only stores the original and queues ``media.process_upload``.
+    The worker then writes the derivatives (resized image, ``.preview.jpg``,
+    GIF to MP4, AVIF/WebP variants) and marks the ``ImageCache`` row ready.
+    The returned URL is the final one; until the derivatives exist nginx
+    answers with the uploaded original.
+    """
+
     ALLOWED_EXTENSIONS = {'jpg', 'jpeg', 'png', 'gif', 'mp4', 'webm'}
+    PNG_TO_JPG_MIN_SIZE = 1024 * 1024 * 2
+    # Videos are decoded by the worker; the request only checks the container.
+    VIDEO_SIGNATURES = {
+        'mp4': (4, b'ftyp'),
+        'webm': (0, b'\x1a\x45\xdf\xa3'),
+    }
+
+    @staticmethod
+    def get_output_extension(ext, size):
+        if ext == 'gif':
+            return 'mp4'
+        if ext == 'png' and size > ImageUploadService.PNG_TO_JPG_MIN_SIZE:
+            return 'jpg'
+        return ext
+
+    @staticmethod
+    def get_key(digest):
+        return base64.b64encode(digest).decode()
+
+    @staticmethod
+    def find_upload(image_key):
+        """Upload with the same content, unless its processing failed."""
+        return ImageCache.objects.filter(key=image_key).exclude(
+            status=ImageCache.Status.FAILED,
+        ).first()
+
+    @staticmethod
+    def verify_upload(path, ext):
+        """
+        Check the header of the file at ``path`` before it is accepted, so
+        files that are not images or videos never reach the worker.
+        """
+        try:
+            if ext in ImageUploadService.VIDEO_SIGNATURES:
+                offset, signature = ImageUploadService.VIDEO_SIGNATURES[ext]
+                with open(path, 'rb') as file:
+                    file.seek(offset)
+                    if file.read(len(signature)) != signature:
+                        raise ValueError(f'Not a {ext} file')
+            else:
+                with Image.open(path) as image:
+                    image.verify()
+        except Exception:
+            if ext in ImageUploadService.VIDEO_SIGNATURES:
+                raise ImageUploadError('image.upload_failed', '비디오 업로드를 실패했습니다.')
+            raise ImageUploadError('image.upload_failed', '이미지 업로드를 실패했습니다.')
+
+    @staticmethod
+    def write_upload(image, path):
+        """
+        Write ``image`` to ``path`` in a single pass and return its key.
+
+        Uploads hashed by the upload handlers (``sha256_digest``) and spooled
+        to disk are moved into place; anything else is hashed chunk by chunk
+        as it is written, so memory stays bounded by the chunk size.
+        """
+        digest = getattr(image, 'sha256_digest', None)
+        if digest is not None and hasattr(image, 'temporary_file_path'):
+            file_move_safe(image.temporary_file_path(), path, allow_overwrite=True)
+        else:
+            sha256 = hashlib.sha256() if digest is None else None
+            with open(path, 'wb') as destination:
+                for chunk in image.chunks():
+                    if sha256 is not None:
+                        sha256.update(chunk)
+                    destination.write(chunk)
+            if sha256 is not None:
+                digest = sha256.digest()
+
+        if settings.FILE_UPLOAD_PERMISSIONS is not None:
+            os.chmod(path, settings.FILE_UPLOAD_PERMISSIONS)
+        return ImageUploadService.get_key(digest)
 
     @staticmethod
     def upload_content_image(image, user=None):
+        """
+        Store an upload and queue its derivatives.
+
+        The upload is streamed once into a temporary file next to its final
+        name while it is hashed. An identical earlier upload is returned
+        instead (looked up before anything is written when the upload
+        handlers already hashed the file); otherwise the temporary file is
+        renamed into place.
+        """
         if image is None:
             raise ImageUploadError('image.missing', '이미지가 없습니다.')
 
-        image_key = get_sha256(image.read())
-        image.seek(0)
-        image_cache = ImageCache.objects.filter(key=image_key).first()
-
-        if image_cache:
-            return settings.MEDIA_URL + image_cache.path
+        digest = getattr(image, 'sha256_digest', None)
+        if digest is not None:
+            image_cache = ImageUploadService.find_upload(ImageUploadService.get_key(digest))
+            if image_cache:
+                return settings.MEDIA_URL + image_cache.path
 
         ext = str(image).split('.')[-1].lower()
         if ext not in ImageUploadService.ALLOWED_EXTENSIONS:
             raise ImageUploadError('image.invalid_extension', '허용된 확장자가 아닙니다.')
 
-        image_cache = ImageCache(
-            user=user,
-            key=image_key,
-            size=image.size
-        )
+        upload_path, file_name = ImageUploadService.make_upload_path()
+        temp_path = upload_path + '/' + file_name + '.' + ext + '.tmp'
+        try:
+            image_key = ImageUploadService.write_upload(image, temp_path)
+            return ImageUploadService.store_upload(
+                temp_path, upload_path, file_name, ext, image_key, image.size, user,
+            )
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
 
+    @staticmethod
+    def make_upload_path():
+        """Today's content upload directory and a new file name (without extension)."""
         dt = datetime.datetime.now()
         upload_path = make_path([
             'resources',
@@ -55,132 +157,194 @@ class ImageUploadService:
             str(dt.month),
             str(dt.day)
         ])
+        return upload_path, f'{dt.year}{dt.month}{dt.day}{dt.hour}_{randstr(20)}'
 
-        file_name = f'{dt.year}{dt.month}{dt.day}{dt.hour}_{randstr(20)}'
-        with open(upload_path + '/' + file_name + '.' + ext, 'wb+') as destination:
-            for chunk in image.chunks():
-                destination.write(chunk)
+    @staticmethod
+    def store_upload(temp_path, upload_path, file_name, ext, image_key, size, user=None):
+        """
+        Rename the hashed upload at ``temp_path`` to ``<file_name>.<ext>`` in
+        ``upload_path`` and queue its derivatives, or remove it when an
+        identical upload exists. ``temp_path`` must be on the same filesystem
+        and is removed when it is not a valid image or video.
+        Returns the URL of the upload.
+        """
+        image_cache = ImageUploadService.find_upload(image_key)
+        if image_cache:
+            os.remove(temp_path)
+            return settings.MEDIA_URL + image_cache.path
+
+        try:
+            ImageUploadService.verify_upload(temp_path, ext)
+        except ImageUploadError:
+            os.remove(temp_path)
+            raise
+
+        # An identical upload whose processing failed is replaced; its files
+        # are left to the image cleaner.
+        ImageCache.objects.filter(key=image_key, status=ImageCache.Status.FAILED).delete()
+
+        original_path = upload_path + '/' + file_name + '.' + ext
+        os.replace(temp_path, original_path)
+
+        image_cache = ImageCache(
+            user=user,
+            key=image_key,
+            size=size,
+            status=ImageCache.Status.PENDING,
+        )
 
-        ext = ImageUploadService.process_uploaded_file(upload_path, file_name, ext)
-        image_cache.path = upload_path.replace(
-            'resources/media/', ''
-        ) + file_name + '.' + ext
+        media_path = upload_path.replace('resources/media/', '') + file_name
+        output_ext = ImageUploadService.get_output_extension(ext, size)
+        image_cache.path = media_path + '.' + output_ext
+        if output_ext != ext:
+            image_cache.source_path = media_path + '.' + ext
+        if ImageVariantService.supports(image_cache.path):
+            # Known now so posts saved before the worker runs get srcset.
+            image_cache.width, image_cache.height = ImageVariantService.read_size(original_path)
         image_cache.save()
+
+        BackgroundJobService.enqueue(
+            'media.process_upload',
+            {'image_cache_id': image_cache.id},
+            dedup_key=f'media-upload-{image_cache.id}',
+        )
         return settings.MEDIA_URL + image_cache.path
 
     @staticmethod
-    def process_uploaded_file(upload_path, file_name, ext):
+    def process_upload(image_cache_id):
+        """Write the derivatives of an upload. Runs on the background worker."""
+        image_cache = ImageCache.objects.filter(id=image_cache_id).first()
+        if image_cache is None or image_cache.status == ImageCache.Status.READY:
+            return
+
+        source_path = os.path.join(
+            settings.MEDIA_ROOT,
+            image_cache.source_path or image_cache.path,
+        )
+        upload_path = os.path.dirname(source_path)
+        file_name, ext = os.path.basename(source_path).rsplit('.', 1)
+        output_ext = image_cache.path.rsplit('.', 1)[-1]
+
+        try:
+            ImageUploadService.process_uploaded_file(upload_path, file_name, ext, output_ext)
+            if ImageVariantService.supports(image_cache.path):
+                image_cache.width, image_cache.height = ImageVariantService.generate(
+                    os.path.join(settings.MEDIA_ROOT, image_cache.path)
+                )
+        except Exception:
+            image_cache.status = ImageCache.Status.FAILED
+            image_cache.save(update_fields=['status'])
+            raise
+
+        image_cache.status = ImageCache.Status.READY
+        image_cache.source_path = ''
+        image_cache.save(update_fields=['status', 'source_path', 'width', 'height'])
+
+        if output_ext != ext and os.path.exists(source_path):
+            os.remove(source_path)
+
+    @staticmethod
+    def save_image(image, path, **options):
+        # The file may be served while it is rewritten; replace it at once.
+        temp_path = f'{path}.tmp'
+        image_format = Image.registered_extensions()[os.path.splitext(path)[1].lower()]
+        image.save(temp_path, format=image_format, **options)
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def process_uploaded_file(upload_path, file_name, ext, output_ext):
         if ext == 'gif':
-            return ImageUploadService.process_gif(upload_path, file_name, ext)
-        if ext in ['mp4', 'webm']:
+            ImageUploadService.process_gif(upload_path, file_name, ext)
+        elif ext in ['mp4', 'webm']:
             ImageUploadService.process_video(upload_path, file_name, ext)
-            return ext
-        if ext == 'png':
-            return ImageUploadService.process_png(upload_path, file_name, ext)
-        ImageUploadService.process_raster_image(upload_path, file_name, ext)
-        return ext
+        elif ext == 'png':
+            ImageUploadService.process_png(upload_path, file_name, ext, output_ext)
+        else:
+            ImageUploadService.process_raster_image(upload_path, file_name, ext)
 
     @staticmethod
     def process_gif(upload_path, file_name, ext):
-        try:
-            image_path = upload_path + '/' + file_name
-            convert_image = Image.open(
-                image_path + '.' + ext
-            ).convert('RGB')
-            preview_image = convert_image.filter(
-                ImageFilter.GaussianBlur(50)
-            )
-            preview_image.save(
-                image_path + '.mp4.preview.jpg', quality=50
-            )
+        image_path = upload_path + '/' + file_name
+        convert_image = Image.open(
+            image_path + '.' + ext
+        ).convert('RGB')
+        preview_image = convert_image.filter(
+            ImageFilter.GaussianBlur(50)
+        )
+        ImageUploadService.save_image(
+            preview_image, image_path + '.mp4.preview.jpg', quality=50
+        )
 
-            ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
-            subprocess.run([
-                ffmpeg_exe,
-                '-i', f'{upload_path}/{file_name}.gif',
-                '-vf', 'scale=trunc(iw/2)*2:trunc(ih/2)*2',
-                '-c:v', 'libx264',
-                '-pix_fmt', 'yuv420p',
-                '-movflags', '+faststart',
-                f'{upload_path}/{file_name}.mp4'
-            ], check=True)
-            os.remove(f'{upload_path}/{file_name}.gif')
-            return 'mp4'
-        except Exception:
-            raise ImageUploadError('image.upload_failed', '이미지 업로드를 실패했습니다.')
+        ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
+        subprocess.run([
+            ffmpeg_exe,
+            '-y',
+            '-i', f'{upload_path}/{file_name}.gif',
+            '-vf', 'scale=trunc(iw/2)*2:trunc(ih/2)*2',
+            '-c:v', 'libx264',
+            '-pix_fmt', 'yuv420p',
+            '-movflags', '+faststart',
+            '-f', 'mp4',
+            f'{upload_path}/{file_name}.mp4.tmp'
+        ], check=True)
+        os.replace(f'{upload_path}/{file_name}.mp4.tmp', f'{upload_path}/{file_name}.mp4')
 
     @staticmethod
     def process_video(upload_path, file_name, ext):
-        try:
-            video_path = upload_path + '/' + file_name + '.' + ext
-            preview_path = video_path + '.preview.jpg'
-
-            ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
-            subprocess.run([
-                ffmpeg_exe,
-                '-i', video_path,
-                '-ss', '00:00:00',
-                '-vframes', '1',
-                '-vf', 'scale=480:-1',
-                '-q:v', '10',
-                preview_path
-            ], check=True)
-
-            if os.path.exists(preview_path):
-                preview_image = Image.open(preview_path).convert('RGB')
-                preview_image = preview_image.filter(ImageFilter.GaussianBlur(50))
-                preview_image.save(preview_path, quality=50)
-        except Exception:
-            traceback.print_exc()
-            raise ImageUploadError('image.upload_failed', '비디오 업로드를 실패했습니다.')
+        video_path = upload_path + '/' + file_name + '.' + ext
+        preview_path = video_path + '.preview.jpg'
+        frame_path = video_path + '.frame.jpg'
 
-    @staticmethod
-    def process_png(upload_path, file_name, ext):
-        try:
-            image_path = upload_path + '/' + file_name + '.' + ext
-            image_size = os.stat(image_path).st_size
-            resize_image = Image.open(image_path)
+        ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
+        subprocess.run([
+            ffmpeg_exe,
+            '-y',
+            '-i', video_path,
+            '-ss', '00:00:00',
+            '-vframes', '1',
+            '-vf', 'scale=480:-1',
+            '-q:v', '10',
+            frame_path
+        ], check=True)
 
-            if image_size > 1024 * 1024 * 2:
-                resize_image = resize_image.convert('RGB')
-                ext = 'jpg'
+        if os.path.exists(frame_path):
+            preview_image = Image.open(frame_path).convert('RGB')
+            preview_image = preview_image.filter(ImageFilter.GaussianBlur(50))
+            ImageUploadService.save_image(preview_image, preview_path, quality=50)
+            os.remove(frame_path)
 
-            image_path = upload_path + '/' + file_name + '.' + ext
-            resize_image.thumbnail((1920, 1920), Image.LANCZOS)
-            resize_image.save(image_path)
+    @staticmethod
+    def process_png(upload_path, file_name, ext, output_ext):
+        resize_image = Image.open(upload_path + '/' + file_name + '.' + ext)
+        if output_ext == 'jpg':
+            resize_image = resize_image.convert('RGB')
 
-            if ext == 'jpg':
-                os.system(f'rm {upload_path}/{file_name}.png')
+        image_path = upload_path + '/' + file_name + '.' + output_ext
+        resize_image.thumbnail((1920, 1920), Image.LANCZOS)
+        ImageUploadService.save_image(resize_image, image_path)
 
-            if ext == 'png':
-                resize_image = resize_image.convert('RGB')
+        if output_ext == 'png':
+            resize_image = resize_image.convert('RGB')
 
-            preview_image = resize_image.filter(
-                ImageFilter.GaussianBlur(50)
-            )
-            preview_image.save(
-                image_path + '.preview.jpg', quality=50
-            )
-            return ext
-        except Exception:
-            traceback.print_exc()
-            raise ImageUploadError('image.upload_failed', '이미지 업로드를 실패했습니다.')
+        preview_image = resize_image.filter(
+            ImageFilter.GaussianBlur(50)
+        )
+        ImageUploadService.save_image(
+            preview_image, image_path + '.preview.jpg', quality=50
+        )
 
     @staticmethod
     def process_raster_image(upload_path, file_name, ext):
-        try:
-            image_path = upload_path + '/' + file_name + '.' + ext
-            resize_image = Image.open(image_path)
-            resize_image.thumbnail((1920, 1920), Image.LANCZOS)
-            resize_image.save(image_path)
-
-            if ext != 'jpg':
-                resize_image = resize_image.convert('RGB')
-            preview_image = resize_image.filter(
-                ImageFilter.GaussianBlur(50)
-            )
-            preview_image.save(
-                image_path + '.preview.jpg', quality=50
-            )
-        except Exception:
-            raise ImageUploadError('image.upload_failed', '이미지 업로드를 실패했습니다.')
+        image_path = upload_path + '/' + file_name + '.' + ext
+        resize_image = Image.open(image_path)
+        resize_image.thumbnail((1920, 1920), Image.LANCZOS)
+        ImageUploadService.save_image(resize_image, image_path)
+
+        if ext != 'jpg':
+            resize_image = resize_image.convert('RGB')
+        preview_image = resize_image.filter(
+            ImageFilter.GaussianBlur(50)
+        )
+        ImageUploadService.save_image(
+            preview_image, image_path + '.preview.jpg', quality=50
+        )
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from bs4 import BeautifulSoup
+from django.conf import settings
+from PIL import Image, features
+
+from modules.thumbnail import ThumbnailProcessor
+
+
+class ImageVariantService:
+    """
+    Width-stepped AVIF and WebP copies of content images and post covers.
+
+    Next to ``<name>.<ext>`` the job worker writes ``<name>.<ext>.<w>w.avif``
+    (and ``.webp``) for every step of ``WIDTHS`` narrower than the image,
+    plus ``<name>.<ext>.avif`` at the image's own width. The file names
+    follow from the image width alone, so ``srcset`` is written from the
+    width stored at upload time before the files exist; nginx answers with
+    the image itself until then. Formats the installed Pillow cannot encode
+    are skipped.
+    """
+
+    WIDTHS = (480, 960, 1440)
+    # (extension, MIME type, encoder options), preferred format first.
+    FORMATS = (
+        ('avif', 'image/avif', {'quality': 50, 'speed': 8}),
+        ('webp', 'image/webp', {'quality': 75, 'method': 4}),
+    )
+    EXTENSIONS = ('jpg', 'jpeg', 'png')
+    # Uploads and covers are resized to fit this box before variants exist.
+    MAX_SIZE = 1920
+    # The post body column is 56rem wide from the 80rem breakpoint.
+    CONTENT_SIZES = '(min-width: 80rem) 56rem, 100vw'
+
+    @staticmethod
+    def get_formats() -> List[Tuple[str, str, dict]]:
+        return [
+            image_format for image_format in ImageVariantService.FORMATS
+            if features.check(image_format[0])
+        ]
+
+    @staticmethod
+    def supports(path: str) -> bool:
+        return path.rsplit('.', 1)[-1].lower() in ImageVariantService.EXTENSIONS
+
+    @staticmethod
+    def get_widths(width: int) -> List[int]:
+        return [step for step in ImageVariantService.WIDTHS if step < width]
+
+    @staticmethod
+    def variant_path(path: str, ext: str, width: Optional[int] = None) -> str:
+        if width is None:
+            return f'{path}.{ext}'
+        return f'{path}.{width}w.{ext}'
+
+    @staticmethod
+    def variant_suffixes() -> List[str]:
+        """Every suffix a variant file can have, whatever the image width."""
+        return [
+            ImageVariantService.variant_path('', ext, width)
+            for ext, _, _ in ImageVariantService.FORMATS
+            for width in (*ImageVariantService.WIDTHS, None)
+        ]
+
+    @staticmethod
+    def get_sources(url: str, width: int) -> List[Dict[str, str]]:
+        """``<source>`` attributes for the image at ``url`` that is ``width`` wide."""
+        sources = []
+        for ext, mime_type, _ in ImageVariantService.get_formats():
+            candidates = [
+                f'{ImageVariantService.variant_path(url, ext, step)} {step}w'
+                for step in ImageVariantService.get_widths(width)
+            ]
+            candidates.append(f'{ImageVariantService.variant_path(url, ext)} {width}w')
+            sources.append({'type': mime_type, 'srcset': ', '.join(candidates)})
+        return sources
+
+    @staticmethod
+    def read_size(file) -> Tuple[int, int]:
+        """
+        Size ``file`` will have once resized, read from its header only.
+        Returns ``(0, 0)`` when it is not a readable image.
+        """
+        try:
+            with Image.open(file) as image:
+                return ThumbnailProcessor.fit_size(image.size, ImageVariantService.MAX_SIZE)
+        except Exception:
+            return 0, 0
+        finally:
+            if hasattr(file, 'seek'):
+                file.seek(0)
+
+    @staticmethod
+    def generate(path: str) -> Tuple[int, int]:
+        """
+        Write the variants of the image at ``path``.
+
+        Returns:
+            Width and height of the image
+        """
+        with Image.open(path) as image:
+            image.load()
+            if image.mode not in ('RGB', 'RGBA'):
+                has_alpha = image.mode in ('LA', 'PA') or 'transparency' in image.info
+                image = image.convert('RGBA' if has_alpha else 'RGB')
+
+        width, height = image.size
+        outputs = []
+        for step in [*ImageVariantService.get_widths(width), None]:
+            if step is None:
+                resized = image
+            else:
+                resized = image.resize(
+                    (step, max(round(height * step / width), 1)),
+                    Image.LANCZOS,
+                )
+            for ext, _, options in ImageVariantService.get_formats():
+                # Each output gets its own copy since they are saved concurrently.
+                outputs.append((
+                    resized.copy(),
+                    ImageVariantService.variant_path(path, ext, step),
+                    options,
+                ))
+
+        with ThreadPoolExecutor(max_workers=min(len(outputs), os.cpu_count() or 1)) as executor:
+            futures = [
+                executor.submit(ThumbnailProcessor.save, output, output_path, **options)
+                for output, output_path, options in outputs
+            ]
+            for future in futures:
+                future.result()
+
+        return width, height
+
+    @staticmethod
+    def get_media_path(url: str) -> Optional[str]:
+        if not url:
+            return None
+        if url.startswith(settings.MEDIA_URL):
+            return url[len(settings.MEDIA_URL):]
+
+        parsed = urlsplit(url)
+        media_url_path = urlsplit(settings.MEDIA_URL).path
+        if parsed.scheme or parsed.netloc or not parsed.path.startswith(media_url_path):
+            return None
+        return parsed.path[len(media_url_path):]
+
+    @staticmethod
+    def get_sizes(paths: Iterable[str]) -> Dict[str, Tuple[int, int]]:
+        from board.models import ImageCache
+
+        return {
+            path: (width, height)
+            for path, width, height in ImageCache.objects.filter(
+                path__in=set(paths),
+                width__gt=0,
+            ).values_list('path', 'width', 'height')
+        }
+
+    @staticmethod
+    def add_sources(html: str) -> str:
+        """
+        Wrap uploaded images of ``html`` in ``<picture>`` with AVIF/WebP
+        sources and give them their intrinsic size. Lazy images (the
+        ``lazy`` class) get ``data-srcset`` for the lazy loader to swap in.
+        """
+        if not html or '<img' not in html or not ImageVariantService.get_formats():
+            return html
+
+        soup = BeautifulSoup(html, 'html.parser')
+        images = []
+        for img in soup.find_all('img'):
+            if img.parent is not None and img.parent.name == 'picture':
+                continue
+            media_path = ImageVariantService.get_media_path(img.get('data-src') or img.get('src'))
+            if media_path and ImageVariantService.supports(media_path):
+                images.append((img, media_path))
+
+        sizes = ImageVariantService.get_sizes(path for _, path in images)
+        if not sizes:
+            return html
+
+        for img, media_path in images:
+            if media_path not in sizes:
+                continue
+
+            width, height = sizes[media_path]
+            if not img.get('width') and not img.get('height'):
+                img['width'] = str(width)
+                img['height'] = str(height)
+
+            srcset_attribute = 'data-srcset' if 'lazy' in img.get('class', []) else 'srcset'
+            img.wrap(soup.new_tag('picture'))
+            for source in ImageVariantService.get_sources(img.get('data-src') or img['src'], width):
+                img.insert_before(soup.new_tag('source', attrs={
+                    'type': source['type'],
+                    srcset_attribute: source['srcset'],
+                    'sizes': ImageVariantService.CONTENT_SIZES,
+                }))
+
+        return str(soup)
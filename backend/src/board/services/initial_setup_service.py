@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import partial
+
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.db import transaction
@@ -9,6 +11,7 @@ from django.utils.crypto import constant_time_compare
 from board.constants.config_meta import CONFIG_TYPE
 from board.models import Config, Profile, SiteSetting
 from board.services.auth_service import AuthService
+from board.services.public_cache_service import PublicCacheScope, PublicCacheService
 
 
 class InitialSetupBlockedError(Exception):
@@ -68,4 +71,6 @@ class InitialSetupService:
         config.create_or_update_meta(CONFIG_TYPE.NOTIFY_COMMENT_LIKE, 'true')
         AuthService.send_welcome_notification(user)
 
+        # Site snapshots remember that setup was still pending.
+        transaction.on_commit(partial(PublicCacheService.bump, PublicCacheScope.SITE))
         return user
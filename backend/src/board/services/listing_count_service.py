@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from django.core.cache import cache
+from django.db.models import QuerySet
+
+from board.services.public_cache_service import PublicCacheService
+
+
+class ListingCountService:
+    """
+    Total counts for page-number listings.
+
+    Counts are cached under the public cache versions of the scopes a listing
+    depends on, so publishing, hiding or deleting a post invalidates them.
+    Counting stops after ``EXACT_COUNT_LIMIT`` rows past the requested page;
+    beyond that the total is reported as a lower bound that still leaves a
+    next page, so rendering page links never scans the whole result set.
+    """
+
+    NAMESPACE = 'listing_count'
+    EXACT_COUNT_LIMIT = 10000
+
+    @staticmethod
+    def get_count(
+        kind: str,
+        params: Iterable[Any],
+        queryset: QuerySet,
+        scopes: Iterable[str],
+        page: int = 1,
+        per_page: int = 24,
+    ) -> int:
+        """
+        Args:
+            kind: Listing name, e.g. ``index`` or ``tag_detail``
+            params: Filter values that change the result set
+            queryset: Listing queryset
+            scopes: Public cache scopes the listing depends on
+            page: Requested page number
+            per_page: Page size
+
+        Returns:
+            Exact total, or a lower bound when the result set is very large
+        """
+        scopes = tuple(scopes)
+        cache_key = None
+        if PublicCacheService.is_enabled():
+            cache_key = PublicCacheService.build_versioned_key(
+                ListingCountService.NAMESPACE,
+                [kind, *params],
+                scopes,
+            )
+            cached_count = cache.get(cache_key)
+            if cached_count is not None:
+                return cached_count
+
+        start = max(page - 1, 0) * per_page
+        window = ListingCountService.count_window(queryset, start)
+        if window > ListingCountService.EXACT_COUNT_LIMIT:
+            return start + window
+
+        if window == 0 and start > 0:
+            # Past the end; the exact total is unknown but smaller than start.
+            return start
+
+        count = start + window
+        if cache_key:
+            cache.set(cache_key, count, PublicCacheService.resolve_timeout(scopes))
+        return count
+
+    @staticmethod
+    def count_window(queryset: QuerySet, start: int) -> int:
+        limit = ListingCountService.EXACT_COUNT_LIMIT + 1
+        return queryset.order_by().values('pk')[start:start + limit].count()
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from board.models import PostContent, Series, StaticPage
+
+
+class MarkdownRenditionService:
+    """
+    Stored Markdown renditions of post, series and static page content.
+
+    The agent endpoints (``.md`` and ``llms.txt`` links) used to convert HTML
+    to Markdown on every request. The rendition is now produced when the
+    content is saved and stored next to a hash of its source. Readers fall
+    back to converting on the fly when the hash does not match, e.g. after a
+    ``QuerySet.update`` or a converter change (``VERSION``), and
+    ``backfill_agent_markdown`` repairs such rows in bulk.
+    """
+
+    # Bump when the HTML to Markdown conversion changes output.
+    VERSION = 1
+
+    @staticmethod
+    def hash_source(*sources: str) -> str:
+        payload = '\0'.join([str(MarkdownRenditionService.VERSION), *sources])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def html_to_markdown(html: str) -> str:
+        from board.services.agent_content_service import AgentContentService
+        return AgentContentService.html_to_markdown(html)
+
+    @staticmethod
+    def render_series(series: 'Series') -> str:
+        from board.services.agent_content_service import AgentContentService
+
+        text_md = series.text_md.strip()
+        if text_md and not AgentContentService.looks_like_html(text_md):
+            return text_md
+        return AgentContentService.html_to_markdown(series.text_html or series.text_md)
+
+    @staticmethod
+    def sync_post_content(post_content: 'PostContent') -> None:
+        post_content.content_markdown = MarkdownRenditionService.html_to_markdown(
+            post_content.content_html
+        )
+        post_content.content_markdown_hash = MarkdownRenditionService.hash_source(
+            post_content.content_html
+        )
+
+    @staticmethod
+    def sync_series(series: 'Series') -> None:
+        series.text_markdown = MarkdownRenditionService.render_series(series)
+        series.text_markdown_hash = MarkdownRenditionService.hash_source(
+            series.text_md, series.text_html
+        )
+
+    @staticmethod
+    def sync_static_page(page: 'StaticPage') -> None:
+        page.content_markdown = MarkdownRenditionService.html_to_markdown(page.content)
+        page.content_markdown_hash = MarkdownRenditionService.hash_source(page.content)
+
+    @staticmethod
+    def is_post_content_fresh(post_content: 'PostContent') -> bool:
+        return post_content.content_markdown_hash == MarkdownRenditionService.hash_source(
+            post_content.content_html
+        )
+
+    @staticmethod
+    def is_series_fresh(series: 'Series') -> bool:
+        return series.text_markdown_hash == MarkdownRenditionService.hash_source(
+            series.text_md, series.text_html
+        )
+
+    @staticmethod
+    def is_static_page_fresh(page: 'StaticPage') -> bool:
+        return page.content_markdown_hash == MarkdownRenditionService.hash_source(page.content)
+
+    @staticmethod
+    def get_post_content_markdown(post_content: 'PostContent') -> str:
+        if MarkdownRenditionService.is_post_content_fresh(post_content):
+            return post_content.content_markdown
+        return MarkdownRenditionService.html_to_markdown(post_content.content_html)
+
+    @staticmethod
+    def get_series_markdown(series: 'Series') -> str:
+        if MarkdownRenditionService.is_series_fresh(series):
+            return series.text_markdown
+        return MarkdownRenditionService.render_series(series)
+
+    @staticmethod
+    def get_static_page_markdown(page: 'StaticPage') -> str:
+        if MarkdownRenditionService.is_static_page_fresh(page):
+            return page.content_markdown
+        return MarkdownRenditionService.html_to_markdown(page.content)
+
+    @staticmethod
+    def get_targets() -> List[Tuple[str, object, Tuple[str, ...], object, object]]:
+        """(label, queryset, rendition fields, freshness check, sync) per model."""
+        from board.models import PostContent, Series, StaticPage
+
+        return [
+            (
+                'posts',
+                PostContent.objects.only(
+                    'id', 'content_html', 'content_markdown', 'content_markdown_hash',
+                ),
+                ('content_markdown', 'content_markdown_hash'),
+                MarkdownRenditionService.is_post_content_fresh,
+                MarkdownRenditionService.sync_post_content,
+            ),
+            (
+                'series',
+                Series.objects.only(
+                    'id', 'text_md', 'text_html', 'text_markdown', 'text_markdown_hash',
+                ),
+                ('text_markdown', 'text_markdown_hash'),
+                MarkdownRenditionService.is_series_fresh,
+                MarkdownRenditionService.sync_series,
+            ),
+            (
+                'static pages',
+                StaticPage.objects.only(
+                    'id', 'content', 'content_markdown', 'content_markdown_hash',
+                ),
+                ('content_markdown', 'content_markdown_hash'),
+                MarkdownRenditionService.is_static_page_fresh,
+                MarkdownRenditionService.sync_static_page,
+            ),
+        ]
+
+    @staticmethod
+    def find_stale() -> Dict[str, List[int]]:
+        """Return the ids of rows whose rendition does not match their source."""
+        stale = {}
+        for label, queryset, _, is_fresh, _ in MarkdownRenditionService.get_targets():
+            stale[label] = [row.id for row in queryset.iterator() if not is_fresh(row)]
+        return stale
+
+    @staticmethod
+    def sync_stale(batch_size: int = 200) -> Dict[str, int]:
+        """
+        Regenerate stale renditions without calling ``save()``, so no
+        signals fire and ``updated_date`` is left alone.
+
+        Returns:
+            Number of rows regenerated per label
+        """
+        synced = {}
+        for label, queryset, fields, is_fresh, sync in MarkdownRenditionService.get_targets():
+            batch = []
+            synced[label] = 0
+            for row in queryset.iterator():
+                if is_fresh(row):
+                    continue
+                sync(row)
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    queryset.model.objects.bulk_update(batch, fields)
+                    synced[label] += len(batch)
+                    batch = []
+            if batch:
+                queryset.model.objects.bulk_update(batch, fields)
+                synced[label] += len(batch)
+        return synced
@@ -4,7 +4,6 @@ from typing import TYPE_CHECKING
 
 from board.services.integration_setting_service import IntegrationSettingService
 from board.services.site_url_service import SiteUrlService
-from modules.sub_task import SubTaskProcessor
 from modules.telegram import TelegramBot
 
 if TYPE_CHECKING:
@@ -23,12 +22,38 @@ class NotificationDeliveryService:
         if telegram_id == '':
             return
 
+        if not IntegrationSettingService.get_telegram_bot_token():
+            return
+
+        from board.services.background_job_service import BackgroundJobService
+        BackgroundJobService.enqueue('telegram.send_notification', {'notify_id': notify.id})
+
+    @staticmethod
+    def deliver_telegram_notification(notify_id: int) -> None:
+        """
+        Send a queued notification. The chat id and bot token are resolved
+        here so neither is stored in the job payload.
+        """
+        from board.models import Notify
+
+        notify = Notify.objects.select_related('user__telegramsync').filter(id=notify_id).first()
+        if notify is None or not hasattr(notify.user, 'telegramsync'):
+            return
+
+        telegram_id = notify.user.telegramsync.get_decrypted_tid()
         bot_token = IntegrationSettingService.get_telegram_bot_token()
-        if not bot_token:
+        if telegram_id == '' or not bot_token:
             return
 
-        bot = TelegramBot(bot_token)
-        SubTaskProcessor.process(lambda: bot.send_messages(telegram_id, [
+        TelegramBot(bot_token).send_messages(telegram_id, [
             SiteUrlService.configured_absolute_url(str(notify.url)),
             notify.content,
-        ]))
+        ])
+
+    @staticmethod
+    def send_telegram_message(chat_id: int, text: str) -> None:
+        bot_token = IntegrationSettingService.get_telegram_bot_token()
+        if not bot_token:
+            return
+
+        TelegramBot(bot_token).send_message(chat_id, text)
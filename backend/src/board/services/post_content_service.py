@@ -6,7 +6,9 @@ from django.conf import settings
 
 from modules.markdown import parse_post_to_html
 
+from board.html_utils import extract_table_of_contents
 from board.modules.read_time import calc_read_time
+from board.services.image_variant_service import ImageVariantService
 
 
 class PostContentService:
@@ -241,6 +243,27 @@ class PostContentService:
         post.read_time = calc_read_time(content_html)
         post.save()
 
+    @staticmethod
+    def sync_table_of_contents(post_content) -> None:
+        """
+        Store the display HTML (heading ids, responsive image sources) and the
+        ToC derived from content_html.
+        """
+        content_html_with_ids, table_of_contents = extract_table_of_contents(
+            post_content.content_html
+        )
+        post_content.content_html_with_ids = ImageVariantService.add_sources(
+            content_html_with_ids or ''
+        )
+        post_content.toc = table_of_contents
+
+    @staticmethod
+    def get_table_of_contents(post_content) -> tuple[str, list]:
+        """Return the annotated HTML and ToC, parsing only rows that were never synced."""
+        if post_content.content_html and not post_content.content_html_with_ids:
+            return extract_table_of_contents(post_content.content_html)
+        return post_content.content_html_with_ids, post_content.toc
+
     @staticmethod
     def create_for_post(post, content_html: str):
         from board.models import PostContent
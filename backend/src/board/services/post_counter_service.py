@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from board.models import Comment, Post, PostLikes
+
+
+class PostCounterService:
+    """
+    Maintain the denormalized ``like_count``/``comment_count`` columns on Post.
+
+    Likes and comments adjust the counters with single ``UPDATE`` statements
+    inside the transaction that creates or deletes them. Bulk operations that
+    skip model signals can leave drift behind; ``reconcile`` repairs it.
+    """
+
+    COUNTER_FIELDS = ('like_count', 'comment_count')
+    COUNTED_MODELS = {
+        'like_count': PostLikes,
+        'comment_count': Comment,
+    }
+
+    @staticmethod
+    def adjust(post_id: int, field: str, delta: int) -> None:
+        Post.objects.filter(pk=post_id).update(**{field: F(field) + delta})
+
+    @staticmethod
+    def annotate_actual_counts(queryset):
+        annotations = {}
+        for field, model in PostCounterService.COUNTED_MODELS.items():
+            counts = model.objects.filter(
+                post_id=OuterRef('pk'),
+            ).order_by().values('post_id').annotate(count=Count('id')).values('count')
+            annotations[f'actual_{field}'] = Coalesce(
+                Subquery(counts, output_field=IntegerField()),
+                Value(0),
+            )
+        return queryset.annotate(**annotations)
+
+    @staticmethod
+    def find_drift(post_ids: Optional[Iterable[int]] = None) -> list[Post]:
+        """
+        Return posts whose stored counters differ from the related rows, with
+        ``actual_like_count``/``actual_comment_count`` annotated.
+        """
+        posts = Post.objects.all()
+        if post_ids is not None:
+            posts = posts.filter(pk__in=list(post_ids))
+
+        posts = PostCounterService.annotate_actual_counts(
+            posts.only('id', *PostCounterService.COUNTER_FIELDS)
+        )
+        return [
+            post for post in posts.order_by('id').iterator()
+            if any(
+                getattr(post, field) != getattr(post, f'actual_{field}')
+                for field in PostCounterService.COUNTER_FIELDS
+            )
+        ]
+
+    @staticmethod
+    def reconcile(post_ids: Optional[Iterable[int]] = None, batch_size: int = 500) -> int:
+        """
+        Rewrite drifted counters from the related rows.
+
+        Returns:
+            Number of posts that were repaired
+        """
+        drifted_posts = PostCounterService.find_drift(post_ids)
+        for post in drifted_posts:
+            for field in PostCounterService.COUNTER_FIELDS:
+                setattr(post, field, getattr(post, f'actual_{field}'))
+
+        Post.objects.bulk_update(
+            drifted_posts,
+            list(PostCounterService.COUNTER_FIELDS),
+            batch_size=batch_size,
+        )
+        return len(drifted_posts)
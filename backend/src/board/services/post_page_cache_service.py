@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+
+from board.models import Post
+from board.services.public_cache_service import PublicCacheScope, PublicCacheService
+from main.middleware.html_minify import HTMLMinifyMiddleware
+
+
+class PostPageCacheService:
+    """
+    Full-page cache for anonymous post detail renders.
+
+    Pages are stored minified with the CSRF token placeholder still in place;
+    ``HTMLMinifyMiddleware`` substitutes the visitor's own token on the way out.
+    """
+
+    NAMESPACE = 'post_detail_page'
+    CACHED_HEADERS = ('Content-Type', 'Link', 'X-Llms-Txt')
+    THEME_COOKIE = 'blex_theme'
+
+    @staticmethod
+    def is_cacheable_request(request: HttpRequest) -> bool:
+        if not PublicCacheService.is_enabled():
+            return False
+
+        if request.method not in {'GET', 'HEAD'} or request.user.is_authenticated:
+            return False
+
+        # Flash messages are rendered once and must not leak into the cache.
+        return len(get_messages(request)) == 0
+
+    @staticmethod
+    def get_post_values(request: HttpRequest, username: str, post_url: str) -> Optional[dict]:
+        """
+        Fields the cache key and the conditional GET validator are built from,
+        looked up once per request.
+        """
+        lookup = (username, post_url)
+        cached = getattr(request, '_post_page_values', None)
+        if cached is None or cached[0] != lookup:
+            post = Post.objects.filter(
+                author__username=username,
+                url=post_url,
+            ).values(
+                'id', 'author_id', 'series_id', 'updated_date', 'published_date',
+                'like_count', 'comment_count', 'config__hide',
+            ).first()
+            cached = request._post_page_values = (lookup, post)
+        return cached[1]
+
+    @staticmethod
+    def build_cache_key(request: HttpRequest, username: str, post_url: str) -> Optional[str]:
+        post = PostPageCacheService.get_post_values(request, username, post_url)
+        if post is None:
+            return None
+
+        scopes = [
+            PublicCacheScope.SITE,
+            PublicCacheScope.post(post['id']),
+            PublicCacheScope.author(post['author_id']),
+        ]
+        if post['series_id']:
+            scopes.append(PublicCacheScope.series(post['series_id']))
+
+        return PublicCacheService.build_versioned_key(
+            PostPageCacheService.NAMESPACE,
+            [
+                post['id'],
+                post['updated_date'].isoformat(),
+                request.get_host(),
+                request.COOKIES.get(PostPageCacheService.THEME_COOKIE, ''),
+            ],
+            scopes,
+        )
+
+    @staticmethod
+    def get_response(request: HttpRequest, cache_key: str) -> Optional[HttpResponse]:
+        cached_page = cache.get(cache_key)
+        if cached_page is None:
+            return None
+
+        response = HttpResponse(cached_page['content'])
+        for header, value in cached_page['headers'].items():
+            response[header] = value
+        response.minified = True
+        return response
+
+    @staticmethod
+    def store_response(cache_key: str, response: HttpResponse, series_id: Optional[int]) -> None:
+        content, _ = HTMLMinifyMiddleware.minify_html_cached(response.content.decode('utf-8'))
+        response.content = content.encode('utf-8')
+        response.minified = True
+
+        scopes = [PublicCacheScope.series(series_id)] if series_id else []
+        cache.set(
+            cache_key,
+            {
+                'content': response.content,
+                'headers': {
+                    header: response[header]
+                    for header in PostPageCacheService.CACHED_HEADERS
+                    if response.has_header(header)
+                },
+            },
+            PublicCacheService.resolve_timeout(scopes),
+        )
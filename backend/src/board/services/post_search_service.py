@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from typing import Optional, Sequence, Union
+
+from django.db import connection
+from django.db.models import Case, F, IntegerField, Max, Q, QuerySet, Value, When
+
+from board.models import Post
+from board.services.public_post_service import PublicPostService
+from board.services.search_index_service import SearchIndexService
+
+
+class PostSearchResults:
+    """
+    Lazily evaluated, paginator-compatible result set backed by the FTS index.
+
+    ``count()`` and slicing each run a single query against the index so the
+    shared ``Paginator`` can be used unchanged.
+    """
+
+    ordered = True
+
+    def __init__(self, keywords: list[str], username: str = ''):
+        self.keywords = keywords
+        self.username = username
+        self._count: Optional[int] = None
+
+    def _public_post_ids_sql(self) -> tuple[str, tuple]:
+        posts = PublicPostService.filter_public_posts(Post.objects.all())
+        if self.username:
+            posts = posts.filter(author__username=self.username)
+        return posts.values('id').query.sql_with_params()
+
+    def _use_match(self) -> bool:
+        return all(
+            len(keyword) >= SearchIndexService.MIN_MATCH_LENGTH
+            for keyword in self.keywords
+        )
+
+    @staticmethod
+    def _escape_like(keyword: str) -> str:
+        escaped = keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return f'%{escaped}%'
+
+    @staticmethod
+    def _quote_match_term(keyword: str) -> str:
+        return '"' + keyword.replace('"', '""') + '"'
+
+    def _column_hit_sql(self, column: str) -> tuple[str, list]:
+        table = SearchIndexService.TABLE_NAME
+        clauses = ' OR '.join(
+            f"{table}.{column} LIKE %s ESCAPE '\\'" for _ in self.keywords
+        )
+        return f'({clauses})', [self._escape_like(keyword) for keyword in self.keywords]
+
+    def _where_sql(self) -> tuple[str, list]:
+        table = SearchIndexService.TABLE_NAME
+        public_sql, public_params = self._public_post_ids_sql()
+
+        if self._use_match():
+            match_expression = ' OR '.join(
+                self._quote_match_term(keyword) for keyword in self.keywords
+            )
+            where_sql = f'{table} MATCH %s'
+            params: list = [match_expression]
+        else:
+            hits = [self._column_hit_sql(column) for column in SearchIndexService.COLUMNS]
+            where_sql = '(' + ' OR '.join(sql for sql, _ in hits) + ')'
+            params = [param for _, hit_params in hits for param in hit_params]
+
+        where_sql += f' AND {table}.rowid IN ({public_sql})'
+        params.extend(public_params)
+        return where_sql, params
+
+    def count(self) -> int:
+        if self._count is None:
+            where_sql, params = self._where_sql()
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'SELECT COUNT(*) FROM {SearchIndexService.TABLE_NAME} WHERE {where_sql}',
+                    params,
+                )
+                self._count = cursor.fetchone()[0]
+        return self._count
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[Post, list[Post]]:
+        if isinstance(item, int):
+            return self[item:item + 1][0]
+
+        start = item.start or 0
+        stop = item.stop if item.stop is not None else self.count()
+        return self._fetch(offset=start, limit=max(0, stop - start))
+
+    def _fetch(self, offset: int, limit: int) -> list[Post]:
+        if limit == 0:
+            return []
+
+        table = SearchIndexService.TABLE_NAME
+        where_sql, where_params = self._where_sql()
+        hit_columns = [self._column_hit_sql(column) for column in SearchIndexService.COLUMNS]
+
+        if self._use_match():
+            weights = ', '.join(str(weight) for weight in SearchIndexService.COLUMN_WEIGHTS)
+            score_sql = f'-bm25({table}, {weights})'
+            score_params: list = []
+        else:
+            score_sql = ' + '.join(
+                f'(CASE WHEN {sql} THEN {weight} ELSE 0 END)'
+                for (sql, _), weight in zip(hit_columns, PostSearchService.FIELD_SCORES)
+            )
+            score_params = [param for _, params in hit_columns for param in params]
+
+        hits_sql = ', '.join(sql for sql, _ in hit_columns)
+        hits_params = [param for _, params in hit_columns for param in params]
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT {table}.rowid, {score_sql} AS relevance, {hits_sql} '
+                f'FROM {table} INNER JOIN board_post ON board_post.id = {table}.rowid '
+                f'WHERE {where_sql} '
+                'ORDER BY relevance DESC, board_post.published_date DESC '
+                'LIMIT %s OFFSET %s',
+                [*score_params, *hits_params, *where_params, limit, offset],
+            )
+            rows = cursor.fetchall()
+
+        posts = Post.objects.filter(id__in=[row[0] for row in rows]).annotate(
+            author_username=F('author__username'),
+            author_image=F('author__profile__avatar'),
+        ).in_bulk()
+
+        results = []
+        for post_id, relevance, *hits in rows:
+            post = posts.get(post_id)
+            if post is None:
+                continue
+            post.relevance = relevance
+            post.positions = [
+                position
+                for position, hit in zip(PostSearchService.POSITION_LABELS, hits)
+                if hit
+            ]
+            results.append(post)
+        return results
+
+
+class PostSearchService:
+    """Keyword search over public posts."""
+
+    POSITION_LABELS = ('제목', '설명', '태그', '내용')
+    FIELD_SCORES = (100, 40, 30, 10)
+
+    @staticmethod
+    def search(keywords: list[str], username: str = '') -> Union[PostSearchResults, QuerySet[Post]]:
+        """
+        Return public posts matching any keyword, most relevant first.
+
+        Every result carries ``author_username``, ``author_image`` and a
+        ``positions`` list naming the fields that matched.
+        """
+        if SearchIndexService.is_available():
+            return PostSearchResults(keywords, username)
+        return PostSearchService.search_without_index(keywords, username)
+
+    @staticmethod
+    def search_without_index(keywords: list[str], username: str = '') -> QuerySet[Post]:
+        title_match = Q()
+        description_match = Q()
+        tag_match = Q()
+        content_match = Q()
+
+        for keyword in keywords:
+            title_match |= Q(title__icontains=keyword)
+            description_match |= Q(meta_description__icontains=keyword)
+            tag_match |= Q(tags__value__icontains=keyword)
+            content_match |= Q(content__content_html__icontains=keyword)
+
+        search_filter = title_match | description_match | tag_match | content_match
+
+        posts = PublicPostService.filter_public_posts(
+            Post.objects.filter(search_filter)
+        )
+
+        if username:
+            posts = posts.filter(author__username=username)
+
+        title_score, description_score, tag_score, content_score = PostSearchService.FIELD_SCORES
+        return posts.annotate(
+            author_username=F('author__username'),
+            author_image=F('author__profile__avatar'),
+            title_score=PostSearchService._build_score(title_match, title_score),
+            description_score=PostSearchService._build_score(description_match, description_score),
+            tag_score=PostSearchService._build_score(tag_match, tag_score),
+            content_score=PostSearchService._build_score(content_match, content_score),
+        ).annotate(
+            relevance=F('title_score') + F('description_score') + F('tag_score') + F('content_score'),
+        ).distinct().order_by('-relevance', '-published_date')
+
+    @staticmethod
+    def _build_score(match: Q, score: int) -> Max:
+        return Max(
+            Case(
+                When(match, then=Value(score)),
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+        )
+
+    @staticmethod
+    def get_positions(post: Post) -> Sequence[str]:
+        positions = getattr(post, 'positions', None)
+        if positions is not None:
+            return positions
+
+        scores = (
+            post.title_score,
+            post.description_score,
+            post.tag_score,
+            post.content_score,
+        )
+        return [
+            position
+            for position, score in zip(PostSearchService.POSITION_LABELS, scores)
+            if score > 0
+        ]
@@ -6,14 +6,13 @@ Extracted from views to improve testability and reusability.
 """
 
 import hashlib
-import random
 from typing import Optional, Dict, Any, Tuple, List
 from datetime import datetime
 
 from django.contrib.auth.models import User
 from django.db import transaction
 from django.db.models import (
-    Q, F, Case, Exists, When, Value, OuterRef, Count
+    Q, F, Case, Exists, When, Value, OuterRef
 )
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
@@ -272,7 +271,14 @@ class PostService:
 
     @staticmethod
     def _compute_image_hash(image_file) -> str:
-        """Compute SHA-256 hash of an uploaded image file."""
+        """
+        Compute SHA-256 hash of an uploaded image file, reusing the digest
+        taken by the upload handlers while the request was received.
+        """
+        digest = getattr(image_file, 'sha256_digest', None)
+        if digest is not None:
+            return digest.hex()
+
         sha256 = hashlib.sha256()
         image_file.seek(0)
         for chunk in image_file.chunks():
@@ -479,8 +485,8 @@ class PostService:
         ).annotate(
             author_username=F('author__username'),
             author_image=F('author__profile__avatar'),
-            count_likes=Count('likes', distinct=True),
-            count_comments=Count('comments', distinct=True),
+            count_likes=F('like_count'),
+            count_comments=F('comment_count'),
             has_liked=Exists(
                 PostLikes.objects.filter(
                     post__id=OuterRef('id'),
@@ -489,93 +495,6 @@ class PostService:
             ),
         ), author__username=username, url=url)
 
-    @staticmethod
-    def _calculate_tag_score(candidate_tags: set, current_tag_set: set) -> int:
-        """Calculate score based on tag overlap (max 10)."""
-        tag_overlap = len(current_tag_set & candidate_tags)
-        return min(tag_overlap * 3, 10), tag_overlap
-
-    @staticmethod
-    def _calculate_popularity_score(likes_count: int, comments_count: int) -> int:
-        """Calculate score based on engagement (max 10)."""
-        popularity = (likes_count * 2) + comments_count
-        return min(popularity, 10)
-
-    @staticmethod
-    def _calculate_recency_score(created_date, now) -> int:
-        """Calculate score based on post age."""
-        days_old = (now - created_date).days
-        if days_old < 7:
-            return 5
-        elif days_old < 30:
-            return 3
-        elif days_old < 90:
-            return 1
-        return 0
-
-    @staticmethod
-    def get_related_posts(post: Post) -> List[Post]:
-        """
-        Get related posts based on tags and popularity.
-
-        Args:
-            post: Reference post
-
-        Returns:
-            List of related posts
-        """
-        if not post.tags.exists():
-            return []
-
-        current_tags = list(post.tags.values_list('value', flat=True))
-        current_tag_set = set(current_tags)
-
-        candidates = PublicPostService.filter_public_posts(
-            Post.objects.select_related(
-                'author', 'author__profile', 'config'
-            ).prefetch_related('tags').filter(
-                tags__value__in=current_tags,
-            )
-        ).exclude(
-            id=post.id
-        ).annotate(
-            author_username=F('author__username'),
-            author_name=F('author__first_name'),
-            author_image=F('author__profile__avatar'),
-            likes_count=Count('likes', distinct=True),
-            comments_count=Count('comments', distinct=True),
-        ).distinct()
-
-        scored_posts = []
-        now = timezone.now()
-
-        for candidate in candidates:
-            candidate_tags = set(tag.value for tag in candidate.tags.all())
-            tag_score, tag_overlap = PostService._calculate_tag_score(
-                candidate_tags, current_tag_set
-            )
-            popularity_score = PostService._calculate_popularity_score(
-                candidate.likes_count, candidate.comments_count
-            )
-            recency_score = PostService._calculate_recency_score(
-                candidate.published_date, now
-            )
-
-            score = tag_score + popularity_score + recency_score
-            if candidate.author.id == post.author.id:
-                score -= 5
-            score += random.uniform(-3, 3)
-
-            scored_posts.append({
-                'post': candidate,
-                'score': score,
-                'tag_overlap': tag_overlap,
-            })
-
-        scored_posts.sort(key=lambda x: (x['score'], x['tag_overlap']), reverse=True)
-
-        return [x['post'] for x in scored_posts[:8]]
-
     @staticmethod
     @transaction.atomic
     def update_post(
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING
 
-from modules.thumbnail import make_thumbnail
+from modules.thumbnail import ThumbnailSpec, make_thumbnail_set
 
 if TYPE_CHECKING:
     from board.models import Post
@@ -11,6 +12,12 @@ if TYPE_CHECKING:
 class PostThumbnailService:
     """Encapsulates Post title image thumbnail side effects."""
 
+    THUMBNAIL_SET = [
+        ThumbnailSpec(size=750, quality=50, thumbnail_type='preview'),
+        ThumbnailSpec(size=750, quality=85, thumbnail_type='minify'),
+        ThumbnailSpec(size=1920, quality=85),
+    ]
+
     @staticmethod
     def should_generate(post: 'Post') -> bool:
         if getattr(post, '_skip_thumbnail', False):
@@ -25,8 +32,44 @@ class PostThumbnailService:
 
         return saved_post.image != post.image
 
+    @staticmethod
+    def schedule(post: 'Post') -> None:
+        """
+        Queue the thumbnail set of ``post``. Until the worker writes it,
+        nginx serves the uploaded cover in place of its thumbnails.
+        """
+        from board.services.background_job_service import BackgroundJobService
+
+        BackgroundJobService.enqueue(
+            'media.post_thumbnails',
+            {'post_id': post.id},
+            dedup_key=f'post-thumbnails-{post.id}',
+        )
+
+    @staticmethod
+    def generate_for_post(post_id: int) -> None:
+        from board.models import Post
+        from board.services.image_variant_service import ImageVariantService
+        from board.services.public_cache_service import PublicCacheScope, PublicCacheService
+
+        post = Post.objects.filter(id=post_id).first()
+        if not post or not post.image:
+            return
+
+        PostThumbnailService.generate_thumbnail_set(post)
+
+        image_path = post.image.path
+        if not ImageVariantService.supports(image_path) or not os.path.exists(image_path):
+            return
+
+        image_width, image_height = ImageVariantService.generate(image_path)
+        # A queryset update keeps the post's save hooks from firing again.
+        Post.objects.filter(id=post.id, image=post.image.name).update(
+            image_width=image_width,
+            image_height=image_height,
+        )
+        PublicCacheService.bump(PublicCacheScope.POSTS, PublicCacheScope.post(post.id))
+
     @staticmethod
     def generate_thumbnail_set(post: 'Post') -> None:
-        make_thumbnail(post, size=750, quality=50, thumbnail_type='preview')
-        make_thumbnail(post, size=750, quality=85, thumbnail_type='minify')
-        make_thumbnail(post, size=1920, quality=85)
+        make_thumbnail_set(post, PostThumbnailService.THUMBNAIL_SET)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Min
+from django.utils import timezone
+
+from board.models import Post
+
+T = TypeVar('T')
+
+
+class PublicCacheScope:
+    """Version namespaces that public cache entries can depend on."""
+
+    POSTS = 'posts'
+    SERIES = 'series'
+    ENGAGEMENT = 'engagement'
+    SITE = 'site'
+
+    ALL = (POSTS, SERIES, ENGAGEMENT, SITE)
+
+    @staticmethod
+    def post(post_id: int) -> str:
+        return f'post-{post_id}'
+
+    @staticmethod
+    def author(user_id: int) -> str:
+        return f'author-{user_id}'
+
+    @staticmethod
+    def series(series_id: int) -> str:
+        return f'series-{series_id}'
+
+    @staticmethod
+    def lists_posts(scope: str) -> bool:
+        return scope == PublicCacheScope.POSTS or scope.startswith('series-')
+
+
+class PublicCacheService:
+    """
+    Cache-aside helper for public read paths.
+
+    Entries are keyed by the current version of every scope they depend on.
+    Saving a post, series, comment or site setting bumps the matching scope
+    version, so stale entries are never read again and simply expire.
+    """
+
+    KEY_PREFIX = 'public'
+    VERSION_KEY_TEMPLATE = 'public_version:{scope}'
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return PublicCacheService.default_timeout() > 0
+
+    @staticmethod
+    def default_timeout() -> int:
+        return getattr(settings, 'PUBLIC_CACHE_TIMEOUT', 0)
+
+    @staticmethod
+    def get_versions(scopes: Iterable[str]) -> dict[str, int]:
+        scopes = list(scopes)
+        version_keys = {
+            PublicCacheService.VERSION_KEY_TEMPLATE.format(scope=scope): scope
+            for scope in scopes
+        }
+        cached_versions = cache.get_many(version_keys.keys())
+
+        versions = {}
+        for version_key, scope in version_keys.items():
+            version = cached_versions.get(version_key)
+            if version is None:
+                # Seed with a timestamp so an evicted version never falls back
+                # to a number that older entries were stored under.
+                cache.add(version_key, time.time_ns(), None)
+                version = cache.get(version_key)
+            versions[scope] = version
+        return versions
+
+    @staticmethod
+    def bump(*scopes: str) -> None:
+        for scope in scopes:
+            version_key = PublicCacheService.VERSION_KEY_TEMPLATE.format(scope=scope)
+            try:
+                cache.incr(version_key)
+            except ValueError:
+                cache.set(version_key, time.time_ns(), None)
+
+    @staticmethod
+    def build_key(namespace: str, parts: Iterable[Any], versions: dict[str, int]) -> str:
+        version_stamp = '.'.join(f'{scope}{versions[scope]}' for scope in sorted(versions))
+        digest = hashlib.sha256(repr(tuple(parts)).encode()).hexdigest()
+        return f'{PublicCacheService.KEY_PREFIX}:{namespace}:{version_stamp}:{digest}'
+
+    @staticmethod
+    def get_or_set(
+        namespace: str,
+        parts: Iterable[Any],
+        builder: Callable[[], T],
+        scopes: Iterable[str] = PublicCacheScope.ALL,
+        timeout: Optional[int] = None,
+    ) -> T:
+        """
+        Return the cached value for ``namespace``/``parts`` or build and store it.
+
+        ``builder`` must return a picklable value. Exceptions raised by the
+        builder (for example ``Http404``) propagate and nothing is cached.
+        """
+        if not PublicCacheService.is_enabled():
+            return builder()
+
+        scopes = tuple(scopes)
+        key = PublicCacheService.build_versioned_key(namespace, parts, scopes)
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+        value = builder()
+        cache.set(key, value, PublicCacheService.resolve_timeout(scopes, timeout))
+        return value
+
+    @staticmethod
+    def build_versioned_key(namespace: str, parts: Iterable[Any], scopes: Iterable[str]) -> str:
+        return PublicCacheService.build_key(
+            namespace,
+            parts,
+            PublicCacheService.get_versions(scopes),
+        )
+
+    @staticmethod
+    def resolve_timeout(scopes: Iterable[str], timeout: Optional[int] = None) -> int:
+        if timeout is None:
+            timeout = PublicCacheService.default_timeout()
+
+        if not any(PublicCacheScope.lists_posts(scope) for scope in scopes):
+            return timeout
+
+        # Scheduled posts become public without a save, so entries that list
+        # posts must not outlive the next scheduled publish time.
+        next_publish_date = Post.objects.filter(
+            published_date__gt=timezone.now(),
+        ).aggregate(next_publish_date=Min('published_date'))['next_publish_date']
+        if next_publish_date is None:
+            return timeout
+
+        seconds_until_publish = int((next_publish_date - timezone.now()).total_seconds()) + 1
+        return max(1, min(timeout, seconds_until_publish))
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import random
+from typing import Iterable, List
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from board.models import Post, RelatedPost
+from board.services.public_post_service import PublicPostService
+
+
+class RelatedPostService:
+    """
+    Precomputed related-posts index.
+
+    Each post keeps its top ``NEIGHBOR_COUNT`` candidates with a deterministic
+    score (tag overlap, popularity, recency, same-author penalty). Requests
+    only re-check visibility and add random jitter, so lists are rebuilt when
+    tags change and periodically through ``rebuild_related_posts`` to pick up
+    new posts and age-based recency.
+    """
+
+    NEIGHBOR_COUNT = 16
+    RESULT_COUNT = 8
+    JITTER = 3
+    SAME_AUTHOR_PENALTY = 5
+
+    @staticmethod
+    def calculate_tag_score(tag_overlap: int) -> int:
+        """Calculate score based on tag overlap (max 10)."""
+        return min(tag_overlap * 3, 10)
+
+    @staticmethod
+    def calculate_popularity_score(likes_count: int, comments_count: int) -> int:
+        """Calculate score based on engagement (max 10)."""
+        popularity = (likes_count * 2) + comments_count
+        return min(popularity, 10)
+
+    @staticmethod
+    def calculate_recency_score(published_date, now) -> int:
+        """Calculate score based on post age."""
+        days_old = (now - published_date).days
+        if days_old < 7:
+            return 5
+        elif days_old < 30:
+            return 3
+        elif days_old < 90:
+            return 1
+        return 0
+
+    @staticmethod
+    def score_candidates(post: Post) -> List[RelatedPost]:
+        """
+        Score public posts sharing a tag with ``post`` and return the best
+        ``NEIGHBOR_COUNT`` as unsaved rows.
+        """
+        tag_ids = list(post.tags.values_list('id', flat=True))
+        if not tag_ids:
+            return []
+
+        candidates = PublicPostService.filter_public_posts(
+            Post.objects.filter(tags__id__in=tag_ids)
+        ).exclude(
+            id=post.id
+        ).values(
+            'id', 'author_id', 'published_date', 'like_count', 'comment_count',
+        ).annotate(
+            tag_overlap=Count('tags', filter=Q(tags__id__in=tag_ids), distinct=True),
+        ).order_by()
+
+        now = timezone.now()
+        entries = []
+        for candidate in candidates:
+            score = (
+                RelatedPostService.calculate_tag_score(candidate['tag_overlap'])
+                + RelatedPostService.calculate_popularity_score(
+                    candidate['like_count'], candidate['comment_count']
+                )
+                + RelatedPostService.calculate_recency_score(candidate['published_date'], now)
+            )
+            if candidate['author_id'] == post.author_id:
+                score -= RelatedPostService.SAME_AUTHOR_PENALTY
+
+            entries.append(RelatedPost(
+                post_id=post.id,
+                related_post_id=candidate['id'],
+                score=score,
+                tag_overlap=candidate['tag_overlap'],
+                updated_date=now,
+            ))
+
+        entries.sort(key=lambda entry: (entry.score, entry.tag_overlap), reverse=True)
+        return entries[:RelatedPostService.NEIGHBOR_COUNT]
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild(post: Post) -> int:
+        entries = RelatedPostService.score_candidates(post)
+        RelatedPost.objects.filter(post=post).delete()
+        RelatedPost.objects.bulk_create(entries)
+        return len(entries)
+
+    @staticmethod
+    def rebuild_many(post_ids: Iterable[int]) -> int:
+        rebuilt = 0
+        for post in Post.objects.filter(id__in=list(post_ids)).only('id', 'author_id').iterator():
+            RelatedPostService.rebuild(post)
+            rebuilt += 1
+        return rebuilt
+
+    @staticmethod
+    def refresh_retagged_posts(post_ids: Iterable[int]) -> int:
+        """
+        Rebuild the lists of retagged posts and of every post listing them,
+        since the stored tag overlap of those pairs is now stale.
+        """
+        post_ids = set(post_ids)
+        post_ids.update(
+            RelatedPost.objects.filter(
+                related_post_id__in=post_ids,
+            ).values_list('post_id', flat=True)
+        )
+        return RelatedPostService.rebuild_many(post_ids)
+
+    @staticmethod
+    def sync_popularity(post_id: int, field: str, delta: int) -> None:
+        """
+        Shift the stored score of rows pointing at ``post_id`` after its
+        ``field`` counter moved by ``delta``. Popularity is capped, so most
+        likes on popular posts do not touch the index at all.
+        """
+        counts = Post.objects.filter(pk=post_id).values('like_count', 'comment_count').first()
+        if counts is None:
+            return
+
+        previous_counts = {**counts, field: counts[field] - delta}
+        change = (
+            RelatedPostService.calculate_popularity_score(counts['like_count'], counts['comment_count'])
+            - RelatedPostService.calculate_popularity_score(
+                previous_counts['like_count'], previous_counts['comment_count']
+            )
+        )
+        if change:
+            RelatedPost.objects.filter(related_post_id=post_id).update(score=F('score') + change)
+
+    @staticmethod
+    def get_related_posts(post: Post) -> List[Post]:
+        """
+        Get related posts from the precomputed index.
+
+        Args:
+            post: Reference post
+
+        Returns:
+            List of related posts
+        """
+        candidates = PublicPostService.filter_public_posts(
+            Post.objects.select_related(
+                'author', 'author__profile', 'config'
+            ).filter(
+                related_from__post=post,
+            )
+        ).annotate(
+            author_username=F('author__username'),
+            author_name=F('author__first_name'),
+            author_image=F('author__profile__avatar'),
+            related_score=F('related_from__score'),
+            related_tag_overlap=F('related_from__tag_overlap'),
+        )
+
+        scored_posts = []
+        for candidate in candidates:
+            jitter = random.uniform(-RelatedPostService.JITTER, RelatedPostService.JITTER)
+            scored_posts.append({
+                'post': candidate,
+                'score': candidate.related_score + jitter,
+                'tag_overlap': candidate.related_tag_overlap,
+            })
+
+        scored_posts.sort(key=lambda x: (x['score'], x['tag_overlap']), reverse=True)
+
+        return [x['post'] for x in scored_posts[:RelatedPostService.RESULT_COUNT]]
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import html
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from django.db import connection
+from django.utils.html import strip_tags
+
+from board.models import Post, PostContent
+
+
+@dataclass(frozen=True)
+class SearchIndexDocument:
+    post_id: int
+    title: str
+    description: str
+    tags: str
+    content: str
+
+
+class SearchIndexService:
+    """
+    Maintains the SQLite FTS5 index used by post search.
+
+    The index is a trigram FTS5 virtual table so that substring, case-insensitive
+    keyword lookups (including Korean and symbols like ``C++``) resolve through
+    the index instead of a ``LIKE`` scan over joined post, tag and content rows.
+    Each row is stored under the post id as its ``rowid``, so updating or
+    removing a post's row is a point lookup. On databases without FTS5 the
+    index is simply unavailable and search falls back to the legacy scan query.
+    """
+
+    TABLE_NAME = 'board_post_search_index'
+    COLUMNS = ('title', 'description', 'tags', 'content')
+    # bm25 weights, in table column order (title, description, tags, content)
+    COLUMN_WEIGHTS = (10.0, 4.0, 3.0, 1.0)
+    # The trigram tokenizer can only match terms of at least three characters.
+    MIN_MATCH_LENGTH = 3
+
+    _available: Optional[bool] = None
+
+    @staticmethod
+    def create_table_sql() -> str:
+        return (
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS {SearchIndexService.TABLE_NAME} USING fts5('
+            'title, description, tags, content, '
+            "tokenize='trigram')"
+        )
+
+    @staticmethod
+    def drop_table_sql() -> str:
+        return f'DROP TABLE IF EXISTS {SearchIndexService.TABLE_NAME}'
+
+    @classmethod
+    def is_available(cls) -> bool:
+        if cls._available is None:
+            cls._available = (
+                connection.vendor == 'sqlite'
+                and cls.TABLE_NAME in connection.introspection.table_names()
+            )
+        return cls._available
+
+    @classmethod
+    def reset_availability(cls) -> None:
+        cls._available = None
+
+    @staticmethod
+    def html_to_text(content_html: str) -> str:
+        return html.unescape(strip_tags(content_html or ''))
+
+    @staticmethod
+    def build_document(post: Post) -> SearchIndexDocument:
+        try:
+            content_html = post.content.content_html
+        except PostContent.DoesNotExist:
+            content_html = ''
+
+        return SearchIndexDocument(
+            post_id=post.id,
+            title=post.title or '',
+            description=post.meta_description or '',
+            tags=' '.join(tag.value for tag in post.tags.all()),
+            content=SearchIndexService.html_to_text(content_html),
+        )
+
+    @staticmethod
+    def index_post(post_id: int) -> None:
+        if not SearchIndexService.is_available():
+            return
+
+        post = Post.objects.filter(id=post_id).select_related('content').first()
+        if post is None:
+            SearchIndexService.remove_post(post_id)
+            return
+
+        SearchIndexService.write_documents([SearchIndexService.build_document(post)])
+
+    @staticmethod
+    def index_posts(post_ids: Iterable[int]) -> None:
+        if not SearchIndexService.is_available():
+            return
+
+        for post_id in set(post_ids):
+            SearchIndexService.index_post(post_id)
+
+    @staticmethod
+    def remove_post(post_id: int) -> None:
+        if not SearchIndexService.is_available():
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {SearchIndexService.TABLE_NAME} WHERE rowid = %s',
+                [post_id],
+            )
+
+    @staticmethod
+    def write_documents(documents: Iterable[SearchIndexDocument]) -> None:
+        rows = [
+            (document.post_id, document.title, document.description, document.tags, document.content)
+            for document in documents
+        ]
+        if not rows:
+            return
+
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f'DELETE FROM {SearchIndexService.TABLE_NAME} WHERE rowid = %s',
+                [(row[0],) for row in rows],
+            )
+            cursor.executemany(
+                f'INSERT INTO {SearchIndexService.TABLE_NAME} '
+                '(rowid, title, description, tags, content) VALUES (%s, %s, %s, %s, %s)',
+                rows,
+            )
+
+    @staticmethod
+    def rebuild(batch_size: int = 500) -> int:
+        """Recreate the index from scratch and return the number of indexed posts."""
+        if connection.vendor != 'sqlite':
+            return 0
+
+        with connection.cursor() as cursor:
+            cursor.execute(SearchIndexService.drop_table_sql())
+            cursor.execute(SearchIndexService.create_table_sql())
+        SearchIndexService.reset_availability()
+
+        indexed = 0
+        posts = Post.objects.select_related('content').prefetch_related('tags').order_by('id')
+        batch: list[SearchIndexDocument] = []
+        for post in posts.iterator(chunk_size=batch_size):
+            batch.append(SearchIndexService.build_document(post))
+            if len(batch) >= batch_size:
+                SearchIndexService.write_documents(batch)
+                indexed += len(batch)
+                batch = []
+
+        SearchIndexService.write_documents(batch)
+        indexed += len(batch)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {SearchIndexService.TABLE_NAME}({SearchIndexService.TABLE_NAME}) "
+                "VALUES ('optimize')"
+            )
+
+        return indexed
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+from django.http import HttpRequest
+
+from board.models import (
+    SiteContentScope,
+    SiteNotice,
+    SiteSetting,
+    StaticPage,
+)
+from board.services.public_cache_service import PublicCacheScope, PublicCacheService
+
+
+@dataclass(frozen=True)
+class SiteSnapshot:
+    """Read-only site-wide state used by every page render."""
+
+    version: Optional[int]
+    site_setting: SiteSetting
+    site_brand: Mapping[str, Any]
+    global_notices: Tuple[SiteNotice, ...]
+    footer_pages: Tuple[StaticPage, ...]
+    oauth_client_ids: Mapping[str, str]
+    needs_initial_setup: bool
+
+
+class SiteSnapshotService:
+    """
+    Per-process snapshot of site settings, notices, footer pages and OAuth
+    client ids.
+
+    The snapshot is tagged with the ``site`` public cache version, which is
+    bumped after SiteSetting, SiteNotice, StaticPage, SocialAuthProvider,
+    LoginSetting or IntegrationSetting changes commit. Each worker compares
+    that version (a cache read) and rebuilds only when it moved, so the hot
+    path does not query the database and workers converge on the next
+    request. With the public cache disabled a snapshot is built per request.
+    """
+
+    snapshot: Optional[SiteSnapshot] = None
+    REQUEST_ATTRIBUTE = '_site_snapshot'
+
+    @staticmethod
+    def build(version: Optional[int]) -> SiteSnapshot:
+        from board.services.brand_asset_service import BrandAssetService
+        from board.services.initial_setup_service import InitialSetupService
+        from board.services.social_auth_provider_service import SocialAuthProviderService
+
+        setting = SiteSetting.get_instance()
+        return SiteSnapshot(
+            version=version,
+            site_setting=setting,
+            site_brand=MappingProxyType(BrandAssetService.public_context(setting)),
+            global_notices=tuple(SiteNotice.objects.filter(
+                scope=SiteContentScope.GLOBAL,
+                is_active=True,
+            ).order_by('-created_date')),
+            footer_pages=tuple(StaticPage.objects.filter(
+                is_published=True,
+                show_in_footer=True,
+            ).order_by('order', 'slug')),
+            oauth_client_ids=MappingProxyType(SocialAuthProviderService.get_client_ids()),
+            needs_initial_setup=InitialSetupService.should_prompt_for_initial_setup(),
+        )
+
+    @staticmethod
+    def get(request: Optional[HttpRequest] = None) -> SiteSnapshot:
+        """
+        Return the current snapshot. Passing ``request`` reuses the snapshot
+        already resolved for that request.
+        """
+        snapshot = getattr(request, SiteSnapshotService.REQUEST_ATTRIBUTE, None)
+        if snapshot is not None:
+            return snapshot
+
+        if PublicCacheService.is_enabled():
+            version = PublicCacheService.get_versions([PublicCacheScope.SITE])[PublicCacheScope.SITE]
+            snapshot = SiteSnapshotService.snapshot
+            if snapshot is None or snapshot.version != version:
+                snapshot = SiteSnapshotService.build(version)
+                SiteSnapshotService.snapshot = snapshot
+        else:
+            snapshot = SiteSnapshotService.build(None)
+
+        if request is not None:
+            setattr(request, SiteSnapshotService.REQUEST_ATTRIBUTE, snapshot)
+        return snapshot
+
+    @staticmethod
+    def clear() -> None:
+        """Drop this process's snapshot, e.g. right after a local change."""
+        SiteSnapshotService.snapshot = None
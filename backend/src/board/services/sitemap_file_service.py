@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import bisect
+import datetime
+import gzip
+import json
+import os
+import threading
+from types import SimpleNamespace
+from typing import Dict, Iterable, List, Optional, Set
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.sitemaps.views import SitemapIndexItem
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.utils import timezone
+
+from board.services.background_job_service import BackgroundJobService
+from board.services.site_url_service import SiteUrlService
+
+
+class SitemapFileService:
+    """
+    Static sitemap files under ``SITEMAP_ROOT``.
+
+    Every section page is written as ``{section}-{page}.xml`` (plus a ``.gz``
+    copy) and nginx serves them without reaching Django. A manifest keeps the
+    item count and lastmod of every page, so a change rewrites only the page
+    holding the changed object, or that page and the ones after it when the
+    item count changed, and the index is rebuilt from the manifest alone.
+    """
+
+    INDEX_FILENAME = 'sitemap.xml'
+    MANIFEST_FILENAME = 'manifest.json'
+    REGENERATE_DELAY_SECONDS = 5
+
+    # Sections whose items are ordered by id and regenerated page by page.
+    # The others are small and always regenerated as a whole.
+    PAGED_SECTIONS = ('posts', 'series')
+
+    lock = threading.Lock()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        # Files hold absolute URLs, so they need a fixed public origin.
+        return bool(
+            getattr(settings, 'SITEMAP_STATIC_FILES', False)
+            and SiteUrlService.configured_origin()
+        )
+
+    @staticmethod
+    def get_sitemaps() -> Dict[str, type]:
+        from board.sitemaps import sitemaps
+        return sitemaps
+
+    @staticmethod
+    def get_sitemap(section: str):
+        from board.sitemaps import QuerySetSitemap
+
+        sitemap_class = SitemapFileService.get_sitemaps()[section]
+        if issubclass(sitemap_class, QuerySetSitemap):
+            return sitemap_class(cached=False)
+        return sitemap_class()
+
+    @staticmethod
+    def get_path(filename: str) -> str:
+        return os.path.join(settings.SITEMAP_ROOT, filename)
+
+    @staticmethod
+    def page_filename(section: str, page: int) -> str:
+        return f'{section}-{page}.xml'
+
+    @staticmethod
+    def get_file_path(section: Optional[str] = None, page: int = 1) -> Optional[str]:
+        """Path of a generated file, or None when it has not been written."""
+        if not SitemapFileService.is_enabled():
+            return None
+
+        if section is None:
+            filename = SitemapFileService.INDEX_FILENAME
+        else:
+            filename = SitemapFileService.page_filename(section, page)
+
+        path = SitemapFileService.get_path(filename)
+        return path if os.path.exists(path) else None
+
+    @staticmethod
+    def write_file(filename: str, content: str) -> None:
+        path = SitemapFileService.get_path(filename)
+        data = content.encode('utf-8')
+        files = [(path, data)]
+        if settings.SITEMAP_GZIP:
+            files.append((f'{path}.gz', gzip.compress(data, mtime=0)))
+
+        for file_path, file_data in files:
+            temp_path = f'{file_path}.tmp'
+            with open(temp_path, 'wb') as file:
+                file.write(file_data)
+            os.replace(temp_path, file_path)
+
+    @staticmethod
+    def remove_file(filename: str) -> None:
+        path = SitemapFileService.get_path(filename)
+        for file_path in (path, f'{path}.gz'):
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+    @staticmethod
+    def read_manifest() -> dict:
+        try:
+            with open(SitemapFileService.get_path(SitemapFileService.MANIFEST_FILENAME)) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def write_manifest(manifest: dict) -> None:
+        path = SitemapFileService.get_path(SitemapFileService.MANIFEST_FILENAME)
+        with open(f'{path}.tmp', 'w') as file:
+            json.dump(manifest, file)
+        os.replace(f'{path}.tmp', path)
+
+    @staticmethod
+    def get_origin():
+        origin = urlsplit(SiteUrlService.configured_origin())
+        return origin.scheme, origin.netloc
+
+    @staticmethod
+    def write_pages(section: str, pages: Iterable[int], manifest: dict) -> None:
+        protocol, domain = SitemapFileService.get_origin()
+        sitemap = SitemapFileService.get_sitemap(section)
+        paginator = sitemap.paginator
+        num_pages = paginator.num_pages
+
+        entry = {'count': paginator.count, 'pages': {}}
+        previous_pages = manifest.get(section, {}).get('pages', {})
+        for page in range(1, num_pages + 1):
+            if str(page) in previous_pages:
+                entry['pages'][str(page)] = previous_pages[str(page)]
+
+        for page in pages:
+            if page > num_pages:
+                continue
+            urls = sitemap.get_urls(
+                page=page,
+                site=SimpleNamespace(domain=domain),
+                protocol=protocol,
+            )
+            SitemapFileService.write_file(
+                SitemapFileService.page_filename(section, page),
+                render_to_string('sitemap.xml', {'urlset': urls}),
+            )
+            lastmod = getattr(sitemap, 'latest_lastmod', None)
+            entry['pages'][str(page)] = lastmod.isoformat() if lastmod else None
+
+        for page in previous_pages:
+            if int(page) > num_pages:
+                SitemapFileService.remove_file(SitemapFileService.page_filename(section, int(page)))
+
+        manifest[section] = entry
+
+    @staticmethod
+    def write_index(manifest: dict) -> None:
+        protocol, domain = SitemapFileService.get_origin()
+
+        items = []
+        for section in SitemapFileService.get_sitemaps():
+            pages = manifest.get(section, {}).get('pages', {})
+            lastmods = [
+                datetime.datetime.fromisoformat(lastmod)
+                for lastmod in pages.values() if lastmod
+            ]
+            section_lastmod = max(lastmods) if lastmods and len(lastmods) == len(pages) else None
+
+            sitemap_path = reverse('sitemap_section', kwargs={'section': section})
+            absolute_url = f'{protocol}://{domain}{sitemap_path}'
+            for page in sorted(int(page) for page in pages) or [1]:
+                url = absolute_url if page == 1 else f'{absolute_url}?p={page}'
+                items.append(SitemapIndexItem(url, section_lastmod))
+
+        SitemapFileService.write_file(
+            SitemapFileService.INDEX_FILENAME,
+            render_to_string('sitemap_index.xml', {'sitemaps': items}),
+        )
+
+    @staticmethod
+    def is_written(section: str, manifest: dict) -> bool:
+        pages = manifest.get(section, {}).get('pages')
+        return bool(pages) and all(
+            os.path.exists(SitemapFileService.get_path(
+                SitemapFileService.page_filename(section, int(page))
+            ))
+            for page in pages
+        )
+
+    @staticmethod
+    def rebuild(missing_only: bool = False) -> int:
+        """
+        Regenerate every section and the index. With ``missing_only``, only
+        sections with a missing page are written, and the index only when
+        one was written or it is missing itself.
+
+        Returns:
+            Number of section pages written
+        """
+        if not SitemapFileService.is_enabled():
+            return 0
+
+        os.makedirs(settings.SITEMAP_ROOT, exist_ok=True)
+        with SitemapFileService.lock:
+            manifest = SitemapFileService.read_manifest()
+            written = 0
+            for section in SitemapFileService.get_sitemaps():
+                if missing_only and SitemapFileService.is_written(section, manifest):
+                    continue
+                num_pages = SitemapFileService.get_sitemap(section).paginator.num_pages
+                SitemapFileService.write_pages(section, range(1, num_pages + 1), manifest)
+                written += num_pages
+
+            index_path = SitemapFileService.get_path(SitemapFileService.INDEX_FILENAME)
+            if written or not missing_only or not os.path.exists(index_path):
+                SitemapFileService.write_index(manifest)
+                SitemapFileService.write_manifest(manifest)
+        return written
+
+    @staticmethod
+    def get_pages_of(section: str, object_ids: List[int]) -> Set[int]:
+        sitemap = SitemapFileService.get_sitemap(section)
+        queryset = sitemap.queryset()
+        if len(object_ids) == 1:
+            positions = [queryset.filter(id__lt=object_ids[0]).count()]
+        else:
+            ids = list(queryset.values_list('id', flat=True))
+            positions = [bisect.bisect_left(ids, object_id) for object_id in object_ids]
+        return {position // sitemap.limit + 1 for position in positions}
+
+    @staticmethod
+    def regenerate(section: str, object_ids: Iterable[int] = ()) -> None:
+        """
+        Rewrite the pages of ``section`` that hold ``object_ids``.
+
+        When the section gained or lost items, every page from the first
+        affected one onwards shifts and is rewritten as well.
+        """
+        if not SitemapFileService.is_enabled():
+            return
+
+        os.makedirs(settings.SITEMAP_ROOT, exist_ok=True)
+        sitemap = SitemapFileService.get_sitemap(section)
+        with SitemapFileService.lock:
+            manifest = SitemapFileService.read_manifest()
+            paginator = sitemap.paginator
+            num_pages = paginator.num_pages
+            object_ids = list(object_ids)
+
+            if section in SitemapFileService.PAGED_SECTIONS and object_ids and section in manifest:
+                pages = SitemapFileService.get_pages_of(section, object_ids)
+                if manifest[section]['count'] != paginator.count:
+                    pages = set(range(min(pages), num_pages + 1))
+            else:
+                pages = set(range(1, num_pages + 1))
+
+            SitemapFileService.write_pages(section, sorted(pages), manifest)
+            SitemapFileService.write_index(manifest)
+            SitemapFileService.write_manifest(manifest)
+
+    @staticmethod
+    def schedule(
+        section: str,
+        object_ids: Iterable[int] = (),
+        key: str = '',
+        run_at: Optional[datetime.datetime] = None,
+    ) -> None:
+        """
+        Queue a regeneration of ``section``, shortly or at ``run_at``. Jobs are
+        deduplicated by ``key`` (the object id by default) and ``run_at``, so
+        repeated saves share one job.
+        """
+        if not SitemapFileService.is_enabled():
+            return
+
+        object_ids = list(object_ids)
+        if not key:
+            if len(object_ids) == 1:
+                key = str(object_ids[0])
+            else:
+                key, object_ids = 'all', []
+        if run_at is None:
+            run_at = timezone.now() + datetime.timedelta(
+                seconds=SitemapFileService.REGENERATE_DELAY_SECONDS
+            )
+        else:
+            key = f'{key}@{int(run_at.timestamp())}'
+        BackgroundJobService.enqueue(
+            'sitemap.regenerate',
+            {'section': section, 'object_ids': object_ids},
+            dedup_key=f'sitemap-{section}-{key}',
+            run_at=run_at,
+        )
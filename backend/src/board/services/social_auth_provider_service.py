@@ -36,6 +36,18 @@ class SocialAuthProviderService:
             return ''
         return provider.client_id
 
+    @classmethod
+    def get_client_ids(cls) -> dict[str, str]:
+        """Client ids of every enabled provider, keyed by provider key."""
+        cls.ensure_supported_providers()
+        return {
+            provider.key: provider.client_id
+            for provider in SocialAuthProvider.objects.filter(
+                key__in=cls.supported_keys(),
+                is_enabled=True,
+            )
+        }
+
     @classmethod
     def get_client_secret(cls, key: str) -> str:
         provider = cls.get_provider(key)
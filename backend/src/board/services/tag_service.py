@@ -121,8 +121,8 @@ class TagService:
         ).annotate(
             author_username=F('author__username'),
             author_image=F('author__profile__avatar'),
-            count_likes=Count('likes', distinct=True),
-            count_comments=Count('comments', distinct=True),
+            count_likes=F('like_count'),
+            count_comments=F('comment_count'),
             has_liked=Exists(
                 PostLikes.objects.filter(
                     post__id=OuterRef('id'),
@@ -0,0 +1,251 @@
+import datetime
+import hashlib
+import os
+import re
+import time
+
+from django.conf import settings
+from django.utils import timezone
+
+from board.models import UploadSession
+from board.services.image_upload_service import ImageUploadError, ImageUploadService
+from modules.randomness import randstr
+
+
+class UploadSessionError(Exception):
+    def __init__(self, code, message):
+        self.code = code
+        self.message = message
+        super().__init__(message)
+
+
+class UploadSessionService:
+    """
+    Resumable uploads for files too large to send in one request.
+
+    A session is created with the file name and size, and the SHA-256 of
+    the file either then or when it is completed. Chunks are then sent in
+    order, each starting at the session's current offset, and appended to
+    ``uploads/<key>.part`` under the media root; a client that lost its
+    connection asks for the offset and resumes there.
+    Completing the session verifies the file against its hash and stores it
+    like a single-request upload. Sessions expire ``UPLOAD_SESSION_TTL_HOURS``
+    after their last chunk and are removed by ``collect_expired``.
+    """
+
+    DIRECTORY = 'uploads'
+    CHUNK_MAX_BYTES = 8 * 1024 * 1024
+    READ_SIZE = 64 * 1024
+    SHA256_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+    @staticmethod
+    def get_expires_at():
+        return timezone.now() + datetime.timedelta(hours=settings.UPLOAD_SESSION_TTL_HOURS)
+
+    @staticmethod
+    def get_part_path(key):
+        return os.path.join(settings.MEDIA_ROOT, UploadSessionService.DIRECTORY, key + '.part')
+
+    @staticmethod
+    def normalize_sha256(sha256):
+        sha256 = (sha256 or '').strip().lower()
+        if sha256 and not UploadSessionService.SHA256_PATTERN.match(sha256):
+            raise UploadSessionError('upload.invalid_hash', 'SHA-256 해시 형식이 올바르지 않습니다.')
+        return sha256
+
+    @staticmethod
+    def create(user, file_name, size, sha256=''):
+        """
+        Start a session. When a file with the given hash was uploaded
+        before, the session is returned completed with its URL and nothing
+        has to be sent.
+        """
+        file_name = os.path.basename(str(file_name or ''))[:255]
+        ext = file_name.split('.')[-1].lower()
+        if '.' not in file_name or ext not in ImageUploadService.ALLOWED_EXTENSIONS:
+            raise UploadSessionError('upload.invalid_extension', '허용된 확장자가 아닙니다.')
+
+        if not isinstance(size, int) or isinstance(size, bool) or size <= 0:
+            raise UploadSessionError('upload.invalid_size', '파일 크기가 올바르지 않습니다.')
+        if size > settings.UPLOAD_SESSION_MAX_BYTES:
+            raise UploadSessionError(
+                'upload.too_large',
+                f'파일은 {settings.UPLOAD_SESSION_MAX_MB}MiB 이하만 업로드할 수 있습니다.',
+            )
+
+        sha256 = UploadSessionService.normalize_sha256(sha256)
+        session = UploadSession(
+            user=user,
+            key=randstr(32),
+            file_name=file_name,
+            size=size,
+            sha256=sha256,
+            expires_at=UploadSessionService.get_expires_at(),
+        )
+
+        if sha256:
+            image_cache = ImageUploadService.find_upload(
+                ImageUploadService.get_key(bytes.fromhex(sha256)),
+            )
+            if image_cache:
+                session.offset = size
+                session.url = settings.MEDIA_URL + image_cache.path
+                session.save()
+                return session
+
+        part_path = UploadSessionService.get_part_path(session.key)
+        os.makedirs(os.path.dirname(part_path), exist_ok=True)
+        open(part_path, 'wb').close()
+        session.save()
+        return session
+
+    @staticmethod
+    def get(user, key):
+        session = UploadSession.objects.filter(
+            user=user,
+            key=key,
+            expires_at__gt=timezone.now(),
+        ).first()
+        if session is None:
+            raise UploadSessionError('upload.not_found', '업로드 세션을 찾을 수 없습니다.')
+        return session
+
+    @staticmethod
+    def append_chunk(session, offset, stream, length):
+        """
+        Append ``length`` bytes read from ``stream`` at ``offset``, which must
+        be the session's current offset. The bytes received before a dropped
+        connection are kept, so the client resumes from the stored offset.
+        """
+        if session.url:
+            raise UploadSessionError('upload.completed', '이미 완료된 업로드입니다.')
+        if offset != session.offset:
+            raise UploadSessionError(
+                'upload.offset_mismatch',
+                f'업로드 위치가 맞지 않습니다. {session.offset}부터 이어서 보내주세요.',
+            )
+        if length <= 0 or length > UploadSessionService.CHUNK_MAX_BYTES:
+            raise UploadSessionError(
+                'upload.invalid_chunk',
+                f'조각은 {UploadSessionService.CHUNK_MAX_BYTES // (1024 * 1024)}MiB 이하로 보내주세요.',
+            )
+        if offset + length > session.size:
+            raise UploadSessionError('upload.invalid_chunk', '선언한 파일 크기를 넘었습니다.')
+
+        part_path = UploadSessionService.get_part_path(session.key)
+        received = 0
+        try:
+            with open(part_path, 'r+b') as part:
+                # Drops bytes past the offset left by a request that failed mid-write.
+                part.truncate(offset)
+                part.seek(offset)
+                while received < length:
+                    chunk = stream.read(min(UploadSessionService.READ_SIZE, length - received))
+                    if not chunk:
+                        break
+                    part.write(chunk)
+                    received += len(chunk)
+        except FileNotFoundError:
+            raise UploadSessionError('upload.not_found', '업로드 세션을 찾을 수 없습니다.')
+        finally:
+            if received:
+                session.offset = offset + received
+                session.expires_at = UploadSessionService.get_expires_at()
+                # Only the request that started at the stored offset moves it.
+                UploadSession.objects.filter(id=session.id, offset=offset).update(
+                    offset=session.offset,
+                    expires_at=session.expires_at,
+                )
+
+        return session
+
+    @staticmethod
+    def complete(session, sha256=''):
+        """
+        Verify the received file and store it as a content upload.
+        Completing a completed session returns the same URL again.
+
+        Returns:
+            URL of the upload
+        """
+        if session.url:
+            return session.url
+        if session.offset != session.size:
+            raise UploadSessionError(
+                'upload.incomplete',
+                f'아직 {session.size - session.offset}바이트가 남았습니다.',
+            )
+
+        expected = UploadSessionService.normalize_sha256(sha256) or session.sha256
+        if not expected:
+            raise UploadSessionError('upload.invalid_hash', 'SHA-256 해시가 필요합니다.')
+
+        part_path = UploadSessionService.get_part_path(session.key)
+        sha256_hash = hashlib.sha256()
+        try:
+            with open(part_path, 'rb') as part:
+                for chunk in iter(lambda: part.read(UploadSessionService.READ_SIZE), b''):
+                    sha256_hash.update(chunk)
+        except FileNotFoundError:
+            raise UploadSessionError('upload.not_found', '업로드 세션을 찾을 수 없습니다.')
+
+        if sha256_hash.hexdigest() != expected:
+            # The received bytes are unusable; start the upload over.
+            open(part_path, 'wb').close()
+            session.offset = 0
+            session.save(update_fields=['offset'])
+            raise UploadSessionError('upload.hash_mismatch', '받은 파일의 해시가 일치하지 않습니다.')
+
+        upload_path, file_name = ImageUploadService.make_upload_path()
+        try:
+            session.url = ImageUploadService.store_upload(
+                part_path,
+                upload_path,
+                file_name,
+                session.file_name.split('.')[-1].lower(),
+                ImageUploadService.get_key(sha256_hash.digest()),
+                session.size,
+                session.user,
+            )
+        except ImageUploadError as error:
+            # The file arrived intact but is not an image or video.
+            UploadSessionService.abort(session)
+            raise UploadSessionError('upload.invalid_file', error.message)
+        session.sha256 = expected
+        session.save(update_fields=['url', 'sha256'])
+        return session.url
+
+    @staticmethod
+    def abort(session):
+        UploadSessionService.remove_part(session.key)
+        session.delete()
+
+    @staticmethod
+    def remove_part(key):
+        try:
+            os.remove(UploadSessionService.get_part_path(key))
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def collect_expired() -> int:
+        """Delete expired sessions and part files no session refers to."""
+        expired = UploadSession.objects.filter(expires_at__lte=timezone.now())
+        for key in expired.values_list('key', flat=True):
+            UploadSessionService.remove_part(key)
+        deleted, _ = expired.delete()
+
+        directory = os.path.join(settings.MEDIA_ROOT, UploadSessionService.DIRECTORY)
+        if os.path.isdir(directory):
+            # Part files are written before their session row; leave recent ones.
+            cutoff = time.time() - settings.UPLOAD_SESSION_TTL_HOURS * 60 * 60
+            keys = set(UploadSession.objects.values_list('key', flat=True))
+            for name in os.listdir(directory):
+                path = os.path.join(directory, name)
+                if (
+                    name.endswith('.part')
+                    and name[:-len('.part')] not in keys
+                    and os.path.getmtime(path) < cutoff
+                ):
+                    os.remove(path)
+        return deleted
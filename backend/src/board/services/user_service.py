@@ -12,7 +12,7 @@ from typing import Optional, Dict, Any, List
 
 from django.contrib.auth.models import User
 from django.db import transaction
-from django.db.models import F, Q, Count, Exists, Max, OuterRef, QuerySet
+from django.db.models import F, Q, Count, Exists, OuterRef, QuerySet, Subquery, Sum
 from django.utils import timezone
 
 from board.models import (
@@ -377,10 +377,10 @@ class UserService:
         ).annotate(
             author_username=F('author__username'),
             author_image=F('author__profile__avatar'),
-            count_likes=Count('likes', distinct=True),
-            count_comments=Count('comments', distinct=True),
+            count_likes=F('like_count'),
+            count_comments=F('comment_count'),
             has_liked=Exists(interested_posts),
-            interested_date=Max('likes__created_date', filter=Q(likes__user=user)),
+            interested_date=Subquery(interested_posts.values('created_date')[:1]),
         ).order_by('-interested_date', '-published_date')
 
     @staticmethod
@@ -401,8 +401,8 @@ class UserService:
             published_date__lte=timezone.now(),
         ).aggregate(
             total_posts=Count('id'),
-            total_likes=Count('likes', distinct=True),
-            total_comments=Count('comments', distinct=True),
+            total_likes=Sum('like_count'),
+            total_comments=Sum('comment_count'),
         )
 
         return {
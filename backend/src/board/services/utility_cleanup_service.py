@@ -10,6 +10,7 @@ from board.admin.utilities import (
     TagCleanerService,
 )
 from board.models import DeveloperRequestLog
+from board.services.database_maintenance_service import DatabaseMaintenanceService
 from board.modules.response import StatusError, ErrorCode
 
 
@@ -114,6 +115,29 @@ class UtilityCleanupService:
             'dry_run': dry_run,
         }
 
+    @staticmethod
+    def maintain_database(body: dict) -> dict:
+        dry_run = body.get('dry_run', True)
+        analyze = body.get('analyze', True)
+
+        if dry_run:
+            return {
+                'stats': DatabaseMaintenanceService.get_stats(),
+                'profile_issues': DatabaseMaintenanceService.get_profile_issues(),
+                'dry_run': dry_run,
+            }
+
+        result = DatabaseMaintenanceService.run(analyze=analyze)
+        return {
+            'stats': result.get('after', {}),
+            'stats_before': result.get('before', {}),
+            'analyzed': result.get('analyzed', False),
+            'incremental_vacuum': result.get('incremental_vacuum', False),
+            'checkpoint': result.get('checkpoint'),
+            'profile_issues': DatabaseMaintenanceService.get_profile_issues(),
+            'dry_run': dry_run,
+        }
+
     @staticmethod
     def developer_api_log_retention_days(body: dict) -> int:
         value = body.get(
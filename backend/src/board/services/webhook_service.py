@@ -5,16 +5,25 @@ Handles sending webhook notifications to author-specific and global channels
 when new posts are published.
 Supports Discord, Slack, and other webhook-compatible services.
 """
+import datetime
 import logging
-import time
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, zip_longest
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
 import requests
+from requests.adapters import HTTPAdapter
 
 from django.db.models import Q
+from django.utils import timezone
 
 from board.models import Post, PostConfig, WebhookSubscription, Profile, SiteContentScope
+from board.services.background_job_service import BackgroundJobService
 from board.services.site_url_service import SiteUrlService
 from board.services.webhook_subscription_state_service import WebhookSubscriptionStateService
-from modules.sub_task import SubTaskProcessor
 
 
 logger = logging.getLogger(__name__)
@@ -23,11 +32,19 @@ logger = logging.getLogger(__name__)
 class WebhookService:
     """Service for managing webhook notification channels."""
 
+    WEBHOOK_CONNECT_TIMEOUT = 3  # seconds
     WEBHOOK_TIMEOUT = 10  # seconds
     DEFAULT_NOTIFICATION_DELAY_SECONDS = 2.0
+    MAX_CONCURRENT_DELIVERIES = 16
+    MAX_CONCURRENT_DELIVERIES_PER_HOST = 8
 
     @staticmethod
-    def send_webhook(url: str, content: str, post_url: str) -> bool:
+    def send_webhook(
+        url: str,
+        content: str,
+        post_url: str,
+        session: Optional[requests.Session] = None
+    ) -> bool:
         """
         Send a webhook notification to a URL.
         Supports Discord and Slack webhook formats.
@@ -36,6 +53,7 @@ class WebhookService:
             url: Webhook URL
             content: Message content
             post_url: URL to the published post
+            session: Shared session for pooled connections (optional)
 
         Returns:
             True if successful, False otherwise
@@ -58,10 +76,10 @@ class WebhookService:
                     'url': post_url
                 }
 
-            response = requests.post(
+            response = (session or requests).post(
                 url,
                 json=payload,
-                timeout=WebhookService.WEBHOOK_TIMEOUT
+                timeout=(WebhookService.WEBHOOK_CONNECT_TIMEOUT, WebhookService.WEBHOOK_TIMEOUT)
             )
             response.raise_for_status()
             return True
@@ -149,23 +167,109 @@ class WebhookService:
         content = f'[{author_name}] 새 포스트가 발행되었어요: [{post.title}]({post_url})'
         delay_seconds = max(0.0, WebhookService.DEFAULT_NOTIFICATION_DELAY_SECONDS)
 
-        def send_all_webhooks():
-            if delay_seconds > 0:
-                time.sleep(delay_seconds)
-            # Re-fetch channels in the async context
-            channels = WebhookSubscription.objects.filter(
-                id__in=channel_ids,
-                is_active=True
+        BackgroundJobService.enqueue(
+            'webhook.send_post_notification',
+            {
+                'channel_ids': channel_ids,
+                'content': content,
+                'post_url': post_url,
+            },
+            dedup_key=f'webhook-post-{post.id}',
+            run_at=timezone.now() + datetime.timedelta(seconds=delay_seconds),
+        )
+        return len(channel_ids)
+
+    @staticmethod
+    def send_post_notification(channel_ids: list, content: str, post_url: str) -> None:
+        """
+        Deliver a queued publish notification to channels still active.
+
+        Args:
+            channel_ids: WebhookSubscription IDs selected at publish time
+            content: Message content
+            post_url: URL to the published post
+        """
+        channels = WebhookSubscription.objects.filter(
+            id__in=channel_ids,
+            is_active=True
+        ).only('id', 'webhook_url')
+
+        results = WebhookService.deliver(
+            {channel.id: channel.webhook_url for channel in channels},
+            content=content,
+            post_url=post_url,
+        )
+
+        deactivated_ids = WebhookSubscriptionStateService.record_results(results)
+        for channel_id in deactivated_ids:
+            logger.info(
+                f'Webhook channel {channel_id} deactivated '
+                f'after {WebhookSubscription.MAX_FAILURES} consecutive failures'
             )
-            for channel in channels:
-                WebhookService.send_webhook_with_tracking(
-                    channel=channel,
+
+    @staticmethod
+    def create_session(pool_size: int) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    @staticmethod
+    def deliver(urls: Dict[int, str], content: str, post_url: str) -> Dict[int, bool]:
+        """
+        Send one message to many webhook URLs concurrently.
+
+        Deliveries share a pooled session and run on a bounded thread pool.
+        Each host gets at most ``MAX_CONCURRENT_DELIVERIES_PER_HOST`` requests
+        in flight, and URLs are interleaved across hosts so a slow host does
+        not occupy every worker while other hosts wait.
+
+        Args:
+            urls: Webhook URL keyed by channel id
+            content: Message content
+            post_url: URL to the published post
+
+        Returns:
+            Delivery success keyed by channel id
+        """
+        if not urls:
+            return {}
+
+        urls_by_host = defaultdict(list)
+        for channel_id, url in urls.items():
+            urls_by_host[urlsplit(url).netloc.lower()].append((channel_id, url))
+
+        host_limits = {
+            host: threading.BoundedSemaphore(WebhookService.MAX_CONCURRENT_DELIVERIES_PER_HOST)
+            for host in urls_by_host
+        }
+        interleaved = [
+            item for item in chain.from_iterable(zip_longest(*urls_by_host.values()))
+            if item is not None
+        ]
+
+        max_workers = min(WebhookService.MAX_CONCURRENT_DELIVERIES, len(interleaved))
+        session = WebhookService.create_session(max_workers)
+
+        def send(url: str) -> bool:
+            with host_limits[urlsplit(url).netloc.lower()]:
+                return WebhookService.send_webhook(
+                    url=url,
                     content=content,
-                    post_url=post_url
+                    post_url=post_url,
+                    session=session
                 )
 
-        SubTaskProcessor.process(send_all_webhooks)
-        return len(channel_ids)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    channel_id: executor.submit(send, url)
+                    for channel_id, url in interleaved
+                }
+            return {channel_id: future.result() for channel_id, future in futures.items()}
+        finally:
+            session.close()
 
     @staticmethod
     def create_subscription(
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List
 
+from django.db.models import F
 from django.utils import timezone
 
 if TYPE_CHECKING:
@@ -23,3 +24,38 @@ class WebhookSubscriptionStateService:
         if channel.failure_count >= channel.MAX_FAILURES:
             channel.is_active = False
         channel.save(update_fields=['failure_count', 'is_active'])
+
+    @staticmethod
+    def record_results(results: Dict[int, bool]) -> List[int]:
+        """
+        Record a batch of delivery outcomes keyed by channel id with a fixed
+        number of queries instead of one save per channel.
+
+        Returns:
+            IDs of channels deactivated by this batch
+        """
+        from board.models import WebhookSubscription
+
+        succeeded_ids = [channel_id for channel_id, success in results.items() if success]
+        failed_ids = [channel_id for channel_id, success in results.items() if not success]
+
+        if succeeded_ids:
+            WebhookSubscription.objects.filter(id__in=succeeded_ids).update(
+                failure_count=0,
+                last_success_date=timezone.now(),
+            )
+
+        if not failed_ids:
+            return []
+
+        WebhookSubscription.objects.filter(id__in=failed_ids).update(
+            failure_count=F('failure_count') + 1,
+        )
+        deactivated = WebhookSubscription.objects.filter(
+            id__in=failed_ids,
+            is_active=True,
+            failure_count__gte=WebhookSubscription.MAX_FAILURES,
+        )
+        deactivated_ids = list(deactivated.values_list('id', flat=True))
+        deactivated.update(is_active=False)
+        return deactivated_ids
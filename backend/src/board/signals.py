@@ -0,0 +1,261 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from board.models import (
+    Comment,
+    DeveloperToken,
+    IntegrationSetting,
+    LoginSetting,
+    Post,
+    PostConfig,
+    PostContent,
+    PostLikes,
+    Profile,
+    Series,
+    SiteBanner,
+    SiteContentScope,
+    SiteNotice,
+    SiteSetting,
+    SocialAuthProvider,
+    StaticPage,
+    Tag,
+    UsernameChangeLog,
+    User,
+)
+from board.services.background_job_service import BackgroundJobService
+from board.services.developer_token_service import DeveloperTokenService
+from board.services.post_counter_service import PostCounterService
+from board.services.public_cache_service import PublicCacheScope, PublicCacheService
+from board.services.related_post_service import RelatedPostService
+from board.services.search_index_service import SearchIndexService
+from board.services.sitemap_file_service import SitemapFileService
+
+
+def get_post_scopes(post):
+    series_ids = {post.series_id, getattr(post, '_loaded_series_id', None)}
+    return (
+        PublicCacheScope.POSTS,
+        PublicCacheScope.post(post.id),
+        *(PublicCacheScope.series(series_id) for series_id in series_ids if series_id),
+    )
+
+
+def get_banner_scopes(banner):
+    if banner.scope == SiteContentScope.USER and banner.user_id:
+        return (PublicCacheScope.author(banner.user_id),)
+    return (PublicCacheScope.SITE,)
+
+
+PUBLIC_CACHE_SCOPES_BY_MODEL = {
+    Post: get_post_scopes,
+    PostContent: lambda content: (PublicCacheScope.POSTS, PublicCacheScope.post(content.post_id)),
+    PostConfig: lambda config: (PublicCacheScope.POSTS, PublicCacheScope.post(config.post_id)),
+    Tag: lambda tag: (
+        PublicCacheScope.POSTS,
+        *(PublicCacheScope.post(post_id) for post_id in tag.posts.values_list('id', flat=True)),
+    ),
+    Profile: lambda profile: (PublicCacheScope.POSTS, PublicCacheScope.author(profile.user_id)),
+    UsernameChangeLog: lambda log: (PublicCacheScope.POSTS, PublicCacheScope.author(log.user_id)),
+    Series: lambda series: (PublicCacheScope.SERIES, PublicCacheScope.series(series.id)),
+    Comment: lambda comment: (PublicCacheScope.ENGAGEMENT, PublicCacheScope.post(comment.post_id)),
+    PostLikes: lambda like: (PublicCacheScope.ENGAGEMENT, PublicCacheScope.post(like.post_id)),
+    SiteBanner: get_banner_scopes,
+    SiteNotice: lambda notice: (PublicCacheScope.SITE,),
+    SiteSetting: lambda setting: (PublicCacheScope.SITE,),
+    LoginSetting: lambda setting: (PublicCacheScope.SITE,),
+    IntegrationSetting: lambda setting: (PublicCacheScope.SITE,),
+    SocialAuthProvider: lambda provider: (PublicCacheScope.SITE,),
+    StaticPage: lambda page: (PublicCacheScope.SITE,),
+}
+
+
+def bump_public_cache_versions(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    scopes = PUBLIC_CACHE_SCOPES_BY_MODEL[sender](instance)
+    transaction.on_commit(partial(PublicCacheService.bump, *scopes))
+
+
+for model in PUBLIC_CACHE_SCOPES_BY_MODEL:
+    post_save.connect(
+        bump_public_cache_versions,
+        sender=model,
+        dispatch_uid=f'public_cache_save_{model._meta.label_lower}',
+    )
+    post_delete.connect(
+        bump_public_cache_versions,
+        sender=model,
+        dispatch_uid=f'public_cache_delete_{model._meta.label_lower}',
+    )
+
+
+@receiver(post_init, sender=Post)
+def remember_loaded_series(sender, instance, **kwargs):
+    # A post moved to another series must invalidate the previous series too.
+    # Read from __dict__ so deferred querysets do not load the field.
+    instance._loaded_series_id = instance.__dict__.get('series_id')
+
+
+@receiver(post_save, sender=Post)
+def index_saved_post(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    SearchIndexService.index_post(instance.id)
+
+
+@receiver(post_delete, sender=Post)
+def remove_deleted_post(sender, instance, **kwargs):
+    SearchIndexService.remove_post(instance.id)
+
+
+@receiver(post_save, sender=PostContent)
+def index_saved_post_content(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    SearchIndexService.index_post(instance.post_id)
+
+
+@receiver(post_save, sender=Tag)
+def index_renamed_tag_posts(sender, instance, raw=False, created=False, **kwargs):
+    if raw or created:
+        return
+    SearchIndexService.index_posts(instance.posts.values_list('id', flat=True))
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def sync_retagged_posts(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse and action == 'pre_clear':
+        # Clearing from the tag side does not report which posts were affected.
+        instance._search_index_post_ids = list(instance.posts.values_list('id', flat=True))
+        return
+    if action not in {'post_add', 'post_remove', 'post_clear'}:
+        return
+    if reverse:
+        if action == 'post_clear':
+            pk_set = getattr(instance, '_search_index_post_ids', [])
+        post_ids = list(pk_set or [])
+    else:
+        post_ids = [instance.id]
+
+    SearchIndexService.index_posts(post_ids)
+    for post_id in post_ids:
+        BackgroundJobService.enqueue(
+            'related_posts.refresh',
+            {'post_ids': [post_id]},
+            dedup_key=f'related-posts-{post_id}',
+        )
+    transaction.on_commit(partial(
+        PublicCacheService.bump,
+        PublicCacheScope.POSTS,
+        *(PublicCacheScope.post(post_id) for post_id in post_ids),
+    ))
+
+
+@receiver(post_save, sender=PostLikes, dispatch_uid='post_counter_like_created')
+@receiver(post_save, sender=Comment, dispatch_uid='post_counter_comment_created')
+def increment_post_counter(sender, instance, raw=False, created=False, **kwargs):
+    if raw or not created:
+        return
+    field = 'like_count' if sender is PostLikes else 'comment_count'
+    PostCounterService.adjust(instance.post_id, field, 1)
+    RelatedPostService.sync_popularity(instance.post_id, field, 1)
+
+
+@receiver(post_delete, sender=PostLikes, dispatch_uid='post_counter_like_deleted')
+@receiver(post_delete, sender=Comment, dispatch_uid='post_counter_comment_deleted')
+def decrement_post_counter(sender, instance, **kwargs):
+    field = 'like_count' if sender is PostLikes else 'comment_count'
+    PostCounterService.adjust(instance.post_id, field, -1)
+    RelatedPostService.sync_popularity(instance.post_id, field, -1)
+
+
+def schedule_post_sitemaps(post_id, series_id=None, published_date=None):
+    run_ats = [None]
+    if published_date and published_date > timezone.now():
+        # A reserved post becomes public without a save; add it at that time.
+        run_ats.append(published_date)
+
+    for run_at in run_ats:
+        SitemapFileService.schedule('posts', [post_id], run_at=run_at)
+        SitemapFileService.schedule('user', run_at=run_at)
+        if series_id:
+            SitemapFileService.schedule('series', [series_id], run_at=run_at)
+
+
+@receiver(post_save, sender=Post, dispatch_uid='sitemap_post_saved')
+@receiver(post_delete, sender=Post, dispatch_uid='sitemap_post_deleted')
+def regenerate_post_sitemaps(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    published_date = instance.published_date if kwargs.get('signal') is post_save else None
+    schedule_post_sitemaps(instance.id, instance.series_id, published_date)
+
+
+@receiver(post_save, sender=PostConfig, dispatch_uid='sitemap_post_config_saved')
+def regenerate_post_config_sitemaps(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    schedule_post_sitemaps(instance.post_id)
+
+
+@receiver(post_save, sender=Series, dispatch_uid='sitemap_series_saved')
+@receiver(post_delete, sender=Series, dispatch_uid='sitemap_series_deleted')
+def regenerate_series_sitemaps(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    SitemapFileService.schedule('series', [instance.id])
+
+
+@receiver(post_save, sender=StaticPage, dispatch_uid='sitemap_static_page_saved')
+@receiver(post_delete, sender=StaticPage, dispatch_uid='sitemap_static_page_deleted')
+def regenerate_static_page_sitemaps(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    SitemapFileService.schedule('staticpages')
+
+
+@receiver(post_save, sender=Profile, dispatch_uid='sitemap_profile_saved')
+def regenerate_author_sitemaps(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    SitemapFileService.schedule('user')
+
+
+@receiver(post_save, sender=UsernameChangeLog, dispatch_uid='sitemap_username_changed')
+def regenerate_renamed_author_sitemaps(sender, instance, raw=False, **kwargs):
+    # Post and series URLs contain the username.
+    if raw or not SitemapFileService.is_enabled():
+        return
+    SitemapFileService.schedule('user')
+    SitemapFileService.schedule(
+        'posts',
+        Post.objects.filter(author_id=instance.user_id).values_list('id', flat=True),
+        key=f'author-{instance.user_id}',
+    )
+    SitemapFileService.schedule(
+        'series',
+        Series.objects.filter(owner_id=instance.user_id).values_list('id', flat=True),
+        key=f'author-{instance.user_id}',
+    )
+
+
+@receiver(post_save, sender=DeveloperToken, dispatch_uid='developer_token_saved')
+@receiver(post_delete, sender=DeveloperToken, dispatch_uid='developer_token_deleted')
+def invalidate_developer_token(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    transaction.on_commit(partial(DeveloperTokenService.invalidate_token, instance.token_hash))
+
+
+@receiver(post_save, sender=User, dispatch_uid='developer_token_user_saved')
+@receiver(post_save, sender=Profile, dispatch_uid='developer_token_profile_saved')
+def invalidate_developer_tokens_of_user(sender, instance, raw=False, **kwargs):
+    # Cached tokens carry the active state and role they were verified with.
+    if raw:
+        return
+    user_id = instance.id if sender is User else instance.user_id
+    transaction.on_commit(partial(DeveloperTokenService.invalidate_user, user_id))
@@ -1,6 +1,7 @@
 from django.contrib.sitemaps import Sitemap
 from django.urls import reverse
 from board.models import Post, Series, Profile, StaticPage
+from board.services.public_cache_service import PublicCacheScope, PublicCacheService
 from board.services.public_post_service import PublicPostService
 from board.services.public_series_service import PublicSeriesService
 
@@ -19,29 +20,60 @@ class SiteSitemap(Sitemap):
         return str(item)
 
 
-class UserSitemap(Sitemap):
+class QuerySetSitemap(Sitemap):
+    """
+    Sitemap whose items come from ``queryset()``.
+
+    Request-time renders read a cached list. Static file generation passes
+    ``cached=False`` so each page is sliced from the database instead.
+    Items are ordered by id so existing entries keep their page when other
+    entries are added or updated.
+    """
+
+    cache_namespace = ''
+    cache_scopes = (PublicCacheScope.POSTS,)
+
+    def __init__(self, cached=True):
+        self.cached = cached
+
+    def queryset(self):
+        raise NotImplementedError
+
+    def items(self):
+        if not self.cached:
+            return self.queryset()
+        return PublicCacheService.get_or_set(
+            self.cache_namespace,
+            [],
+            lambda: list(self.queryset()),
+            scopes=self.cache_scopes,
+        )
+
+
+class UserSitemap(QuerySetSitemap):
     changefreq = 'monthly'
     priority = 0.6
+    cache_namespace = 'sitemap_users'
 
-    def items(self):
+    def queryset(self):
         # Only include users who have public posts and can publish content.
-        users = PublicPostService.filter_public_posts(Post.objects).filter(
+        return PublicPostService.filter_public_posts(Post.objects).filter(
             author__profile__role=Profile.Role.EDITOR,
         ).values_list('author__username', flat=True).distinct().order_by('author__username')
-        return users
 
     def location(self, item):
         return reverse('user_profile', args=[item])
 
 
-class PostsSitemap(Sitemap):
+class PostsSitemap(QuerySetSitemap):
     changefreq = 'weekly'
     priority = 0.9
+    cache_namespace = 'sitemap_posts'
 
-    def items(self):
+    def queryset(self):
         return PublicPostService.filter_public_posts(Post.objects).select_related(
             'author'
-        ).order_by('-updated_date')
+        ).order_by('id')
 
     def location(self, element):
         return reverse('post_detail', args=[element.author.username, element.url])
@@ -50,14 +82,16 @@ class PostsSitemap(Sitemap):
         return element.updated_date
 
 
-class SeriesSitemap(Sitemap):
+class SeriesSitemap(QuerySetSitemap):
     changefreq = 'weekly'
     priority = 0.7
+    cache_namespace = 'sitemap_series'
+    cache_scopes = (PublicCacheScope.POSTS, PublicCacheScope.SERIES)
 
-    def items(self):
+    def queryset(self):
         return PublicSeriesService.filter_public_series(
             Series.objects.select_related('owner')
-        ).order_by('-updated_date')
+        ).order_by('id')
 
     def location(self, element):
         return reverse('series_detail', args=[element.owner.username, element.url])
@@ -66,12 +100,14 @@ class SeriesSitemap(Sitemap):
         return element.updated_date
 
 
-class StaticPageSitemap(Sitemap):
+class StaticPageSitemap(QuerySetSitemap):
     changefreq = 'monthly'
     priority = 0.8
+    cache_namespace = 'sitemap_static_pages'
+    cache_scopes = (PublicCacheScope.SITE,)
 
-    def items(self):
-        return StaticPage.objects.filter(is_published=True).order_by('-updated_date')
+    def queryset(self):
+        return StaticPage.objects.filter(is_published=True).order_by('id')
 
     def location(self, element):
         return reverse('static_page', args=[element.slug])
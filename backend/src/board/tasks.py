@@ -0,0 +1,25 @@
+"""
+Background job tasks
+
+Maps the task names stored on ``BackgroundJob`` to the callables that
+``manage.py run_worker`` executes. Payloads are passed as keyword arguments
+and must stay JSON-serializable.
+"""
+
+from board.services.image_upload_service import ImageUploadService
+from board.services.notification_delivery_service import NotificationDeliveryService
+from board.services.post_thumbnail_service import PostThumbnailService
+from board.services.related_post_service import RelatedPostService
+from board.services.sitemap_file_service import SitemapFileService
+from board.services.webhook_service import WebhookService
+
+
+TASKS = {
+    'media.post_thumbnails': PostThumbnailService.generate_for_post,
+    'media.process_upload': ImageUploadService.process_upload,
+    'related_posts.refresh': RelatedPostService.refresh_retagged_posts,
+    'sitemap.regenerate': SitemapFileService.regenerate,
+    'telegram.send_message': NotificationDeliveryService.send_telegram_message,
+    'telegram.send_notification': NotificationDeliveryService.deliver_telegram_notification,
+    'webhook.send_post_notification': WebhookService.send_post_notification,
+}
@@ -57,3 +57,19 @@ def get_pagination_base_url(context):
     if query_dict:
         return f"?{query_dict.urlencode()}&page="
     return "?page="
+
+
+@register.simple_tag(takes_context=True)
+def get_cursor_url(context, cursor):
+    """
+    Generate a URL for cursor pagination that preserves existing query
+    parameters while replacing the page and cursor parameters.
+    """
+    request = context.get('request')
+    if not request:
+        return f"?cursor={cursor}"
+
+    query_dict = request.GET.copy()
+    query_dict.pop('page', None)
+    query_dict['cursor'] = cursor
+    return f"?{query_dict.urlencode()}"
@@ -1,9 +1,14 @@
 import json
+from unittest.mock import Mock
 
-from django.test import TestCase, override_settings
+from django.contrib.admin.sites import AdminSite
+from django.core.cache import cache
+from django.db.models import Model
+from django.test import RequestFactory, TestCase, override_settings
 
+from board.admin.user import CustomUserAdmin
 from board.models import Config, DeveloperToken, Profile, User
-from board.services.developer_token_service import DeveloperTokenService
+from board.services.developer_token_service import DeveloperAuthError, DeveloperTokenService
 
 
 class DeveloperAuthAPITestCase(TestCase):
@@ -293,3 +298,101 @@ class DeveloperAuthAPITestCase(TestCase):
 
         self.assertEqual(response.status_code, 401)
         self.assertEqual(response.json()['error']['code'], 'auth.invalid_token')
+
+
+@override_settings(DEVELOPER_TOKEN_CACHE_TIMEOUT=60, DEVELOPER_TOKEN_TOUCH_INTERVAL=300)
+class DeveloperTokenCacheTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.editor = User.objects.create_user(username='developer', password='developer')
+        Profile.objects.create(user=cls.editor, role=Profile.Role.EDITOR)
+
+    def setUp(self):
+        cache.clear()
+        self.raw_token, self.token = DeveloperTokenService.create_token(
+            self.editor,
+            name='MCP',
+            scopes=['posts:read'],
+        )
+
+    def authenticate(self):
+        request = RequestFactory().get(
+            '/api/developer/v1/me',
+            HTTP_AUTHORIZATION=f'Bearer {self.raw_token}',
+        )
+        return DeveloperTokenService.authenticate_request(request)
+
+    def test_verified_token_is_reused_without_queries(self):
+        self.assertEqual(self.authenticate().id, self.token.id)
+
+        with self.assertNumQueries(0):
+            token = self.authenticate()
+
+        self.assertEqual(token.user.username, 'developer')
+        self.token.refresh_from_db()
+        self.assertIsNotNone(self.token.last_used_at)
+
+    def test_cache_does_not_hold_user(self):
+        self.authenticate()
+
+        entry = cache.get(DeveloperTokenService.token_cache_key(self.token.token_hash))
+
+        self.assertNotIn(self.editor.password, repr(entry))
+        self.assertFalse(any(isinstance(value, Model) for value in entry.values()))
+
+    def test_last_used_is_written_once_per_interval(self):
+        self.authenticate()
+        self.token.refresh_from_db()
+        last_used_at = self.token.last_used_at
+
+        cache.delete(DeveloperTokenService.token_cache_key(self.token.token_hash))
+        self.authenticate()
+
+        self.token.refresh_from_db()
+        self.assertEqual(self.token.last_used_at, last_used_at)
+
+    def test_revoked_token_is_rejected_after_caching(self):
+        self.authenticate()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            DeveloperTokenService.revoke_token(self.token)
+
+        with self.assertRaises(DeveloperAuthError) as context:
+            self.authenticate()
+        self.assertEqual(context.exception.code, 'auth.invalid_token')
+
+    def test_demoted_editor_is_rejected_after_caching(self):
+        self.authenticate()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            profile = Profile.objects.get(user=self.editor)
+            profile.role = Profile.Role.READER
+            profile.save(update_fields=['role'])
+
+        with self.assertRaises(DeveloperAuthError) as context:
+            self.authenticate()
+        self.assertEqual(context.exception.code, 'auth.editor_required')
+
+    def test_deactivated_user_is_rejected_after_caching(self):
+        self.authenticate()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.editor.is_active = False
+            self.editor.save(update_fields=['is_active'])
+
+        with self.assertRaises(DeveloperAuthError) as context:
+            self.authenticate()
+        self.assertEqual(context.exception.code, 'auth.inactive_user')
+
+    def test_user_deactivated_in_admin_is_rejected_after_caching(self):
+        self.authenticate()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CustomUserAdmin(User, AdminSite()).deactivate_users(
+                Mock(),
+                User.objects.filter(id=self.editor.id),
+            )
+
+        with self.assertRaises(DeveloperAuthError) as context:
+            self.authenticate()
+        self.assertEqual(context.exception.code, 'auth.inactive_user')
@@ -153,6 +153,37 @@ class DeveloperPostsAPITestCase(TestCase):
         self.assertEqual(body['posts'][0]['id'], draft['id'])
         self.assertEqual(body['posts'][0]['status'], 'draft')
 
+    def test_list_posts_supports_cursor_pagination(self):
+        """cursor를 넘기면 count 없이 다음/이전 cursor로 페이지를 넘긴다."""
+        drafts = [self.create_draft(f'Cursor Draft {index}') for index in range(3)]
+
+        first = self.client.get(
+            '/api/developer/v1/posts?cursor=&limit=2',
+            **self.auth_header(),
+        ).json()['data']
+        self.assertIsNone(first['pagination']['total'])
+        self.assertIsNone(first['pagination']['prev_cursor'])
+        self.assertEqual(
+            [post['id'] for post in first['posts']],
+            [drafts[2]['id'], drafts[1]['id']],
+        )
+
+        second = self.client.get(
+            f"/api/developer/v1/posts?cursor={first['pagination']['next_cursor']}&limit=2",
+            **self.auth_header(),
+        ).json()['data']
+        self.assertEqual([post['id'] for post in second['posts']], [drafts[0]['id']])
+        self.assertIsNone(second['pagination']['next_cursor'])
+        self.assertIsNotNone(second['pagination']['prev_cursor'])
+
+    def test_list_posts_rejects_invalid_cursor(self):
+        response = self.client.get(
+            '/api/developer/v1/posts?cursor=invalid',
+            **self.auth_header(),
+        )
+
+        self.assert_developer_error(response, 400, 'pagination.invalid_cursor')
+
     def test_serialized_tags_use_prefetch_cache(self):
         draft = self.create_draft('Cached Tags Draft')
         post = Post.objects.prefetch_related('tags').get(id=draft['id'])
@@ -6,9 +6,11 @@ from unittest.mock import patch, MagicMock
 
 from PIL import Image
 from django.test import TestCase, override_settings
+from django.core.files.move import file_move_safe
 from django.core.files.uploadedfile import SimpleUploadedFile
 
 from board.models import User, Config, Profile, ImageCache
+from board.services.image_upload_service import ImageUploadService
 
 
 class ImageUploadTestCase(TestCase):
@@ -51,6 +53,14 @@ class ImageUploadTestCase(TestCase):
         file.seek(0)
         return file
 
+    def post_with_upload_dir(self, uploaded_file):
+        """Uploads into a temporary directory; derivatives are left to the worker."""
+        with tempfile.TemporaryDirectory() as upload_dir:
+            with patch('board.services.image_upload_service.make_path', return_value=upload_dir + '/'):
+                response = self.client.post('/v1/image', {'image': uploaded_file})
+                stored_files = sorted(os.listdir(upload_dir))
+        return response, stored_files
+
     @override_settings(MEDIA_ROOT=tempfile.gettempdir())
     def test_upload_jpg_image(self):
         """JPG 이미지 업로드 테스트"""
@@ -63,26 +73,13 @@ class ImageUploadTestCase(TestCase):
             content_type="image/jpeg"
         )
 
-        with patch('board.services.image_upload_service.make_path') as mock_make_path:
-            with patch('builtins.open', create=True) as mock_open:
-                with patch('PIL.Image.open') as mock_pil:
-                    mock_make_path.return_value = tempfile.gettempdir()
-                    mock_open.return_value.__enter__ = lambda s: s
-                    mock_open.return_value.__exit__ = MagicMock()
-                    mock_open.return_value.write = MagicMock()
-
-                    mock_img = MagicMock()
-                    mock_img.convert = MagicMock(return_value=mock_img)
-                    mock_img.thumbnail = MagicMock()
-                    mock_img.filter = MagicMock(return_value=mock_img)
-                    mock_img.save = MagicMock()
-                    mock_pil.return_value = mock_img
-
-                    response = self.client.post('/v1/image', {'image': uploaded_file})
+        response, stored_files = self.post_with_upload_dir(uploaded_file)
 
         self.assertEqual(response.status_code, 200)
         content = json.loads(response.content)
         self.assertIn('url', content['body'])
+        self.assertEqual(len(stored_files), 1)
+        self.assertTrue(content['body']['url'].endswith(stored_files[0]))
 
     @override_settings(MEDIA_ROOT=tempfile.gettempdir())
     def test_upload_png_image(self):
@@ -96,21 +93,7 @@ class ImageUploadTestCase(TestCase):
             content_type="image/png"
         )
 
-        with patch('board.services.image_upload_service.make_path') as mock_make_path:
-            with patch('builtins.open', create=True):
-                with patch('PIL.Image.open') as mock_pil:
-                    with patch('os.stat') as mock_stat:
-                        mock_make_path.return_value = tempfile.gettempdir()
-                        mock_stat.return_value.st_size = 1024 * 100  # 100KB
-
-                        mock_img = MagicMock()
-                        mock_img.convert = MagicMock(return_value=mock_img)
-                        mock_img.thumbnail = MagicMock()
-                        mock_img.filter = MagicMock(return_value=mock_img)
-                        mock_img.save = MagicMock()
-                        mock_pil.return_value = mock_img
-
-                        response = self.client.post('/v1/image', {'image': uploaded_file})
+        response, stored_files = self.post_with_upload_dir(uploaded_file)
 
         self.assertEqual(response.status_code, 200)
         content = json.loads(response.content)
@@ -162,10 +145,8 @@ class ImageUploadTestCase(TestCase):
             content_type="image/bmp"
         )
 
-        with patch('board.services.image_upload_service.make_path') as mock_make_path:
-            with patch('builtins.open', create=True):
-                mock_make_path.return_value = tempfile.gettempdir()
-                response = self.client.post('/v1/image', {'image': invalid_file})
+        response, stored_files = self.post_with_upload_dir(invalid_file)
+        self.assertEqual(stored_files, [])
 
         content = json.loads(response.content)
         self.assertNotEqual(content['status'], 'DONE')
@@ -199,6 +180,27 @@ class ImageUploadTestCase(TestCase):
         content_json = json.loads(response.content)
         self.assertIn('cached/test.jpg', content_json['body']['url'])
 
+    @override_settings(MEDIA_ROOT=tempfile.gettempdir(), FILE_UPLOAD_MAX_MEMORY_SIZE=0)
+    def test_spooled_upload_is_hashed_while_received(self):
+        """디스크에 임시 저장되는 업로드도 받는 동안 해시"""
+        self.client.login(username='testuser', password='testpass')
+
+        content = self.create_test_image(format='JPEG').read()
+        uploaded_file = SimpleUploadedFile("spooled.jpg", content, content_type="image/jpeg")
+
+        with patch(
+            'board.services.image_upload_service.file_move_safe',
+            wraps=file_move_safe,
+        ) as mock_move:
+            response, stored_files = self.post_with_upload_dir(uploaded_file)
+
+        self.assertEqual(response.status_code, 200)
+        # The spooled file is moved into place instead of being read again.
+        mock_move.assert_called_once()
+        self.assertEqual(len(stored_files), 1)
+        from modules.hash import get_sha256
+        self.assertEqual(ImageCache.objects.get().key, get_sha256(content))
+
     @override_settings(MEDIA_ROOT=tempfile.gettempdir())
     @patch('subprocess.run')
     def test_upload_gif_converts_to_mp4(self, mock_subprocess):
@@ -212,20 +214,7 @@ class ImageUploadTestCase(TestCase):
             content_type="image/gif"
         )
 
-        with patch('board.services.image_upload_service.make_path') as mock_make_path:
-            with patch('builtins.open', create=True):
-                with patch('PIL.Image.open') as mock_pil:
-                    with patch('os.remove'):
-                        mock_make_path.return_value = tempfile.gettempdir()
-
-                        mock_img = MagicMock()
-                        mock_img.convert = MagicMock(return_value=mock_img)
-                        mock_img.filter = MagicMock(return_value=mock_img)
-                        mock_img.save = MagicMock()
-                        mock_pil.return_value = mock_img
-                        mock_subprocess.return_value = MagicMock()
-
-                        response = self.client.post('/v1/image', {'image': uploaded_file})
+        response, stored_files = self.post_with_upload_dir(uploaded_file)
 
         self.assertEqual(response.status_code, 200)
 
@@ -241,25 +230,12 @@ class ImageUploadTestCase(TestCase):
             content_type="image/png"
         )
 
-        with patch('board.services.image_upload_service.make_path') as mock_make_path:
-            with patch('builtins.open', create=True):
-                with patch('PIL.Image.open') as mock_pil:
-                    with patch('os.stat') as mock_stat:
-                        with patch('os.system'):
-                            mock_make_path.return_value = tempfile.gettempdir()
-                            # Simulate file size > 2MB
-                            mock_stat.return_value.st_size = 1024 * 1024 * 3
-
-                            mock_img = MagicMock()
-                            mock_img.convert = MagicMock(return_value=mock_img)
-                            mock_img.thumbnail = MagicMock()
-                            mock_img.filter = MagicMock(return_value=mock_img)
-                            mock_img.save = MagicMock()
-                            mock_pil.return_value = mock_img
-
-                            response = self.client.post('/v1/image', {'image': uploaded_file})
+        with patch.object(ImageUploadService, 'PNG_TO_JPG_MIN_SIZE', 0):
+            response, stored_files = self.post_with_upload_dir(uploaded_file)
 
         self.assertEqual(response.status_code, 200)
+        self.assertTrue(json.loads(response.content)['body']['url'].endswith('.jpg'))
+        self.assertEqual(stored_files, [os.path.basename(ImageCache.objects.get().source_path)])
 
     def test_invalid_method(self):
         """POST 이외의 메서드는 허용되지 않음"""
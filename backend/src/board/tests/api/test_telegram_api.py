@@ -1,11 +1,11 @@
 import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from datetime import timedelta
 
 from django.test import TestCase, override_settings
 from django.utils import timezone
 
-from board.models import Config, IntegrationSetting, Profile, TelegramSync, User
+from board.models import BackgroundJob, Config, IntegrationSetting, Profile, TelegramSync, User
 from board.services.integration_setting_service import IntegrationSettingService
 
 
@@ -131,13 +131,8 @@ class TelegramAPITestCase(TestCase):
 
     # POST /v1/telegram/webHook - Telegram webhook handler
     @override_settings(SITE_URL='https://test.com')
-    @patch('board.views.api.v1.telegram.TelegramBot')
-    @patch('modules.sub_task.SubTaskProcessor.process')
-    def test_webhook_successful_sync(self, mock_subtask, mock_telegram):
+    def test_webhook_successful_sync(self):
         """웹훅을 통한 텔레그램 연동 성공"""
-        mock_bot = MagicMock()
-        mock_telegram.return_value = mock_bot
-
         # Create a sync token (not expired)
         sync = TelegramSync.objects.create(
             user=self.user,
@@ -167,14 +162,12 @@ class TelegramAPITestCase(TestCase):
         self.assertEqual(sync.get_decrypted_tid(), '987654321')
         self.assertEqual(sync.auth_token, '')  # Token should be cleared
 
+        job = BackgroundJob.objects.get(task='telegram.send_message')
+        self.assertEqual(job.payload, {'chat_id': 987654321, 'text': '정상적으로 연동되었습니다.'})
+
     @override_settings(SITE_URL='https://test.com')
-    @patch('board.views.api.v1.telegram.TelegramBot')
-    @patch('modules.sub_task.SubTaskProcessor.process')
-    def test_webhook_expired_token(self, mock_subtask, mock_telegram):
+    def test_webhook_expired_token(self):
         """만료된 토큰으로 연동 시도"""
-        mock_bot = MagicMock()
-        mock_telegram.return_value = mock_bot
-
         # Create a token
         sync = TelegramSync.objects.create(
             user=self.user,
@@ -207,13 +200,8 @@ class TelegramAPITestCase(TestCase):
         self.assertEqual(sync.tid, '')  # tid should remain empty when expired
 
     @override_settings(SITE_URL='https://test.com')
-    @patch('board.views.api.v1.telegram.TelegramBot')
-    @patch('modules.sub_task.SubTaskProcessor.process')
-    def test_webhook_invalid_token(self, mock_subtask, mock_telegram):
+    def test_webhook_invalid_token(self):
         """잘못된 토큰으로 연동 시도"""
-        mock_bot = MagicMock()
-        mock_telegram.return_value = mock_bot
-
         webhook_data = {
             'message': {
                 'from': {
@@ -235,12 +223,8 @@ class TelegramAPITestCase(TestCase):
         # No TelegramSync should be created
         self.assertFalse(TelegramSync.objects.filter(tid='987654321').exists())
 
-    @patch('board.views.api.v1.telegram.TelegramBot')
-    def test_webhook_malformed_request(self, mock_telegram):
+    def test_webhook_malformed_request(self):
         """잘못된 형식의 웹훅 요청"""
-        mock_bot = MagicMock()
-        mock_telegram.return_value = mock_bot
-
         # Missing required fields
         webhook_data = {
             'message': {}
@@ -348,13 +332,8 @@ class TelegramAPITestCase(TestCase):
         self.assertLessEqual(sync.auth_token_exp, after_time)
 
     @override_settings(SITE_URL='https://example.com')
-    @patch('board.views.api.v1.telegram.TelegramBot')
-    @patch('modules.sub_task.SubTaskProcessor.process')
-    def test_webhook_with_no_matching_token(self, mock_subtask, mock_telegram):
+    def test_webhook_with_no_matching_token(self):
         """매칭되는 토큰이 없는 경우"""
-        mock_bot = MagicMock()
-        mock_telegram.return_value = mock_bot
-
         webhook_data = {
             'message': {
                 'from': {'id': 999999},
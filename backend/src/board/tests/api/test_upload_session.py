@@ -0,0 +1,198 @@
+import hashlib
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from board.models import Config, ImageCache, Profile, UploadSession, User
+from board.services.developer_token_service import DeveloperTokenService
+
+
+class UploadSessionTestMixin:
+    def setUp(self):
+        self.client.defaults['HTTP_USER_AGENT'] = 'BLEX_TEST'
+
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.upload_dir = os.path.join(temp_dir.name, 'images', 'content')
+        os.makedirs(self.upload_dir)
+
+        settings_override = override_settings(MEDIA_ROOT=temp_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        make_path = patch(
+            'board.services.image_upload_service.make_path',
+            return_value=self.upload_dir + '/',
+        )
+        make_path.start()
+        self.addCleanup(make_path.stop)
+
+        self.data = b'\x00\x00\x00\x18ftypisom' + os.urandom(96 * 1024)
+        self.sha256 = hashlib.sha256(self.data).hexdigest()
+
+
+class UploadSessionAPITestCase(UploadSessionTestMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='uploader', password='test')
+        Profile.objects.create(user=cls.user, role=Profile.Role.EDITOR)
+        Config.objects.create(user=cls.user)
+        cls.reader = User.objects.create_user(username='reader', password='test')
+        Profile.objects.create(user=cls.reader, role=Profile.Role.READER)
+
+    def put_chunk(self, key, offset, chunk):
+        return self.client.put(
+            f'/v1/uploads/{key}?offset={offset}',
+            chunk,
+            content_type='application/octet-stream',
+        ).json()
+
+    def test_upload_in_chunks_and_resume(self):
+        self.client.login(username='uploader', password='test')
+
+        content = self.client.post('/v1/uploads', json.dumps({
+            'file_name': 'clip.mp4',
+            'size': len(self.data),
+        }), content_type='application/json').json()
+        self.assertEqual(content['status'], 'DONE')
+        key = content['body']['id']
+        self.assertEqual(content['body']['offset'], 0)
+
+        content = self.put_chunk(key, 0, self.data[:32 * 1024])
+        self.assertEqual(content['body']['offset'], 32 * 1024)
+
+        # A retried chunk at an old offset is rejected; the client resumes
+        # from the offset of the session.
+        content = self.put_chunk(key, 0, self.data[:32 * 1024])
+        self.assertEqual(content['status'], 'ERROR')
+        offset = self.client.get(f'/v1/uploads/{key}').json()['body']['offset']
+
+        content = self.put_chunk(key, offset, self.data[offset:])
+        self.assertEqual(content['body']['offset'], len(self.data))
+
+        content = self.client.post(f'/v1/uploads/{key}/complete', json.dumps({
+            'sha256': self.sha256,
+        }), content_type='application/json').json()
+
+        self.assertEqual(content['status'], 'DONE')
+        image_cache = ImageCache.objects.get()
+        self.assertEqual(content['body']['url'], '/resources/media/' + image_cache.path)
+        self.assertEqual(image_cache.user, self.user)
+
+    def test_wrong_hash_is_rejected(self):
+        self.client.login(username='uploader', password='test')
+        key = self.client.post('/v1/uploads', json.dumps({
+            'file_name': 'photo.png',
+            'size': len(self.data),
+        }), content_type='application/json').json()['body']['id']
+        self.put_chunk(key, 0, self.data)
+
+        content = self.client.post(f'/v1/uploads/{key}/complete', json.dumps({
+            'sha256': hashlib.sha256(b'other').hexdigest(),
+        }), content_type='application/json').json()
+
+        self.assertEqual(content['status'], 'ERROR')
+        self.assertFalse(ImageCache.objects.exists())
+
+    def test_sessions_belong_to_their_user(self):
+        other = User.objects.create_user(username='other', password='test')
+        Profile.objects.create(user=other, role=Profile.Role.EDITOR)
+        self.client.login(username='other', password='test')
+        key = self.client.post('/v1/uploads', json.dumps({
+            'file_name': 'clip.mp4',
+            'size': 10,
+        }), content_type='application/json').json()['body']['id']
+
+        self.client.login(username='uploader', password='test')
+        content = self.client.get(f'/v1/uploads/{key}').json()
+        self.assertEqual(content['errorCode'], 'error:NF')
+
+        self.client.login(username='other', password='test')
+        self.assertEqual(self.client.delete(f'/v1/uploads/{key}').json()['status'], 'DONE')
+        self.assertFalse(UploadSession.objects.exists())
+
+    def test_reader_cannot_upload(self):
+        self.client.login(username='reader', password='test')
+
+        content = self.client.post('/v1/uploads', json.dumps({
+            'file_name': 'clip.mp4',
+            'size': 10,
+        }), content_type='application/json').json()
+
+        self.assertEqual(content['status'], 'ERROR')
+        self.assertFalse(UploadSession.objects.exists())
+
+
+class DeveloperUploadSessionAPITestCase(UploadSessionTestMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='dev-uploader', password='test')
+        Profile.objects.create(user=cls.user, role=Profile.Role.EDITOR)
+        Config.objects.create(user=cls.user)
+        cls.raw_token, _ = DeveloperTokenService.create_token(
+            cls.user,
+            name='Upload token',
+            scopes=['posts:read', 'posts:write'],
+        )
+
+    def auth_header(self):
+        return {'HTTP_AUTHORIZATION': f'Bearer {self.raw_token}'}
+
+    def test_upload_in_chunks(self):
+        response = self.client.post('/api/developer/v1/uploads', json.dumps({
+            'file_name': 'clip.mp4',
+            'size': len(self.data),
+            'sha256': self.sha256,
+        }), content_type='application/json', **self.auth_header())
+        self.assertEqual(response.status_code, 201)
+        upload_id = response.json()['data']['id']
+
+        response = self.client.put(
+            f'/api/developer/v1/uploads/{upload_id}?offset=0',
+            self.data[:50 * 1024],
+            content_type='application/octet-stream',
+            **self.auth_header(),
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data']['offset'], 50 * 1024)
+
+        response = self.client.put(
+            f'/api/developer/v1/uploads/{upload_id}?offset=0',
+            self.data[:50 * 1024],
+            content_type='application/octet-stream',
+            **self.auth_header(),
+        )
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['error']['code'], 'upload.offset_mismatch')
+
+        response = self.client.post(
+            f'/api/developer/v1/uploads/{upload_id}/complete',
+            content_type='application/json',
+            **self.auth_header(),
+        )
+        self.assertEqual(response.status_code, 409)
+
+        self.client.put(
+            f'/api/developer/v1/uploads/{upload_id}?offset={50 * 1024}',
+            self.data[50 * 1024:],
+            content_type='application/octet-stream',
+            **self.auth_header(),
+        )
+        response = self.client.post(
+            f'/api/developer/v1/uploads/{upload_id}/complete',
+            content_type='application/json',
+            **self.auth_header(),
+        )
+
+        self.assertEqual(response.status_code, 201)
+        image_cache = ImageCache.objects.get()
+        self.assertEqual(response.json()['data']['url'], '/resources/media/' + image_cache.path)
+
+    def test_unknown_upload_is_not_found(self):
+        response = self.client.get('/api/developer/v1/uploads/missing', **self.auth_header())
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()['error']['code'], 'upload.not_found')
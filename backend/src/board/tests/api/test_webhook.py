@@ -9,6 +9,7 @@ from django.contrib.auth.models import User
 from django.utils import timezone
 
 from board.models import (
+    BackgroundJob,
     Profile,
     Post,
     PostConfig,
@@ -17,6 +18,7 @@ from board.models import (
     SiteContentScope
 )
 from board.services import WebhookService
+from board.services.background_job_service import BackgroundJobService
 
 
 class WebhookAPITestCase(TestCase):
@@ -419,8 +421,7 @@ class WebhookNotificationTestCase(TestCase):
             content_html='<p>Test content</p>'
         )
 
-    @patch('board.services.webhook_service.SubTaskProcessor.process')
-    def test_notify_channels_on_publish(self, mock_process):
+    def test_notify_channels_on_publish(self):
         """글 발행 시 웹훅 알림 전송"""
         WebhookSubscription.objects.create(
             author=self.profile,
@@ -430,10 +431,11 @@ class WebhookNotificationTestCase(TestCase):
 
         WebhookService.notify_channels(self.post, post_config)
 
-        mock_process.assert_called_once()
+        job = BackgroundJob.objects.get()
+        self.assertEqual(job.task, 'webhook.send_post_notification')
+        self.assertEqual(job.dedup_key, f'webhook-post-{self.post.id}')
 
-    @patch('board.services.webhook_service.SubTaskProcessor.process')
-    def test_no_notify_hidden_post(self, mock_process):
+    def test_no_notify_hidden_post(self):
         """숨긴 글은 웹훅 알림 전송 안함"""
         WebhookSubscription.objects.create(
             author=self.profile,
@@ -443,18 +445,14 @@ class WebhookNotificationTestCase(TestCase):
 
         WebhookService.notify_channels(self.post, post_config)
 
-        mock_process.assert_not_called()
+        self.assertFalse(BackgroundJob.objects.exists())
 
     @override_settings(SITE_URL='https://blex.example')
     @patch.object(WebhookService, 'DEFAULT_NOTIFICATION_DELAY_SECONDS', 0)
-    @patch('board.services.webhook_service.WebhookService.send_webhook_with_tracking')
-    @patch('board.services.webhook_service.time.sleep')
-    @patch('board.services.webhook_service.SubTaskProcessor.process')
+    @patch('board.services.webhook_service.WebhookService.send_webhook')
     def test_notify_channels_sends_to_author_and_global_channels(
         self,
-        mock_process,
-        mock_sleep,
-        mock_send_webhook_with_tracking
+        mock_send_webhook
     ):
         """작성자 채널 + 글로벌 채널로 발행 알림 전송"""
         other_user = User.objects.create_user(
@@ -479,13 +477,20 @@ class WebhookNotificationTestCase(TestCase):
         )
 
         post_config = PostConfig.objects.create(post=self.post, hide=False)
-        mock_process.side_effect = lambda func, *args, **kwargs: func(*args, **kwargs)
 
         WebhookService.notify_channels(self.post, post_config)
-
-        mock_sleep.assert_not_called()
-        self.assertEqual(mock_send_webhook_with_tracking.call_count, 2)
-        for call_args in mock_send_webhook_with_tracking.call_args_list:
+        mock_send_webhook.return_value = True
+        BackgroundJobService.run_pending()
+
+        self.assertEqual(mock_send_webhook.call_count, 2)
+        self.assertEqual(
+            sorted(call_args.kwargs['url'] for call_args in mock_send_webhook.call_args_list),
+            [
+                'https://discord.com/api/webhooks/all/a',
+                'https://discord.com/api/webhooks/global/channel',
+            ],
+        )
+        for call_args in mock_send_webhook.call_args_list:
             self.assertEqual(
                 call_args.kwargs['post_url'],
                 'https://blex.example/@author/test-post',
@@ -496,14 +501,10 @@ class WebhookNotificationTestCase(TestCase):
             )
 
     @patch.object(WebhookService, 'DEFAULT_NOTIFICATION_DELAY_SECONDS', 1.25)
-    @patch('board.services.webhook_service.WebhookService.send_webhook_with_tracking')
-    @patch('board.services.webhook_service.time.sleep')
-    @patch('board.services.webhook_service.SubTaskProcessor.process')
+    @patch('board.services.webhook_service.WebhookService.send_webhook')
     def test_notify_channels_applies_delay_before_delivery(
         self,
-        mock_process,
-        mock_sleep,
-        mock_send_webhook_with_tracking
+        mock_send_webhook
     ):
         """웹훅 전송 전에 지연을 적용"""
         WebhookSubscription.objects.create(
@@ -512,12 +513,13 @@ class WebhookNotificationTestCase(TestCase):
         )
         post_config = PostConfig.objects.create(post=self.post, hide=False)
 
-        mock_process.side_effect = lambda func, *args, **kwargs: func(*args, **kwargs)
-
+        before = timezone.now()
         WebhookService.notify_channels(self.post, post_config)
 
-        mock_sleep.assert_called_once_with(1.25)
-        mock_send_webhook_with_tracking.assert_called_once()
+        job = BackgroundJob.objects.get()
+        self.assertGreaterEqual((job.scheduled_at - before).total_seconds(), 1.25)
+        self.assertEqual(BackgroundJobService.run_pending(), 0)
+        mock_send_webhook.assert_not_called()
 
 
 class WebhookFailureTrackingTestCase(TestCase):
@@ -2,7 +2,8 @@ from unittest.mock import patch
 
 from django.test import TestCase, override_settings
 
-from board.models import IntegrationSetting, Notify, TelegramSync, User
+from board.models import BackgroundJob, IntegrationSetting, Notify, TelegramSync, User
+from board.services.background_job_service import BackgroundJobService
 from board.services.integration_setting_service import IntegrationSettingService
 
 
@@ -32,53 +33,52 @@ class NotifySendNotifyTestCase(TestCase):
         setting.telegram_bot_token = IntegrationSettingService.encrypt_secret('token')
         setting.save()
 
-    @patch('board.services.notification_delivery_service.SubTaskProcessor.process')
     @patch('board.services.notification_delivery_service.TelegramBot')
-    def test_send_notify_without_telegram_sync_is_noop(self, mock_bot, mock_process):
+    def test_send_notify_without_telegram_sync_is_noop(self, mock_bot):
         notify = self.create_notify()
 
         notify.send_notify()
 
         mock_bot.assert_not_called()
-        mock_process.assert_not_called()
+        self.assertFalse(BackgroundJob.objects.exists())
 
-    @patch('board.services.notification_delivery_service.SubTaskProcessor.process')
     @patch('board.services.notification_delivery_service.TelegramBot')
-    def test_send_notify_with_blank_telegram_id_is_noop(self, mock_bot, mock_process):
+    def test_send_notify_with_blank_telegram_id_is_noop(self, mock_bot):
         TelegramSync.objects.create(user=self.user, tid='')
         notify = self.create_notify()
 
         notify.send_notify()
 
         mock_bot.assert_not_called()
-        mock_process.assert_not_called()
+        self.assertFalse(BackgroundJob.objects.exists())
 
-    @patch('board.services.notification_delivery_service.SubTaskProcessor.process')
     @patch('board.services.notification_delivery_service.TelegramBot')
-    def test_send_notify_without_bot_configuration_is_noop(self, mock_bot, mock_process):
+    def test_send_notify_without_bot_configuration_is_noop(self, mock_bot):
         TelegramSync.objects.create(user=self.user, tid='123456')
         notify = self.create_notify()
 
         notify.send_notify()
 
         mock_bot.assert_not_called()
-        mock_process.assert_not_called()
+        self.assertFalse(BackgroundJob.objects.exists())
 
     @override_settings(SITE_URL='https://example.test')
-    @patch('board.services.notification_delivery_service.SubTaskProcessor.process')
     @patch('board.services.notification_delivery_service.TelegramBot')
-    def test_send_notify_dispatches_telegram_message(self, mock_bot, mock_process):
+    def test_send_notify_dispatches_telegram_message(self, mock_bot):
         self.configure_telegram_bot()
         TelegramSync.objects.create(user=self.user, tid='123456')
         notify = self.create_notify()
 
         notify.send_notify()
 
-        mock_bot.assert_called_once_with('token')
-        mock_process.assert_called_once()
+        job = BackgroundJob.objects.get()
+        self.assertEqual(job.task, 'telegram.send_notification')
+        self.assertEqual(job.payload, {'notify_id': notify.id})
+        mock_bot.assert_not_called()
 
-        callback = mock_process.call_args.args[0]
-        callback()
+        BackgroundJobService.run_pending()
+
+        mock_bot.assert_called_once_with('token')
 
         mock_bot.return_value.send_messages.assert_called_once_with(
             '123456',
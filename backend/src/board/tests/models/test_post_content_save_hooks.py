@@ -41,10 +41,10 @@ class PostContentSaveHookTestCase(TestCase):
 
         with TemporaryDirectory() as media_root:
             with override_settings(MEDIA_ROOT=media_root):
-                with patch('board.services.post_thumbnail_service.make_thumbnail') as mock_make_thumbnail:
+                with patch('board.services.post_thumbnail_service.make_thumbnail_set') as mock_make_thumbnail_set:
                     PostContent.objects.create(post=post, content_html='<p>content</p>')
 
-        mock_make_thumbnail.assert_not_called()
+        mock_make_thumbnail_set.assert_not_called()
 
     def test_content_update_refreshes_parent_read_time(self):
         post = Post.objects.create(
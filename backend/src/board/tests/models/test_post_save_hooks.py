@@ -1,12 +1,14 @@
 from io import BytesIO
 from tempfile import TemporaryDirectory
-from unittest.mock import call, patch
+from unittest.mock import patch
 
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase, override_settings
 from PIL import Image
 
 from board.models import Post, User
+from board.services.background_job_service import BackgroundJobService
+from modules.thumbnail import ThumbnailSpec
 
 
 class PostSaveThumbnailHookTestCase(TestCase):
@@ -29,30 +31,31 @@ class PostSaveThumbnailHookTestCase(TestCase):
         return SimpleUploadedFile(name, buffer.read(), content_type='image/jpeg')
 
     def assert_thumbnail_set_created(self, mock_make_thumbnail, post):
-        self.assertEqual(mock_make_thumbnail.call_count, 3)
-        mock_make_thumbnail.assert_has_calls([
-            call(post, size=750, quality=50, thumbnail_type='preview'),
-            call(post, size=750, quality=85, thumbnail_type='minify'),
-            call(post, size=1920, quality=85),
+        mock_make_thumbnail.assert_called_once_with(post, [
+            ThumbnailSpec(size=750, quality=50, thumbnail_type='preview'),
+            ThumbnailSpec(size=750, quality=85, thumbnail_type='minify'),
+            ThumbnailSpec(size=1920, quality=85),
         ])
 
     def test_new_post_with_image_generates_thumbnail_set(self):
         with TemporaryDirectory() as media_root:
             with override_settings(MEDIA_ROOT=media_root):
-                with patch('board.services.post_thumbnail_service.make_thumbnail') as mock_make_thumbnail:
+                with patch('board.services.post_thumbnail_service.make_thumbnail_set') as mock_make_thumbnail:
                     post = Post.objects.create(
                         author=self.user,
                         title='New image post',
                         url='new-image-post',
                         image=self.create_test_image(),
                     )
+                    mock_make_thumbnail.assert_not_called()
+                    BackgroundJobService.run_pending()
 
         self.assert_thumbnail_set_created(mock_make_thumbnail, post)
 
     def test_post_image_change_generates_thumbnail_set(self):
         with TemporaryDirectory() as media_root:
             with override_settings(MEDIA_ROOT=media_root):
-                with patch('board.services.post_thumbnail_service.make_thumbnail') as mock_make_thumbnail:
+                with patch('board.services.post_thumbnail_service.make_thumbnail_set') as mock_make_thumbnail:
                     post = Post.objects.create(
                         author=self.user,
                         title='Changed image post',
@@ -63,13 +66,14 @@ class PostSaveThumbnailHookTestCase(TestCase):
 
                     post.image = self.create_test_image('new.jpg', color='green')
                     post.save()
+                    BackgroundJobService.run_pending()
 
         self.assert_thumbnail_set_created(mock_make_thumbnail, post)
 
     def test_post_save_without_image_change_does_not_generate_thumbnails(self):
         with TemporaryDirectory() as media_root:
             with override_settings(MEDIA_ROOT=media_root):
-                with patch('board.services.post_thumbnail_service.make_thumbnail') as mock_make_thumbnail:
+                with patch('board.services.post_thumbnail_service.make_thumbnail_set') as mock_make_thumbnail:
                     post = Post.objects.create(
                         author=self.user,
                         title='Unchanged image post',
@@ -86,7 +90,7 @@ class PostSaveThumbnailHookTestCase(TestCase):
     def test_skip_thumbnail_flag_disables_thumbnail_generation(self):
         with TemporaryDirectory() as media_root:
             with override_settings(MEDIA_ROOT=media_root):
-                with patch('board.services.post_thumbnail_service.make_thumbnail') as mock_make_thumbnail:
+                with patch('board.services.post_thumbnail_service.make_thumbnail_set') as mock_make_thumbnail:
                     post = Post(
                         author=self.user,
                         title='Skip thumbnail post',
@@ -101,7 +105,7 @@ class PostSaveThumbnailHookTestCase(TestCase):
     def test_skip_thumbnail_flag_disables_changed_image_thumbnail_generation(self):
         with TemporaryDirectory() as media_root:
             with override_settings(MEDIA_ROOT=media_root):
-                with patch('board.services.post_thumbnail_service.make_thumbnail') as mock_make_thumbnail:
+                with patch('board.services.post_thumbnail_service.make_thumbnail_set') as mock_make_thumbnail:
                     post = Post.objects.create(
                         author=self.user,
                         title='Skip changed thumbnail post',
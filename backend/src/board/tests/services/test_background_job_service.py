@@ -0,0 +1,130 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import Mock, patch
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from board.models import BackgroundJob
+from board.services.background_job_service import BackgroundJobService, UnknownJobTaskError
+
+
+class BackgroundJobServiceTestCase(TestCase):
+    def setUp(self):
+        self.task = Mock()
+        patcher = patch.dict('board.tasks.TASKS', {'test.task': self.task})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unknown_task_is_rejected(self):
+        with self.assertRaises(UnknownJobTaskError):
+            BackgroundJobService.enqueue('missing.task')
+
+    def test_job_runs_with_payload(self):
+        BackgroundJobService.enqueue('test.task', {'post_id': 1})
+
+        self.assertEqual(BackgroundJobService.run_pending(), 1)
+
+        self.task.assert_called_once_with(post_id=1)
+        job = BackgroundJob.objects.get()
+        self.assertEqual(job.status, BackgroundJob.Status.DONE)
+        self.assertIsNotNone(job.finished_date)
+
+    def test_dedup_key_reuses_pending_job(self):
+        """같은 키로 대기 중인 작업이 있으면 새로 쌓지 않는다"""
+        first = BackgroundJobService.enqueue('test.task', dedup_key='same')
+        second = BackgroundJobService.enqueue('test.task', dedup_key='same')
+        self.assertEqual(first.id, second.id)
+
+        BackgroundJobService.run_pending()
+        third = BackgroundJobService.enqueue('test.task', dedup_key='same')
+        self.assertNotEqual(first.id, third.id)
+
+    def test_scheduled_job_waits_until_due(self):
+        job = BackgroundJobService.enqueue('test.task', run_at=timezone.now() + timedelta(minutes=5))
+
+        self.assertEqual(BackgroundJobService.run_pending(), 0)
+
+        BackgroundJob.objects.filter(pk=job.pk).update(scheduled_at=timezone.now())
+        self.assertEqual(BackgroundJobService.run_pending(), 1)
+
+    def test_failed_job_is_retried_with_backoff(self):
+        self.task.side_effect = RuntimeError('boom')
+        BackgroundJobService.enqueue('test.task', max_attempts=2)
+
+        before = timezone.now()
+        BackgroundJobService.run_pending()
+        job = BackgroundJob.objects.get()
+        self.assertEqual(job.status, BackgroundJob.Status.PENDING)
+        self.assertEqual(job.attempts, 1)
+        self.assertIn('RuntimeError: boom', job.last_error)
+        self.assertGreaterEqual(job.scheduled_at, before + BackgroundJobService.get_retry_delay(1))
+
+        BackgroundJob.objects.filter(pk=job.pk).update(scheduled_at=timezone.now())
+        BackgroundJobService.run_pending()
+        job.refresh_from_db()
+        self.assertEqual(job.status, BackgroundJob.Status.FAILED)
+        self.assertEqual(job.attempts, 2)
+
+    def test_retry_while_duplicate_is_pending_closes_job(self):
+        """재시도할 작업과 같은 키의 작업이 이미 대기 중이면 그 작업에 맡긴다"""
+        job = BackgroundJobService.enqueue('test.task', dedup_key='same')
+        [job] = BackgroundJobService.claim('test', 1)
+
+        def enqueue_duplicate():
+            BackgroundJobService.enqueue('test.task', dedup_key='same')
+            raise RuntimeError('boom')
+        self.task.side_effect = enqueue_duplicate
+
+        self.assertFalse(BackgroundJobService.run(job))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, BackgroundJob.Status.FAILED)
+        self.assertIn('Superseded', job.last_error)
+        self.assertEqual(
+            BackgroundJob.objects.filter(status=BackgroundJob.Status.PENDING, dedup_key='same').count(),
+            1,
+        )
+
+    def test_retry_delay_doubles_and_is_capped(self):
+        self.assertEqual(BackgroundJobService.get_retry_delay(1), timedelta(seconds=10))
+        self.assertEqual(BackgroundJobService.get_retry_delay(3), timedelta(seconds=40))
+        self.assertEqual(BackgroundJobService.get_retry_delay(30), timedelta(hours=1))
+
+    def test_claimed_job_is_not_claimed_twice(self):
+        BackgroundJobService.enqueue('test.task')
+
+        self.assertEqual(len(BackgroundJobService.claim('worker-a', 5)), 1)
+        self.assertEqual(BackgroundJobService.claim('worker-b', 5), [])
+
+    def test_stale_running_job_is_reclaimed(self):
+        job = BackgroundJobService.enqueue('test.task')
+        BackgroundJob.objects.filter(pk=job.pk).update(
+            status=BackgroundJob.Status.RUNNING,
+            locked_by='dead-worker',
+            locked_at=timezone.now() - BackgroundJobService.LOCK_TIMEOUT - timedelta(seconds=1),
+        )
+
+        claimed = BackgroundJobService.claim('worker-a', 5)
+
+        self.assertEqual([claimed_job.locked_by for claimed_job in claimed], ['worker-a'])
+
+    def test_prune_removes_old_finished_jobs(self):
+        BackgroundJobService.enqueue('test.task')
+        BackgroundJobService.run_pending()
+        BackgroundJob.objects.update(finished_date=timezone.now() - timedelta(days=8))
+        BackgroundJobService.enqueue('test.task')
+
+        self.assertEqual(BackgroundJobService.prune(retention_days=7), 1)
+        self.assertEqual(BackgroundJob.objects.get().status, BackgroundJob.Status.PENDING)
+
+    def test_run_worker_once_processes_due_jobs(self):
+        for post_id in range(3):
+            BackgroundJobService.enqueue('test.task', {'post_id': post_id})
+
+        stdout = StringIO()
+        call_command('run_worker', '--once', '--concurrency', '2', stdout=stdout)
+
+        self.assertIn('stopped after 3 jobs', stdout.getvalue())
+        self.assertEqual(self.task.call_count, 3)
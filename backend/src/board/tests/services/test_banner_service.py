@@ -0,0 +1,87 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from board.models import SiteBanner, SiteContentScope
+from board.services.banner_service import BannerService
+
+
+@override_settings(PUBLIC_CACHE_TIMEOUT=600)
+class BannerServiceTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='author', password='test')
+        cls.other = User.objects.create_user(username='other', password='test')
+        cls.admin = User.objects.create_superuser(username='admin', password='test')
+
+    def setUp(self):
+        cache.clear()
+
+    def create_banner(self, **kwargs):
+        defaults = {
+            'scope': SiteContentScope.USER,
+            'user': self.author,
+            'title': 'Banner',
+            'content_html': '<div>Banner</div>',
+            'banner_type': 'horizontal',
+            'position': 'top',
+        }
+        defaults.update(kwargs)
+        return SiteBanner.objects.create(**defaults)
+
+    def titles(self, banners):
+        return {
+            position: [banner.title for banner in items]
+            for position, items in banners.items()
+        }
+
+    def test_banners_are_merged_by_position_and_order(self):
+        self.create_banner(title='Author top', order=2)
+        self.create_banner(title='Author left', position='left', banner_type='sidebar')
+        self.create_banner(title='Global top', scope=SiteContentScope.GLOBAL, user=self.admin, order=1)
+        self.create_banner(title='Inactive', is_active=False)
+
+        self.assertEqual(self.titles(BannerService.get_all_banners_for_author(self.author)), {
+            'top': ['Global top', 'Author top'],
+            'bottom': [],
+            'left': ['Author left'],
+            'right': [],
+        })
+
+    def test_cached_banners_do_not_query(self):
+        self.create_banner(title='Author top')
+        self.create_banner(title='Global top', scope=SiteContentScope.GLOBAL, user=self.admin)
+        BannerService.get_all_banners_for_author(self.author)
+
+        with self.assertNumQueries(0):
+            banners = BannerService.get_all_banners_for_author(self.author)
+
+        self.assertEqual([banner.user.username for banner in banners['top']], ['admin', 'author'])
+
+    def test_author_banners_do_not_leak(self):
+        self.create_banner(title='Author top')
+        BannerService.get_all_banners_for_author(self.author)
+
+        self.assertEqual(BannerService.get_all_banners_for_author(self.other)['top'], [])
+
+    def test_saved_banners_refresh_cache(self):
+        BannerService.get_all_banners_for_author(self.author)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            banner = self.create_banner(title='Author top')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_banner(title='Global top', scope=SiteContentScope.GLOBAL, user=self.admin)
+
+        self.assertEqual(
+            self.titles(BannerService.get_all_banners_for_author(self.author))['top'],
+            ['Global top', 'Author top'],
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            banner.is_active = False
+            banner.save()
+
+        self.assertEqual(
+            self.titles(BannerService.get_all_banners_for_author(self.author))['top'],
+            ['Global top'],
+        )
@@ -0,0 +1,74 @@
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from board.checks import check_sqlite_runtime_profile
+from board.services.database_maintenance_service import DatabaseMaintenanceService
+from board.services.utility_cleanup_service import UtilityCleanupService
+
+
+class DatabaseMaintenanceServiceTestCase(TestCase):
+    def test_get_stats_reports_sizes(self):
+        stats = DatabaseMaintenanceService.get_stats()
+
+        self.assertGreater(stats['page_size'], 0)
+        self.assertGreater(stats['database_size'], 0)
+        self.assertGreaterEqual(stats['free_size'], 0)
+
+    def test_profile_issues_flag_missing_wal(self):
+        # The test database lives in memory, where WAL is not available.
+        issues = DatabaseMaintenanceService.get_profile_issues()
+
+        self.assertTrue(any('journal_mode' in issue for issue in issues))
+
+    def test_profile_issues_empty_when_profile_is_active(self):
+        values = {'journal_mode': 'wal', 'busy_timeout': 5000}
+        with patch.object(
+            DatabaseMaintenanceService,
+            'pragma',
+            side_effect=lambda name, using='default': values[name],
+        ):
+            self.assertEqual(DatabaseMaintenanceService.get_profile_issues(), [])
+
+    def test_run_analyzes_and_checkpoints(self):
+        result = DatabaseMaintenanceService.run()
+
+        self.assertTrue(result['analyzed'])
+        # No WAL to checkpoint for the in-memory test database.
+        self.assertIsNone(result['checkpoint'])
+        self.assertEqual(set(result['before']), set(result['after']))
+
+    def test_utility_dry_run_reports_without_running(self):
+        with patch.object(DatabaseMaintenanceService, 'run') as mock_run:
+            payload = UtilityCleanupService.maintain_database({'dry_run': True})
+
+        mock_run.assert_not_called()
+        self.assertTrue(payload['dry_run'])
+        self.assertIn('database_size', payload['stats'])
+
+    def test_utility_execute_runs_maintenance(self):
+        payload = UtilityCleanupService.maintain_database({'dry_run': False, 'analyze': False})
+
+        self.assertFalse(payload['dry_run'])
+        self.assertFalse(payload['analyzed'])
+        self.assertIn('database_size', payload['stats_before'])
+
+    def test_command_runs_maintenance(self):
+        with patch.object(DatabaseMaintenanceService, 'run', wraps=DatabaseMaintenanceService.run) as mock_run:
+            call_command('maintain_database', '--skip-analyze', stdout=open('/dev/null', 'w'))
+
+        mock_run.assert_called_once_with(
+            analyze=False,
+            vacuum_pages=DatabaseMaintenanceService.DEFAULT_VACUUM_PAGES,
+        )
+
+    @override_settings(TESTING=False)
+    def test_check_warns_when_profile_is_inactive(self):
+        warnings = check_sqlite_runtime_profile(None, databases=['default'])
+
+        self.assertEqual([warning.id for warning in warnings], ['board.W005'])
+
+    @override_settings(TESTING=False)
+    def test_check_skips_without_database_option(self):
+        self.assertEqual(check_sqlite_runtime_profile(None), [])
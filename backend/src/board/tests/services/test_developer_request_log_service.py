@@ -0,0 +1,82 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+from board.models import DeveloperRequestLog, DeveloperToken
+from board.services.developer_request_log_service import DeveloperRequestLogService
+
+
+@override_settings(DEVELOPER_REQUEST_LOG_FLUSH_INTERVAL=5)
+class DeveloperRequestLogServiceTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='developer', password='developer')
+        cls.token = DeveloperToken.objects.create(
+            user=cls.user,
+            name='MCP',
+            token_prefix='abc123',
+            token_hash='a' * 64,
+            scopes=['posts:read'],
+        )
+
+    def setUp(self):
+        patcher = mock.patch.object(DeveloperRequestLogService, 'start_flusher')
+        self.start_flusher = patcher.start()
+        self.addCleanup(patcher.stop)
+        DeveloperRequestLogService.pending = []
+        self.addCleanup(setattr, DeveloperRequestLogService, 'pending', [])
+
+    def build_log(self, token=None, path='/api/developer/v1/me'):
+        return DeveloperRequestLog(
+            user=self.user,
+            token=token or self.token,
+            method='GET',
+            path=path,
+            status_code=200,
+        )
+
+    def test_logs_are_buffered_until_flush(self):
+        with self.assertNumQueries(0):
+            DeveloperRequestLogService.record(self.build_log(path='/a'))
+            DeveloperRequestLogService.record(self.build_log(path='/b'))
+
+        self.start_flusher.assert_called()
+        self.assertFalse(DeveloperRequestLog.objects.exists())
+
+        self.assertEqual(DeveloperRequestLogService.flush(), 2)
+        self.assertEqual(
+            sorted(DeveloperRequestLog.objects.values_list('path', flat=True)),
+            ['/a', '/b'],
+        )
+        self.assertEqual(DeveloperRequestLogService.flush(), 0)
+
+    def test_full_batch_wakes_flusher(self):
+        DeveloperRequestLogService.wake.clear()
+        self.addCleanup(DeveloperRequestLogService.wake.clear)
+
+        for _ in range(DeveloperRequestLogService.BATCH_SIZE):
+            DeveloperRequestLogService.record(self.build_log())
+
+        self.assertTrue(DeveloperRequestLogService.wake.is_set())
+
+    def test_logs_of_deleted_token_are_kept(self):
+        token = DeveloperToken.objects.create(
+            user=self.user,
+            name='Removed',
+            token_prefix='def456',
+            token_hash='b' * 64,
+            scopes=['posts:read'],
+        )
+        DeveloperRequestLogService.record(self.build_log(token=token))
+        DeveloperToken.objects.get(id=token.id).delete()
+
+        self.assertEqual(DeveloperRequestLogService.flush(), 1)
+        self.assertIsNone(DeveloperRequestLog.objects.get().token_id)
+
+    @override_settings(DEVELOPER_REQUEST_LOG_FLUSH_INTERVAL=0)
+    def test_logs_are_written_immediately_without_interval(self):
+        DeveloperRequestLogService.record(self.build_log())
+
+        self.start_flusher.assert_not_called()
+        self.assertEqual(DeveloperRequestLog.objects.count(), 1)
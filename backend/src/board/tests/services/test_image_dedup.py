@@ -59,6 +59,16 @@ class ImageDedupTestCase(TestCase):
 
         self.assertNotEqual(hash1, hash2)
 
+    def test_compute_image_hash_reuses_upload_handler_digest(self):
+        """업로드 핸들러가 받으면서 계산한 해시를 다시 읽지 않고 사용"""
+        img = self._create_test_image()
+        expected = PostService._compute_image_hash(img)
+        img.sha256_digest = bytes.fromhex(expected)
+
+        with patch.object(img, 'chunks') as mock_chunks:
+            self.assertEqual(PostService._compute_image_hash(img), expected)
+        mock_chunks.assert_not_called()
+
     def test_compute_image_hash_resets_seek(self):
         """해시 계산 후 파일 포인터가 처음으로 돌아가는지 확인"""
         img = self._create_test_image()
@@ -0,0 +1,186 @@
+import hashlib
+import os
+from io import BytesIO
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from board.models import BackgroundJob, ImageCache, User
+from board.services.background_job_service import BackgroundJobService
+from board.services.image_upload_service import ImageUploadError, ImageUploadService
+from modules.hash import get_sha256
+
+
+class ImageUploadServiceTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='uploader', password='test')
+
+    def setUp(self):
+        # Uploads are written under ``resources/media`` of the working directory.
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.media_root = os.path.join(temp_dir.name, 'resources', 'media')
+
+        cwd = os.getcwd()
+        os.chdir(temp_dir.name)
+        self.addCleanup(os.chdir, cwd)
+
+        settings_override = override_settings(
+            MEDIA_ROOT=self.media_root,
+            MEDIA_URL='/resources/media/',
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def create_upload(self, name, image_format, size=(2400, 1200)):
+        buffer = BytesIO()
+        Image.new('RGB', size, 'red').save(buffer, image_format)
+        return SimpleUploadedFile(name, buffer.getvalue())
+
+    def media_file(self, path):
+        return os.path.join(self.media_root, path)
+
+    def test_upload_returns_before_derivatives_are_written(self):
+        url = ImageUploadService.upload_content_image(
+            self.create_upload('photo.jpg', 'JPEG'),
+            user=self.user,
+        )
+
+        image_cache = ImageCache.objects.get()
+        self.assertEqual(url, '/resources/media/' + image_cache.path)
+        self.assertEqual(image_cache.status, ImageCache.Status.PENDING)
+        self.assertEqual((image_cache.width, image_cache.height), (1920, 960))
+        self.assertTrue(os.path.exists(self.media_file(image_cache.path)))
+        self.assertFalse(os.path.exists(self.media_file(image_cache.path + '.preview.jpg')))
+        self.assertTrue(BackgroundJob.objects.filter(task='media.process_upload').exists())
+
+        BackgroundJobService.run_pending()
+
+        image_cache.refresh_from_db()
+        self.assertEqual(image_cache.status, ImageCache.Status.READY)
+        self.assertTrue(os.path.exists(self.media_file(image_cache.path + '.preview.jpg')))
+        self.assertTrue(os.path.exists(self.media_file(image_cache.path + '.1440w.avif')))
+        with Image.open(self.media_file(image_cache.path)) as image:
+            self.assertEqual(image.size, (1920, 960))
+
+    def test_large_png_is_served_as_png_until_converted(self):
+        with patch.object(ImageUploadService, 'PNG_TO_JPG_MIN_SIZE', 0):
+            url = ImageUploadService.upload_content_image(self.create_upload('large.png', 'PNG'))
+
+        image_cache = ImageCache.objects.get()
+        self.assertTrue(url.endswith('.jpg'))
+        self.assertTrue(image_cache.source_path.endswith('.png'))
+        self.assertTrue(os.path.exists(self.media_file(image_cache.source_path)))
+
+        source_path = image_cache.source_path
+        BackgroundJobService.run_pending()
+
+        image_cache.refresh_from_db()
+        self.assertEqual(image_cache.status, ImageCache.Status.READY)
+        self.assertEqual(image_cache.source_path, '')
+        self.assertFalse(os.path.exists(self.media_file(source_path)))
+        with Image.open(self.media_file(image_cache.path)) as image:
+            self.assertEqual(image.format, 'JPEG')
+
+    def test_gif_is_transcoded_by_worker(self):
+        def fake_ffmpeg(command, check):
+            with open(command[-1], 'wb') as output:
+                output.write(b'mp4')
+
+        url = ImageUploadService.upload_content_image(self.create_upload('anim.gif', 'GIF', (20, 20)))
+        image_cache = ImageCache.objects.get()
+        self.assertTrue(url.endswith('.mp4'))
+        source_path = image_cache.source_path
+
+        with patch('board.services.image_upload_service.subprocess.run', side_effect=fake_ffmpeg):
+            BackgroundJobService.run_pending()
+
+        image_cache.refresh_from_db()
+        self.assertEqual(image_cache.status, ImageCache.Status.READY)
+        self.assertTrue(os.path.exists(self.media_file(image_cache.path)))
+        self.assertTrue(os.path.exists(self.media_file(image_cache.path + '.preview.jpg')))
+        self.assertFalse(os.path.exists(self.media_file(source_path)))
+
+    def test_failed_processing_is_retried(self):
+        ImageUploadService.upload_content_image(self.create_upload('anim.gif', 'GIF', (20, 20)))
+
+        with patch('board.services.image_upload_service.subprocess.run', side_effect=OSError):
+            BackgroundJobService.run_pending()
+
+        self.assertEqual(ImageCache.objects.get().status, ImageCache.Status.FAILED)
+        job = BackgroundJob.objects.get(task='media.process_upload')
+        self.assertEqual(job.status, BackgroundJob.Status.PENDING)
+        self.assertEqual(job.attempts, 1)
+
+    def test_file_that_is_not_an_image_is_rejected(self):
+        for name in ('bad.jpg', 'bad.mp4'):
+            with self.subTest(name=name):
+                with self.assertRaises(ImageUploadError) as context:
+                    ImageUploadService.upload_content_image(
+                        SimpleUploadedFile(name, b'not an image at all'),
+                    )
+
+                self.assertEqual(context.exception.code, 'image.upload_failed')
+                self.assertFalse(ImageCache.objects.exists())
+                self.assertFalse(BackgroundJob.objects.exists())
+                upload_dir = os.path.dirname(ImageUploadService.make_upload_path()[0])
+                self.assertEqual(os.listdir(upload_dir), [])
+
+    def test_failed_upload_is_replaced_by_identical_upload(self):
+        first_url = ImageUploadService.upload_content_image(self.create_upload('photo.jpg', 'JPEG'))
+        ImageCache.objects.update(status=ImageCache.Status.FAILED)
+
+        duplicate = self.create_upload('again.jpg', 'JPEG')
+        duplicate.sha256_digest = hashlib.sha256(duplicate.read()).digest()
+        duplicate.seek(0)
+        url = ImageUploadService.upload_content_image(duplicate)
+
+        self.assertNotEqual(url, first_url)
+        image_cache = ImageCache.objects.get()
+        self.assertEqual(url, '/resources/media/' + image_cache.path)
+        self.assertEqual(image_cache.status, ImageCache.Status.PENDING)
+
+    def test_duplicate_upload_leaves_no_file(self):
+        first_url = ImageUploadService.upload_content_image(self.create_upload('photo.jpg', 'JPEG'))
+        upload_dir = os.path.dirname(self.media_file(ImageCache.objects.get().path))
+
+        url = ImageUploadService.upload_content_image(self.create_upload('again.jpg', 'JPEG'))
+
+        self.assertEqual(url, first_url)
+        self.assertEqual(ImageCache.objects.count(), 1)
+        self.assertEqual(os.listdir(upload_dir), [os.path.basename(first_url)])
+
+    def test_hashed_duplicate_is_found_before_anything_is_written(self):
+        first_url = ImageUploadService.upload_content_image(self.create_upload('photo.jpg', 'JPEG'))
+        duplicate = self.create_upload('again.jpg', 'JPEG')
+        duplicate.sha256_digest = hashlib.sha256(duplicate.read()).digest()
+        duplicate.seek(0)
+
+        with patch('board.services.image_upload_service.make_path') as mock_make_path:
+            url = ImageUploadService.upload_content_image(duplicate)
+
+        self.assertEqual(url, first_url)
+        mock_make_path.assert_not_called()
+
+    def test_spooled_upload_is_moved_into_place(self):
+        content = self.create_upload('photo.jpg', 'JPEG').read()
+        upload = TemporaryUploadedFile('photo.jpg', 'image/jpeg', len(content), None)
+        upload.write(content)
+        upload.seek(0)
+        upload.sha256_digest = hashlib.sha256(content).digest()
+        spooled_path = upload.temporary_file_path()
+
+        ImageUploadService.upload_content_image(upload)
+        upload.close()
+
+        image_cache = ImageCache.objects.get()
+        self.assertEqual(image_cache.key, get_sha256(content))
+        self.assertFalse(os.path.exists(spooled_path))
+        stored_path = self.media_file(image_cache.path)
+        with open(stored_path, 'rb') as stored:
+            self.assertEqual(stored.read(), content)
+        self.assertEqual(os.stat(stored_path).st_mode & 0o777, 0o644)
@@ -0,0 +1,172 @@
+import os
+from io import BytesIO, StringIO
+from tempfile import TemporaryDirectory
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from board.models import ImageCache, Post, PostContent, User
+from board.services.background_job_service import BackgroundJobService
+from board.services.image_variant_service import ImageVariantService
+
+
+class ImageVariantServiceTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='variant-author', password='test')
+
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.media_root = temp_dir.name
+
+        settings_override = override_settings(
+            MEDIA_ROOT=self.media_root,
+            MEDIA_URL='/resources/media/',
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def create_image(self, path, size=(1500, 1000), mode='RGB'):
+        full_path = os.path.join(self.media_root, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        Image.new(mode, size).save(full_path)
+        return full_path
+
+    def test_generate_writes_width_steps_in_each_format(self):
+        path = self.create_image('images/content/2024/1/1/photo.jpg')
+
+        self.assertEqual(ImageVariantService.generate(path), (1500, 1000))
+
+        for ext in ('avif', 'webp'):
+            for width in (480, 960, 1440):
+                with Image.open(f'{path}.{width}w.{ext}') as variant:
+                    self.assertEqual(variant.width, width)
+            with Image.open(f'{path}.{ext}') as variant:
+                self.assertEqual(variant.size, (1500, 1000))
+
+    def test_narrow_image_only_gets_full_width_variants(self):
+        path = self.create_image('images/content/2024/1/1/icon.png', size=(300, 200), mode='P')
+
+        ImageVariantService.generate(path)
+
+        self.assertTrue(os.path.exists(f'{path}.avif'))
+        self.assertTrue(os.path.exists(f'{path}.webp'))
+        self.assertFalse(os.path.exists(f'{path}.480w.webp'))
+
+    def test_get_sources_lists_steps_and_full_width(self):
+        sources = ImageVariantService.get_sources('/resources/media/a.jpg', 1000)
+
+        self.assertEqual(sources, [
+            {
+                'type': 'image/avif',
+                'srcset': '/resources/media/a.jpg.480w.avif 480w, '
+                          '/resources/media/a.jpg.960w.avif 960w, '
+                          '/resources/media/a.jpg.avif 1000w',
+            },
+            {
+                'type': 'image/webp',
+                'srcset': '/resources/media/a.jpg.480w.webp 480w, '
+                          '/resources/media/a.jpg.960w.webp 960w, '
+                          '/resources/media/a.jpg.webp 1000w',
+            },
+        ])
+
+    def test_add_sources_wraps_uploaded_images_in_picture(self):
+        ImageCache.objects.create(key='a', path='images/content/a.jpg', width=800, height=600)
+
+        html = ImageVariantService.add_sources(
+            '<p><img class="lazy" data-src="/resources/media/images/content/a.jpg" '
+            'src="/resources/media/images/content/a.jpg.preview.jpg"></p>'
+            '<p><img src="/resources/media/images/content/a.jpg" width="400"></p>'
+        )
+
+        self.assertEqual(html.count('<picture>'), 2)
+        self.assertIn(
+            '<source data-srcset="/resources/media/images/content/a.jpg.480w.avif 480w, '
+            '/resources/media/images/content/a.jpg.avif 800w" sizes="(min-width: 80rem) 56rem, 100vw" '
+            'type="image/avif"/>',
+            html,
+        )
+        self.assertIn('height="600"', html)
+        self.assertIn('<source sizes="(min-width: 80rem) 56rem, 100vw" srcset=', html)
+        # An explicit size set by the author is kept.
+        self.assertIn('<img src="/resources/media/images/content/a.jpg" width="400"/>', html)
+
+    def test_add_sources_leaves_other_images_alone(self):
+        ImageCache.objects.create(key='gif', path='images/content/b.mp4', width=0)
+        html = (
+            '<p><img src="https://example.com/resources/media/images/content/a.jpg"></p>'
+            '<p><img src="/resources/media/images/content/unknown.jpg"></p>'
+            '<p><img src="/resources/media/images/content/b.mp4.preview.jpg"></p>'
+        )
+
+        self.assertEqual(ImageVariantService.add_sources(html), html)
+
+    def test_post_content_stores_picture_markup(self):
+        ImageCache.objects.create(key='a', path='images/content/a.jpg', width=800, height=600)
+        post = Post.objects.create(author=self.user, title='Pictures', url='pictures')
+
+        post_content = PostContent.objects.create(
+            post=post,
+            content_html='<h2>Photo</h2><p><img src="/resources/media/images/content/a.jpg"></p>',
+        )
+
+        self.assertNotIn('<picture>', post_content.content_html)
+        self.assertIn('<picture><source', post_content.content_html_with_ids)
+        self.assertIn('id="photo"', post_content.content_html_with_ids)
+
+    def test_worker_stores_cover_size_and_variants(self):
+        buffer = BytesIO()
+        Image.new('RGB', (1200, 800), 'blue').save(buffer, 'JPEG')
+        post = Post.objects.create(
+            author=self.user,
+            title='Cover',
+            url='cover',
+            image=SimpleUploadedFile('cover.jpg', buffer.getvalue()),
+        )
+        self.assertEqual(post.get_image_sources(), [])
+
+        BackgroundJobService.run_pending()
+
+        post.refresh_from_db()
+        self.assertEqual((post.image_width, post.image_height), (1200, 800))
+        self.assertTrue(os.path.exists(post.image.path + '.960w.avif'))
+        self.assertEqual(
+            post.get_image_sources()[1]['srcset'],
+            f'{post.image.url}.480w.webp 480w, {post.image.url}.960w.webp 960w, '
+            f'{post.image.url}.webp 1200w',
+        )
+
+        # A later full save does not write back the size it loaded before.
+        stale_post = Post.objects.get(id=post.id)
+        Post.objects.filter(id=post.id).update(image_width=1000)
+        stale_post.title = 'Renamed'
+        stale_post.save()
+        post.refresh_from_db()
+        self.assertEqual(post.image_width, 1000)
+
+    def test_backfill_generates_variants_and_refreshes_content(self):
+        self.create_image('images/content/2024/1/1/old.jpg', size=(1000, 500))
+        self.create_image('images/content/2024/1/1/old.jpg.preview.jpg', size=(10, 5))
+        image_cache = ImageCache.objects.create(key='old', path='images/content/2024/1/1/old.jpg')
+        post = Post.objects.create(author=self.user, title='Old', url='old')
+        PostContent.objects.create(
+            post=post,
+            content_html='<p><img src="/resources/media/images/content/2024/1/1/old.jpg"></p>',
+        )
+
+        call_command('backfill_image_variants', stdout=StringIO())
+
+        image_cache.refresh_from_db()
+        self.assertEqual((image_cache.width, image_cache.height), (1000, 500))
+        self.assertTrue(os.path.exists(
+            os.path.join(self.media_root, 'images/content/2024/1/1/old.jpg.960w.webp')
+        ))
+        self.assertFalse(os.path.exists(
+            os.path.join(self.media_root, 'images/content/2024/1/1/old.jpg.preview.jpg.webp')
+        ))
+        post.content.refresh_from_db()
+        self.assertIn('<picture>', post.content.content_html_with_ids)
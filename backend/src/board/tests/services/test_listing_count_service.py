@@ -0,0 +1,65 @@
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from board.models import Post, PostConfig
+from board.services.listing_count_service import ListingCountService
+from board.services.public_cache_service import PublicCacheScope
+from board.services.public_post_service import PublicPostService
+
+
+@override_settings(PUBLIC_CACHE_TIMEOUT=600)
+class ListingCountServiceTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='listing-count-author', password='test')
+        cls.posts = []
+        for index in range(5):
+            post = Post.objects.create(
+                title=f'Listing Post {index}',
+                url=f'listing-post-{index}',
+                author=cls.author,
+                published_date=timezone.now(),
+            )
+            PostConfig.objects.create(post=post, hide=False)
+            cls.posts.append(post)
+
+    def setUp(self):
+        cache.clear()
+
+    def get_count(self, page=1, per_page=24):
+        return ListingCountService.get_count(
+            'test_listing',
+            [],
+            PublicPostService.filter_public_posts(Post.objects.all()),
+            scopes=(PublicCacheScope.POSTS,),
+            page=page,
+            per_page=per_page,
+        )
+
+    def test_count_is_cached_until_post_is_hidden(self):
+        self.assertEqual(self.get_count(), 5)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_count(), 5)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            config = self.posts[0].config
+            config.hide = True
+            config.save()
+
+        self.assertEqual(self.get_count(), 4)
+
+    def test_large_result_set_reports_lower_bound(self):
+        with patch.object(ListingCountService, 'EXACT_COUNT_LIMIT', 2):
+            # Counts at most 3 rows from the start of page 2.
+            self.assertEqual(self.get_count(page=2, per_page=1), 4)
+            # The lower bound is not cached; the last page counts exactly.
+            self.assertEqual(self.get_count(page=4, per_page=1), 5)
+
+    def test_page_past_the_end_is_not_cached(self):
+        self.assertEqual(self.get_count(page=3, per_page=10), 20)
+        self.assertEqual(self.get_count(), 5)
@@ -0,0 +1,90 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.utils import timezone
+
+from board.models import Post, PostContent, Series, StaticPage
+from board.services.agent_content_service import AgentContentService
+from board.services.markdown_rendition_service import MarkdownRenditionService
+
+
+class MarkdownRenditionServiceTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='rendition-author', password='test')
+        cls.post = Post.objects.create(
+            title='Rendition Post',
+            url='rendition-post',
+            author=cls.author,
+            published_date=timezone.now(),
+        )
+        cls.content = PostContent.objects.create(
+            post=cls.post,
+            content_html='<h2>Heading</h2><p>Some <strong>bold</strong> text</p>',
+        )
+        cls.series = Series.objects.create(
+            owner=cls.author,
+            name='Rendition Series',
+            url='rendition-series',
+            text_html='<p>Series <em>intro</em></p>',
+        )
+        cls.page = StaticPage.objects.create(
+            slug='rendition-page',
+            title='Rendition Page',
+            content='<p>Page body</p>',
+        )
+
+    def test_renditions_are_stored_on_save(self):
+        self.assertEqual(self.content.content_markdown, '## Heading\n\nSome **bold** text')
+        self.assertTrue(MarkdownRenditionService.is_post_content_fresh(self.content))
+        self.assertEqual(self.series.text_markdown, 'Series _intro_')
+        self.assertEqual(self.page.content_markdown, 'Page body')
+
+    def test_fresh_rendition_is_served_without_conversion(self):
+        content = PostContent.objects.get(id=self.content.id)
+
+        with patch.object(AgentContentService, 'html_to_markdown') as html_to_markdown:
+            markdown = MarkdownRenditionService.get_post_content_markdown(content)
+
+        html_to_markdown.assert_not_called()
+        self.assertEqual(markdown, '## Heading\n\nSome **bold** text')
+
+    def test_update_fields_save_refreshes_rendition(self):
+        self.content.content_html = '<p>Changed</p>'
+        self.content.save(update_fields=['content_html'])
+
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.content_markdown, 'Changed')
+
+    def test_stale_rendition_is_detected_and_backfilled(self):
+        PostContent.objects.filter(id=self.content.id).update(content_html='<p>Updated</p>')
+        StaticPage.objects.filter(id=self.page.id).update(content_markdown_hash='')
+
+        content = PostContent.objects.get(id=self.content.id)
+        self.assertEqual(MarkdownRenditionService.get_post_content_markdown(content), 'Updated')
+        self.assertEqual(MarkdownRenditionService.find_stale(), {
+            'posts': [self.content.id],
+            'series': [],
+            'static pages': [self.page.id],
+        })
+
+        with self.assertRaises(CommandError):
+            call_command('backfill_agent_markdown', '--check', stdout=StringIO())
+
+        call_command('backfill_agent_markdown', stdout=StringIO())
+
+        content.refresh_from_db()
+        self.assertEqual(content.content_markdown, 'Updated')
+        self.assertFalse(any(MarkdownRenditionService.find_stale().values()))
+        call_command('backfill_agent_markdown', '--check', stdout=StringIO())
+
+    def test_converter_version_change_marks_renditions_stale(self):
+        with patch.object(MarkdownRenditionService, 'VERSION', MarkdownRenditionService.VERSION + 1):
+            stale = MarkdownRenditionService.find_stale()
+
+        self.assertEqual(stale['posts'], [self.content.id])
+        self.assertEqual(stale['series'], [self.series.id])
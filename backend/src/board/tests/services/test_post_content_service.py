@@ -1,5 +1,13 @@
-from django.test import SimpleTestCase, override_settings
+from io import StringIO
+from unittest.mock import patch
 
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from board.models import Post, PostConfig, PostContent
 from board.services.post_content_service import PostContentService
 
 
@@ -161,3 +169,71 @@ class PostContentServiceTest(SimpleTestCase):
             PostContentService.normalize_content_html(html),
             '<img src=/resources/media/images/content/a.png>',
         )
+
+
+class PostContentTableOfContentsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(
+            username='toc-author',
+            email='toc@example.com',
+            password='password123',
+        )
+        cls.post = Post.objects.create(
+            title='ToC Post',
+            url='toc-post',
+            author=cls.author,
+            published_date=timezone.now(),
+        )
+        PostConfig.objects.create(post=cls.post, hide=False)
+        cls.content = PostContent.objects.create(
+            post=cls.post,
+            content_html='<h2>Intro</h2><p>Body</p><h3>Intro</h3>',
+        )
+
+    def test_save_precomputes_heading_ids_and_toc(self):
+        """저장 시 헤딩 id가 붙은 HTML과 목차를 함께 저장한다"""
+        self.content.refresh_from_db()
+
+        self.assertEqual(
+            self.content.content_html_with_ids,
+            '<h2 id="intro">Intro</h2><p>Body</p><h3 id="intro-1">Intro</h3>',
+        )
+        self.assertEqual(self.content.toc, [
+            {'level': 2, 'text': 'Intro', 'id': 'intro'},
+            {'level': 3, 'text': 'Intro', 'id': 'intro-1'},
+        ])
+        self.assertEqual(self.content.content_html, '<h2>Intro</h2><p>Body</p><h3>Intro</h3>')
+
+    def test_update_fields_save_refreshes_toc(self):
+        self.content.content_html = '<h2>Changed</h2>'
+        self.content.save(update_fields=['content_html'])
+        self.content.refresh_from_db()
+
+        self.assertEqual(self.content.toc, [{'level': 2, 'text': 'Changed', 'id': 'changed'}])
+
+    def test_post_detail_does_not_parse_html(self):
+        url = reverse('post_detail', kwargs={'username': self.author.username, 'post_url': self.post.url})
+
+        with patch('board.services.post_content_service.extract_table_of_contents') as extract:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        extract.assert_not_called()
+        self.assertEqual(response.context['table_of_contents'][0]['id'], 'intro')
+
+    def test_unsynced_rows_fall_back_and_are_backfilled(self):
+        PostContent.objects.filter(pk=self.content.pk).update(content_html_with_ids='', toc=[])
+        self.content.refresh_from_db()
+
+        html, toc = PostContentService.get_table_of_contents(self.content)
+        self.assertIn('id="intro"', html)
+        self.assertEqual(len(toc), 2)
+
+        stdout = StringIO()
+        call_command('backfill_post_toc', stdout=stdout)
+        self.content.refresh_from_db()
+
+        self.assertIn('Updated table of contents for 1 posts.', stdout.getvalue())
+        self.assertIn('id="intro"', self.content.content_html_with_ids)
+        self.assertEqual(len(self.content.toc), 2)
@@ -0,0 +1,98 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from board.models import Comment, Config, Post, PostConfig, PostContent, PostLikes
+from board.services.post_counter_service import PostCounterService
+from board.services.user_service import UserService
+
+
+class PostCounterServiceTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(
+            username='counter-author',
+            email='counter-author@example.com',
+            password='password123',
+        )
+        Config.objects.create(user=cls.author)
+        cls.reader = User.objects.create_user(
+            username='counter-reader',
+            email='counter-reader@example.com',
+            password='password123',
+        )
+        cls.post = Post.objects.create(
+            title='Counter Post',
+            url='counter-post',
+            author=cls.author,
+            published_date=timezone.now(),
+        )
+        PostContent.objects.create(post=cls.post, content_html='<p>Counter</p>')
+        PostConfig.objects.create(post=cls.post, hide=False, advertise=False)
+
+    def get_counters(self):
+        self.post.refresh_from_db(fields=['like_count', 'comment_count'])
+        return self.post.like_count, self.post.comment_count
+
+    def test_likes_and_comments_update_counters(self):
+        like = PostLikes.objects.create(post=self.post, user=self.reader)
+        comment = Comment.objects.create(post=self.post, author=self.reader, text_html='<p>hi</p>')
+        Comment.objects.create(post=self.post, author=self.author, parent=comment, text_html='<p>re</p>')
+        self.assertEqual(self.get_counters(), (1, 2))
+
+        like.delete()
+        comment.delete()
+        self.assertEqual(self.get_counters(), (0, 0))
+
+    def test_stale_post_save_keeps_counters(self):
+        """메모리에 남은 오래된 카운터 값으로 저장해도 카운터를 덮어쓰지 않는다"""
+        stale_post = Post.objects.get(pk=self.post.pk)
+        PostLikes.objects.create(post=self.post, user=self.reader)
+
+        stale_post.title = 'Renamed Counter Post'
+        stale_post.save()
+
+        self.assertEqual(self.get_counters(), (1, 0))
+        self.assertEqual(Post.objects.get(pk=self.post.pk).title, 'Renamed Counter Post')
+
+    def test_like_view_returns_counter(self):
+        self.client.force_login(self.reader)
+
+        response = self.client.post(reverse('like_post', args=[self.post.url]))
+
+        self.assertEqual(response.json()['count_likes'], 1)
+        self.assertEqual(self.get_counters(), (1, 0))
+
+    def test_dashboard_stats_read_counters(self):
+        PostLikes.objects.create(post=self.post, user=self.reader)
+        Comment.objects.create(post=self.post, author=self.reader, text_html='<p>hi</p>')
+
+        stats = UserService.get_user_dashboard_stats(self.author)
+
+        self.assertEqual(stats['total_likes'], 1)
+        self.assertEqual(stats['total_comments'], 1)
+
+    def test_reconcile_repairs_drift(self):
+        PostLikes.objects.bulk_create([PostLikes(post=self.post, user=self.reader)])
+        Post.objects.filter(pk=self.post.pk).update(comment_count=5)
+
+        self.assertEqual([post.id for post in PostCounterService.find_drift()], [self.post.id])
+        self.assertEqual(PostCounterService.reconcile(), 1)
+        self.assertEqual(self.get_counters(), (1, 0))
+        self.assertEqual(PostCounterService.reconcile(), 0)
+
+    def test_reconcile_command_dry_run_does_not_write(self):
+        Post.objects.filter(pk=self.post.pk).update(like_count=3)
+
+        stdout = StringIO()
+        call_command('reconcile_post_counters', '--dry-run', stdout=stdout)
+
+        self.assertIn('likes 3 -> 0', stdout.getvalue())
+        self.assertEqual(self.get_counters(), (3, 0))
+
+        call_command('reconcile_post_counters', stdout=StringIO())
+        self.assertEqual(self.get_counters(), (0, 0))
@@ -0,0 +1,130 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from board.models import Post, PostConfig, PostContent, Tag
+from board.services.post_search_service import PostSearchResults, PostSearchService
+from board.services.search_index_service import SearchIndexService
+
+
+class PostSearchServiceTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(
+            username='search-index-author',
+            email='search-index@example.com',
+            password='password123',
+        )
+        cls.post = cls.create_post(
+            'Indexed Rust Notes',
+            'indexed-rust-notes',
+            '<p>Ownership &amp; borrowing</p>',
+            ['rust'],
+        )
+
+    @classmethod
+    def create_post(cls, title: str, url: str, content_html: str, tags: list[str]) -> Post:
+        post = Post.objects.create(
+            title=title,
+            url=url,
+            author=cls.author,
+            published_date=timezone.now(),
+        )
+        PostConfig.objects.create(post=post, hide=False, advertise=False)
+        PostContent.objects.create(post=post, content_html=content_html)
+        for value in tags:
+            tag, _ = Tag.objects.get_or_create(value=value)
+            post.tags.add(tag)
+        return post
+
+    def setUp(self):
+        SearchIndexService.reset_availability()
+
+    def tearDown(self):
+        SearchIndexService.reset_availability()
+
+    def get_index_row(self, post_id: int):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT title, tags, content FROM {SearchIndexService.TABLE_NAME} WHERE rowid = %s',
+                [post_id],
+            )
+            return cursor.fetchall()
+
+    def search_urls(self, *keywords: str) -> list[str]:
+        results = PostSearchService.search(list(keywords))
+        return [post.url for post in results[:30]]
+
+    def test_index_is_available_on_sqlite(self):
+        self.assertTrue(SearchIndexService.is_available())
+        self.assertIsInstance(PostSearchService.search(['rust']), PostSearchResults)
+
+    def test_saved_post_is_indexed_as_plain_text(self):
+        """저장된 포스트는 HTML 태그가 제거된 본문과 태그로 색인된다"""
+        self.assertEqual(
+            self.get_index_row(self.post.id),
+            [('Indexed Rust Notes', 'rust', 'Ownership & borrowing')],
+        )
+
+    def test_content_update_refreshes_index(self):
+        content = self.post.content
+        content.content_html = '<p>Lifetimes explained</p>'
+        content.save()
+
+        self.assertEqual(self.search_urls('Lifetimes'), ['indexed-rust-notes'])
+        self.assertEqual(self.search_urls('borrowing'), [])
+
+    def test_tag_changes_refresh_index(self):
+        tag = Tag.objects.create(value='systems')
+        self.post.tags.add(tag)
+        self.assertEqual(self.search_urls('systems'), ['indexed-rust-notes'])
+
+        self.post.tags.remove(tag)
+        self.assertEqual(self.search_urls('systems'), [])
+
+    def test_deleted_post_is_removed_from_index(self):
+        post_id = self.post.id
+        self.post.delete()
+
+        self.assertEqual(self.get_index_row(post_id), [])
+
+    def test_short_keyword_uses_substring_scan(self):
+        """트라이그램 최소 길이보다 짧은 검색어도 찾을 수 있다"""
+        self.create_post('Go Concurrency', 'go-concurrency', '<p>Channels</p>', [])
+
+        results = PostSearchService.search(['Go'])
+
+        self.assertIn('go-concurrency', [post.url for post in results[:30]])
+        self.assertEqual(results[:30][0].positions, ['제목'])
+
+    def test_title_match_ranks_above_content_match(self):
+        self.create_post('Weekly Digest', 'weekly-digest', '<p>Some rust tooling links</p>', [])
+
+        self.assertEqual(
+            self.search_urls('rust'),
+            ['indexed-rust-notes', 'weekly-digest'],
+        )
+
+    def test_falls_back_to_scan_query_without_index(self):
+        with patch.object(SearchIndexService, 'is_available', return_value=False):
+            results = PostSearchService.search(['rust'])
+
+        self.assertNotIsInstance(results, PostSearchResults)
+        post = results.get()
+        self.assertEqual(post.url, 'indexed-rust-notes')
+        self.assertEqual(list(PostSearchService.get_positions(post)), ['제목', '태그'])
+
+    def test_rebuild_command_reindexes_posts(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SearchIndexService.TABLE_NAME}')
+
+        stdout = StringIO()
+        call_command('rebuild_search_index', stdout=stdout)
+
+        self.assertIn('Indexed 1 posts.', stdout.getvalue())
+        self.assertEqual(self.search_urls('borrowing'), ['indexed-rust-notes'])
@@ -0,0 +1,119 @@
+from datetime import timedelta
+from unittest.mock import Mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from board.models import Comment, Post, PostConfig, PostContent, Profile
+from board.services.public_cache_service import PublicCacheScope, PublicCacheService
+
+
+@override_settings(PUBLIC_CACHE_TIMEOUT=600)
+class PublicCacheServiceTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(
+            username='public-cache-author',
+            email='public-cache@example.com',
+            password='password123',
+        )
+        Profile.objects.create(user=cls.author, role=Profile.Role.EDITOR)
+        User.objects.create_user(
+            username='public-cache-admin',
+            email='public-cache-admin@example.com',
+            password='password123',
+            is_staff=True,
+        )
+        cls.post = cls.create_post('Cached Post', 'cached-post', timezone.now())
+
+    @classmethod
+    def create_post(cls, title: str, url: str, published_date) -> Post:
+        post = Post.objects.create(
+            title=title,
+            url=url,
+            author=cls.author,
+            published_date=published_date,
+        )
+        PostConfig.objects.create(post=post, hide=False, advertise=False)
+        PostContent.objects.create(post=post, content_html=f'<p>{title}</p>')
+        return post
+
+    def setUp(self):
+        cache.clear()
+
+    def test_builder_runs_once_until_scope_is_bumped(self):
+        builder = Mock(return_value=['value'])
+
+        first = PublicCacheService.get_or_set('test', [1], builder, scopes=(PublicCacheScope.POSTS,))
+        second = PublicCacheService.get_or_set('test', [1], builder, scopes=(PublicCacheScope.POSTS,))
+        self.assertEqual(first, ['value'])
+        self.assertEqual(second, ['value'])
+        self.assertEqual(builder.call_count, 1)
+
+        PublicCacheService.bump(PublicCacheScope.POSTS)
+        PublicCacheService.get_or_set('test', [1], builder, scopes=(PublicCacheScope.POSTS,))
+        self.assertEqual(builder.call_count, 2)
+
+    def test_unrelated_scope_bump_keeps_entry(self):
+        builder = Mock(return_value='value')
+
+        PublicCacheService.get_or_set('test', [], builder, scopes=(PublicCacheScope.SERIES,))
+        PublicCacheService.bump(PublicCacheScope.ENGAGEMENT)
+        PublicCacheService.get_or_set('test', [], builder, scopes=(PublicCacheScope.SERIES,))
+
+        self.assertEqual(builder.call_count, 1)
+
+    def test_key_parts_are_isolated(self):
+        PublicCacheService.get_or_set('test', [1], lambda: 'first')
+
+        self.assertEqual(PublicCacheService.get_or_set('test', [2], lambda: 'second'), 'second')
+
+    def test_model_saves_bump_their_scopes(self):
+        """포스트와 댓글 저장은 커밋 시점에 해당 버전 키를 올린다"""
+        versions = PublicCacheService.get_versions(PublicCacheScope.ALL)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Comment.objects.create(post=self.post, author=self.author, text_html='<p>hi</p>')
+        after_comment = PublicCacheService.get_versions(PublicCacheScope.ALL)
+        self.assertNotEqual(after_comment[PublicCacheScope.ENGAGEMENT], versions[PublicCacheScope.ENGAGEMENT])
+        self.assertEqual(after_comment[PublicCacheScope.POSTS], versions[PublicCacheScope.POSTS])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post.save()
+        after_post = PublicCacheService.get_versions(PublicCacheScope.ALL)
+        self.assertNotEqual(after_post[PublicCacheScope.POSTS], versions[PublicCacheScope.POSTS])
+
+    def test_scheduled_post_caps_timeout(self):
+        self.create_post('Scheduled Post', 'scheduled-post', timezone.now() + timedelta(seconds=30))
+
+        timeout = PublicCacheService.resolve_timeout((PublicCacheScope.POSTS,))
+
+        self.assertLessEqual(timeout, 31)
+        self.assertEqual(PublicCacheService.resolve_timeout((PublicCacheScope.SITE,)), 600)
+
+    @override_settings(PUBLIC_CACHE_TIMEOUT=0)
+    def test_disabled_cache_always_builds(self):
+        builder = Mock(return_value='value')
+
+        PublicCacheService.get_or_set('test', [], builder)
+        PublicCacheService.get_or_set('test', [], builder)
+
+        self.assertEqual(builder.call_count, 2)
+
+    def test_anonymous_index_is_served_from_cache_until_post_changes(self):
+        response = self.client.get('/')
+        self.assertEqual([post.url for post in response.context['posts']], ['cached-post'])
+
+        Post.objects.filter(pk=self.post.pk).update(title='Changed Without Save')
+        response = self.client.get('/')
+        self.assertEqual(response.context['posts'][0].title, 'Cached Post')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_post('Fresh Post', 'fresh-post', timezone.now())
+        response = self.client.get('/')
+        self.assertEqual(
+            [post.url for post in response.context['posts']],
+            ['fresh-post', 'cached-post'],
+        )
@@ -0,0 +1,108 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from board.models import Post, PostConfig, PostContent, PostLikes, RelatedPost, Tag
+from board.services.background_job_service import BackgroundJobService
+from board.services.related_post_service import RelatedPostService
+
+
+class RelatedPostServiceTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(
+            username='related-author',
+            email='related-author@example.com',
+            password='password123',
+        )
+        cls.other_author = User.objects.create_user(
+            username='related-other',
+            email='related-other@example.com',
+            password='password123',
+        )
+        cls.python = Tag.objects.create(value='python')
+        cls.django = Tag.objects.create(value='django')
+
+    def create_post(self, url, author, tags, hide=False):
+        post = Post.objects.create(
+            title=url,
+            url=url,
+            author=author,
+            published_date=timezone.now(),
+        )
+        PostContent.objects.create(post=post, content_html=f'<p>{url}</p>')
+        PostConfig.objects.create(post=post, hide=hide, advertise=False)
+        post.tags.add(*tags)
+        BackgroundJobService.run_pending()
+        return post
+
+    def related_urls(self, post):
+        return {related_post.url for related_post in RelatedPostService.get_related_posts(post)}
+
+    def test_retagging_builds_lists_for_post_and_its_neighbors(self):
+        base = self.create_post('base', self.author, [self.python])
+        neighbor = self.create_post('neighbor', self.other_author, [self.python, self.django])
+
+        self.assertEqual(self.related_urls(neighbor), {'base'})
+        self.assertEqual(self.related_urls(base), set())
+
+        RelatedPostService.rebuild(base)
+        self.assertEqual(self.related_urls(base), {'neighbor'})
+
+        neighbor.tags.remove(self.python)
+        BackgroundJobService.run_pending()
+        self.assertEqual(self.related_urls(base), set())
+
+    def test_stored_score_orders_by_overlap_and_author(self):
+        base = self.create_post('base', self.author, [self.python, self.django])
+        self.create_post('one-tag', self.other_author, [self.python])
+        self.create_post('two-tags', self.other_author, [self.python, self.django])
+        self.create_post('same-author', self.author, [self.python, self.django])
+
+        RelatedPostService.rebuild(base)
+
+        scores = dict(
+            RelatedPost.objects.filter(post=base).values_list('related_post__url', 'score')
+        )
+        self.assertGreater(scores['two-tags'], scores['one-tag'])
+        self.assertEqual(scores['two-tags'] - scores['same-author'], RelatedPostService.SAME_AUTHOR_PENALTY)
+
+    def test_hidden_posts_are_filtered_at_read_time(self):
+        """색인에 남아 있어도 숨겨진 글은 관련 글로 노출하지 않는다"""
+        base = self.create_post('base', self.author, [self.python])
+        neighbor = self.create_post('neighbor', self.other_author, [self.python])
+        RelatedPostService.rebuild(base)
+
+        PostConfig.objects.filter(post=neighbor).update(hide=True)
+
+        self.assertTrue(RelatedPost.objects.filter(post=base).exists())
+        self.assertEqual(self.related_urls(base), set())
+
+    def test_likes_shift_stored_score_until_popularity_caps(self):
+        base = self.create_post('base', self.author, [self.python])
+        neighbor = self.create_post('neighbor', self.other_author, [self.python])
+        RelatedPostService.rebuild(base)
+        entry = RelatedPost.objects.get(post=base)
+
+        PostLikes.objects.create(post=neighbor, user=self.author)
+        entry.refresh_from_db()
+        self.assertEqual(entry.score - entry.tag_overlap * 3, 5 + 2)
+
+        Post.objects.filter(pk=neighbor.pk).update(like_count=10)
+        PostLikes.objects.create(post=neighbor, user=self.other_author)
+        score = RelatedPost.objects.get(pk=entry.pk).score
+        self.assertEqual(score, entry.score)
+
+    def test_rebuild_command_fills_missing_lists(self):
+        base = self.create_post('base', self.author, [self.python])
+        self.create_post('neighbor', self.other_author, [self.python])
+        RelatedPost.objects.all().delete()
+
+        stdout = StringIO()
+        call_command('rebuild_related_posts', '--missing', stdout=stdout)
+
+        self.assertIn('Rebuilt related posts for 2 posts.', stdout.getvalue())
+        self.assertEqual(self.related_urls(base), {'neighbor'})
@@ -0,0 +1,87 @@
+from dataclasses import FrozenInstanceError
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+
+from board.models import SiteContentScope, SiteNotice, SiteSetting, SocialAuthProvider, StaticPage
+from board.services.initial_setup_service import InitialSetupService
+from board.services.public_cache_service import PublicCacheScope, PublicCacheService
+from board.services.site_snapshot_service import SiteSnapshotService
+
+
+@override_settings(PUBLIC_CACHE_TIMEOUT=600)
+class SiteSnapshotServiceTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        SiteSetting.objects.update_or_create(pk=1, defaults={'site_name': 'Snapshot Blog'})
+        SiteNotice.objects.create(
+            scope=SiteContentScope.GLOBAL,
+            title='Global notice',
+            is_active=True,
+        )
+        StaticPage.objects.create(slug='about', title='About', content='<p>About</p>', show_in_footer=True)
+        SocialAuthProvider.objects.filter(key='github').delete()
+        SocialAuthProvider.objects.create(key='github', is_enabled=True, client_id='github-client')
+
+    def setUp(self):
+        cache.clear()
+        SiteSnapshotService.clear()
+        self.addCleanup(SiteSnapshotService.clear)
+
+    def test_snapshot_is_reused_without_queries(self):
+        snapshot = SiteSnapshotService.get()
+
+        self.assertEqual(snapshot.site_setting.site_name, 'Snapshot Blog')
+        self.assertEqual(snapshot.site_brand['site_name'], 'Snapshot Blog')
+        self.assertEqual([notice.title for notice in snapshot.global_notices], ['Global notice'])
+        self.assertEqual([page.slug for page in snapshot.footer_pages], ['about'])
+        self.assertEqual(dict(snapshot.oauth_client_ids), {'github': 'github-client'})
+        self.assertTrue(snapshot.needs_initial_setup)
+
+        with self.assertNumQueries(0):
+            self.assertIs(SiteSnapshotService.get(), snapshot)
+
+    def test_snapshot_is_immutable(self):
+        snapshot = SiteSnapshotService.get()
+
+        with self.assertRaises(FrozenInstanceError):
+            snapshot.footer_pages = ()
+        with self.assertRaises(TypeError):
+            snapshot.oauth_client_ids['google'] = 'client'
+
+    def test_committed_setting_change_refreshes_snapshot(self):
+        SiteSnapshotService.get()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            setting = SiteSetting.get_instance()
+            setting.site_name = 'Renamed Blog'
+            setting.save()
+
+        self.assertEqual(SiteSnapshotService.get().site_setting.site_name, 'Renamed Blog')
+
+    def test_version_bumped_by_another_worker_refreshes_snapshot(self):
+        snapshot = SiteSnapshotService.get()
+        SiteNotice.objects.all().delete()
+
+        # Another process committed the change and bumped the shared version.
+        self.assertIs(SiteSnapshotService.get(), snapshot)
+        PublicCacheService.bump(PublicCacheScope.SITE)
+
+        self.assertEqual(SiteSnapshotService.get().global_notices, ())
+
+    def test_initial_admin_creation_refreshes_snapshot(self):
+        self.assertTrue(SiteSnapshotService.get().needs_initial_setup)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            InitialSetupService.create_initial_admin('admin', 'Admin', 'admin@example.com', 'password123!')
+
+        self.assertFalse(SiteSnapshotService.get().needs_initial_setup)
+
+    @override_settings(PUBLIC_CACHE_TIMEOUT=0)
+    def test_disabled_cache_builds_one_snapshot_per_request(self):
+        request = RequestFactory().get('/')
+        snapshot = SiteSnapshotService.get(request)
+
+        with self.assertNumQueries(0):
+            self.assertIs(SiteSnapshotService.get(request), snapshot)
+        self.assertIsNot(SiteSnapshotService.get(), snapshot)
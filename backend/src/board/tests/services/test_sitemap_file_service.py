@@ -0,0 +1,154 @@
+import datetime
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from board.models import BackgroundJob, Post, PostConfig, Profile
+from board.services.sitemap_file_service import SitemapFileService
+from board.sitemaps import PostsSitemap
+
+
+class SitemapFileServiceTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='sitemap-author', password='test')
+        Profile.objects.create(user=cls.author, role=Profile.Role.EDITOR)
+        cls.posts = []
+        for index in range(5):
+            post = Post.objects.create(
+                title=f'Sitemap Post {index}',
+                url=f'sitemap-post-{index}',
+                author=cls.author,
+                published_date=timezone.now(),
+            )
+            PostConfig.objects.create(post=post, hide=False)
+            cls.posts.append(post)
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        settings_override = override_settings(
+            SITEMAP_STATIC_FILES=True,
+            SITEMAP_GZIP=True,
+            SITEMAP_ROOT=self.root,
+            SITE_URL='https://blex.example',
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def read(self, filename):
+        with open(os.path.join(self.root, filename)) as file:
+            return file.read()
+
+    def test_rebuild_writes_index_and_sections(self):
+        SitemapFileService.rebuild()
+
+        index = self.read('sitemap.xml')
+        self.assertIn('https://blex.example/posts/sitemap.xml', index)
+        self.assertIn('https://blex.example/staticpages/sitemap.xml', index)
+
+        posts = self.read('posts-1.xml')
+        for post in self.posts:
+            self.assertIn(f'https://blex.example/@sitemap-author/{post.url}', posts)
+        self.assertTrue(os.path.exists(os.path.join(self.root, 'posts-1.xml.gz')))
+
+    def test_regenerate_rewrites_only_affected_page(self):
+        with patch.object(PostsSitemap, 'limit', 2):
+            SitemapFileService.rebuild()
+            self.assertIn('posts/sitemap.xml?p=3', self.read('sitemap.xml'))
+            first_page = self.read('posts-1.xml')
+
+            Post.objects.filter(id=self.posts[4].id).update(title='Renamed', url='renamed')
+            SitemapFileService.regenerate('posts', [self.posts[4].id])
+
+            self.assertEqual(self.read('posts-1.xml'), first_page)
+            self.assertIn('@sitemap-author/renamed', self.read('posts-3.xml'))
+
+    def test_regenerate_shifts_following_pages_when_post_is_hidden(self):
+        with patch.object(PostsSitemap, 'limit', 2):
+            SitemapFileService.rebuild()
+
+            PostConfig.objects.filter(post=self.posts[1]).update(hide=True)
+            SitemapFileService.regenerate('posts', [self.posts[1].id])
+
+            self.assertIn(self.posts[2].url, self.read('posts-1.xml'))
+            self.assertIn(self.posts[4].url, self.read('posts-2.xml'))
+            self.assertFalse(os.path.exists(os.path.join(self.root, 'posts-3.xml')))
+            self.assertNotIn('?p=3', self.read('sitemap.xml'))
+
+    def test_view_serves_written_file(self):
+        SitemapFileService.rebuild()
+
+        response = self.client.get('/posts/sitemap.xml')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/xml')
+        self.assertEqual(
+            b''.join(response.streaming_content).decode(),
+            self.read('posts-1.xml'),
+        )
+
+    def test_view_renders_when_file_is_missing(self):
+        response = self.client.get('/posts/sitemap.xml')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(self.posts[0].url, response.content.decode())
+
+    def test_post_save_schedules_one_job(self):
+        BackgroundJob.objects.all().delete()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.posts[0].title = 'Updated'
+            self.posts[0].save()
+            self.posts[0].save()
+
+        jobs = BackgroundJob.objects.filter(task='sitemap.regenerate')
+        self.assertEqual(
+            sorted(jobs.values_list('dedup_key', flat=True)),
+            [f'sitemap-posts-{self.posts[0].id}', 'sitemap-user-all'],
+        )
+        self.assertEqual(
+            jobs.get(dedup_key__startswith='sitemap-posts').payload,
+            {'section': 'posts', 'object_ids': [self.posts[0].id]},
+        )
+
+    def test_reserved_post_schedules_job_at_publish_time(self):
+        BackgroundJob.objects.all().delete()
+        published_date = timezone.now() + datetime.timedelta(days=1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.posts[0].published_date = published_date
+            self.posts[0].save()
+
+        stamp = int(published_date.timestamp())
+        jobs = BackgroundJob.objects.filter(task='sitemap.regenerate')
+        self.assertEqual(
+            sorted(jobs.values_list('dedup_key', flat=True)),
+            [
+                f'sitemap-posts-{self.posts[0].id}',
+                f'sitemap-posts-{self.posts[0].id}@{stamp}',
+                'sitemap-user-all',
+                f'sitemap-user-all@{stamp}',
+            ],
+        )
+        self.assertEqual(
+            jobs.get(dedup_key=f'sitemap-posts-{self.posts[0].id}@{stamp}').scheduled_at,
+            published_date,
+        )
+
+    def test_rebuild_missing_only_writes_missing_sections(self):
+        SitemapFileService.rebuild()
+        os.remove(os.path.join(self.root, 'posts-1.xml'))
+        with open(os.path.join(self.root, 'user-1.xml'), 'w') as file:
+            file.write('kept')
+
+        SitemapFileService.rebuild(missing_only=True)
+
+        self.assertIn(self.posts[0].url, self.read('posts-1.xml'))
+        self.assertEqual(self.read('user-1.xml'), 'kept')
+        self.assertEqual(SitemapFileService.rebuild(missing_only=True), 0)
@@ -0,0 +1,178 @@
+import datetime
+import hashlib
+import os
+from io import BytesIO
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from board.models import BackgroundJob, ImageCache, UploadSession, User
+from board.services.image_upload_service import ImageUploadService
+from board.services.upload_session_service import UploadSessionError, UploadSessionService
+
+
+class UploadSessionServiceTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='uploader', password='test')
+
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.media_root = temp_dir.name
+        self.upload_dir = os.path.join(self.media_root, 'images', 'content')
+        os.makedirs(self.upload_dir)
+
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        make_path = patch(
+            'board.services.image_upload_service.make_path',
+            return_value=self.upload_dir + '/',
+        )
+        make_path.start()
+        self.addCleanup(make_path.stop)
+
+        # An MP4 container header is all the upload checks for videos.
+        self.data = b'\x00\x00\x00\x18ftypisom' + os.urandom(300 * 1024)
+        self.sha256 = hashlib.sha256(self.data).hexdigest()
+
+    def send(self, session, start, end):
+        return UploadSessionService.append_chunk(
+            session, start, BytesIO(self.data[start:end]), end - start,
+        )
+
+    def test_chunks_are_verified_and_stored_as_upload(self):
+        session = UploadSessionService.create(self.user, 'clip.mp4', len(self.data), self.sha256)
+
+        self.send(session, 0, 100 * 1024)
+        self.send(session, 100 * 1024, len(self.data))
+        url = UploadSessionService.complete(session)
+
+        image_cache = ImageCache.objects.get()
+        self.assertEqual(url, '/resources/media/' + image_cache.path)
+        self.assertEqual(image_cache.status, ImageCache.Status.PENDING)
+        self.assertEqual(image_cache.size, len(self.data))
+        with open(os.path.join(self.upload_dir, os.path.basename(image_cache.path)), 'rb') as stored:
+            self.assertEqual(stored.read(), self.data)
+        self.assertFalse(os.path.exists(UploadSessionService.get_part_path(session.key)))
+        self.assertEqual(
+            BackgroundJob.objects.get().payload,
+            {'image_cache_id': image_cache.id},
+        )
+
+        # Completing again, e.g. after a lost response, returns the same URL.
+        session.refresh_from_db()
+        self.assertEqual(UploadSessionService.complete(session), url)
+        self.assertEqual(ImageCache.objects.count(), 1)
+
+    def test_dropped_chunk_resumes_from_received_offset(self):
+        session = UploadSessionService.create(self.user, 'clip.mp4', len(self.data))
+
+        # The connection drops after 50 KiB of a 200 KiB chunk.
+        UploadSessionService.append_chunk(
+            session, 0, BytesIO(self.data[:50 * 1024]), 200 * 1024,
+        )
+        session = UploadSessionService.get(self.user, session.key)
+        self.assertEqual(session.offset, 50 * 1024)
+
+        with self.assertRaises(UploadSessionError) as context:
+            self.send(session, 200 * 1024, len(self.data))
+        self.assertEqual(context.exception.code, 'upload.offset_mismatch')
+
+        self.send(session, 50 * 1024, len(self.data))
+        url = UploadSessionService.complete(session, self.sha256)
+        self.assertTrue(url.endswith('.mp4'))
+
+    def test_hash_mismatch_restarts_the_upload(self):
+        session = UploadSessionService.create(self.user, 'photo.jpg', len(self.data), '0' * 64)
+        self.send(session, 0, len(self.data))
+
+        with self.assertRaises(UploadSessionError) as context:
+            UploadSessionService.complete(session)
+
+        self.assertEqual(context.exception.code, 'upload.hash_mismatch')
+        session.refresh_from_db()
+        self.assertEqual(session.offset, 0)
+        self.assertEqual(os.path.getsize(UploadSessionService.get_part_path(session.key)), 0)
+        self.assertFalse(ImageCache.objects.exists())
+
+    def test_file_that_is_not_an_image_is_rejected(self):
+        data = b'not an image'
+        session = UploadSessionService.create(
+            self.user, 'photo.jpg', len(data), hashlib.sha256(data).hexdigest(),
+        )
+        UploadSessionService.append_chunk(session, 0, BytesIO(data), len(data))
+
+        with self.assertRaises(UploadSessionError) as context:
+            UploadSessionService.complete(session)
+
+        self.assertEqual(context.exception.code, 'upload.invalid_file')
+        self.assertFalse(UploadSession.objects.exists())
+        self.assertFalse(ImageCache.objects.exists())
+        self.assertFalse(os.path.exists(UploadSessionService.get_part_path(session.key)))
+        self.assertEqual(os.listdir(self.upload_dir), [])
+
+    def test_incomplete_upload_cannot_be_completed(self):
+        session = UploadSessionService.create(self.user, 'photo.jpg', len(self.data), self.sha256)
+        self.send(session, 0, 1024)
+
+        with self.assertRaises(UploadSessionError) as context:
+            UploadSessionService.complete(session)
+        self.assertEqual(context.exception.code, 'upload.incomplete')
+
+    def test_known_hash_completes_without_chunks(self):
+        ImageCache.objects.create(
+            key=ImageUploadService.get_key(bytes.fromhex(self.sha256)),
+            path='images/content/known.mp4',
+        )
+
+        session = UploadSessionService.create(self.user, 'clip.mp4', len(self.data), self.sha256)
+
+        self.assertEqual(session.url, '/resources/media/images/content/known.mp4')
+        self.assertEqual(session.offset, session.size)
+        self.assertFalse(os.path.exists(UploadSessionService.get_part_path(session.key)))
+
+    def test_create_validates_file(self):
+        cases = [
+            (('script.sh', 10), 'upload.invalid_extension'),
+            (('clip.mp4', 0), 'upload.invalid_size'),
+            (('clip.mp4', 101 * 1024 * 1024), 'upload.too_large'),
+            (('clip.mp4', 10, 'not-a-hash'), 'upload.invalid_hash'),
+        ]
+        for args, code in cases:
+            with self.subTest(code=code):
+                with self.assertRaises(UploadSessionError) as context:
+                    UploadSessionService.create(self.user, *args)
+                self.assertEqual(context.exception.code, code)
+
+    def test_chunk_past_declared_size_is_rejected(self):
+        session = UploadSessionService.create(self.user, 'clip.mp4', 10)
+
+        with self.assertRaises(UploadSessionError) as context:
+            UploadSessionService.append_chunk(session, 0, BytesIO(b'x' * 11), 11)
+        self.assertEqual(context.exception.code, 'upload.invalid_chunk')
+
+    def test_collect_expired_removes_sessions_and_part_files(self):
+        live = UploadSessionService.create(self.user, 'clip.mp4', 10)
+        expired = UploadSessionService.create(self.user, 'old.mp4', 10)
+        UploadSession.objects.filter(id=expired.id).update(
+            expires_at=timezone.now() - datetime.timedelta(minutes=1),
+        )
+        orphan_path = UploadSessionService.get_part_path('orphan')
+        open(orphan_path, 'wb').close()
+        old = (timezone.now() - datetime.timedelta(hours=25)).timestamp()
+        os.utime(orphan_path, (old, old))
+
+        with self.assertRaises(UploadSessionError):
+            UploadSessionService.get(self.user, expired.key)
+
+        self.assertEqual(UploadSessionService.collect_expired(), 1)
+
+        self.assertEqual(list(UploadSession.objects.values_list('key', flat=True)), [live.key])
+        self.assertTrue(os.path.exists(UploadSessionService.get_part_path(live.key)))
+        self.assertFalse(os.path.exists(UploadSessionService.get_part_path(expired.key)))
+        self.assertFalse(os.path.exists(orphan_path))
@@ -0,0 +1,125 @@
+"""
+Tests for concurrent webhook fan-out against a local stub server
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.test import TestCase
+
+from board.models import Profile, User, WebhookSubscription
+from board.services.webhook_service import WebhookService
+
+
+class StubWebhookHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        time.sleep(self.server.delay)
+
+        with self.server.lock:
+            self.server.payloads.append(json.loads(body))
+
+        status = 500 if self.path.startswith('/fail') else 204
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class WebhookDeliveryTestCase(TestCase):
+    CHANNEL_COUNT = 500
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubWebhookHandler)
+        cls.server.daemon_threads = True
+        cls.server.delay = 0.02
+        cls.server.lock = threading.Lock()
+        cls.server.payloads = []
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_port}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(
+            username='webhook-delivery-user',
+            password='test',
+            email='webhook-delivery-user@test.com',
+        )
+        cls.profile = Profile.objects.create(user=user)
+
+    def setUp(self):
+        self.server.payloads.clear()
+
+    def test_fan_out_to_many_channels(self):
+        """500개 채널에 동시 전송하고 상태를 일괄 기록한다"""
+        WebhookSubscription.objects.bulk_create([
+            WebhookSubscription(
+                author=self.profile,
+                webhook_url=f'{self.base_url}/hook/{index}',
+                failure_count=1,
+            )
+            for index in range(self.CHANNEL_COUNT)
+        ])
+        channel_ids = list(WebhookSubscription.objects.values_list('id', flat=True))
+
+        started = time.monotonic()
+        WebhookService.send_post_notification(
+            channel_ids=channel_ids,
+            content='New post',
+            post_url='https://blex.example/@author/post',
+        )
+        elapsed = time.monotonic() - started
+
+        # Sequential delivery would take at least CHANNEL_COUNT * delay (10s).
+        self.assertLess(elapsed, 5)
+        self.assertEqual(len(self.server.payloads), self.CHANNEL_COUNT)
+        self.assertFalse(WebhookSubscription.objects.filter(failure_count__gt=0).exists())
+        self.assertFalse(WebhookSubscription.objects.filter(last_success_date__isnull=True).exists())
+
+    def test_failed_deliveries_deactivate_channels(self):
+        ok_channel = WebhookSubscription.objects.create(
+            author=self.profile,
+            webhook_url=f'{self.base_url}/hook/ok',
+        )
+        failing_channel = WebhookSubscription.objects.create(
+            author=self.profile,
+            webhook_url=f'{self.base_url}/fail',
+            failure_count=WebhookSubscription.MAX_FAILURES - 1,
+        )
+
+        results = WebhookService.deliver(
+            {
+                ok_channel.id: ok_channel.webhook_url,
+                failing_channel.id: failing_channel.webhook_url,
+            },
+            content='New post',
+            post_url='https://blex.example/@author/post',
+        )
+        self.assertEqual(results, {ok_channel.id: True, failing_channel.id: False})
+
+        WebhookService.send_post_notification(
+            channel_ids=[ok_channel.id, failing_channel.id],
+            content='New post',
+            post_url='https://blex.example/@author/post',
+        )
+
+        failing_channel.refresh_from_db()
+        self.assertFalse(failing_channel.is_active)
+        self.assertTrue(WebhookSubscription.objects.get(id=ok_channel.id).is_active)
+
+    def test_deliver_without_urls_does_nothing(self):
+        self.assertEqual(WebhookService.deliver({}, content='x', post_url='y'), {})
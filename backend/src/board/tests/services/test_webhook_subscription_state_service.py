@@ -45,3 +45,26 @@ class WebhookSubscriptionStateServiceTestCase(TestCase):
         self.channel.refresh_from_db()
         self.assertEqual(self.channel.failure_count, WebhookSubscription.MAX_FAILURES)
         self.assertFalse(self.channel.is_active)
+
+    def test_record_results_updates_channels_in_bulk(self):
+        failing_channel = WebhookSubscription.objects.create(
+            author=self.profile,
+            webhook_url='https://discord.com/api/webhooks/state-service/failing',
+            failure_count=WebhookSubscription.MAX_FAILURES - 1,
+        )
+        self.channel.failure_count = 1
+        self.channel.save(update_fields=['failure_count'])
+
+        with self.assertNumQueries(4):
+            deactivated_ids = WebhookSubscriptionStateService.record_results({
+                self.channel.id: True,
+                failing_channel.id: False,
+            })
+
+        self.assertEqual(deactivated_ids, [failing_channel.id])
+        self.channel.refresh_from_db()
+        failing_channel.refresh_from_db()
+        self.assertEqual(self.channel.failure_count, 0)
+        self.assertIsNotNone(self.channel.last_success_date)
+        self.assertEqual(failing_channel.failure_count, WebhookSubscription.MAX_FAILURES)
+        self.assertFalse(failing_channel.is_active)
@@ -0,0 +1,129 @@
+"""
+Tests for ETag/Last-Modified validation of public pages
+"""
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from board.models import Post, PostConfig, PostContent, PostLikes, Profile, SiteSetting, Tag
+
+
+@override_settings(PUBLIC_CACHE_TIMEOUT=600)
+class ConditionalGetTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(
+            username='conditional-author',
+            email='conditional@example.com',
+            password='password123',
+        )
+        Profile.objects.create(user=cls.author, role=Profile.Role.EDITOR)
+        cls.reader = User.objects.create_user(username='conditional-reader', password='password123')
+        cls.tag = Tag.objects.create(value='conditional')
+        cls.post = Post.objects.create(
+            title='Conditional Post',
+            url='conditional-post',
+            author=cls.author,
+            published_date=timezone.now(),
+        )
+        cls.post.tags.add(cls.tag)
+        PostContent.objects.create(post=cls.post, content_html='<p>Conditional body</p>')
+        PostConfig.objects.create(post=cls.post, hide=False, advertise=False)
+        cls.post_url = reverse('post_detail', kwargs={
+            'username': cls.author.username,
+            'post_url': cls.post.url,
+        })
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+
+    def test_unchanged_post_returns_not_modified_without_rendering(self):
+        """같은 ETag로 다시 요청하면 렌더링 없이 304를 응답한다"""
+        first = self.client.get(self.post_url)
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(first['ETag'].startswith('W/"'))
+        self.assertIn('Last-Modified', first)
+        self.assertIn('no-cache', first['Cache-Control'])
+
+        with patch('board.views.post.PostService.get_post_detail') as get_post_detail:
+            second = self.client.get(self.post_url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second['ETag'], first['ETag'])
+        get_post_detail.assert_not_called()
+
+        third = self.client.get(self.post_url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        self.assertEqual(third.status_code, 304)
+
+    def test_like_and_edit_change_etag(self):
+        etag = self.client.get(self.post_url)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            PostLikes.objects.create(post=self.post, user=self.reader)
+        response = self.client.get(self.post_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+        etag = response['ETag']
+        Post.objects.filter(id=self.post.id).update(updated_date=timezone.now())
+        self.assertEqual(self.client.get(self.post_url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_etag_differs_per_visitor(self):
+        anonymous = self.client.get(self.post_url)
+
+        self.client.force_login(self.reader)
+        response = self.client.get(self.post_url, HTTP_IF_NONE_MATCH=anonymous['ETag'])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Last-Modified', response)
+        self.assertIn('private', response['Cache-Control'])
+
+    def test_missing_post_is_not_validated(self):
+        response = self.client.get(reverse('post_detail', kwargs={
+            'username': self.author.username,
+            'post_url': 'missing',
+        }))
+
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn('ETag', response)
+
+    def test_tag_and_author_pages_return_not_modified(self):
+        for url in [
+            reverse('tag_detail', kwargs={'name': self.tag.value}),
+            reverse('user_profile', kwargs={'username': self.author.username}),
+            f'/v1/users/@{self.author.username}/heatmap',
+        ]:
+            with self.subTest(url=url):
+                etag = self.client.get(url)['ETag']
+                self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_new_tagged_post_changes_tag_page(self):
+        url = reverse('tag_detail', kwargs={'name': self.tag.value})
+        etag = self.client.get(url)['ETag']
+
+        post = Post.objects.create(
+            title='Another Post',
+            url='another-post',
+            author=self.author,
+            published_date=timezone.now(),
+        )
+        PostConfig.objects.create(post=post, hide=False)
+        post.tags.add(self.tag)
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_post_markdown_returns_not_modified(self):
+        setting = SiteSetting.get_instance()
+        setting.aeo_enabled = True
+        setting.save(update_fields=['aeo_enabled'])
+        url = reverse('post_markdown', kwargs={
+            'username': self.author.username,
+            'post_url': self.post.url,
+        })
+
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
@@ -158,6 +158,19 @@ class MainPageTemplateTestCase(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.context['page_number'], 1)
 
+    def test_index_page_cursor_pagination(self):
+        response = self.client.get(reverse('index') + '?cursor=')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context['cursor_mode'])
+        self.assertEqual([post.title for post in response.context['posts']], ['Test Post'])
+        self.assertIsNone(response.context['next_cursor'])
+        self.assertContains(response, '<meta name="robots" content="noindex,follow">', html=True)
+
+    def test_index_page_invalid_cursor_returns_404(self):
+        response = self.client.get(reverse('index') + '?cursor=invalid')
+        self.assertEqual(response.status_code, 404)
+
     def test_index_page_with_hidden_post(self):
         hidden_post = Post.objects.create(
             title='Hidden Post',
@@ -0,0 +1,109 @@
+"""
+Tests for the anonymous post detail page cache
+"""
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from board.models import (
+    BannerPosition,
+    Comment,
+    Post,
+    PostConfig,
+    PostContent,
+    SiteBanner,
+    SiteContentScope,
+)
+from board.services.post_page_cache_service import PostPageCacheService
+from main.middleware.html_minify import HTMLMinifyMiddleware
+
+
+@override_settings(PUBLIC_CACHE_TIMEOUT=600)
+class PostPageCacheTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(
+            username='page-cache-author',
+            email='page-cache@example.com',
+            password='password123',
+        )
+        cls.post = Post.objects.create(
+            title='Page Cache Post',
+            url='page-cache-post',
+            author=cls.author,
+            published_date=timezone.now(),
+        )
+        PostContent.objects.create(post=cls.post, content_html='<p>Original body</p>')
+        PostConfig.objects.create(post=cls.post, hide=False, advertise=False)
+        cls.url = reverse('post_detail', kwargs={
+            'username': cls.author.username,
+            'post_url': cls.post.url,
+        })
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+
+    def test_anonymous_page_is_served_from_cache(self):
+        """익명 사용자의 두 번째 요청은 렌더링 없이 캐시에서 응답한다"""
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, 200)
+        self.assertIsNotNone(first.context)
+
+        PostContent.objects.filter(post=self.post).update(content_html='<p>Changed body</p>')
+
+        with self.assertNumQueries(1):
+            second = self.client.get(self.url)
+        self.assertEqual(second.status_code, 200)
+        self.assertIsNone(second.context)
+        self.assertContains(second, 'Original body')
+
+    def test_cached_page_gets_visitor_csrf_token(self):
+        self.client.get(self.url)
+
+        response = self.client.get(self.url)
+
+        self.assertNotContains(response, HTMLMinifyMiddleware.CSRF_TOKEN_PLACEHOLDER)
+        self.assertIn('csrftoken', response.cookies)
+
+    def test_post_content_save_invalidates_page(self):
+        self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            content = self.post.content
+            content.content_html = '<p>Edited body</p>'
+            content.save()
+
+        self.assertContains(self.client.get(self.url), 'Edited body')
+
+    def test_comment_invalidates_page(self):
+        self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Comment.objects.create(post=self.post, author=self.author, text_html='<p>hi</p>')
+
+        self.assertIsNotNone(self.client.get(self.url).context)
+
+    def test_author_banner_invalidates_page(self):
+        self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            SiteBanner.objects.create(
+                scope=SiteContentScope.USER,
+                user=self.author,
+                title='Author Banner',
+                content_html='<p>Author banner body</p>',
+                position=BannerPosition.TOP,
+            )
+
+        self.assertContains(self.client.get(self.url), 'Author banner body')
+
+    def test_logged_in_user_is_not_served_from_cache(self):
+        self.client.get(self.url)
+
+        self.client.force_login(self.author)
+        response = self.client.get(self.url)
+
+        self.assertIsNotNone(response.context)
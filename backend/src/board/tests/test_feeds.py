@@ -0,0 +1,70 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from board.models import Post, PostConfig, PostContent, Profile
+
+
+@override_settings(PUBLIC_CACHE_TIMEOUT=600)
+class CachedFeedTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='feedauthor', password='test')
+        Profile.objects.create(user=cls.author, role=Profile.Role.EDITOR)
+        cls.post = Post.objects.create(
+            title='Feed Post',
+            url='feed-post',
+            author=cls.author,
+            published_date=timezone.now(),
+        )
+        PostContent.objects.create(post=cls.post, content_html='<p>Feed\x08 body</p>')
+        PostConfig.objects.create(post=cls.post, hide=False)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_feed_strips_control_characters(self):
+        response = self.client.get('/rss')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Feed body')
+        self.assertTrue(response['ETag'])
+        self.assertTrue(response['Last-Modified'])
+
+    def test_cached_feed_answers_without_queries(self):
+        first = self.client.get('/rss/@feedauthor')
+
+        with self.assertNumQueries(0):
+            second = self.client.get('/rss/@feedauthor')
+        self.assertEqual(second.content, first.content)
+
+        with self.assertNumQueries(0):
+            response = self.client.get('/rss/@feedauthor', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], first['ETag'])
+
+        response = self.client.get('/rss', HTTP_IF_MODIFIED_SINCE=self.client.get('/rss')['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_edit_and_hide_invalidate_feed(self):
+        etag = self.client.get('/rss')['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            PostContent.objects.filter(post=self.post).update(content_html='<p>Edited</p>')
+            content = PostContent.objects.get(post=self.post)
+            content.save()
+
+        response = self.client.get('/rss', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Edited')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            config = self.post.config
+            config.hide = True
+            config.save()
+
+        self.assertNotContains(self.client.get('/rss'), 'Feed Post')
+
+    def test_unknown_author_is_not_found(self):
+        self.assertEqual(self.client.get('/rss/@nobody').status_code, 404)
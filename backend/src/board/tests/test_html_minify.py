@@ -0,0 +1,89 @@
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from main.middleware.html_minify import HTMLMinifyMiddleware
+
+
+PAGE = (
+    '<html><head></head><body>\n'
+    '    <p>  Hello   world  </p>\n'
+    '    <input type="hidden" name="csrfmiddlewaretoken" value="BLEXCSRFTOKENPLACEHOLDER">\n'
+    '</body></html>'
+)
+
+
+@override_settings(HTML_MINIFY_CACHE_TIMEOUT=600)
+class HTMLMinifyMiddlewareTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def process(self, response):
+        middleware = HTMLMinifyMiddleware(lambda request: response)
+        return middleware(self.factory.get('/'))
+
+    def test_minifies_html_and_substitutes_csrf_token(self):
+        response = self.process(HttpResponse(PAGE))
+
+        content = response.content.decode()
+        self.assertIn('<p>Hello world</p>', content)
+        self.assertNotIn(HTMLMinifyMiddleware.CSRF_TOKEN_PLACEHOLDER, content)
+        self.assertEqual(int(response['Content-Length']), len(response.content))
+
+    def test_same_body_is_minified_once(self):
+        """같은 본문은 한 번만 압축하고 이후에는 캐시된 결과를 사용한다"""
+        with patch.object(
+            HTMLMinifyMiddleware, 'minify_html', wraps=HTMLMinifyMiddleware.minify_html,
+        ) as minify:
+            first = self.process(HttpResponse(PAGE))
+            second = self.process(HttpResponse(PAGE))
+
+        self.assertEqual(minify.call_count, 1)
+        self.assertIn('desc="miss"', first['Server-Timing'])
+        self.assertIn('desc="hit"', second['Server-Timing'])
+
+    def test_signed_in_page_is_not_cached(self):
+        """로그인한 사용자의 페이지는 반복되지 않으므로 캐시하지 않는다"""
+        request = self.factory.get('/')
+        request.user = Mock(is_authenticated=True)
+        middleware = HTMLMinifyMiddleware(lambda request: HttpResponse(PAGE))
+
+        with patch.object(
+            HTMLMinifyMiddleware, 'minify_html', wraps=HTMLMinifyMiddleware.minify_html,
+        ) as minify:
+            first = middleware(request)
+            middleware(request)
+
+        self.assertEqual(minify.call_count, 2)
+        self.assertIn('<p>Hello world</p>', first.content.decode())
+        self.assertIn('desc="miss"', first['Server-Timing'])
+
+    def test_already_minified_response_is_skipped(self):
+        response = HttpResponse(PAGE)
+        response.minified = True
+
+        with patch.object(HTMLMinifyMiddleware, 'minify_html') as minify:
+            response = self.process(response)
+
+        minify.assert_not_called()
+        self.assertFalse(response.has_header('Server-Timing'))
+        self.assertNotIn(HTMLMinifyMiddleware.CSRF_TOKEN_PLACEHOLDER, response.content.decode())
+
+    def test_non_html_response_still_gets_csrf_token(self):
+        response = self.process(JsonResponse({'body': PAGE}))
+
+        self.assertFalse(response.has_header('Server-Timing'))
+        self.assertNotIn(HTMLMinifyMiddleware.CSRF_TOKEN_PLACEHOLDER, response.content.decode())
+
+    @override_settings(HTML_MINIFY_CACHE_TIMEOUT=0)
+    def test_cache_can_be_disabled(self):
+        with patch.object(
+            HTMLMinifyMiddleware, 'minify_html', wraps=HTMLMinifyMiddleware.minify_html,
+        ) as minify:
+            self.process(HttpResponse(PAGE))
+            self.process(HttpResponse(PAGE))
+
+        self.assertEqual(minify.call_count, 2)
@@ -1,6 +1,11 @@
-from django.test import TestCase
+import threading
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase
 
 from modules.markdown import (
+    CustomPostprocessor,
+    MarkdownRendererPool,
     parse_to_html,
     parse_post_to_html,
     parse_comment_to_html,
@@ -148,3 +153,56 @@ class ParseToHtmlTest(TestCase):
         result = parse_to_html(md)
         self.assertNotIn('class="mention"', result)
         self.assertIn('<code>@author</code>', result)
+
+
+class MarkdownRendererPoolTest(SimpleTestCase):
+    def setUp(self):
+        self.pool = MarkdownRendererPool()
+
+    def test_renderer_is_reused_within_thread(self):
+        self.assertIs(self.pool.get_renderer(), self.pool.get_renderer())
+
+    def test_renderer_is_not_shared_across_threads(self):
+        renderers = []
+        thread = threading.Thread(target=lambda: renderers.append(self.pool.get_renderer()))
+        thread.start()
+        thread.join()
+
+        self.assertIsNot(renderers[0], self.pool.get_renderer())
+
+    def test_reused_renderer_does_not_leak_state(self):
+        """재사용된 렌더러도 헤더 id와 참조 링크를 매번 새로 계산한다"""
+        first = self.pool.render('[ref]: https://example.com\n\n## Title\n\n[link][ref]')
+        second = self.pool.render('## Title\n\n[link][ref]')
+
+        self.assertIn('id="title"', first)
+        self.assertIn('href="https://example.com"', first)
+        self.assertIn('id="title"', second)
+        self.assertNotIn('href="https://example.com"', second)
+
+    def test_render_cache_skips_conversion_for_same_content(self):
+        self.pool.render('cached **text**')
+
+        with patch.object(self.pool, 'convert') as convert:
+            html = self.pool.render('cached **text**')
+
+        convert.assert_not_called()
+        self.assertEqual(html, '<p>cached <strong>text</strong></p>')
+
+    def test_render_cache_separates_mention_mode(self):
+        self.assertNotIn('class="mention"', self.pool.render('`@baealex`'))
+        self.assertIn('class="mention"', self.pool.render('`@baealex`', enable_mentions=True))
+
+    def test_render_cache_is_bounded(self):
+        with patch.object(MarkdownRendererPool, 'CACHE_SIZE', 2):
+            for text in ('one', 'two', 'three'):
+                self.pool.render(text)
+
+        self.assertEqual(len(self.pool.cache), 2)
+
+    def test_postprocessor_applies_rules_inside_caption(self):
+        html = CustomPostprocessor.process(
+            '&lt;grid-image col="2"&gt;&lt;caption&gt;see &lt;br&gt;&lt;/caption&gt;&lt;/grid-image&gt;'
+        )
+
+        self.assertEqual(html, '<figure class="col-2"><figcaption>see <br/></figcaption></figure>')
@@ -0,0 +1,65 @@
+import datetime
+
+from django.contrib.auth.models import User
+from django.http import Http404
+from django.test import TestCase
+from django.utils import timezone
+
+from board.models import Post
+from board.modules.paginator import CursorPaginator, decode_cursor, encode_cursor
+
+
+class CursorPaginatorTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='cursor-author', password='test')
+        base_date = timezone.now() - datetime.timedelta(days=30)
+        # Two posts share each timestamp so ties are broken by id.
+        cls.posts = [
+            Post.objects.create(
+                title=f'Cursor Post {index}',
+                url=f'cursor-post-{index}',
+                author=cls.author,
+                published_date=base_date + datetime.timedelta(days=index // 2),
+            )
+            for index in range(7)
+        ]
+        cls.expected_ids = [
+            post.id for post in sorted(
+                cls.posts,
+                key=lambda post: (post.published_date, post.id),
+                reverse=True,
+            )
+        ]
+
+    def test_walks_forward_and_back_without_gaps(self):
+        first = CursorPaginator(Post.objects.all(), 3, '')
+        second = CursorPaginator(Post.objects.all(), 3, first.next_cursor)
+        third = CursorPaginator(Post.objects.all(), 3, second.next_cursor)
+
+        self.assertIsNone(first.prev_cursor)
+        self.assertIsNone(third.next_cursor)
+        self.assertEqual(
+            [post.id for page in (first, second, third) for post in page],
+            self.expected_ids,
+        )
+
+        back = CursorPaginator(Post.objects.all(), 3, third.prev_cursor)
+        self.assertEqual([post.id for post in back], [post.id for post in second])
+        back_to_start = CursorPaginator(Post.objects.all(), 3, back.prev_cursor)
+        self.assertEqual([post.id for post in back_to_start], [post.id for post in first])
+        self.assertIsNone(back_to_start.prev_cursor)
+
+    def test_does_not_count(self):
+        with self.assertNumQueries(1):
+            CursorPaginator(Post.objects.all(), 3, '')
+
+    def test_cursor_round_trip(self):
+        value = timezone.now()
+
+        self.assertEqual(decode_cursor(encode_cursor(value, 42)), (value, 42, 'next'))
+
+    def test_invalid_cursor_raises_404(self):
+        for cursor in ['not-a-cursor', encode_cursor(timezone.now(), 1, 'sideways')]:
+            with self.assertRaises(Http404):
+                CursorPaginator(Post.objects.all(), 3, cursor)
@@ -1,6 +1,7 @@
 import os
 import subprocess
 import sys
+import tempfile
 from unittest.mock import patch
 
 from django.test import SimpleTestCase, override_settings
@@ -26,6 +27,15 @@ class RuntimeSettingsTestCase(SimpleTestCase):
                     runtime_settings.get_env_optional('BLEX_TEST_OPTIONAL'),
                 )
 
+    def test_cache_config_sets_max_entries(self):
+        """캐시 항목 수 제한은 설정한 경우에만 OPTIONS로 전달한다."""
+        self.assertEqual(
+            runtime_settings.get_cache_config('file', '/tmp/blex-cache', 5000)['OPTIONS'],
+            {'MAX_ENTRIES': 5000},
+        )
+        self.assertNotIn('OPTIONS', runtime_settings.get_cache_config('file', '/tmp/blex-cache'))
+        self.assertNotIn('OPTIONS', runtime_settings.get_cache_config('redis', None, 5000))
+
     def test_session_cookie_domain_ignores_loopback_hosts(self):
         """로컬 개발 호스트는 host-only 세션 쿠키를 사용한다."""
         for value in ['localhost', '.localhost', '127.0.0.1', '0.0.0.0', '::1']:
@@ -149,6 +159,45 @@ class RuntimeSettingsTestCase(SimpleTestCase):
 
         self.assertEqual(result.stdout.strip(), "('HTTP_X_FORWARDED_PROTO', 'https')")
 
+    def test_runtime_sqlite_profile_is_applied_on_connect(self):
+        """SQLite 연결은 WAL, busy_timeout과 영구 연결 설정으로 열린다."""
+        with tempfile.TemporaryDirectory() as directory:
+            env = {
+                **os.environ,
+                'SECRET_KEY': 'test-secret',
+                'CIPHER_KEY': 'BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB',
+                'DEBUG': 'FALSE',
+                'RESOURCE_URL': '',
+                'SITE_URL': 'https://blex.example',
+                'TZ': 'Asia/Seoul',
+                'DJANGO_SETTINGS_MODULE': 'main.settings',
+                'BLEX_SQLITE_DB_PATH': os.path.join(directory, 'db.sqlite3'),
+            }
+
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    '-c',
+                    'import django; django.setup(); '
+                    'from django.db import connection; '
+                    'database = connection.settings_dict; '
+                    'print(database["CONN_MAX_AGE"], database["OPTIONS"]["transaction_mode"]); '
+                    'cursor = connection.cursor(); '
+                    'print(*[cursor.execute(f"PRAGMA {name}").fetchone()[0] '
+                    'for name in ("journal_mode", "busy_timeout", "synchronous")])',
+                ],
+                cwd=runtime_settings.BASE_DIR,
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+
+        options, pragmas = result.stdout.strip().splitlines()[-2:]
+        self.assertEqual(options, '600 IMMEDIATE')
+        # synchronous=NORMAL is reported as 1.
+        self.assertEqual(pragmas, 'wal 5000 1')
+
     def test_runtime_resource_url_defaults_to_local_resources_path(self):
         """RESOURCE_URL 미설정 배포도 기본 /resources/ 경로로 설정을 로드한다."""
         env = {
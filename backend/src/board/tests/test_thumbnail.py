@@ -0,0 +1,73 @@
+import os
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from PIL import Image
+
+from modules.thumbnail import ThumbnailProcessor, ThumbnailSpec, make_thumbnail, make_thumbnail_set
+
+
+POST_THUMBNAILS = [
+    ThumbnailSpec(size=750, quality=50, thumbnail_type='preview'),
+    ThumbnailSpec(size=750, quality=85, thumbnail_type='minify'),
+    ThumbnailSpec(size=1920, quality=85),
+]
+
+
+class ThumbnailSetTest(SimpleTestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.media_root = temp_dir.name
+
+    def make_instance(self, name, size=(4000, 3000), image_format='JPEG'):
+        path = os.path.join(self.media_root, name)
+        Image.new('RGB', size, 'red').save(path, image_format)
+        return SimpleNamespace(image=name), path
+
+    def test_set_is_written_from_one_decode(self):
+        instance, path = self.make_instance('cover.jpg')
+
+        with self.settings(MEDIA_ROOT=self.media_root):
+            with patch('modules.thumbnail.Image.open', wraps=Image.open) as image_open:
+                make_thumbnail_set(instance, POST_THUMBNAILS)
+
+        self.assertEqual(image_open.call_count, 1)
+        with Image.open(path) as image:
+            self.assertEqual(image.size, (1920, 1440))
+        with Image.open(f'{path}.minify.jpg') as image:
+            self.assertEqual(image.size, (750, 563))
+        with Image.open(f'{path}.preview.jpg') as image:
+            self.assertEqual(image.size, (750, 563))
+        self.assertFalse([name for name in os.listdir(self.media_root) if name.endswith('.tmp')])
+
+    def test_jpeg_is_decoded_at_reduced_scale(self):
+        _, path = self.make_instance('large.jpg', size=(8000, 6000))
+
+        image, source_width = ThumbnailProcessor.open(path, POST_THUMBNAILS)
+
+        self.assertEqual(source_width, 8000)
+        self.assertEqual(image.size, (2000, 1500))
+
+    def test_png_minify_keeps_format(self):
+        instance, path = self.make_instance('cover.png', size=(1000, 500), image_format='PNG')
+
+        with self.settings(MEDIA_ROOT=self.media_root):
+            make_thumbnail_set(instance, POST_THUMBNAILS)
+
+        with Image.open(f'{path}.minify.png') as image:
+            self.assertEqual(image.format, 'PNG')
+            self.assertEqual(image.size, (750, 375))
+        with Image.open(path) as image:
+            self.assertEqual(image.size, (1000, 500))
+
+    def test_single_thumbnail_still_supported(self):
+        instance, path = self.make_instance('avatar.jpg', size=(1200, 1200))
+
+        with self.settings(MEDIA_ROOT=self.media_root):
+            make_thumbnail(instance, size=500)
+
+        with Image.open(path) as image:
+            self.assertEqual(image.size, (500, 500))
@@ -135,6 +135,9 @@ urlpatterns = [
     path('v1/series/order', api_v1.series_order),
     path('v1/report/error', api_v1.error_report),
     path('v1/image', api_v1.image),
+    path('v1/uploads', api_v1.uploads),
+    path('v1/uploads/<key>', api_v1.upload_detail),
+    path('v1/uploads/<key>/complete', api_v1.upload_complete),
     path('v1/forms', api_v1.forms_list),
     path('v1/forms/<int:id>', api_v1.forms_detail),
     path('v1/telegram/<parameter>', api_v1.telegram),
@@ -166,6 +169,7 @@ urlpatterns = [
     path('v1/utilities/clean-sessions', api_v1.utility_clean_sessions),
     path('v1/utilities/clean-logs', api_v1.utility_clean_logs),
     path('v1/utilities/clean-images', api_v1.utility_clean_images),
+    path('v1/utilities/maintain-database', api_v1.utility_maintain_database),
 
     # Webhook channels (author's notification channels)
     path('v1/webhook/channels', api_v1.my_channels),
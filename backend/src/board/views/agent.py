@@ -1,6 +1,8 @@
 from django.http import HttpRequest, HttpResponse
 
+from board.decorators import conditional_get
 from board.services.agent_content_service import AgentContentService
+from board.services.conditional_get_service import ConditionalGetService
 
 
 def llms_txt(request: HttpRequest) -> HttpResponse:
@@ -11,6 +13,7 @@ def llms_txt(request: HttpRequest) -> HttpResponse:
     return response
 
 
+@conditional_get(ConditionalGetService.post_markdown)
 def post_markdown(request: HttpRequest, username: str, post_url: str) -> HttpResponse:
     AgentContentService.require_aeo_enabled()
     post = AgentContentService.get_public_post(username, post_url)
@@ -20,6 +23,7 @@ def post_markdown(request: HttpRequest, username: str, post_url: str) -> HttpRes
     return response
 
 
+@conditional_get(ConditionalGetService.series_markdown)
 def series_markdown(request: HttpRequest, username: str, series_url: str) -> HttpResponse:
     AgentContentService.require_aeo_enabled()
     series = AgentContentService.get_public_series_detail(username, series_url)
@@ -29,6 +33,7 @@ def series_markdown(request: HttpRequest, username: str, series_url: str) -> Htt
     return response
 
 
+@conditional_get(ConditionalGetService.static_page_markdown)
 def static_page_markdown(request: HttpRequest, slug: str) -> HttpResponse:
     AgentContentService.require_aeo_enabled()
     page = AgentContentService.get_public_static_page(slug)
@@ -1,11 +1,13 @@
 from django.conf import settings
 from django.db.models import Count, Q
+from django.http import Http404
 from ninja import Body, File, NinjaAPI, Query, Status, UploadedFile
 from ninja.errors import HttpError, ValidationError
 from ninja.security import HttpBearer
 
 from board.decorators import editor_required
 from board.models import Series, Tag
+from board.modules.paginator import CursorPaginator
 from board.modules.developer_serializers import (
     DeveloperPostSerializer,
     DeveloperSeriesSerializer,
@@ -17,6 +19,7 @@ from board.services.developer_token_service import (
 )
 from board.services.image_upload_service import ImageUploadError, ImageUploadService
 from board.services.post_service import PostService, PostValidationError
+from board.services.upload_session_service import UploadSessionError, UploadSessionService
 from board.views.api.developer.v1.post import DeveloperPostAPI
 from board.views.api.developer.v1.publishing import DeveloperPublishingAPI
 from board.views.api.developer.v1.schemas import (
@@ -31,6 +34,9 @@ from board.views.api.developer.v1.schemas import (
     PostUpdatePayload,
     SeriesListEnvelope,
     TagListEnvelope,
+    UploadSessionCompletePayload,
+    UploadSessionCreatePayload,
+    UploadSessionEnvelope,
 )
 
 
@@ -90,6 +96,40 @@ def auth_error_response(error: DeveloperAuthError):
     return error_response(error.code, error.message, error.status_code)
 
 
+def invalid_cursor_response():
+    return error_response('pagination.invalid_cursor', '유효하지 않은 cursor입니다.', 400)
+
+
+def paginate_posts(queryset, page, limit, cursor):
+    """
+    Paginate by page number (with a total count) or, when ``cursor`` is
+    given, by keyset on ``(updated_date, id)`` without counting.
+    An empty cursor starts from the first page.
+    """
+    limit = min(max(limit, 1), 100)
+
+    if cursor is not None:
+        paginated_posts = CursorPaginator(
+            objects=queryset,
+            offset=limit,
+            cursor=cursor,
+            field='updated_date',
+        )
+        return list(paginated_posts), {
+            'limit': limit,
+            'next_cursor': paginated_posts.next_cursor,
+            'prev_cursor': paginated_posts.prev_cursor,
+        }
+
+    page = max(page, 1)
+    offset = (page - 1) * limit
+    return list(queryset[offset:offset + limit]), {
+        'page': page,
+        'limit': limit,
+        'total': queryset.count(),
+    }
+
+
 def require_scope(token, scope):
     try:
         DeveloperTokenService.require_scope(token, scope)
@@ -118,6 +158,24 @@ def post_validation_error(error: PostValidationError):
     )
 
 
+UPLOAD_SESSION_ERROR_STATUS = {
+    'upload.not_found': 404,
+    'upload.offset_mismatch': 409,
+    'upload.completed': 409,
+    'upload.incomplete': 409,
+    'upload.hash_mismatch': 422,
+    'upload.invalid_file': 422,
+}
+
+
+def upload_session_error(error: UploadSessionError):
+    return error_response(
+        error.code,
+        error.message,
+        UPLOAD_SESSION_ERROR_STATUS.get(error.code, 400),
+    )
+
+
 def developer_me_data(token):
     return {
         'user': {
@@ -201,7 +259,13 @@ def get_me(request):
     summary='포스트 목록 조회',
     tags=['Posts'],
 )
-def list_posts(request, status: str = '', page: int = 1, limit: int = 20):
+def list_posts(
+    request,
+    status: str = '',
+    page: int = 1,
+    limit: int = 20,
+    cursor: str | None = None,
+):
     require_scope(request.auth, 'posts:read')
 
     try:
@@ -210,22 +274,17 @@ def list_posts(request, status: str = '', page: int = 1, limit: int = 20):
     except DeveloperAuthError as error:
         return auth_error_response(error)
 
-    page = max(page, 1)
-    limit = min(max(limit, 1), 100)
-    offset = (page - 1) * limit
-    total = queryset.count()
-    posts = queryset[offset:offset + limit]
+    try:
+        posts, pagination = paginate_posts(queryset, page, limit, cursor)
+    except Http404:
+        return invalid_cursor_response()
 
     response = success({
         'posts': [
             DeveloperPostSerializer.summary(post)
             for post in posts
         ],
-        'pagination': {
-            'page': page,
-            'limit': limit,
-            'total': total,
-        },
+        'pagination': pagination,
     })
     DeveloperTokenService.record_request(request, request.auth, response.status_code)
     return response
@@ -320,6 +379,7 @@ def search_posts(
     series_id: str | None = None,
     page: int = 1,
     limit: int = 20,
+    cursor: str | None = None,
 ):
     require_scope(request.auth, 'posts:read')
     queryset = DeveloperPostAPI.post_queryset(request.auth.user)
@@ -336,22 +396,17 @@ def search_posts(
         queryset = queryset.filter(tags__value__in=tags)
 
     queryset = queryset.distinct().order_by('-updated_date')
-    page = max(page, 1)
-    limit = min(max(limit, 1), 100)
-    offset = (page - 1) * limit
-    total = queryset.count()
-    posts = queryset[offset:offset + limit]
+    try:
+        posts, pagination = paginate_posts(queryset, page, limit, cursor)
+    except Http404:
+        return invalid_cursor_response()
 
     response = success({
         'posts': [
             DeveloperPostSerializer.summary(post)
             for post in posts
         ],
-        'pagination': {
-            'page': page,
-            'limit': limit,
-            'total': total,
-        },
+        'pagination': pagination,
     })
     DeveloperTokenService.record_request(request, request.auth, response.status_code)
     return response
@@ -649,3 +704,115 @@ def upload_image(request, image: UploadedFile = File(...)):
     }, status=201)
     DeveloperTokenService.record_request(request, request.auth, response.status_code)
     return response
+
+
+@api.post(
+    '/uploads',
+    response={201: UploadSessionEnvelope, **ERROR_RESPONSES},
+    operation_id='createUpload',
+    summary='이어 올리기 업로드 시작',
+    description=(
+        '큰 이미지나 동영상을 여러 조각으로 나눠 올립니다. 같은 해시의 파일이 이미 있으면 '
+        '`url`이 채워진 완료 상태로 응답합니다.'
+    ),
+    tags=['Media'],
+)
+def create_upload(request, payload: UploadSessionCreatePayload):
+    require_scope(request.auth, 'posts:write')
+
+    try:
+        session = UploadSessionService.create(
+            request.auth.user,
+            file_name=payload.file_name,
+            size=payload.size,
+            sha256=payload.sha256 or '',
+        )
+    except UploadSessionError as error:
+        response = upload_session_error(error)
+        DeveloperTokenService.record_request(request, request.auth, response.status_code)
+        return response
+
+    response = success(session.to_dict(), status=201)
+    DeveloperTokenService.record_request(request, request.auth, response.status_code)
+    return response
+
+
+@api.get(
+    '/uploads/{upload_id}',
+    response={200: UploadSessionEnvelope, **ERROR_RESPONSES},
+    operation_id='getUpload',
+    summary='이어 올리기 업로드 상태',
+    description='연결이 끊겼다면 응답의 `offset`부터 이어서 보냅니다.',
+    tags=['Media'],
+)
+def get_upload(request, upload_id: str):
+    require_scope(request.auth, 'posts:write')
+
+    try:
+        session = UploadSessionService.get(request.auth.user, upload_id)
+    except UploadSessionError as error:
+        response = upload_session_error(error)
+        DeveloperTokenService.record_request(request, request.auth, response.status_code)
+        return response
+
+    response = success(session.to_dict())
+    DeveloperTokenService.record_request(request, request.auth, response.status_code)
+    return response
+
+
+@api.put(
+    '/uploads/{upload_id}',
+    response={200: UploadSessionEnvelope, **ERROR_RESPONSES},
+    operation_id='appendUploadChunk',
+    summary='업로드 조각 전송',
+    description=(
+        '요청 본문 전체가 `offset` 위치부터 이어지는 조각입니다. '
+        '`offset`은 현재 업로드 위치와 같아야 하며 조각은 8MiB 이하입니다.'
+    ),
+    tags=['Media'],
+)
+def append_upload_chunk(request, upload_id: str, offset: int):
+    require_scope(request.auth, 'posts:write')
+
+    try:
+        content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        content_length = 0
+
+    try:
+        session = UploadSessionService.get(request.auth.user, upload_id)
+        UploadSessionService.append_chunk(session, offset, request, content_length)
+    except UploadSessionError as error:
+        response = upload_session_error(error)
+        DeveloperTokenService.record_request(request, request.auth, response.status_code)
+        return response
+
+    response = success(session.to_dict())
+    DeveloperTokenService.record_request(request, request.auth, response.status_code)
+    return response
+
+
+@api.post(
+    '/uploads/{upload_id}/complete',
+    response={201: ImageUploadEnvelope, **ERROR_RESPONSES},
+    operation_id='completeUpload',
+    summary='이어 올리기 업로드 완료',
+    description='받은 파일을 SHA-256으로 확인한 뒤 본문 이미지로 저장합니다.',
+    tags=['Media'],
+)
+def complete_upload(request, upload_id: str, payload: UploadSessionCompletePayload | None = Body(None)):
+    require_scope(request.auth, 'posts:write')
+
+    try:
+        session = UploadSessionService.get(request.auth.user, upload_id)
+        url = UploadSessionService.complete(session, payload.sha256 if payload else '')
+    except UploadSessionError as error:
+        response = upload_session_error(error)
+        DeveloperTokenService.record_request(request, request.auth, response.status_code)
+        return response
+
+    response = success({
+        'url': url,
+    }, status=201)
+    DeveloperTokenService.record_request(request, request.auth, response.status_code)
+    return response
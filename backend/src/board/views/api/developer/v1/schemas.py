@@ -75,9 +75,11 @@ class PostDetail(PostSummary):
 
 
 class Pagination(Schema):
-    page: int
     limit: int
-    total: int
+    page: int | None = None
+    total: int | None = None
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
 
 
 class PostListData(Schema):
@@ -188,3 +190,26 @@ class ImageUploadData(Schema):
 
 class ImageUploadEnvelope(Schema):
     data: ImageUploadData
+
+
+class UploadSessionCreatePayload(Schema):
+    file_name: str = Field(..., description='확장자를 포함한 파일 이름입니다.')
+    size: int = Field(..., description='파일 전체 크기(바이트)입니다.')
+    sha256: str | None = Field(None, description='파일 전체의 SHA-256(hex)입니다. 완료 요청에서 보내도 됩니다.')
+
+
+class UploadSessionCompletePayload(Schema):
+    sha256: str | None = Field(None, description='파일 전체의 SHA-256(hex)입니다. 생성 시 보냈다면 생략할 수 있습니다.')
+
+
+class UploadSessionData(Schema):
+    id: str
+    file_name: str
+    size: int
+    offset: int
+    url: str | None = None
+    expires_at: str
+
+
+class UploadSessionEnvelope(Schema):
+    data: UploadSessionData
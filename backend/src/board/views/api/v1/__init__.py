@@ -23,6 +23,7 @@ from .setting import *
 from .site_setting import *
 from .static_page import *
 from .telegram import *
+from .upload import *
 from .user import *
 from .utility import *
 from .user_management import *
@@ -28,7 +28,6 @@ from board.services.hcaptcha_service import HCaptchaService
 from modules import oauth
 from board.services.social_auth_provider_service import SocialAuthProviderService
 from modules.challenge import auth_hcaptcha
-from modules.sub_task import SubTaskProcessor
 from modules.telegram import TelegramBot
 
 
@@ -6,12 +6,15 @@ from django.utils import timezone
 from django.shortcuts import get_object_or_404
 from django.core.cache import cache
 
+from board.decorators import conditional_get
 from board.models import User, Post, Comment, PostLikes
 from board.services import UserService
+from board.services.conditional_get_service import ConditionalGetService
 from board.services.public_post_service import PublicPostService
 from board.modules.response import StatusDone, StatusError, ErrorCode
 
 
+@conditional_get(ConditionalGetService.author_heatmap)
 def get_author_heatmap(request, username):
     """
     API endpoint for author heatmap
@@ -12,6 +12,7 @@ from board.services.api_permission_service import ApiPermissionService
 from board.services.api_request_body_service import ApiRequestBodyService
 from board.services.post_service import PostService, PostValidationError
 from board.services.public_post_service import PublicPostService
+from board.services.related_post_service import RelatedPostService
 
 
 def post_list(request):
@@ -231,7 +232,7 @@ def user_posts(request, username, url=None):
 def user_post_related(request, username, url):
     """
     Get related posts for a specific post based on shared tags and popularity.
-    Uses a scoring system to rank relevance.
+    Reads the precomputed related posts index.
     """
     if request.method == 'GET':
         post = get_object_or_404(Post.objects.select_related('config').prefetch_related('tags'),
@@ -240,7 +241,7 @@ def user_post_related(request, username, url):
         if request.user != post.author and not PublicPostService.is_public(post):
             raise Http404
 
-        related_posts = PostService.get_related_posts(post)
+        related_posts = RelatedPostService.get_related_posts(post)
 
         return StatusDone({
             'posts': list(map(lambda related_post: {
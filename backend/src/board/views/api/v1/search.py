@@ -1,13 +1,11 @@
 import time
 
-from django.db.models import Case, F, IntegerField, Max, Q, Value, When
 from django.http import Http404
 
-from board.models import Post
 from board.modules.paginator import Paginator
 from board.modules.response import ErrorCode, StatusDone, StatusError
 from board.modules.time import convert_to_localtime
-from board.services.public_post_service import PublicPostService
+from board.services.post_search_service import PostSearchService
 
 
 def search(request):
@@ -32,60 +30,7 @@ def search(request):
 
     start_time = time.perf_counter()
 
-    title_match = Q()
-    description_match = Q()
-    tag_match = Q()
-    content_match = Q()
-
-    for keyword in keywords:
-        title_match |= Q(title__icontains=keyword)
-        description_match |= Q(meta_description__icontains=keyword)
-        tag_match |= Q(tags__value__icontains=keyword)
-        content_match |= Q(content__content_html__icontains=keyword)
-
-    search_filter = title_match | description_match | tag_match | content_match
-
-    posts = PublicPostService.filter_public_posts(
-        Post.objects.filter(search_filter)
-    )
-
-    if username:
-        posts = posts.filter(author__username=username)
-
-    posts = posts.annotate(
-        author_username=F('author__username'),
-        author_image=F('author__profile__avatar'),
-        title_score=Max(
-            Case(
-                When(title_match, then=Value(100)),
-                default=Value(0),
-                output_field=IntegerField(),
-            )
-        ),
-        description_score=Max(
-            Case(
-                When(description_match, then=Value(40)),
-                default=Value(0),
-                output_field=IntegerField(),
-            )
-        ),
-        tag_score=Max(
-            Case(
-                When(tag_match, then=Value(30)),
-                default=Value(0),
-                output_field=IntegerField(),
-            )
-        ),
-        content_score=Max(
-            Case(
-                When(content_match, then=Value(10)),
-                default=Value(0),
-                output_field=IntegerField(),
-            )
-        ),
-    ).annotate(
-        relevance=F('title_score') + F('description_score') + F('tag_score') + F('content_score'),
-    ).distinct().order_by('-relevance', '-published_date')
+    posts = PostSearchService.search(keywords, username)
 
     try:
         paginated = Paginator(
@@ -111,11 +56,6 @@ def search(request):
             'created_date': convert_to_localtime(post.published_date).strftime('%Y년 %m월 %d일'),
             'author_image': post.author_image,
             'author': post.author_username,
-            'positions': list(filter(lambda item: item, [
-                '제목' if post.title_score > 0 else '',
-                '설명' if post.description_score > 0 else '',
-                '태그' if post.tag_score > 0 else '',
-                '내용' if post.content_score > 0 else '',
-            ])),
+            'positions': list(PostSearchService.get_positions(post)),
         }, paginated)),
     })
@@ -1,7 +1,7 @@
 import json
 
 from django.contrib import auth
-from django.db.models import Count
+from django.db.models import Count, F
 from django.http import Http404
 from django.shortcuts import get_object_or_404
 from board.models import (
@@ -48,8 +48,8 @@ def get_post_management_queryset(user, *, scheduled=False):
     ).prefetch_related(
         'tags'
     ).annotate(
-        count_likes=Count('likes', distinct=True),
-        count_comments=Count('comments', distinct=True),
+        count_likes=F('like_count'),
+        count_comments=F('comment_count'),
     ).filter(
         author=user,
     ).order_by('-published_date')
@@ -115,13 +115,8 @@ def paginate_post_management_posts(posts, request, total_count):
 
 
 def serialize_post_management_post(post, *, date_format):
-    count_likes = getattr(post, 'count_likes', None)
-    if count_likes is None:
-        count_likes = post.likes.count()
-
-    count_comments = getattr(post, 'count_comments', None)
-    if count_comments is None:
-        count_comments = post.comments.count()
+    count_likes = getattr(post, 'count_likes', post.like_count)
+    count_comments = getattr(post, 'count_comments', post.comment_count)
 
     return {
         'url': post.url,
@@ -4,21 +4,18 @@ from django.utils import timezone
 from board.models import TelegramSync
 from board.modules.response import StatusDone, StatusError, ErrorCode
 from board.services.api_request_body_service import ApiRequestBodyService
+from board.services.background_job_service import BackgroundJobService
 from board.services.integration_setting_service import IntegrationSettingService
 from board.services.site_url_service import SiteUrlService
-from modules.sub_task import SubTaskProcessor
-from modules.telegram import TelegramBot
 from modules.randomness import randstr
 
 
 def telegram(request, parameter):
     if parameter == 'webHook':
         if request.method == 'POST':
-            bot_token = IntegrationSettingService.get_telegram_bot_token()
-            if not bot_token:
+            if not IntegrationSettingService.get_telegram_bot_token():
                 return StatusDone()
 
-            bot = TelegramBot(bot_token)
             req_userid = None
             try:
                 req = ApiRequestBodyService.parse_json_or_empty_for_legacy_only(request)
@@ -31,19 +28,25 @@ def telegram(request, parameter):
                         telegram_sync.tid = str(req_userid)
                         telegram_sync.auth_token = ''
                         telegram_sync.save()
-                        SubTaskProcessor.process(
-                            lambda: bot.send_message(req_userid, '정상적으로 연동되었습니다.'))
+                        BackgroundJobService.enqueue('telegram.send_message', {
+                            'chat_id': req_userid,
+                            'text': '정상적으로 연동되었습니다.',
+                        })
                     else:
                         telegram_sync.auth_token = ''
                         telegram_sync.save()
-                        SubTaskProcessor.process(lambda: bot.send_message(
-                            req_userid, '기간이 만료된 토큰입니다. 홈페이지에서 연동을 다시 시도하십시오.'))
+                        BackgroundJobService.enqueue('telegram.send_message', {
+                            'chat_id': req_userid,
+                            'text': '기간이 만료된 토큰입니다. 홈페이지에서 연동을 다시 시도하십시오.',
+                        })
 
             except:
                 if req_userid:
                     message = '블렉스 다양한 정보를 살펴보세요!\n\n' + SiteUrlService.configured_absolute_url('/notion')
-                    SubTaskProcessor.process(
-                        lambda: bot.send_message(req_userid, message))
+                    BackgroundJobService.enqueue('telegram.send_message', {
+                        'chat_id': req_userid,
+                        'text': message,
+                    })
             return StatusDone()
 
     if parameter == 'makeToken':
@@ -0,0 +1,108 @@
+from django.http import Http404
+
+from board.modules.response import StatusDone, StatusError, ErrorCode
+from board.services.api_permission_service import ApiPermissionService
+from board.services.api_request_body_service import ApiRequestBodyService
+from board.services.upload_session_service import UploadSessionError, UploadSessionService
+
+
+UPLOAD_ERROR_CODES = {
+    'upload.not_found': ErrorCode.NOT_FOUND,
+    'upload.too_large': ErrorCode.SIZE_OVERFLOW,
+    'upload.invalid_extension': ErrorCode.VALIDATE,
+    'upload.invalid_size': ErrorCode.VALIDATE,
+    'upload.invalid_hash': ErrorCode.VALIDATE,
+    'upload.invalid_chunk': ErrorCode.VALIDATE,
+    'upload.invalid_file': ErrorCode.VALIDATE,
+}
+
+
+def upload_error(error):
+    return StatusError(UPLOAD_ERROR_CODES.get(error.code, ErrorCode.REJECT), error.message)
+
+
+def parse_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def require_uploader(request):
+    if not request.user.is_active:
+        raise Http404
+    return ApiPermissionService.require_editor(request.user)
+
+
+def uploads(request):
+    if request.method == 'POST':
+        permission_error = require_uploader(request)
+        if permission_error:
+            return permission_error
+
+        data, error = ApiRequestBodyService.parse_json_or_error(request)
+        if error:
+            return error
+
+        try:
+            session = UploadSessionService.create(
+                request.user,
+                file_name=data.get('file_name'),
+                size=parse_int(data.get('size')),
+                sha256=data.get('sha256', ''),
+            )
+        except UploadSessionError as error:
+            return upload_error(error)
+        return StatusDone(session.to_dict())
+
+    raise Http404
+
+
+def upload_detail(request, key):
+    if request.method not in ('GET', 'PUT', 'DELETE'):
+        raise Http404
+
+    permission_error = require_uploader(request)
+    if permission_error:
+        return permission_error
+
+    try:
+        session = UploadSessionService.get(request.user, key)
+
+        if request.method == 'PUT':
+            offset = parse_int(request.GET.get('offset'))
+            if offset is None:
+                return StatusError(ErrorCode.VALIDATE, '업로드 위치가 필요합니다.')
+            UploadSessionService.append_chunk(
+                session,
+                offset,
+                request,
+                parse_int(request.META.get('CONTENT_LENGTH')) or 0,
+            )
+        elif request.method == 'DELETE':
+            UploadSessionService.abort(session)
+            return StatusDone()
+    except UploadSessionError as error:
+        return upload_error(error)
+
+    return StatusDone(session.to_dict())
+
+
+def upload_complete(request, key):
+    if request.method == 'POST':
+        permission_error = require_uploader(request)
+        if permission_error:
+            return permission_error
+
+        data, error = ApiRequestBodyService.parse_json_or_error(request)
+        if error:
+            return error
+
+        try:
+            session = UploadSessionService.get(request.user, key)
+            url = UploadSessionService.complete(session, data.get('sha256', ''))
+        except UploadSessionError as error:
+            return upload_error(error)
+        return StatusDone({'url': url})
+
+    raise Http404
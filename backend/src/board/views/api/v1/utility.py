@@ -78,6 +78,25 @@ def utility_clean_logs(request):
     return StatusDone(UtilityCleanupService.clean_logs(body))
 
 
+def utility_maintain_database(request):
+    """
+    POST /v1/utilities/maintain-database - DB 최적화 (ANALYZE, WAL 체크포인트)
+    Body: { dry_run: bool, analyze: bool }
+    """
+    permission_error = UtilityPermissionService.require_staff(request.user)
+    if permission_error:
+        return permission_error
+
+    if request.method != 'POST':
+        return StatusError(ErrorCode.REJECT)
+
+    body, body_error = ApiRequestBodyService.parse_json_or_error(request)
+    if body_error:
+        return body_error
+
+    return StatusDone(UtilityCleanupService.maintain_database(body))
+
+
 def utility_clean_images(request):
     """
     POST /v1/utilities/clean-images - 이미지 정리
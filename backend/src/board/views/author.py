@@ -8,14 +8,18 @@ from django.http import HttpResponse, JsonResponse
 from django.urls import reverse
 from django.views.decorators.http import require_GET
 
+from board.decorators import conditional_get
 from board.modules.paginator import Paginator
 from board.modules.time import time_since
 from board.services.user_service import UserService
 from board.services.authoring_permission_service import AuthoringPermissionService
+from board.services.conditional_get_service import ConditionalGetService
 from board.services.discovery_metadata_service import DiscoveryMetadataService
+from board.services.listing_count_service import ListingCountService
+from board.services.public_cache_service import PublicCacheScope
 from board.services.public_post_service import PublicPostService
 from board.services.public_series_service import PublicSeriesService
-from board.models import Comment, Post, Series, PostLikes, Tag, Profile, SiteNotice, SiteContentScope
+from board.models import Post, Series, PostLikes, Tag, Profile, SiteNotice, SiteContentScope
 
 
 def apply_partial_response_headers(response):
@@ -24,6 +28,7 @@ def apply_partial_response_headers(response):
     return response
 
 
+@conditional_get(ConditionalGetService.author_overview)
 def author_overview(request, username):
     """
     View for the author's overview page.
@@ -173,7 +178,14 @@ def author_posts(request, username):
     paginated_posts = Paginator(
         objects=posts,
         offset=24,
-        page=page
+        page=page,
+        count=ListingCountService.get_count(
+            'author_posts',
+            [author.id, search_query, tag_filter],
+            posts,
+            scopes=(PublicCacheScope.POSTS,),
+            page=page,
+        ),
     )
 
     post_count = paginated_posts.paginator.count
@@ -184,18 +196,6 @@ def author_posts(request, username):
 
     page_posts = list(paginated_posts)
     post_ids = [post.id for post in page_posts]
-    like_counts = {
-        item['post_id']: item['count']
-        for item in PostLikes.objects.filter(post_id__in=post_ids)
-        .values('post_id')
-        .annotate(count=Count('id'))
-    }
-    comment_counts = {
-        item['post_id']: item['count']
-        for item in Comment.objects.filter(post_id__in=post_ids)
-        .values('post_id')
-        .annotate(count=Count('id'))
-    }
     liked_post_ids = set()
     if request.user.is_authenticated:
         liked_post_ids = set(
@@ -204,8 +204,8 @@ def author_posts(request, username):
         )
 
     for post in page_posts:
-        post.count_likes = like_counts.get(post.id, 0)
-        post.count_comments = comment_counts.get(post.id, 0)
+        post.count_likes = post.like_count
+        post.count_comments = post.comment_count
         post.has_liked = post.id in liked_post_ids
         post.time_display = time_since(post.published_date)
 
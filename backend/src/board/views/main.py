@@ -1,54 +1,53 @@
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import redirect, render
-from django.db.models import F, Count, Exists, OuterRef
+from django.db.models import F, Exists, OuterRef
 from django.urls import reverse
 
 from board.models import Post, PostLikes
-from board.modules.paginator import Paginator
+from board.modules.paginator import CursorPaginator, Paginator
 from board.modules.time import time_since
 from board.services.discovery_metadata_service import DiscoveryMetadataService
+from board.services.listing_count_service import ListingCountService
 from board.services.initial_setup_service import InitialSetupService
+from board.services.public_cache_service import PublicCacheScope, PublicCacheService
 from board.services.public_post_service import PublicPostService
+from board.services.site_snapshot_service import SiteSnapshotService
 from board.services.user_service import UserService
 
 
 def index(request):
-    if InitialSetupService.should_prompt_for_initial_setup():
+    # The snapshot can lag behind accounts created outside the setup flow.
+    if (
+        SiteSnapshotService.get(request).needs_initial_setup
+        and InitialSetupService.should_prompt_for_initial_setup()
+    ):
         return redirect('/setup')
 
-    posts = PublicPostService.filter_public_posts(
-        Post.objects.select_related(
-            'config', 'series', 'author', 'author__profile'
-        )
-    ).annotate(
-        author_username=F('author__username'),
-        author_image=F('author__profile__avatar'),
-        count_likes=Count('likes', distinct=True),
-        count_comments=Count('comments', distinct=True),
-        has_liked=Exists(
-            PostLikes.objects.filter(
-                post__id=OuterRef('id'),
-                user__id=request.user.id if request.user.id else -1
-            )
-        ),
-    )
-
-    posts = posts.order_by('-published_date')
+    if 'cursor' in request.GET:
+        return index_cursor(request, request.GET['cursor'])
 
     page = int(request.GET.get('page', 1))
-    paginated_posts = Paginator(
-        objects=posts,
-        offset=24,
-        page=page
-    )
+    if request.user.is_authenticated:
+        posts, page_count = get_index_page(request.user.id, page)
+    else:
+        posts, page_count = PublicCacheService.get_or_set(
+            'index',
+            [page],
+            lambda: get_index_page(None, page),
+            scopes=(
+                PublicCacheScope.POSTS,
+                PublicCacheScope.SERIES,
+                PublicCacheScope.ENGAGEMENT,
+            ),
+        )
 
-    for post in paginated_posts:
+    for post in posts:
         post.time_display = time_since(post.published_date)
 
     context = {
-        'posts': paginated_posts,
+        'posts': posts,
         'page_number': page,
-        'page_count': paginated_posts.paginator.num_pages,
+        'page_count': page_count,
     }
     if DiscoveryMetadataService.has_unexpected_query_parameters(request, {'page'}):
         context.update(
@@ -63,13 +62,97 @@ def index(request):
                 request,
                 reverse('index'),
                 page,
-                paginated_posts.paginator.num_pages,
+                page_count,
             )
         )
 
     return render(request, 'board/posts/post_list.html', context)
 
 
+def index_cursor(request, cursor):
+    """
+    Opt-in keyset pagination for the index (``?cursor=``). Page-number URLs
+    stay canonical for search engines, so cursor pages are not indexed.
+    """
+    if request.user.is_authenticated:
+        posts, next_cursor, prev_cursor = get_index_cursor_page(request.user.id, cursor)
+    else:
+        posts, next_cursor, prev_cursor = PublicCacheService.get_or_set(
+            'index_cursor',
+            [cursor],
+            lambda: get_index_cursor_page(None, cursor),
+            scopes=(
+                PublicCacheScope.POSTS,
+                PublicCacheScope.SERIES,
+                PublicCacheScope.ENGAGEMENT,
+            ),
+        )
+
+    for post in posts:
+        post.time_display = time_since(post.published_date)
+
+    context = {
+        'posts': posts,
+        'cursor_mode': True,
+        'next_cursor': next_cursor,
+        'prev_cursor': prev_cursor,
+    }
+    context.update(
+        DiscoveryMetadataService.build_noindex_page_metadata(
+            request,
+            reverse('index'),
+        )
+    )
+
+    return render(request, 'board/posts/post_list.html', context)
+
+
+def get_index_posts(user_id):
+    return PublicPostService.filter_public_posts(
+        Post.objects.select_related(
+            'config', 'series', 'author', 'author__profile'
+        )
+    ).annotate(
+        author_username=F('author__username'),
+        author_image=F('author__profile__avatar'),
+        count_likes=F('like_count'),
+        count_comments=F('comment_count'),
+        has_liked=Exists(
+            PostLikes.objects.filter(
+                post__id=OuterRef('id'),
+                user__id=user_id if user_id else -1
+            )
+        ),
+    )
+
+
+def get_index_page(user_id, page):
+    posts = get_index_posts(user_id).order_by('-published_date')
+
+    paginated_posts = Paginator(
+        objects=posts,
+        offset=24,
+        page=page,
+        count=ListingCountService.get_count(
+            'index',
+            [],
+            posts,
+            scopes=(PublicCacheScope.POSTS,),
+            page=page,
+        ),
+    )
+    return list(paginated_posts), paginated_posts.paginator.num_pages
+
+
+def get_index_cursor_page(user_id, cursor):
+    paginated_posts = CursorPaginator(
+        objects=get_index_posts(user_id),
+        offset=24,
+        cursor=cursor
+    )
+    return list(paginated_posts), paginated_posts.next_cursor, paginated_posts.prev_cursor
+
+
 @login_required(login_url='/login')
 def interested_posts(request):
     posts = UserService.get_user_interested_posts(request.user)
@@ -78,7 +161,14 @@ def interested_posts(request):
     paginated_posts = Paginator(
         objects=posts,
         offset=24,
-        page=page
+        page=page,
+        count=ListingCountService.get_count(
+            'interested_posts',
+            [request.user.id],
+            posts,
+            scopes=(PublicCacheScope.POSTS, PublicCacheScope.ENGAGEMENT),
+            page=page,
+        ),
     )
 
     for post in paginated_posts:
@@ -9,19 +9,30 @@ from django.utils import timezone
 
 from board.models import Post, Series, PostLikes, UsernameChangeLog
 from board.services.post_service import PostService, PostValidationError
+from board.services.post_content_service import PostContentService
 from board.services.banner_service import BannerService
 from board.services.agent_content_service import AgentContentService
 from board.services.brand_asset_service import BrandAssetService
 from board.services.discovery_metadata_service import DiscoveryMetadataService
+from board.services.post_page_cache_service import PostPageCacheService
 from board.services.public_post_service import PublicPostService
 from board.services.site_url_service import SiteUrlService
-from board.html_utils import extract_table_of_contents
-from board.decorators import editor_required
+from board.decorators import conditional_get, editor_required
+from board.services.conditional_get_service import ConditionalGetService
 
+@conditional_get(ConditionalGetService.post_detail)
 def post_detail(request, username, post_url):
     """
     View for the post detail page.
     """
+    page_cache_key = None
+    if PostPageCacheService.is_cacheable_request(request):
+        page_cache_key = PostPageCacheService.build_cache_key(request, username, post_url)
+        if page_cache_key:
+            cached_response = PostPageCacheService.get_response(request, page_cache_key)
+            if cached_response:
+                return cached_response
+
     # Check if this is an old username in the change log
     username_log = UsernameChangeLog.objects.filter(username=username).select_related('user').first()
     if username_log:
@@ -61,8 +72,8 @@ def post_detail(request, username, post_url):
     if post.series:
         post.visible_series_posts = PostService.get_visible_series_posts(post)
 
-    # Extract table of contents from post content
-    content_html_with_ids, table_of_contents = extract_table_of_contents(post.content.content_html)
+    # Table of contents and heading ids are precomputed when content is saved
+    content_html_with_ids, table_of_contents = PostContentService.get_table_of_contents(post.content)
 
     banners = BannerService.get_all_banners_for_author(author)
 
@@ -124,6 +135,9 @@ def post_detail(request, username, post_url):
     if show_agent_post_markdown:
         response['Link'] = AgentContentService.build_agent_link_header(post, request)
         response['X-Llms-Txt'] = AgentContentService.build_llms_txt_url(request)
+
+    if page_cache_key is not None and is_public_post:
+        PostPageCacheService.store_response(page_cache_key, response, post.series_id)
     return response
 
 
@@ -1,3 +1,4 @@
+from django.db import transaction
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
 from django.views.decorators.http import require_POST
@@ -8,6 +9,7 @@ from board.modules.notify import create_notify
 
 
 @require_POST
+@transaction.atomic
 def like_post(request, url):
     """
     View to handle post likes via AJAX.
@@ -45,7 +47,7 @@ def like_post(request, url):
                 url=post.get_absolute_url(),
                 content=send_notify_content)
     
-    count_likes = PostLikes.objects.filter(post=post).count()
+    count_likes = Post.objects.filter(pk=post.pk).values_list('like_count', flat=True).get()
     
     return JsonResponse({
         'status': 'done',
@@ -1,15 +1,19 @@
 from django.shortcuts import render, get_object_or_404
 from django.contrib.auth.models import User
-from django.db.models import Count, Exists, OuterRef
+from django.db.models import Exists, F, OuterRef
 from django.http import Http404
 
+from board.decorators import conditional_get
 from board.models import Post, Series, PostLikes
 from board.services.agent_content_service import AgentContentService
+from board.services.conditional_get_service import ConditionalGetService
 from board.services.discovery_metadata_service import DiscoveryMetadataService
+from board.services.public_cache_service import PublicCacheScope, PublicCacheService
 from board.services.public_post_service import PublicPostService
 from board.services.public_series_service import PublicSeriesService
 
 
+@conditional_get(ConditionalGetService.series_detail)
 def series_detail(request, username, series_url):
     """
     View for the series detail page.
@@ -20,48 +24,35 @@ def series_detail(request, username, series_url):
     if sort_order not in ['asc', 'desc']:
         sort_order = 'desc'
 
-    series = get_object_or_404(
-        PublicSeriesService.filter_public_series(Series.objects),
-        owner=author,
-        url=series_url,
-    )
-
-    order_by = 'published_date' if sort_order == 'asc' else '-published_date'
-
-    all_posts = PublicPostService.filter_public_posts(
-        Post.objects.select_related(
-            'config', 'author', 'author__profile'
-        ).filter(series=series)
-    ).annotate(
-        count_likes=Count('likes', distinct=True),
-        count_comments=Count('comments', distinct=True),
-        has_liked=Exists(
-            PostLikes.objects.filter(
-                post__id=OuterRef('id'),
-                user__id=request.user.id if request.user.id else -1
-            )
-        ),
-    ).order_by(order_by)
-
     page = int(request.GET.get('page', 1))
     posts_per_page = 10  # Show 10 posts per page
-    total_posts = all_posts.count()
+    if request.user.is_authenticated:
+        series, paginated_posts, total_posts = get_series_detail_page(
+            author, series_url, sort_order, page, posts_per_page, request.user.id,
+        )
+    else:
+        series, paginated_posts, total_posts = PublicCacheService.get_or_set(
+            'series_detail',
+            [author.id, series_url, sort_order, page],
+            lambda: get_series_detail_page(
+                author, series_url, sort_order, page, posts_per_page, None,
+            ),
+            scopes=(
+                PublicCacheScope.POSTS,
+                PublicCacheScope.SERIES,
+                PublicCacheScope.ENGAGEMENT,
+            ),
+        )
     total_pages = (total_posts + posts_per_page - 1) // posts_per_page  # Ceiling division
 
     series.post_count = total_posts
 
-    if page < 1 or (total_posts > 0 and page > total_pages):
-        raise Http404("Page not found")
-
     start_idx = (page - 1) * posts_per_page
-    end_idx = min(start_idx + posts_per_page, total_posts)
-
-    paginated_posts = all_posts[start_idx:end_idx]
     metadata = DiscoveryMetadataService.build_series_metadata(
         series=series,
         author=author,
         request=request,
-        posts=list(paginated_posts),
+        posts=paginated_posts,
         total_posts=total_posts,
         page=page,
         sort_order=sort_order,
@@ -111,3 +102,39 @@ def series_detail(request, username, series_url):
         )
         response['X-Llms-Txt'] = AgentContentService.build_llms_txt_url(request)
     return response
+
+
+def get_series_detail_page(author, series_url, sort_order, page, posts_per_page, user_id):
+    series = get_object_or_404(
+        PublicSeriesService.filter_public_series(Series.objects),
+        owner=author,
+        url=series_url,
+    )
+
+    order_by = 'published_date' if sort_order == 'asc' else '-published_date'
+
+    all_posts = PublicPostService.filter_public_posts(
+        Post.objects.select_related(
+            'config', 'author', 'author__profile'
+        ).filter(series=series)
+    ).annotate(
+        count_likes=F('like_count'),
+        count_comments=F('comment_count'),
+        has_liked=Exists(
+            PostLikes.objects.filter(
+                post__id=OuterRef('id'),
+                user__id=user_id if user_id else -1
+            )
+        ),
+    ).order_by(order_by)
+
+    total_posts = all_posts.count()
+    total_pages = (total_posts + posts_per_page - 1) // posts_per_page  # Ceiling division
+
+    if page < 1 or (total_posts > 0 and page > total_pages):
+        raise Http404("Page not found")
+
+    start_idx = (page - 1) * posts_per_page
+    end_idx = min(start_idx + posts_per_page, total_posts)
+
+    return series, list(all_posts[start_idx:end_idx]), total_posts
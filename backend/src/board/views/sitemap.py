@@ -3,12 +3,13 @@ from urllib.parse import urlsplit
 
 from django.contrib.sitemaps.views import SitemapIndexItem, x_robots_tag
 from django.core.paginator import EmptyPage, PageNotAnInteger
-from django.http import Http404, HttpRequest
+from django.http import FileResponse, Http404, HttpRequest
 from django.template.response import TemplateResponse
 from django.urls import reverse
 from django.utils.http import http_date
 
 from board.services.site_url_service import SiteUrlService
+from board.services.sitemap_file_service import SitemapFileService
 
 
 def get_sitemap_origin(request: HttpRequest) -> tuple[str, str]:
@@ -20,6 +21,19 @@ def get_sitemap_origin(request: HttpRequest) -> tuple[str, str]:
     return fallback_origin.scheme or request.scheme, fallback_origin.netloc or request.get_host()
 
 
+def get_static_sitemap_response(section=None, page=1):
+    # nginx serves these files directly; this covers deployments without it.
+    try:
+        page = int(page)
+    except (TypeError, ValueError):
+        return None
+
+    file_path = SitemapFileService.get_file_path(section, page)
+    if file_path is None:
+        return None
+    return FileResponse(open(file_path, 'rb'), content_type='application/xml')
+
+
 def get_latest_lastmod(current, candidate):
     if current is None or candidate > current:
         return candidate
@@ -34,6 +48,10 @@ def sitemap_index_view(
     content_type='application/xml',
     sitemap_url_name='sitemap_section',
 ):
+    static_response = get_static_sitemap_response()
+    if static_response:
+        return static_response
+
     protocol, domain = get_sitemap_origin(request)
 
     sites = []
@@ -77,6 +95,11 @@ def sitemap_section_view(
     template_name='sitemap.xml',
     content_type='application/xml',
 ):
+    if section in sitemaps:
+        static_response = get_static_sitemap_response(section, request.GET.get('p', 1))
+        if static_response:
+            return static_response
+
     protocol, domain = get_sitemap_origin(request)
     sitemap_site = SimpleNamespace(domain=domain)
 
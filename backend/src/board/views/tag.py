@@ -2,10 +2,14 @@ from django.http import Http404
 from django.shortcuts import render
 from django.urls import reverse
 
-from board.modules.paginator import Paginator
+from board.decorators import conditional_get
+from board.modules.paginator import CursorPaginator, Paginator
 
+from board.services.conditional_get_service import ConditionalGetService
 from board.services.discovery_metadata_service import DiscoveryMetadataService
+from board.services.listing_count_service import ListingCountService
 from board.services import TagService
+from board.services.public_cache_service import PublicCacheScope, PublicCacheService
 
 
 def tag_list_view(request):
@@ -16,37 +20,14 @@ def tag_list_view(request):
 
     sort = request.GET.get('sort', 'popular')
 
-    tags = TagService.get_tag_list_with_count()
-
-    if search_query:
-        tags = tags.filter(value__icontains=search_query)
-
-    if sort == 'popular':
-        tags = tags.order_by('-count', 'value')
-    elif sort == 'name':
-        tags = tags.order_by('value')
-    elif sort == 'recent':
-        tags = tags.order_by('-id')
-    else:
-        tags = tags.order_by('-count', 'value')
-
     page = int(request.GET.get('page', 1))
-    paginated_tags = Paginator(
-        objects=tags,
-        offset=50,
-        page=page
+    tag_list, last_page = PublicCacheService.get_or_set(
+        'tag_list',
+        [search_query, sort, page],
+        lambda: get_tag_list_page(search_query, sort, page),
+        scopes=(PublicCacheScope.POSTS,),
     )
 
-    tags_page = paginated_tags
-
-    tag_list = []
-    for tag in tags_page:
-        tag_list.append({
-            'name': tag.value,
-            'count': tag.count,
-            'image': tag.get_image(),
-        })
-
     sort_options = [
         {'value': 'popular', 'label': '인기순'},
         {'value': 'name', 'label': '이름순'},
@@ -56,7 +37,7 @@ def tag_list_view(request):
     context = {
         'tags': tag_list,
         'page': page,
-        'last_page': paginated_tags.paginator.num_pages,
+        'last_page': last_page,
         'sort_options': sort_options,
     }
     tags_path = reverse('tag_list')
@@ -77,38 +58,37 @@ def tag_list_view(request):
                 request,
                 tags_path,
                 page,
-                paginated_tags.paginator.num_pages,
+                last_page,
             )
         )
 
     return render(request, 'board/tags/tag_list.html', context)
 
 
+@conditional_get(ConditionalGetService.tag_detail)
 def tag_detail_view(request, name):
     """
     View function for displaying posts with a specific tag.
     """
-    user_id = request.user.id if request.user.is_authenticated else None
-    posts = TagService.get_posts_by_tag(name, user_id)
-
-    if len(posts) == 0:
-        raise Http404()
+    if 'cursor' in request.GET:
+        return tag_detail_cursor_view(request, name, request.GET['cursor'])
 
-    # Pagination
     page = int(request.GET.get('page', 1))
-    paginated_posts = Paginator(
-        objects=posts,
-        offset=24,
-        page=page
-    )
-
-    posts_page = paginated_posts
+    if request.user.is_authenticated:
+        posts, last_page = get_tag_detail_page(name, request.user.id, page)
+    else:
+        posts, last_page = PublicCacheService.get_or_set(
+            'tag_detail',
+            [name, page],
+            lambda: get_tag_detail_page(name, None, page),
+            scopes=(PublicCacheScope.POSTS, PublicCacheScope.ENGAGEMENT),
+        )
 
     context = {
         'tag': name,
-        'posts': paginated_posts,
+        'posts': posts,
         'page': page,
-        'last_page': paginated_posts.paginator.num_pages,
+        'last_page': last_page,
     }
     tag_detail_path = reverse('tag_detail', kwargs={'name': name})
     if DiscoveryMetadataService.has_unexpected_query_parameters(request, {'page'}):
@@ -124,8 +104,107 @@ def tag_detail_view(request, name):
                 request,
                 tag_detail_path,
                 page,
-                paginated_posts.paginator.num_pages,
+                last_page,
             )
         )
 
     return render(request, 'board/tags/tag_detail.html', context)
+
+
+def tag_detail_cursor_view(request, name, cursor):
+    """
+    Opt-in keyset pagination for tag pages (``?cursor=``). Page-number URLs
+    stay canonical for search engines, so cursor pages are not indexed.
+    """
+    if request.user.is_authenticated:
+        posts, next_cursor, prev_cursor = get_tag_detail_cursor_page(name, request.user.id, cursor)
+    else:
+        posts, next_cursor, prev_cursor = PublicCacheService.get_or_set(
+            'tag_detail_cursor',
+            [name, cursor],
+            lambda: get_tag_detail_cursor_page(name, None, cursor),
+            scopes=(PublicCacheScope.POSTS, PublicCacheScope.ENGAGEMENT),
+        )
+
+    context = {
+        'tag': name,
+        'posts': posts,
+        'cursor_mode': True,
+        'next_cursor': next_cursor,
+        'prev_cursor': prev_cursor,
+    }
+    context.update(
+        DiscoveryMetadataService.build_noindex_page_metadata(
+            request,
+            reverse('tag_detail', kwargs={'name': name}),
+        )
+    )
+
+    return render(request, 'board/tags/tag_detail.html', context)
+
+
+def get_tag_list_page(search_query, sort, page):
+    tags = TagService.get_tag_list_with_count()
+
+    if search_query:
+        tags = tags.filter(value__icontains=search_query)
+
+    if sort == 'popular':
+        tags = tags.order_by('-count', 'value')
+    elif sort == 'name':
+        tags = tags.order_by('value')
+    elif sort == 'recent':
+        tags = tags.order_by('-id')
+    else:
+        tags = tags.order_by('-count', 'value')
+
+    paginated_tags = Paginator(
+        objects=tags,
+        offset=50,
+        page=page
+    )
+
+    tag_list = []
+    for tag in paginated_tags:
+        tag_list.append({
+            'name': tag.value,
+            'count': tag.count,
+            'image': tag.get_image(),
+        })
+
+    return tag_list, paginated_tags.paginator.num_pages
+
+
+def get_tag_detail_page(name, user_id, page):
+    posts = TagService.get_posts_by_tag(name, user_id)
+
+    if not posts.exists():
+        raise Http404()
+
+    paginated_posts = Paginator(
+        objects=posts,
+        offset=24,
+        page=page,
+        count=ListingCountService.get_count(
+            'tag_detail',
+            [name],
+            posts,
+            scopes=(PublicCacheScope.POSTS,),
+            page=page,
+        ),
+    )
+    return list(paginated_posts), paginated_posts.paginator.num_pages
+
+
+def get_tag_detail_cursor_page(name, user_id, cursor):
+    posts = TagService.get_posts_by_tag(name, user_id)
+
+    if not posts.exists():
+        raise Http404()
+
+    paginated_posts = CursorPaginator(
+        objects=posts,
+        offset=24,
+        cursor=cursor
+    )
+    return list(paginated_posts), paginated_posts.next_cursor, paginated_posts.prev_cursor
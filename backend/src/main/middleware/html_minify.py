@@ -1,25 +1,83 @@
+import hashlib
+import time
+
 import minify_html
+from django.conf import settings
+from django.core.cache import cache
+from django.middleware.csrf import get_token
 from django.utils.deprecation import MiddlewareMixin
 
 
 class HTMLMinifyMiddleware(MiddlewareMixin):
+    """
+    Minify HTML responses once per distinct body.
+
+    Templates render a placeholder instead of the per-request CSRF token, so
+    unchanged pages hash to the same key and the minified output is reused
+    from the cache. Only pages for anonymous visitors are cached; signed-in
+    pages rarely repeat and would push shared entries out of the cache. The
+    visitor's token is substituted after minification and the time spent is
+    reported in the ``Server-Timing`` header.
+    """
+
+    CSRF_TOKEN_PLACEHOLDER = 'BLEXCSRFTOKENPLACEHOLDER'
+    CACHE_KEY_TEMPLATE = 'html_minify:{digest}'
+    SERVER_TIMING_METRIC = 'minify'
+
     def __init__(self, get_response):
         self.get_response = get_response
         super().__init__(get_response)
 
     def process_response(self, request, response):
-        # Only minify HTML responses
+        if response.streaming:
+            return response
+
+        # Only minify HTML responses that were not minified before caching
         if (response.status_code == 200 and
-            response.get('Content-Type', '').startswith('text/html')):
+            response.get('Content-Type', '').startswith('text/html') and
+            not getattr(response, 'minified', False)):
+
+            started_at = time.perf_counter()
+            html = response.content.decode('utf-8')
+            if self.is_cacheable(request):
+                content, cache_hit = self.minify_html_cached(html)
+            else:
+                content, cache_hit = self.minify_html(html), False
+            elapsed_ms = (time.perf_counter() - started_at) * 1000
 
-            content = response.content.decode('utf-8')
-            minified_content = self.minify_html(content)
-            response.content = minified_content.encode('utf-8')
+            response.content = content.encode('utf-8')
             response['Content-Length'] = len(response.content)
+            response.minified = True
+            self.add_server_timing(response, elapsed_ms, 'hit' if cache_hit else 'miss')
 
-        return response
+        return self.apply_csrf_token(request, response)
+
+    @staticmethod
+    def is_cacheable(request):
+        user = getattr(request, 'user', None)
+        return user is None or not user.is_authenticated
 
-    def minify_html(self, html):
+    @staticmethod
+    def minify_html_cached(html):
+        """
+        Return ``(minified_html, cache_hit)`` using the content hash as key.
+        """
+        timeout = getattr(settings, 'HTML_MINIFY_CACHE_TIMEOUT', 0)
+        if timeout <= 0:
+            return HTMLMinifyMiddleware.minify_html(html), False
+
+        digest = hashlib.sha256(html.encode('utf-8')).hexdigest()
+        cache_key = HTMLMinifyMiddleware.CACHE_KEY_TEMPLATE.format(digest=digest)
+        minified = cache.get(cache_key)
+        if minified is not None:
+            return minified, True
+
+        minified = HTMLMinifyMiddleware.minify_html(html)
+        cache.set(cache_key, minified, timeout)
+        return minified, False
+
+    @staticmethod
+    def minify_html(html):
         try:
             return minify_html.minify(
                 html,
@@ -32,3 +90,22 @@ class HTMLMinifyMiddleware(MiddlewareMixin):
         except Exception as e:
             print(f"HTML minification error: {e}")
             return html
+
+    @staticmethod
+    def apply_csrf_token(request, response):
+        if response.streaming:
+            return response
+
+        placeholder = HTMLMinifyMiddleware.CSRF_TOKEN_PLACEHOLDER.encode()
+        if placeholder in response.content:
+            response.content = response.content.replace(placeholder, get_token(request).encode())
+        if response.has_header('Content-Length'):
+            response['Content-Length'] = len(response.content)
+        return response
+
+    @staticmethod
+    def add_server_timing(response, elapsed_ms, description):
+        metric = f'{HTMLMinifyMiddleware.SERVER_TIMING_METRIC};dur={elapsed_ms:.2f};desc="{description}"'
+        if response.has_header('Server-Timing'):
+            metric = f"{response['Server-Timing']}, {metric}"
+        response['Server-Timing'] = metric
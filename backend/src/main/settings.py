@@ -69,6 +69,34 @@ def get_env_http_origin(name: str) -> str | None:
     return origin
 
 
+def get_cache_config(backend: str, location: str | None, max_entries: int | None = None) -> dict:
+    if backend == 'locmem':
+        config = {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': location or 'blex',
+        }
+    elif backend == 'database':
+        config = {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': location or 'blex_cache',
+        }
+    elif backend == 'redis':
+        # Redis evicts by its own maxmemory policy.
+        return {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': location or 'redis://127.0.0.1:6379',
+        }
+    else:
+        config = {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': location or os.path.join(BASE_DIR, 'cache'),
+        }
+
+    if max_entries:
+        config['OPTIONS'] = {'MAX_ENTRIES': max_entries}
+    return config
+
+
 SECRET_KEY = os.environ.get('SECRET_KEY')
 
 CIPHER_KEY = os.environ.get('CIPHER_KEY').encode()
@@ -151,6 +179,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'board.context_processors.csrf_placeholder',
                 'board.context_processors.oauth_settings',
                 'board.context_processors.site_settings',
                 'board.context_processors.global_notices',
@@ -165,6 +194,11 @@ TEMPLATES = [
 WSGI_APPLICATION = 'main.wsgi.application'
 
 FILE_UPLOAD_PERMISSIONS = 0o644
+# Same as Django's defaults, but uploads are hashed while they are received.
+FILE_UPLOAD_HANDLERS = [
+    'main.upload_handlers.Sha256MemoryFileUploadHandler',
+    'main.upload_handlers.Sha256TemporaryFileUploadHandler',
+]
 DEVELOPER_API_MAX_UPLOAD_MB = max(get_env_int('DEVELOPER_API_MAX_UPLOAD_MB', 20), 1)
 DEVELOPER_API_MAX_UPLOAD_BYTES = DEVELOPER_API_MAX_UPLOAD_MB * 1024 * 1024
 DEVELOPER_API_LOG_RETENTION_DAYS = max(get_env_int('DEVELOPER_API_LOG_RETENTION_DAYS', 30), 1)
@@ -176,13 +210,78 @@ SQLITE_DB_PATH = os.environ.get(
     os.path.join(BASE_DIR, 'db.sqlite3'),
 )
 
+# SQLite runtime profile, applied to every new connection.
+# WAL lets readers run while a write is in progress and busy_timeout makes
+# writers wait for the lock instead of failing with "database is locked".
+# IMMEDIATE transactions take the write lock up front, so a transaction that
+# reads before writing cannot deadlock on the lock upgrade.
+# WAL keeps the -wal and -shm files next to the database, so processes in
+# different containers must share its directory, not just the file.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': max(get_env_int('BLEX_SQLITE_BUSY_TIMEOUT', 5000), 0),
+    'mmap_size': max(get_env_int('BLEX_SQLITE_MMAP_SIZE', 128 * 1024 * 1024), 0),
+    'cache_size': -max(get_env_int('BLEX_SQLITE_CACHE_SIZE_KB', 20000), 0),
+    'temp_store': 'MEMORY',
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': SQLITE_DB_PATH,
+        'CONN_MAX_AGE': max(get_env_int('BLEX_DB_CONN_MAX_AGE', 600), 0),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'init_command': ';'.join(
+                f'PRAGMA {name}={value}' for name, value in SQLITE_PRAGMAS.items()
+            ),
+            'transaction_mode': 'IMMEDIATE',
+        },
     }
 }
 
+# Cache
+# BLEX_CACHE_BACKEND: file (default), database, redis or locmem.
+# The database backend needs `python manage.py createcachetable`.
+
+CACHE_BACKEND = 'locmem' if TESTING else (
+    get_env_optional('BLEX_CACHE_BACKEND') or 'file'
+).lower()
+CACHES = {
+    'default': get_cache_config(
+        CACHE_BACKEND,
+        get_env_optional('BLEX_CACHE_LOCATION'),
+        max(get_env_int('BLEX_CACHE_MAX_ENTRIES', 0), 0) or None,
+    ),
+}
+PUBLIC_CACHE_TIMEOUT = 0 if TESTING else max(get_env_int('BLEX_PUBLIC_CACHE_TIMEOUT', 600), 0)
+HTML_MINIFY_CACHE_TIMEOUT = 0 if TESTING else max(get_env_int('BLEX_HTML_MINIFY_CACHE_TIMEOUT', 86400), 0)
+
+# Developer API
+# Verified tokens are cached briefly and `last_used_at` is written at most
+# once per touch interval. Request logs are buffered in memory and inserted
+# in bulk every flush interval (0 writes each log immediately).
+
+DEVELOPER_TOKEN_CACHE_TIMEOUT = 0 if TESTING else max(get_env_int('BLEX_DEVELOPER_TOKEN_CACHE_TIMEOUT', 60), 0)
+DEVELOPER_TOKEN_TOUCH_INTERVAL = max(get_env_int('BLEX_DEVELOPER_TOKEN_TOUCH_INTERVAL', 300), 0)
+DEVELOPER_REQUEST_LOG_FLUSH_INTERVAL = 0 if TESTING else max(get_env_int('BLEX_DEVELOPER_REQUEST_LOG_FLUSH_INTERVAL', 5), 0)
+
+# Background jobs
+# Jobs are stored in the database and processed by `python manage.py run_worker`.
+
+JOB_WORKER_CONCURRENCY = max(get_env_int('BLEX_JOB_WORKER_CONCURRENCY', 2), 1)
+JOB_RETENTION_DAYS = max(get_env_int('BLEX_JOB_RETENTION_DAYS', 7), 1)
+
+# Resumable uploads
+# Chunks are appended to part files under MEDIA_ROOT/uploads until the upload
+# is completed. Sessions left unfinished are removed by the job worker once
+# they expire; each received chunk extends the expiry.
+
+UPLOAD_SESSION_MAX_MB = max(get_env_int('BLEX_UPLOAD_SESSION_MAX_MB', 100), 1)
+UPLOAD_SESSION_MAX_BYTES = UPLOAD_SESSION_MAX_MB * 1024 * 1024
+UPLOAD_SESSION_TTL_HOURS = max(get_env_int('BLEX_UPLOAD_SESSION_TTL_HOURS', 24), 1)
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -224,6 +323,12 @@ VITE_DEV_SERVER_INFO_PATH = os.environ.get(
 MEDIA_URL = RESOURCE_URL + 'media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'resources', 'media')
 
+# Sitemaps are written here as static XML and served by nginx.
+# Files are only generated when SITE_URL is set.
+SITEMAP_ROOT = os.path.join(BASE_DIR, 'resources', 'sitemaps')
+SITEMAP_STATIC_FILES = not TESTING and os.environ.get('BLEX_STATIC_SITEMAPS', 'TRUE').upper() == 'TRUE'
+SITEMAP_GZIP = os.environ.get('BLEX_SITEMAP_GZIP', 'TRUE').upper() == 'TRUE'
+
 
 # Initial setup
 
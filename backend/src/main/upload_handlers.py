@@ -0,0 +1,42 @@
+"""
+File upload handlers that hash uploads while they are received.
+
+Django reads multipart bodies in chunks, keeping small files in memory and
+spooling larger ones to a temporary file. These handlers feed the same
+chunks to SHA-256 and attach the result to the uploaded file as
+``sha256_digest``, so services can look uploads up by content without
+reading them again.
+"""
+import hashlib
+
+from django.core.files.uploadhandler import (
+    MemoryFileUploadHandler,
+    TemporaryFileUploadHandler,
+)
+
+
+class Sha256UploadHandlerMixin:
+    def new_file(self, *args, **kwargs):
+        # Set before super(): the memory handler stops later handlers by raising.
+        self.sha256 = hashlib.sha256()
+        super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        # An inactive memory handler passes the chunk on without keeping it.
+        if getattr(self, 'activated', True):
+            self.sha256.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        file = super().file_complete(file_size)
+        if file is not None:
+            file.sha256_digest = self.sha256.digest()
+        return file
+
+
+class Sha256MemoryFileUploadHandler(Sha256UploadHandlerMixin, MemoryFileUploadHandler):
+    pass
+
+
+class Sha256TemporaryFileUploadHandler(Sha256UploadHandlerMixin, TemporaryFileUploadHandler):
+    pass
@@ -1,4 +1,8 @@
+import hashlib
 import re
+import threading
+from collections import OrderedDict
+
 import markdown
 from markdown.extensions import Extension
 from markdown.treeprocessors import Treeprocessor
@@ -27,6 +31,8 @@ class HeaderHashTreeprocessor(Treeprocessor):
         return id_text  # Fallback
     
     def run(self, root):
+        # The processor is reused across conversions by the renderer pool.
+        self.ids = []
         for elem in root.iter():
             if elem.tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
                 # Adjust header level to match JS implementation
@@ -98,53 +104,84 @@ class CustomPreprocessor(Preprocessor):
         return new_lines
 
 class CustomPostprocessor:
+    # Every rule runs in a single left-to-right pass over the rendered HTML.
+    # Alternatives are ordered like the original sequential substitutions so
+    # that overlapping syntax keeps resolving the same way.
+    YOUTUBE_FIGURE = (
+        '<figure style="text-align: center; display: flex; justify-content: center; '
+        'flex-direction: column; align-items: center;"><iframe style="width: 100%; '
+        'aspect-ratio: {aspect_css}; border: 0;" data-aspect-ratio="{aspect_ratio}" '
+        'src="https://www.youtube.com/embed/{video_id}" frameborder="0" '
+        'allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; '
+        'picture-in-picture" allowfullscreen></iframe></figure>'
+    )
+    RULES = (
+        ('gif', r'@gif\[.*(?P<gif_src>https?://.*\.mp4).*\]'),
+        ('youtube', r'@youtube\[(?P<youtube_id>[^\]]+)\](?:\{(?P<youtube_ratio>[^\}]+)\})?'),
+        ('checkbox', r'<li>\[ \] '),
+        ('checkbox_checked', r'<li>\[x\] '),
+        ('mention', r'<code>@(?P<mention_username>[a-zA-Z0-9\.]+)</code>'),
+        ('br', r'&lt;br\/?&gt;'),
+        ('center_open', r'&lt;center&gt;'),
+        ('center_close', r'&lt;\/center&gt;'),
+        ('grid_image_open', r'&lt;grid-image col=(?:&quot;|")(?P<grid_col>1|2|3)(?:&quot;|")&gt;'),
+        ('caption', r'&lt;caption&gt;(?P<caption_text>.*)&lt;/caption&gt;'),
+        ('grid_image_close', r'&lt;/grid-image&gt;'),
+    )
+    PATTERN = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in RULES))
+    # Caption text gets every other rule applied, but captions never nest.
+    CAPTION_TEXT_PATTERN = re.compile('|'.join(
+        f'(?P<{name}>{pattern})' for name, pattern in RULES if name != 'caption'
+    ))
+    STATIC_REPLACEMENTS = {
+        'checkbox': '<li class="checkbox">',
+        'checkbox_checked': '<li class="checkbox checked">',
+        'br': '<br/>',
+        'center_open': '<div style="text-align: center;">',
+        'center_close': '</div>',
+        'grid_image_close': '</figure>',
+    }
+
     @staticmethod
     def process(html_content, enable_mentions=False):
-        # Custom Markdown
-        html_content = re.sub(
-            r'@gif\[.*(https?://.*\.mp4).*\]',
-            r'<video class="lazy" autoplay muted loop playsinline poster="\1.preview.jpg"><source data-src="\1" type="video/mp4"/></video>',
-            html_content
-        )
-        # YouTube with aspect ratio: @youtube[ID]{16:9} or @youtube[ID]
-        def youtube_replace(match):
-            video_id = match.group(1)
-            aspect_ratio = match.group(2) if match.group(2) else '16:9'
-            aspect_css = aspect_ratio.replace(':', ' / ')
-            return f'<figure style="text-align: center; display: flex; justify-content: center; flex-direction: column; align-items: center;"><iframe style="width: 100%; aspect-ratio: {aspect_css}; border: 0;" data-aspect-ratio="{aspect_ratio}" src="https://www.youtube.com/embed/{video_id}" frameborder="0" allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture" allowfullscreen></iframe></figure>'
-
-        html_content = re.sub(
-            r'@youtube\[([^\]]+)\](?:\{([^\}]+)\})?',
-            youtube_replace,
-            html_content
-        )
-        html_content = re.sub(r'<li>\[ \] ', r'<li class="checkbox">', html_content)
-        html_content = re.sub(r'<li>\[x\] ', r'<li class="checkbox checked">', html_content)
-
-        if enable_mentions:
-            # Mention: `@username` -> <a href="/@username" class="mention">@username</a>
-            html_content = re.sub(
-                r'<code>@([a-zA-Z0-9\.]+)</code>',
-                r'<a href="/@\1" class="mention">@\1</a>',
-                html_content
-            )
-
-        # Allow Markup
-        html_content = re.sub(r'&lt;br\/?&gt;', '<br/>', html_content)
-        html_content = re.sub(r'&lt;center&gt;', '<div style="text-align: center;">', html_content)
-        html_content = re.sub(r'&lt;\/center&gt;', '</div>', html_content)
-
-        # Grid Image (quotes may appear as &quot; or literal ")
-        html_content = re.sub(r'&lt;grid-image col=(?:&quot;|")(1|2|3)(?:&quot;|")&gt;', r'<figure class="col-\1">', html_content)
-        html_content = re.sub(r'&lt;caption&gt;(.*)&lt;/caption&gt;', r'<figcaption>\1</figcaption>', html_content)
-        html_content = re.sub(r'&lt;/grid-image&gt;', '</figure>', html_content)
+        def replace(match):
+            rule = match.lastgroup
+            if rule in CustomPostprocessor.STATIC_REPLACEMENTS:
+                return CustomPostprocessor.STATIC_REPLACEMENTS[rule]
+            if rule == 'gif':
+                src = match.group('gif_src')
+                return (
+                    f'<video class="lazy" autoplay muted loop playsinline poster="{src}.preview.jpg">'
+                    f'<source data-src="{src}" type="video/mp4"/></video>'
+                )
+            if rule == 'youtube':
+                aspect_ratio = match.group('youtube_ratio') or '16:9'
+                return CustomPostprocessor.YOUTUBE_FIGURE.format(
+                    aspect_css=aspect_ratio.replace(':', ' / '),
+                    aspect_ratio=aspect_ratio,
+                    video_id=match.group('youtube_id'),
+                )
+            if rule == 'mention':
+                if not enable_mentions:
+                    return match.group(0)
+                username = match.group('mention_username')
+                return f'<a href="/@{username}" class="mention">@{username}</a>'
+            if rule == 'grid_image_open':
+                return f'<figure class="col-{match.group("grid_col")}">'
+            # Caption text may itself contain custom syntax.
+            caption = CustomPostprocessor.CAPTION_TEXT_PATTERN.sub(replace, match.group('caption_text'))
+            return f'<figcaption>{caption}</figcaption>'
 
-        return html_content
+        return CustomPostprocessor.PATTERN.sub(replace, html_content)
 
-def _parse_to_html(text, enable_mentions=False):
-    """Parse markdown text to HTML with optional mention rendering."""
-    # Initialize Markdown with extensions
-    md = markdown.Markdown(extensions=[
+
+class MarkdownRendererPool:
+    """
+    Thread-local ``markdown.Markdown`` instances reused across conversions,
+    plus a bounded LRU cache of rendered HTML keyed by a content hash.
+    """
+
+    EXTENSIONS = (
         'markdown.extensions.fenced_code',
         'markdown.extensions.tables',
         'markdown.extensions.nl2br',
@@ -154,19 +191,71 @@ def _parse_to_html(text, enable_mentions=False):
         'pymdownx.tasklist',
         'pymdownx.tilde',
         'pymdownx.mark',
-        CustomMarkdownExtension()
-    ])
-    
-    # Convert markdown to HTML
-    html_content = md.convert(text)
-    
-    # Apply post-processing
-    html_content = CustomPostprocessor.process(
-        html_content,
-        enable_mentions=enable_mentions
     )
-    
-    return html_content
+    CACHE_SIZE = 512
+    # Larger documents are rendered every time instead of pinning memory.
+    CACHE_MAX_TEXT_LENGTH = 100_000
+
+    def __init__(self):
+        self.local = threading.local()
+        self.cache = OrderedDict()
+        self.cache_lock = threading.Lock()
+
+    @staticmethod
+    def create_renderer():
+        return markdown.Markdown(extensions=[
+            *MarkdownRendererPool.EXTENSIONS,
+            CustomMarkdownExtension(),
+        ])
+
+    def get_renderer(self):
+        renderer = getattr(self.local, 'renderer', None)
+        if renderer is None:
+            renderer = self.create_renderer()
+            self.local.renderer = renderer
+        return renderer
+
+    def convert(self, text):
+        renderer = self.get_renderer()
+        renderer.reset()
+        try:
+            return renderer.convert(text)
+        except Exception:
+            # Never reuse a renderer left in an unknown state.
+            self.local.renderer = None
+            raise
+
+    def render(self, text, enable_mentions=False):
+        if len(text) > self.CACHE_MAX_TEXT_LENGTH:
+            return CustomPostprocessor.process(self.convert(text), enable_mentions=enable_mentions)
+
+        key = (hashlib.sha256(text.encode('utf-8')).digest(), enable_mentions)
+        with self.cache_lock:
+            html_content = self.cache.get(key)
+            if html_content is not None:
+                self.cache.move_to_end(key)
+                return html_content
+
+        html_content = CustomPostprocessor.process(self.convert(text), enable_mentions=enable_mentions)
+
+        with self.cache_lock:
+            self.cache[key] = html_content
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.CACHE_SIZE:
+                self.cache.popitem(last=False)
+        return html_content
+
+    def clear_cache(self):
+        with self.cache_lock:
+            self.cache.clear()
+
+
+renderer_pool = MarkdownRendererPool()
+
+
+def _parse_to_html(text, enable_mentions=False):
+    """Parse markdown text to HTML with optional mention rendering."""
+    return renderer_pool.render(text, enable_mentions=enable_mentions)
 
 
 def parse_post_to_html(text):
@@ -5,15 +5,32 @@ Handles image thumbnail generation with different processing modes:
 - preview: Blurred low-quality preview for lazy loading
 - minify: Smaller version for list views
 - normal: Standard resized image
+
+Several modes are produced from a single decode of the source image: JPEG
+files are decoded at a reduced scale with ``draft()``, every output is
+derived from one downscaled intermediate and the files are encoded in
+parallel.
 """
+import math
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, NamedTuple, Tuple
+
 from PIL import Image, ImageFilter
 from django.conf import settings
 
 
+class ThumbnailSpec(NamedTuple):
+    size: int
+    quality: int = 100
+    thumbnail_type: str = 'normal'
+
+
 class ThumbnailProcessor:
     """Handles image thumbnail generation with different processing modes."""
 
+    PREVIEW_BLUR_RADIUS = 50
+
     @staticmethod
     def get_image_path(instance) -> str:
         if hasattr(instance.image, 'path'):
@@ -21,32 +38,78 @@ class ThumbnailProcessor:
         return os.path.join(settings.MEDIA_ROOT, str(instance.image))
 
     @staticmethod
-    def save_preview(image, image_path: str, quality: int):
-        preview_image = image.convert('RGB').filter(ImageFilter.GaussianBlur(50))
-        preview_path = f"{image_path}.preview.jpg"
-        os.makedirs(os.path.dirname(preview_path), exist_ok=True)
-        preview_image.save(preview_path, quality=quality)
+    def fit_size(image_size: Tuple[int, int], size: int) -> Tuple[int, int]:
+        width, height = image_size
+        scale = min(size / width, size / height, 1)
+        return max(math.ceil(width * scale), 1), max(math.ceil(height * scale), 1)
 
     @staticmethod
-    def save_minify(image, instance, image_path: str, size: int, quality: int):
-        image.thumbnail((size, size), Image.LANCZOS)
-        ext = str(instance.image).split('.')[-1]
-        minify_path = f"{image_path}.minify.{ext}"
-        os.makedirs(os.path.dirname(minify_path), exist_ok=True)
-        image.save(minify_path, quality=quality)
+    def resize(image, size: int):
+        resized = image.copy()
+        resized.thumbnail((size, size), Image.LANCZOS)
+        return resized
 
     @staticmethod
-    def save_normal(image, image_path: str, size: int, quality: int):
-        image.thumbnail((size, size), Image.LANCZOS)
-        os.makedirs(os.path.dirname(image_path), exist_ok=True)
-        image.save(image_path, quality=quality)
+    def save(image, path: str, quality: int, **options):
+        # The file may be served while it is rewritten; replace it at once.
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        image_format = Image.registered_extensions().get(os.path.splitext(path)[1].lower())
+        temp_path = f"{path}.tmp"
+        image.save(temp_path, format=image_format, quality=quality, **options)
+        os.replace(temp_path, path)
 
     @classmethod
-    def process(cls, instance, size: int, quality: int = 100, thumbnail_type: str = 'normal'):
+    def build_preview(cls, image, source_width: int):
+        # Keep the blur relative to the original so previews look the same
+        # whatever resolution they are rendered from.
+        radius = max(cls.PREVIEW_BLUR_RADIUS * image.width / source_width, 1)
+        return image.convert('RGB').filter(ImageFilter.GaussianBlur(radius))
+
+    @classmethod
+    def build_outputs(cls, instance, image_path: str, image, source_width: int, specs: Iterable[ThumbnailSpec]):
+        """Returns ``(image, path, quality)`` for every spec."""
+        specs = list(specs)
+
+        # One intermediate at the largest requested size feeds every output.
+        largest = max(spec.size for spec in specs)
+        intermediate = cls.resize(image, largest)
+
+        outputs = []
+        for spec in specs:
+            # Each output gets its own copy since they are saved concurrently.
+            output = cls.resize(intermediate, spec.size)
+            if spec.thumbnail_type == 'preview':
+                outputs.append((
+                    cls.build_preview(output, source_width),
+                    f"{image_path}.preview.jpg",
+                    spec.quality,
+                ))
+            elif spec.thumbnail_type == 'minify':
+                ext = str(instance.image).split('.')[-1]
+                outputs.append((output, f"{image_path}.minify.{ext}", spec.quality))
+            else:
+                outputs.append((output, image_path, spec.quality))
+        return outputs
+
+    @classmethod
+    def open(cls, image_path: str, specs: Iterable[ThumbnailSpec]):
+        """Returns the decoded image and the width of the original."""
+        image = Image.open(image_path)
+        source_width = image.width
+        if image.format == 'JPEG':
+            # Decode at the smallest DCT scale that still covers every output.
+            largest = max(spec.size for spec in specs)
+            image.draft(image.mode, cls.fit_size(image.size, largest))
+        image.load()
+        return image, source_width
+
+    @classmethod
+    def process_set(cls, instance, specs: Iterable[ThumbnailSpec]):
+        specs = list(specs)
         if hasattr(instance, 'avatar'):
             instance.image = instance.avatar
 
-        if not instance.image:
+        if not instance.image or not specs:
             return
 
         image_path = cls.get_image_path(instance)
@@ -56,19 +119,30 @@ class ThumbnailProcessor:
             return
 
         try:
-            image = Image.open(image_path)
+            image, source_width = cls.open(image_path, specs)
         except Exception as e:
             print(f"Error opening image: {e}")
             return
 
-        if thumbnail_type == 'preview':
-            cls.save_preview(image, image_path, quality)
-        elif thumbnail_type == 'minify':
-            cls.save_minify(image, instance, image_path, size, quality)
-        else:
-            cls.save_normal(image, image_path, size, quality)
+        outputs = cls.build_outputs(instance, image_path, image, source_width, specs)
+        if len(outputs) == 1:
+            cls.save(*outputs[0])
+            return
+
+        with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+            for future in [executor.submit(cls.save, *output) for output in outputs]:
+                future.result()
+
+    @classmethod
+    def process(cls, instance, size: int, quality: int = 100, thumbnail_type: str = 'normal'):
+        cls.process_set(instance, [ThumbnailSpec(size, quality, thumbnail_type)])
 
 
 def make_thumbnail(instance, size: int, quality: int = 100, thumbnail_type: str = 'normal'):
     """Convenience function for thumbnail processing."""
     ThumbnailProcessor.process(instance, size, quality, thumbnail_type)
+
+
+def make_thumbnail_set(instance, specs: Iterable[ThumbnailSpec]):
+    """Produce several thumbnail types from one decode of the image."""
+    ThumbnailProcessor.process_set(instance, specs)